@@ -0,0 +1,138 @@
+"""Micro-benchmark for per-entity config resolution during dispatch preparation.
+
+Builds a synthetic config with many agents (each with tools, history and
+compaction overrides, knowledge bases, delegation and rooms), then times the
+per-entity lookups one dispatch performs against the runtime-validated config,
+which answers from its compiled entity index, and against a copy of it, which
+resolves every lookup from the pydantic models.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from mindroom.config.main import Config
+from mindroom.constants import resolve_runtime_paths
+from mindroom.entity_rooms import get_rooms_for_entity
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+_TOOL_NAMES = ("calculator", "shell", "file", "matrix_message", "scheduler", "openclaw_compat")
+
+
+def _config_data(agent_count: int) -> dict[str, object]:
+    agents: dict[str, object] = {}
+    for index in range(agent_count):
+        agent: dict[str, object] = {
+            "display_name": f"Agent {index}",
+            "role": "Synthetic benchmark agent",
+            "rooms": [f"room_{index % 20}", "lobby"],
+            "tools": [
+                _TOOL_NAMES[index % len(_TOOL_NAMES)],
+                {"shell": {"defer": True}} if index % 3 == 0 else "calculator",
+            ],
+            "knowledge_bases": [f"kb_{index % 5}"],
+            "delegate_to": [f"agent_{(index + 1) % agent_count}", f"agent_{(index + 7) % agent_count}"],
+        }
+        if index % 2 == 0:
+            agent["num_history_runs"] = 5 + index % 4
+            agent["compaction"] = {"threshold_percent": 0.7}
+        agents[f"agent_{index}"] = agent
+    return {
+        "models": {"default": {"provider": "openai", "id": "benchmark-model", "context_window": 128_000}},
+        "agents": agents,
+        "teams": {
+            f"team_{index}": {
+                "display_name": f"Team {index}",
+                "role": "Synthetic benchmark team",
+                "agents": [f"agent_{member}" for member in range(index * 5, index * 5 + 5)],
+                "rooms": ["lobby"],
+            }
+            for index in range(agent_count // 10)
+        },
+        "knowledge_bases": {f"kb_{index}": {"path": f"./knowledge/kb_{index}"} for index in range(5)},
+        "defaults": {"tools": ["scheduler"], "compaction": {"enabled": True, "threshold_tokens": 64_000}},
+    }
+
+
+def _prepare_dispatch(config: Config, entity_name: str) -> int:
+    """Perform the per-entity lookups of one agent dispatch and return a checksum."""
+    view = config.resolve_entity(entity_name)
+    touched = len(view.tool_configs) + len(view.authored_tool_configs) + len(view.knowledge_base_ids)
+    touched += view.history_settings.max_tool_calls_from_history or 0
+    touched += int(view.compaction_config.enabled)
+    touched += len(config.get_agent_delegation_closure(entity_name))
+    touched += len(get_rooms_for_entity(entity_name, config))
+    return touched
+
+
+def _nearest_rank(sorted_samples: Sequence[float], percentile: float) -> float:
+    index = max(math.ceil((percentile / 100) * len(sorted_samples)) - 1, 0)
+    return sorted_samples[min(index, len(sorted_samples) - 1)]
+
+
+def _run_case(label: str, config: Config, *, iterations: int, warmup: int, seed: int) -> dict[str, object]:
+    names = list(config.agents)
+    rng = random.Random(seed)  # noqa: S311 - deterministic benchmark workload
+    for _ in range(warmup):
+        _prepare_dispatch(config, rng.choice(names))
+    samples: list[float] = []
+    for _ in range(iterations):
+        entity_name = rng.choice(names)
+        started_at = time.perf_counter()
+        _prepare_dispatch(config, entity_name)
+        samples.append((time.perf_counter() - started_at) * 1_000_000)
+    sorted_samples = sorted(samples)
+    return {
+        "case": label,
+        "count": len(samples),
+        "mean_us": round(sum(samples) / len(samples), 2),
+        "p50_us": round(_nearest_rank(sorted_samples, 50), 2),
+        "p95_us": round(_nearest_rank(sorted_samples, 95), 2),
+        "max_us": round(sorted_samples[-1], 2),
+    }
+
+
+def main() -> None:
+    """Run the command-line benchmark and print JSON results."""
+    parser = argparse.ArgumentParser(description="Benchmark per-entity config resolution for dispatch preparation.")
+    parser.add_argument("--agents", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    if args.agents < 1:
+        parser.error("--agents must be >= 1")
+    if args.iterations < 1:
+        parser.error("--iterations must be >= 1")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        runtime_paths = resolve_runtime_paths(config_path=root / "config.yaml", storage_path=root / "storage")
+        started_at = time.perf_counter()
+        compiled = Config.validate_with_runtime(_config_data(args.agents), runtime_paths)
+        validate_ms = (time.perf_counter() - started_at) * 1000
+        uncompiled = compiled.model_copy()
+        results = [
+            _run_case("resolved_per_call", uncompiled, iterations=args.iterations, warmup=args.warmup, seed=args.seed),
+            _run_case("compiled_index", compiled, iterations=args.iterations, warmup=args.warmup, seed=args.seed),
+        ]
+    print(
+        json.dumps(
+            {"agents": args.agents, "validate_with_runtime_ms": round(validate_ms, 1), "results": results},
+            indent=2,
+            sort_keys=True,
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
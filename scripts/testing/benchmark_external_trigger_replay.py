@@ -0,0 +1,210 @@
+"""Measure external trigger webhook ingestion against the replay store.
+
+Each simulated webhook does what the trigger endpoint does with replay state
+for a signed, successfully delivered request: claim the signature nonce, claim
+the event id, and mark the event delivered. Requests arrive open-loop at
+``--rate`` per second for ``--seconds`` and run their store calls through
+``asyncio.to_thread``, as the API does, so latency includes any queueing once
+the store cannot keep up with the offered load.
+
+Two stores are compared on the same arrival schedule: ``json_file`` is the
+previous design, which locked, parsed, pruned, and durably rewrote the whole
+``replay.json`` on every call; ``sqlite`` is the current indexed store.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Protocol
+
+import structlog
+
+from mindroom.durable_write import write_json_file_durable
+from mindroom.external_triggers.replay_store import ExternalTriggerEventClaim, ExternalTriggerReplayStore
+from mindroom.file_locks import advisory_file_lock
+
+_NONCE_TTL_SECONDS = 300
+_EVENT_TTL_SECONDS = 86400
+
+
+class _ReplayStore(Protocol):
+    def claim_nonce(self, replay_scope: str, nonce: str, *, now: int, ttl_seconds: int) -> bool: ...
+
+    def claim_event_id(
+        self,
+        replay_scope: str,
+        event_id: str,
+        *,
+        now: int,
+        ttl_seconds: int,
+    ) -> ExternalTriggerEventClaim: ...
+
+    def mark_event_delivered(self, replay_scope: str, event_id: str, *, now: int, ttl_seconds: int) -> None: ...
+
+
+@dataclass
+class _JsonFileReplayStore:
+    """The whole-file JSON replay store, reduced to the calls one webhook makes."""
+
+    control_state_root: Path
+    _store_path: Path = field(init=False)
+
+    def __post_init__(self) -> None:
+        self._store_path = self.control_state_root / "external_triggers" / "replay.json"
+
+    def claim_nonce(self, replay_scope: str, nonce: str, *, now: int, ttl_seconds: int) -> bool:
+        with advisory_file_lock(self._store_path.with_suffix(".json.lock")):
+            store = self._read(now)
+            nonces = store["nonces"].setdefault(replay_scope, {})
+            if nonce in nonces:
+                return False
+            nonces[nonce] = {"expires_at": now + ttl_seconds}
+            self._write(store)
+            return True
+
+    def claim_event_id(
+        self,
+        replay_scope: str,
+        event_id: str,
+        *,
+        now: int,
+        ttl_seconds: int,
+    ) -> ExternalTriggerEventClaim:
+        with advisory_file_lock(self._store_path.with_suffix(".json.lock")):
+            store = self._read(now)
+            events = store["events"].setdefault(replay_scope, {})
+            event = events.get(event_id)
+            if event is not None:
+                return ExternalTriggerEventClaim(event["state"])
+            events[event_id] = {"state": "in_progress", "expires_at": now + ttl_seconds}
+            self._write(store)
+            return ExternalTriggerEventClaim.FRESH
+
+    def mark_event_delivered(self, replay_scope: str, event_id: str, *, now: int, ttl_seconds: int) -> None:
+        with advisory_file_lock(self._store_path.with_suffix(".json.lock")):
+            store = self._read(now)
+            store["events"].setdefault(replay_scope, {})[event_id] = {
+                "state": "delivered",
+                "expires_at": now + ttl_seconds,
+            }
+            self._write(store)
+
+    def _read(self, now: int) -> dict[str, dict[str, dict[str, dict[str, object]]]]:
+        try:
+            store = json.loads(self._store_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {"nonces": {}, "events": {}}
+        for section in store.values():
+            for scope, records in list(section.items()):
+                section[scope] = {key: record for key, record in records.items() if record["expires_at"] >= now}
+        return store
+
+    def _write(self, store: dict[str, dict[str, dict[str, dict[str, object]]]]) -> None:
+        write_json_file_durable(self._store_path, store, indent=2, sort_keys=True)
+
+
+async def _webhook(store: _ReplayStore, index: int, now: int) -> None:
+    assert await asyncio.to_thread(
+        store.claim_nonce,
+        "campground",
+        f"nonce-{index}",
+        now=now,
+        ttl_seconds=_NONCE_TTL_SECONDS,
+    )
+    claim = await asyncio.to_thread(
+        store.claim_event_id,
+        "campground",
+        f"event-{index}",
+        now=now,
+        ttl_seconds=_EVENT_TTL_SECONDS,
+    )
+    assert claim is ExternalTriggerEventClaim.FRESH
+    await asyncio.to_thread(
+        store.mark_event_delivered,
+        "campground",
+        f"event-{index}",
+        now=now,
+        ttl_seconds=_EVENT_TTL_SECONDS,
+    )
+
+
+async def _drive(store: _ReplayStore, *, rate: float, requests: int) -> dict[str, object]:
+    loop = asyncio.get_running_loop()
+    now = int(time.time())
+    latencies: list[float] = []
+
+    async def one(index: int, arrival: float) -> None:
+        await asyncio.sleep(max(0.0, arrival - loop.time()))
+        await _webhook(store, index, now)
+        latencies.append(loop.time() - arrival)
+
+    started = loop.time()
+    await asyncio.gather(*(one(index, started + index / rate) for index in range(requests)))
+    elapsed = loop.time() - started
+    latencies.sort()
+    return {
+        "requests": requests,
+        "seconds": round(elapsed, 3),
+        "requests_per_second": round(requests / elapsed, 1),
+        "latency_ms_p50": round(statistics.median(latencies) * 1000, 2),
+        "latency_ms_p99": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000, 2),
+        "latency_ms_max": round(latencies[-1] * 1000, 2),
+    }
+
+
+def _case(name: str, args: argparse.Namespace) -> dict[str, object]:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        if name == "json_file":
+            store: _ReplayStore = _JsonFileReplayStore(root)
+        else:
+            store = ExternalTriggerReplayStore(root)
+        result = asyncio.run(_drive(store, rate=args.rate, requests=int(args.rate * args.seconds)))
+        if isinstance(store, ExternalTriggerReplayStore):
+            store.close()
+        return {"store": name, **result}
+
+
+def main() -> None:
+    """Run the command-line benchmark and print JSON results."""
+    parser = argparse.ArgumentParser(description="Measure external trigger replay-store ingestion.")
+    parser.add_argument("--rate", type=float, default=500.0, help="Offered webhooks per second.")
+    parser.add_argument("--seconds", type=float, default=4.0, help="How long to offer load.")
+    parser.add_argument(
+        "--stores",
+        nargs="+",
+        choices=("json_file", "sqlite"),
+        default=["json_file", "sqlite"],
+        help="Stores to measure; json_file takes minutes at the default load.",
+    )
+    args = parser.parse_args()
+    if args.rate <= 0:
+        parser.error("--rate must be > 0")
+    if args.seconds <= 0:
+        parser.error("--seconds must be > 0")
+
+    logging.getLogger().setLevel(logging.WARNING)
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL),
+        cache_logger_on_first_use=False,
+    )
+    results = [_case(name, args) for name in args.stores]
+    print(
+        json.dumps(
+            {"offered_rate": args.rate, "offered_seconds": args.seconds, "results": results},
+            indent=2,
+            sort_keys=True,
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""Benchmark handled-turn ledger lookups and retention over a large SQLite-backed ledger.
+
+Records ``--records`` turns (10k by default, the per-agent retention cap)
+through a real ledger, then times the reads that edit, redaction and
+regeneration handling perform: lookup by conversation session and by visible
+response event ID. Each is compared with a linear scan over the same records,
+which is what answering them cost before the ledger kept secondary indexes.
+Finally it times one retention pass that has to drop a handful of old turns.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import structlog
+
+from mindroom.event_journal import EventJournalStore
+from mindroom.handled_turns import HandledTurnLedger, TurnRecord
+from mindroom.message_target import MessageTarget
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+_SESSIONS = 200
+
+
+def _nearest_rank(sorted_samples: Sequence[float], percentile: float) -> float:
+    index = max(math.ceil((percentile / 100) * len(sorted_samples)) - 1, 0)
+    return sorted_samples[min(index, len(sorted_samples) - 1)]
+
+
+def _time_case(label: str, call: Callable[[int], object], *, iterations: int) -> dict[str, object]:
+    samples: list[float] = []
+    for iteration in range(iterations):
+        started_at = time.perf_counter()
+        call(iteration)
+        samples.append((time.perf_counter() - started_at) * 1_000_000)
+    sorted_samples = sorted(samples)
+    return {
+        "case": label,
+        "count": len(samples),
+        "mean_us": round(sum(samples) / len(samples), 2),
+        "p50_us": round(_nearest_rank(sorted_samples, 50), 2),
+        "p95_us": round(_nearest_rank(sorted_samples, 95), 2),
+    }
+
+
+def _turn(index: int, *, now: float) -> TurnRecord:
+    target = MessageTarget.resolve(
+        room_id=f"!room{index % 20}:example.com",
+        thread_id=f"$thread{index % _SESSIONS}",
+        reply_to_event_id=f"$source{index}",
+    )
+    # The first few turns are past the 30-day retention window.
+    age_seconds = 40 * 24 * 60 * 60 if index < 5 else 0.0
+    return TurnRecord.create(
+        [f"$source{index}"],
+        response_event_id=f"$response{index}",
+        conversation_target=target,
+        timestamp=now - age_seconds + index / 1000,
+    )
+
+
+async def _run_benchmark(records: int, iterations: int, seed: int) -> dict[str, object]:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store = EventJournalStore.open_sqlite(Path(temp_dir) / "event_journal.db")
+        try:
+            ledger = HandledTurnLedger("benchmark", records=store.turn_records("benchmark"))
+            await ledger.load()
+            now = time.time()
+            turns = [_turn(index, now=now) for index in range(records)]
+            started_at = time.perf_counter()
+            for turn in turns:
+                await ledger.record_handled_turn(turn)
+            seed_seconds = time.perf_counter() - started_at
+
+            rng = random.Random(seed)  # noqa: S311 - deterministic benchmark workload
+            targets = [turns[rng.randrange(records)].conversation_target for _ in range(iterations)]
+            sessions = [target.session_id for target in targets if target is not None]
+            response_ids = [f"$response{rng.randrange(records)}" for _ in range(iterations)]
+
+            def scan_session(iteration: int) -> object:
+                session_id = sessions[iteration]
+                return [
+                    turn
+                    for turn in turns
+                    if turn.conversation_target is not None and turn.conversation_target.session_id == session_id
+                ]
+
+            def scan_response(iteration: int) -> object:
+                response_id = response_ids[iteration]
+                return [turn for turn in turns if response_id in {turn.response_event_id, turn.visible_echo_event_id}]
+
+            results = [
+                _time_case("conversation_linear_scan", scan_session, iterations=iterations),
+                _time_case(
+                    "conversation_ledger",
+                    lambda iteration: ledger.turn_records_for_conversation(session_id=sessions[iteration]),
+                    iterations=iterations,
+                ),
+                _time_case("response_linear_scan", scan_response, iterations=iterations),
+                _time_case(
+                    "response_ledger",
+                    lambda iteration: ledger.turn_record_for_response_event_id(response_ids[iteration]),
+                    iterations=iterations,
+                ),
+            ]
+            started_at = time.perf_counter()
+            await ledger.cleanup()
+            cleanup_ms = (time.perf_counter() - started_at) * 1000
+            dropped = sum(1 for turn in turns[:5] if ledger.get_turn_record(turn.anchor_event_id or "") is None)
+        finally:
+            await store.close()
+    return {
+        "records": records,
+        "seed_seconds": round(seed_seconds, 2),
+        "cleanup_ms": round(cleanup_ms, 3),
+        "cleanup_dropped": dropped,
+        "results": results,
+    }
+
+
+def main() -> None:
+    """Run the command-line benchmark and print JSON results."""
+    parser = argparse.ArgumentParser(description="Benchmark handled-turn ledger lookups and retention.")
+    parser.add_argument("--records", type=int, default=10_000)
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    if args.records < 10:
+        parser.error("--records must be >= 10")
+    if args.iterations < 1:
+        parser.error("--iterations must be >= 1")
+
+    logging.getLogger().setLevel(logging.WARNING)
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING),
+        cache_logger_on_first_use=False,
+    )
+    print(json.dumps(asyncio.run(_run_benchmark(args.records, args.iterations, args.seed)), indent=2, sort_keys=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""Measure knowledge recall with and without the BM25 lexical index.
+
+A synthetic corpus is indexed into a real ChromaDB collection in a temporary
+directory. Every chunk describes one of a handful of incidents in shared prose
+and names its own identifiers: an error code, a snake_case function name, and
+a ticket id. Each query asks about one chunk's identifier, so the only way to
+rank the right chunk first is to match that identifier exactly.
+
+The embedder is a deterministic proxy, not a real model: it hashes the
+alphabetic words of a text into a fixed-size bag-of-words vector and ignores
+tokens containing digits or underscores. That mimics what matters here about
+real embedders -- they capture topic vocabulary but blur exact identifiers --
+without downloading a model. Absolute recall numbers therefore describe this
+proxy; the gap between ``vector`` and ``hybrid`` is the signal.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import math
+import random
+import re
+import statistics
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import structlog
+from agno.knowledge.document import Document
+from agno.knowledge.embedder.base import Embedder
+from agno.vectordb.chroma import ChromaDb
+
+from mindroom.knowledge.lexical_index import LexicalIndex, build_lexical_index, lexical_index_path
+from mindroom.knowledge.utils import _MultiKnowledgeVectorDb
+
+_DIMENSIONS = 256
+_INSERT_BATCH = 256
+_WORD_PATTERN = re.compile(r"\w+")
+_INCIDENTS = (
+    "the connection pool is exhausted while the nightly export job is running",
+    "the payment gateway rejects the signature after a certificate rotation",
+    "the search cluster falls behind and serves stale results to dashboards",
+    "the upload worker runs out of disk space while unpacking archives",
+    "the scheduler skips a run after the daylight saving time change",
+)
+_NOUNS = ("orders", "invoices", "accounts", "sessions", "reports", "shipments", "ledgers", "tokens")
+_QUERY_TEMPLATES = (
+    "what does error {error_code} mean",
+    "why does {function} fail",
+    "status of {ticket}",
+)
+
+
+@dataclass
+class _ProxyEmbedder(Embedder):
+    """Hashed bag of alphabetic words; identifiers carry no signal."""
+
+    dimensions: int | None = _DIMENSIONS
+
+    def get_embedding(self, text: str) -> list[float]:
+        vector = [0.0] * _DIMENSIONS
+        for token in _WORD_PATTERN.findall(text.lower()):
+            if not token.isalpha():
+                continue
+            bucket = int.from_bytes(hashlib.blake2b(token.encode(), digest_size=4).digest(), "big")
+            vector[bucket % _DIMENSIONS] += 1.0
+        norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+        return [value / norm for value in vector]
+
+    def get_embedding_and_usage(self, text: str) -> tuple[list[float], dict[str, object] | None]:
+        return self.get_embedding(text), None
+
+    async def async_get_embedding(self, text: str) -> list[float]:
+        return self.get_embedding(text)
+
+    async def async_get_embedding_and_usage(self, text: str) -> tuple[list[float], dict[str, object] | None]:
+        return self.get_embedding_and_usage(text)
+
+
+def _corpus(chunks: int, rng: random.Random) -> list[tuple[Document, dict[str, str]]]:
+    corpus = []
+    for index in range(chunks):
+        identifiers = {
+            "error_code": f"E{4000 + index}",
+            "function": f"fetch_{rng.choice(_NOUNS)}_v{index}",
+            "ticket": f"TICKET-{10000 + index}",
+        }
+        content = (
+            f"Runbook entry: {_INCIDENTS[index % len(_INCIDENTS)]}. "
+            f"The service logs error {identifiers['error_code']} from {identifiers['function']}. "
+            f"Follow-up is tracked in {identifiers['ticket']}; restart the worker after the fix is deployed."
+        )
+        document = Document(id=f"chunk-{index}", content=content, meta_data={"source_path": f"runbook/{index}.md"})
+        corpus.append((document, identifiers))
+    return corpus
+
+
+def _recall(searches: list[tuple[list[Document], str]]) -> float:
+    return sum(expected in {document.content for document in results} for results, expected in searches) / len(
+        searches,
+    )
+
+
+def _measure(
+    vector_db: _MultiKnowledgeVectorDb,
+    queries: list[tuple[str, str]],
+    k_values: list[int],
+) -> dict[str, object]:
+    limit = max(k_values)
+    latencies: list[float] = []
+    searches: list[tuple[list[Document], str]] = []
+    for query, expected in queries:
+        started = time.perf_counter()
+        results = vector_db.search(query=query, limit=limit)
+        latencies.append(time.perf_counter() - started)
+        searches.append((results, expected))
+    return {
+        **{
+            f"recall_at_{k}": round(_recall([(results[:k], expected) for results, expected in searches]), 3)
+            for k in k_values
+        },
+        "search_ms_p50": round(statistics.median(latencies) * 1000, 2),
+    }
+
+
+def main() -> None:
+    """Run the command-line benchmark and print JSON results."""
+    parser = argparse.ArgumentParser(description="Compare vector-only and hybrid knowledge recall.")
+    parser.add_argument("--chunks", type=int, default=2000, help="Chunks in the synthetic corpus.")
+    parser.add_argument("--queries", type=int, default=300, help="Identifier queries to run.")
+    parser.add_argument("--k", type=int, nargs="+", default=[1, 5, 10], help="Cutoffs to report recall at.")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for the corpus and queries.")
+    args = parser.parse_args()
+    if args.chunks <= 0:
+        parser.error("--chunks must be > 0")
+    if args.queries <= 0:
+        parser.error("--queries must be > 0")
+    if any(k <= 0 for k in args.k):
+        parser.error("--k values must be > 0")
+
+    logging.getLogger().setLevel(logging.WARNING)
+    logging.getLogger("agno").setLevel(logging.WARNING)
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL),
+        cache_logger_on_first_use=False,
+    )
+    rng = random.Random(args.seed)  # noqa: S311 - deterministic benchmark corpus
+    corpus = _corpus(args.chunks, rng)
+    queries = []
+    for document, identifiers in rng.choices(corpus, k=args.queries):
+        template = rng.choice(_QUERY_TEMPLATES)
+        queries.append((template.format(**identifiers), document.content))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        chroma = ChromaDb(
+            collection="benchmark_hybrid",
+            path=str(root / "chroma"),
+            persistent_client=True,
+            embedder=_ProxyEmbedder(),
+        )
+        chroma.create()
+        started = time.perf_counter()
+        documents = [document for document, _identifiers in corpus]
+        for offset in range(0, len(documents), _INSERT_BATCH):
+            chroma.insert(content_hash=f"batch-{offset}", documents=documents[offset : offset + _INSERT_BATCH])
+        embed_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        build_lexical_index(chroma, root)
+        lexical_build_seconds = time.perf_counter() - started
+        lexical_index = LexicalIndex(lexical_index_path(root, chroma.collection_name))
+        results = {
+            "vector": _measure(_MultiKnowledgeVectorDb(vector_dbs=[chroma]), queries, args.k),
+            "hybrid": _measure(
+                _MultiKnowledgeVectorDb(vector_dbs=[chroma], lexical_indexes=[lexical_index]),
+                queries,
+                args.k,
+            ),
+        }
+    print(
+        json.dumps(
+            {
+                "chunks": args.chunks,
+                "queries": args.queries,
+                "embedder": "proxy_bag_of_words",
+                "index_seconds": round(embed_seconds, 3),
+                "lexical_build_seconds": round(lexical_build_seconds, 3),
+                "results": results,
+            },
+            indent=2,
+            sort_keys=True,
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
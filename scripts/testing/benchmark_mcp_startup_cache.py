@@ -0,0 +1,181 @@
+"""Measure how long MCP discovery delays a restart, with and without the persisted catalog cache.
+
+Runs ``--servers`` fake stdio MCP servers whose initialize and tool listing
+together take ``--discovery-ms``, through a real ``MCPServerManager``. A cold
+boot starts with an empty storage directory; a warm boot reuses the storage
+the cold boot left behind, so its catalogs come from
+``<storage>/mcp/catalog_cache.json`` and are revalidated in the background.
+
+For each boot it reports how long ``sync_servers`` took (the runtime creates
+no bot before it returns, so this bounds the time to the first response), how
+long the first MCP tool call after that took, and when every server had a live
+session again.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Self
+
+import mcp.types as mcp_types
+import structlog
+
+import mindroom.mcp.manager as mcp_manager_module
+from mindroom.config.auth import AuthorizationConfig
+from mindroom.constants import resolve_runtime_paths
+from mindroom.mcp.config import MCPServerConfig
+from mindroom.mcp.manager import MCPServerManager
+from mindroom.mcp.transports import _MCPTransportHandle
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from mindroom.constants import RuntimePaths
+
+_TOOLS_PER_SERVER = 12
+
+
+class _FakeClientSession:
+    """Just enough of ``mcp.ClientSession`` for discovery and tool calls."""
+
+    discovery_seconds = 0.0
+    sessions = 0
+
+    def __init__(self, *_args: object, **_kwargs: object) -> None:
+        _FakeClientSession.sessions += 1
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *_args: object) -> None:
+        return None
+
+    async def initialize(self) -> mcp_types.InitializeResult:
+        await asyncio.sleep(self.discovery_seconds / 2)
+        return mcp_types.InitializeResult(
+            protocolVersion="2025-03-26",
+            capabilities=mcp_types.ServerCapabilities(),
+            serverInfo=mcp_types.Implementation(name="bench", version="1.0"),
+        )
+
+    async def list_tools(self, cursor: str | None = None) -> mcp_types.ListToolsResult:
+        del cursor
+        await asyncio.sleep(self.discovery_seconds / 2)
+        return mcp_types.ListToolsResult(
+            tools=[
+                mcp_types.Tool(name=f"tool_{index}", inputSchema={"type": "object", "properties": {}})
+                for index in range(_TOOLS_PER_SERVER)
+            ],
+        )
+
+    async def call_tool(self, name: str, **_kwargs: object) -> mcp_types.CallToolResult:
+        return mcp_types.CallToolResult(content=[mcp_types.TextContent(type="text", text=name)])
+
+
+@asynccontextmanager
+async def _fake_transport() -> AsyncIterator[tuple[object, object]]:
+    yield object(), object()
+
+
+def _fake_transport_handle(
+    _server_id: str,
+    server_config: MCPServerConfig,
+    _runtime_paths: RuntimePaths,
+    *,
+    extra_headers: object = None,
+) -> _MCPTransportHandle:
+    del extra_headers
+    return _MCPTransportHandle(
+        transport=server_config.transport,
+        opener=_fake_transport,  # ty: ignore[invalid-argument-type]
+    )
+
+
+def _config(server_count: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        mcp_servers={
+            f"server_{index}": MCPServerConfig(transport="stdio", command="npx", args=[f"bench-{index}"])
+            for index in range(server_count)
+        },
+        authorization=AuthorizationConfig(),
+        plugins=[],
+        agents={},
+        defaults=SimpleNamespace(allow_self_config=False),
+        get_entities_referencing_tools=lambda _tool_names: set(),
+        agent_has_tool_at_execution_scope=lambda *_args: True,
+    )
+
+
+async def _boot(label: str, runtime_paths: RuntimePaths, config: SimpleNamespace) -> dict[str, object]:
+    _FakeClientSession.sessions = 0
+    manager = MCPServerManager(runtime_paths)
+    started_at = time.perf_counter()
+    try:
+        await manager.sync_servers(config)  # ty: ignore[invalid-argument-type]
+        ready_at = time.perf_counter()
+        await manager.call_tool("server_0", "tool_0", {})
+        first_call_at = time.perf_counter()
+        revalidations = [state.refresh_task for state in manager._states.values() if state.refresh_task is not None]
+        if revalidations:
+            await asyncio.wait(revalidations)
+        all_live_at = time.perf_counter()
+        connected = sum(1 for state in manager._states.values() if state.connected)
+    finally:
+        await manager.shutdown()
+    return {
+        "boot": label,
+        "sync_servers_ms": round((ready_at - started_at) * 1000, 1),
+        "first_tool_call_ms": round((first_call_at - started_at) * 1000, 1),
+        "all_servers_live_ms": round((all_live_at - started_at) * 1000, 1),
+        "connected_servers": connected,
+        "sessions_opened": _FakeClientSession.sessions,
+    }
+
+
+async def _run_benchmark(args: argparse.Namespace, runtime_paths: RuntimePaths) -> dict[str, object]:
+    config = _config(args.servers)
+    return {
+        "servers": args.servers,
+        "discovery_ms": args.discovery_ms,
+        "results": [
+            await _boot("cold", runtime_paths, config),
+            await _boot("warm", runtime_paths, config),
+        ],
+    }
+
+
+def main() -> None:
+    """Run the command-line simulation and print JSON results."""
+    parser = argparse.ArgumentParser(description="Measure MCP discovery cost on cold and warm restarts.")
+    parser.add_argument("--servers", type=int, default=4)
+    parser.add_argument("--discovery-ms", type=float, default=1500.0)
+    args = parser.parse_args()
+    if args.servers < 1:
+        parser.error("--servers must be >= 1")
+    if args.discovery_ms < 0:
+        parser.error("--discovery-ms must be >= 0")
+
+    logging.getLogger().setLevel(logging.WARNING)
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL),
+        cache_logger_on_first_use=False,
+    )
+    _FakeClientSession.discovery_seconds = args.discovery_ms / 1000
+    mcp_manager_module.ClientSession = _FakeClientSession  # ty: ignore[invalid-assignment]
+    mcp_manager_module.build_transport_handle = _fake_transport_handle  # ty: ignore[invalid-assignment]
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        runtime_paths = resolve_runtime_paths(config_path=root / "config.yaml", storage_path=root / "storage")
+        print(json.dumps(asyncio.run(_run_benchmark(args, runtime_paths)), indent=2, sort_keys=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""Measure claim→publish throughput of the background-script run store.
+
+Each cycle is what the broker does for one tool call from a script: recheck
+the run's dispatch authority, claim the call, and publish its terminal
+receipt. ``--threads`` callers run ``--cycles`` cycles each against one store,
+as the broker does from ``asyncio.to_thread``.
+
+Three stores are compared on the same workload: ``per_operation`` opens and
+configures a fresh connection for every operation, as the store did before it
+kept its connections; ``pooled`` uses the store's writer and reader pool; and
+``group_commit`` additionally batches receipts published within
+``--window-ms`` of each other into one transaction.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import structlog
+
+from mindroom.constants import RuntimePaths
+from mindroom.script_runs import store as store_module
+from mindroom.script_runs.models import ScriptCallState, ScriptRunRecord, ScriptToolGrant
+from mindroom.script_runs.store import ScriptRunStore, mint_script_capability
+
+if TYPE_CHECKING:
+    import sqlite3
+    from collections.abc import Iterator
+
+_GRANT = ScriptToolGrant("website", "read_url")
+
+
+class _PerOperationStore(ScriptRunStore):
+    """The store with a fresh connection per operation, for comparison."""
+
+    @contextmanager
+    def _read_connection(self) -> Iterator[sqlite3.Connection]:
+        connection = store_module._connect(self.database_path)
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    @contextmanager
+    def _write_transaction(self) -> Iterator[sqlite3.Connection]:
+        connection = store_module._connect(self.database_path)
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        finally:
+            connection.close()
+
+
+def _runtime_paths(root: Path) -> RuntimePaths:
+    return RuntimePaths(
+        config_path=root / "config.yaml",
+        config_dir=root,
+        env_path=root / ".env",
+        storage_root=root / "storage",
+        control_state_root=root / "control_state",
+    )
+
+
+def _run(store: ScriptRunStore, *, threads: int, cycles: int) -> dict[str, object]:
+    run = store.create_run(
+        ScriptRunRecord(
+            run_id="bench-run",
+            agent_name="bench",
+            owner_user_id="@bench:example.org",
+            room_id="!bench:example.org",
+            source_digest="source-digest",
+            grants=(_GRANT,),
+            token_hash=mint_script_capability()[1],
+            max_tool_calls_per_minute=threads * cycles + 1,
+        ),
+    )
+
+    def caller(thread_index: int) -> None:
+        for cycle in range(cycles):
+            call_id = f"call-{thread_index}-{cycle}"
+            store.require_call_dispatch_allowed(run.run_id)
+            store.claim_call(run_id=run.run_id, call_id=call_id, grant=_GRANT, arguments_digest="digest")
+            store.publish_call_result(
+                run_id=run.run_id,
+                call_id=call_id,
+                state=ScriptCallState.COMPLETED,
+                result={"cycle": cycle},
+            )
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(caller, range(threads)))
+    elapsed = time.perf_counter() - started
+    store.close()
+    return {
+        "cycles": threads * cycles,
+        "seconds": round(elapsed, 3),
+        "cycles_per_second": round(threads * cycles / elapsed, 1),
+    }
+
+
+def _case(name: str, args: argparse.Namespace) -> dict[str, object]:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        runtime_paths = _runtime_paths(Path(temp_dir))
+        if name == "per_operation":
+            store: ScriptRunStore = _PerOperationStore(runtime_paths)
+        elif name == "pooled":
+            store = ScriptRunStore(runtime_paths)
+        else:
+            store = ScriptRunStore(runtime_paths, receipt_commit_window_seconds=args.window_ms / 1000)
+        return {"store": name, **_run(store, threads=args.threads, cycles=args.cycles)}
+
+
+def main() -> None:
+    """Run the command-line benchmark and print JSON results."""
+    parser = argparse.ArgumentParser(description="Measure script-run store claim→publish throughput.")
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--cycles", type=int, default=200)
+    parser.add_argument("--window-ms", type=float, default=2.0)
+    args = parser.parse_args()
+    if args.threads < 1:
+        parser.error("--threads must be >= 1")
+    if args.cycles < 1:
+        parser.error("--cycles must be >= 1")
+    if args.window_ms <= 0:
+        parser.error("--window-ms must be > 0")
+
+    logging.getLogger().setLevel(logging.WARNING)
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL),
+        cache_logger_on_first_use=False,
+    )
+    results = [_case(name, args) for name in ("per_operation", "pooled", "group_commit")]
+    print(
+        json.dumps(
+            {
+                "threads": args.threads,
+                "cycles_per_thread": args.cycles,
+                "window_ms": args.window_ms,
+                "results": results,
+            },
+            indent=2,
+            sort_keys=True,
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+"""Simulate concurrent streamed replies against a fake homeserver with configurable edit latency.
+
+Runs ``--streams`` concurrent ``send_streaming_response`` calls, each fed a
+synthetic token stream, against a fake Matrix client. The fake homeserver
+serves ``--capacity`` requests at once, each taking ``--latency-ms``; further
+requests queue for a slot, and that queueing counts toward the round trip the
+client observes. With ``--rate-limit-per-second`` set, a token bucket also
+refuses requests with ``M_LIMIT_EXCEEDED``; like nio, the fake client sleeps
+for the advertised retry delay and sends again, so refusals surface to the
+stream as slower round trips.
+
+Each case runs once with the fixed ``defaults.streaming`` cadence and once
+with the adaptive one, and reports how many edits the streams sent, the
+deepest the homeserver queue got, how many requests were refused, and how long
+streamed text took to become visible (p50/p95 over all chunks).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, cast
+
+import nio
+import structlog
+
+from mindroom.config.main import Config
+from mindroom.config.models import StreamingConfig
+from mindroom.constants import resolve_runtime_paths
+from mindroom.matrix import edit_cadence
+from mindroom.message_target import MessageTarget
+from mindroom.streaming import send_streaming_response
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
+
+    from mindroom.constants import RuntimePaths
+
+_ROOM_ID = "!bench:example.org"
+_CHUNK = "word "
+
+
+def _nearest_rank(sorted_samples: Sequence[float], percentile: float) -> float:
+    index = max(math.ceil((percentile / 100) * len(sorted_samples)) - 1, 0)
+    return sorted_samples[min(index, len(sorted_samples) - 1)]
+
+
+class _FakeHomeserver:
+    """A homeserver with bounded concurrency, fixed service time and an optional rate limit."""
+
+    def __init__(self, *, latency_seconds: float, capacity: int, rate_limit_per_second: float | None) -> None:
+        self._latency_seconds = latency_seconds
+        self._slots = asyncio.Semaphore(capacity)
+        self._rate_limit_per_second = rate_limit_per_second
+        self._tokens = rate_limit_per_second or 0.0
+        self._tokens_at = time.monotonic()
+        self._waiting = 0
+        self.max_queue_depth = 0
+        self.requests = 0
+        self.rate_limited = 0
+        self.event_ids = 0
+
+    def _take_token(self) -> bool:
+        if self._rate_limit_per_second is None:
+            return True
+        now = time.monotonic()
+        self._tokens = min(
+            self._rate_limit_per_second,
+            self._tokens + (now - self._tokens_at) * self._rate_limit_per_second,
+        )
+        self._tokens_at = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    async def handle(self) -> None:
+        """Serve one request, retrying after each rate-limit refusal the way nio does."""
+        self.requests += 1
+        while True:
+            self._waiting += 1
+            self.max_queue_depth = max(self.max_queue_depth, self._waiting)
+            try:
+                async with self._slots:
+                    await asyncio.sleep(self._latency_seconds)
+            finally:
+                self._waiting -= 1
+            if self._take_token():
+                return
+            self.rate_limited += 1
+            await asyncio.sleep(1 / (self._rate_limit_per_second or 1.0))
+
+
+class _FakeMatrixClient:
+    """Just enough of ``nio.AsyncClient`` for streamed sends and edits."""
+
+    def __init__(self, homeserver: _FakeHomeserver, *, name: str, visible_lengths: list[tuple[float, int]]) -> None:
+        self.homeserver = f"https://{name}"
+        self.user_id = "@bench:example.org"
+        self.rooms = {_ROOM_ID: SimpleNamespace(encrypted=False)}
+        self.olm = None
+        self._server = homeserver
+        self._visible_lengths = visible_lengths
+
+    async def room_send(self, room_id: str, message_type: str, content: dict[str, object], **_kwargs: object) -> object:
+        del message_type
+        await self._server.handle()
+        new_content = content.get("m.new_content", content)
+        body = cast("dict[str, object]", new_content).get("body", "") if isinstance(new_content, dict) else ""
+        self._visible_lengths.append((time.monotonic(), len(str(body))))
+        self._server.event_ids += 1
+        return nio.RoomSendResponse(event_id=f"$event{self._server.event_ids}", room_id=room_id)
+
+
+async def _token_stream(
+    produced: list[tuple[float, int]],
+    *,
+    chunks: int,
+    chunk_interval: float,
+) -> AsyncIterator[str]:
+    length = 0
+    for _ in range(chunks):
+        await asyncio.sleep(chunk_interval)
+        length += len(_CHUNK)
+        produced.append((time.monotonic(), length))
+        yield _CHUNK
+
+
+def _visibility_lags(produced: list[tuple[float, int]], visible: list[tuple[float, int]]) -> list[float]:
+    """Return, per produced chunk, how long until an accepted edit showed at least that much text."""
+    lags: list[float] = []
+    for produced_at, length in produced:
+        shown_at = next(
+            (at for at, visible_length in visible if at >= produced_at and visible_length >= length),
+            None,
+        )
+        if shown_at is not None:
+            lags.append(shown_at - produced_at)
+    return lags
+
+
+async def _run_case(
+    label: str,
+    *,
+    adaptive: bool,
+    args: argparse.Namespace,
+    runtime_paths: RuntimePaths,
+) -> dict[str, object]:
+    edit_cadence._CONTROLLERS.clear()
+    server = _FakeHomeserver(
+        latency_seconds=args.latency_ms / 1000,
+        capacity=args.capacity,
+        rate_limit_per_second=args.rate_limit_per_second,
+    )
+    config = Config.validate_with_runtime(
+        {
+            "models": {"default": {"provider": "openai", "id": "benchmark-model"}},
+            "defaults": {
+                "streaming": StreamingConfig(
+                    adaptive_cadence=adaptive,
+                    target_inflight_edits=args.target_inflight_edits,
+                ).model_dump(),
+            },
+        },
+        runtime_paths,
+    )
+    lags: list[float] = []
+
+    async def one_stream(index: int) -> None:
+        produced: list[tuple[float, int]] = []
+        visible: list[tuple[float, int]] = []
+        client = _FakeMatrixClient(server, name=label, visible_lengths=visible)
+        await send_streaming_response(
+            client,  # ty: ignore[invalid-argument-type]
+            MessageTarget.resolve(_ROOM_ID, None, f"$source{index}"),
+            config,
+            runtime_paths,
+            _token_stream(produced, chunks=args.chunks, chunk_interval=1 / args.chunks_per_second),
+        )
+        lags.extend(_visibility_lags(produced, visible))
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(one_stream(index) for index in range(args.streams)))
+    elapsed = time.perf_counter() - started_at
+    sorted_lags = sorted(lags) or [0.0]
+    snapshot = edit_cadence.edit_cadence_snapshots()
+    return {
+        "case": label,
+        "adaptive_cadence": adaptive,
+        "elapsed_seconds": round(elapsed, 2),
+        "requests": server.requests,
+        "requests_per_stream": round(server.requests / args.streams, 1),
+        "rate_limited": server.rate_limited,
+        "max_queue_depth": server.max_queue_depth,
+        "visible_lag_p50_ms": round(_nearest_rank(sorted_lags, 50) * 1000, 1),
+        "visible_lag_p95_ms": round(_nearest_rank(sorted_lags, 95) * 1000, 1),
+        "paced_interval_seconds": snapshot[0].as_dict()["paced_interval_seconds"] if snapshot else None,
+    }
+
+
+async def _run_benchmark(args: argparse.Namespace, runtime_paths: RuntimePaths) -> dict[str, object]:
+    results = [
+        await _run_case("fixed.example.org", adaptive=False, args=args, runtime_paths=runtime_paths),
+        await _run_case("adaptive.example.org", adaptive=True, args=args, runtime_paths=runtime_paths),
+    ]
+    return {
+        "streams": args.streams,
+        "chunks_per_stream": args.chunks,
+        "chunks_per_second": args.chunks_per_second,
+        "latency_ms": args.latency_ms,
+        "capacity": args.capacity,
+        "rate_limit_per_second": args.rate_limit_per_second,
+        "target_inflight_edits": args.target_inflight_edits,
+        "results": results,
+    }
+
+
+def main() -> None:
+    """Run the command-line simulation and print JSON results."""
+    parser = argparse.ArgumentParser(description="Simulate streamed edits against a fake homeserver.")
+    parser.add_argument("--streams", type=int, default=8)
+    parser.add_argument("--chunks", type=int, default=120)
+    parser.add_argument("--chunks-per-second", type=float, default=30.0)
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    parser.add_argument("--capacity", type=int, default=2)
+    parser.add_argument("--rate-limit-per-second", type=float, default=None)
+    parser.add_argument("--target-inflight-edits", type=float, default=StreamingConfig().target_inflight_edits)
+    args = parser.parse_args()
+    if args.streams < 1 or args.chunks < 1 or args.capacity < 1:
+        parser.error("--streams, --chunks and --capacity must be >= 1")
+    if args.chunks_per_second <= 0 or args.latency_ms < 0 or args.target_inflight_edits <= 0:
+        parser.error("--chunks-per-second and --target-inflight-edits must be > 0 and --latency-ms >= 0")
+
+    logging.getLogger().setLevel(logging.WARNING)
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL),
+        cache_logger_on_first_use=False,
+    )
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        runtime_paths = resolve_runtime_paths(config_path=root / "config.yaml", storage_path=root / "storage")
+        print(json.dumps(asyncio.run(_run_benchmark(args, runtime_paths)), indent=2, sort_keys=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""Load test for the OpenAI-compatible completions endpoint with a stub model.
+
+Drives ``/v1/chat/completions`` in-process over ASGI with ``ai_response``
+replaced by a stub that sleeps, so the numbers isolate MindRoom's request
+path and per-session serialization from any real model latency variance.
+Two workloads run by default: many requests with random session ids, which
+should never wait on each other and must not grow the session lock table, and
+a burst aimed at a few hot session ids, which exercises the bounded queue and
+its 429 rejections.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import httpx
+import structlog
+from fastapi import FastAPI
+
+from mindroom.api import openai_compat
+from mindroom.api.main import initialize_api_app
+from mindroom.config.agent import AgentConfig
+from mindroom.config.main import Config
+from mindroom.config.models import ModelConfig, RouterConfig
+from mindroom.constants import resolve_runtime_paths
+from scripts.testing.benchmark_tool_call_overhead import summarize_samples
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from mindroom.constants import RuntimePaths
+
+
+def _load_test_config() -> Config:
+    return Config(
+        agents={"general": AgentConfig(display_name="GeneralAgent", role="Load test agent", rooms=[])},
+        models={"default": ModelConfig(provider="ollama", id="load-test-model")},
+        router=RouterConfig(model="default"),
+    )
+
+
+def _stub_model(latency_seconds: float) -> object:
+    async def stub_ai_response(*_args: object, **_kwargs: object) -> str:
+        await asyncio.sleep(latency_seconds)
+        return "ok"
+
+    return stub_ai_response
+
+
+async def _post_completion(client: httpx.AsyncClient, session_id: str) -> tuple[int, float]:
+    started_at = time.perf_counter()
+    response = await client.post(
+        "/v1/chat/completions",
+        headers={"X-Session-Id": session_id},
+        json={"model": "general", "messages": [{"role": "user", "content": "ping"}]},
+    )
+    return response.status_code, (time.perf_counter() - started_at) * 1000
+
+
+async def _run_workload(
+    client: httpx.AsyncClient,
+    *,
+    label: str,
+    session_ids: Sequence[str],
+    concurrency: int,
+) -> dict[str, object]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(session_id: str) -> tuple[int, float]:
+        async with semaphore:
+            return await _post_completion(client, session_id)
+
+    started_at = time.perf_counter()
+    results = await asyncio.gather(*(one(session_id) for session_id in session_ids))
+    elapsed = time.perf_counter() - started_at
+    status_counts: dict[str, int] = {}
+    for status, _elapsed_ms in results:
+        status_counts[str(status)] = status_counts.get(str(status), 0) + 1
+    return {
+        "workload": label,
+        "requests": len(results),
+        "requests_per_second": round(len(results) / elapsed, 1) if elapsed > 0 else 0.0,
+        "status_counts": status_counts,
+        "ok_latency": summarize_samples([ms for status, ms in results if status == 200]),
+        "rejected_latency": summarize_samples([ms for status, ms in results if status == 429]),
+    }
+
+
+async def _run_load_test(
+    runtime_paths: RuntimePaths,
+    *,
+    requests: int,
+    hot_sessions: int,
+    concurrency: int,
+    latency_seconds: float,
+    seed: int,
+) -> dict[str, object]:
+    config = _load_test_config()
+    app = FastAPI()
+    app.include_router(openai_compat.router)
+    initialize_api_app(app, runtime_paths)
+    rng = random.Random(seed)  # noqa: S311 - reproducible synthetic session ids
+    random_sessions = [f"load-{uuid.UUID(int=rng.getrandbits(128)).hex}" for _ in range(requests)]
+    hot_session_ids = [f"hot-{index}" for index in range(hot_sessions)]
+    burst_sessions = [rng.choice(hot_session_ids) for _ in range(requests)]
+
+    with (
+        patch.object(openai_compat, "_load_config", return_value=(config, runtime_paths)),
+        patch.object(openai_compat, "ai_response", side_effect=_stub_model(latency_seconds)),
+    ):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://load-test") as client:
+            workloads = [
+                await _run_workload(
+                    client,
+                    label="random_sessions",
+                    session_ids=random_sessions,
+                    concurrency=concurrency,
+                ),
+                await _run_workload(
+                    client,
+                    label="hot_sessions",
+                    session_ids=burst_sessions,
+                    concurrency=concurrency,
+                ),
+            ]
+    return {
+        "workloads": workloads,
+        "session_locks": openai_compat.openai_session_lock_stats().as_dict(),
+    }
+
+
+def main() -> None:
+    """Run the command-line load test and print JSON results."""
+    parser = argparse.ArgumentParser(description="Load test the OpenAI-compatible endpoint with a stub model.")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--hot-sessions", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--model-latency-ms", type=float, default=20.0)
+    parser.add_argument("--max-queued-per-session", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    if args.requests < 1:
+        parser.error("--requests must be >= 1")
+    if args.hot_sessions < 1:
+        parser.error("--hot-sessions must be >= 1")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be >= 1")
+
+    logging.getLogger().setLevel(logging.WARNING)
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR),
+        cache_logger_on_first_use=False,
+    )
+    process_env = {"OPENAI_COMPAT_ALLOW_UNAUTHENTICATED": "true"}
+    if args.max_queued_per_session is not None:
+        process_env["OPENAI_COMPAT_MAX_QUEUED_PER_SESSION"] = str(args.max_queued_per_session)
+    with tempfile.TemporaryDirectory(prefix="mindroom-openai-load-") as tmp:
+        runtime_paths = resolve_runtime_paths(
+            config_path=Path(tmp) / "config.yaml",
+            storage_path=Path(tmp) / "storage",
+            process_env=process_env,
+        )
+        results = asyncio.run(
+            _run_load_test(
+                runtime_paths,
+                requests=args.requests,
+                hot_sessions=args.hot_sessions,
+                concurrency=args.concurrency,
+                latency_seconds=args.model_latency_ms / 1000,
+                seed=args.seed,
+            ),
+        )
+    print(json.dumps(results, indent=2, sort_keys=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -100,6 +100,7 @@ from mindroom.tool_system.events import (
     complete_pending_tool_block,
     format_tool_combined,
 )
+from mindroom.tool_system.sandbox_proxy import prepare_worker_for_tool_call
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator, AsyncIterator, Callable, Sequence
@@ -1690,6 +1691,12 @@ async def ai_response(  # noqa: C901
         _reset_reusable_agent_context(reusable_agent, reusable_agent_base_context)
 
 
+def _agent_tool_list(agent: Agent) -> Sequence[object]:
+    """Return the agent's tools when they are a plain list rather than a per-run factory."""
+    tools = getattr(agent, "tools", None)
+    return tools if isinstance(tools, list) else ()
+
+
 @timed("model_request_to_completion")
 async def _process_stream_events(  # noqa: C901, PLR0912, PLR0915
     stream_generator: AsyncIterator[object],
@@ -1703,6 +1710,7 @@ async def _process_stream_events(  # noqa: C901, PLR0912, PLR0915
     context_media_kinds: frozenset[MediaKind],
     state_updated: Callable[[], None] | None = None,
     pipeline_timing: DispatchPipelineTiming | None = None,
+    agent_tools: Sequence[object] = (),
 ) -> AsyncGenerator[AIStreamChunk, None]:
     """Consume one streaming attempt, yielding chunks and mutating *state*."""
     try:
@@ -1724,6 +1732,9 @@ async def _process_stream_events(  # noqa: C901, PLR0912, PLR0915
 
             if isinstance(event, ToolCallStartedEvent):
                 tool_execution = event.tool
+                if tool_execution is not None and tool_execution.tool_name:
+                    # Ready the worker while the call is rendered and passes hooks and approval.
+                    prepare_worker_for_tool_call(agent_tools, tool_execution.tool_name)
                 emit_timing_event(
                     "Dispatch tool-call timing",
                     phase="agno_tool_call_started",
@@ -1879,6 +1890,7 @@ async def _stream_agent_attempt_chunks(
             retried_after_media_fallback=retried_after_media_fallback,
             state_updated=state_updated,
             pipeline_timing=pipeline_timing,
+            agent_tools=_agent_tool_list(agent),
         ):
             yield stream_chunk
     except Exception as e:
@@ -38,6 +38,7 @@ if TYPE_CHECKING:
     from mindroom.external_triggers.store import TriggerDeliverySnapshot
     from mindroom.knowledge.refresh_scheduler import KnowledgeRefreshScheduler
     from mindroom.knowledge.watch import KnowledgeSourceWatcher
+    from mindroom.matrix.shared_ingestion import SharedSyncFanout
     from mindroom.response_admission import ResponseAdmissionGate
     from mindroom.workers.backend import WorkerBackend
 
@@ -116,6 +117,7 @@ class _MindroomAppState:
     knowledge_refresh_scheduler: KnowledgeRefreshScheduler | None = None
     external_trigger_runtime: ExternalTriggerRuntime | None = None
     script_worker_keepalive: Callable[[WorkerBackend], None] | None = None
+    shared_sync_fanout: SharedSyncFanout | None = None
 
 
 def ensure_app_state(api_app: FastAPI) -> _MindroomAppState:
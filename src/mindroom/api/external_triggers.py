@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import time
+from functools import lru_cache
 from typing import TYPE_CHECKING, ParamSpec, TypeVar, cast
 
 from fastapi import APIRouter, HTTPException, Request
@@ -41,6 +42,7 @@ from mindroom.response_admission import (
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from pathlib import Path
 
     import nio
 
@@ -239,7 +241,13 @@ def _trigger_store(runtime_paths: RuntimePaths) -> ExternalTriggerStore:
 def _replay_store(runtime_paths: RuntimePaths) -> ExternalTriggerReplayStore:
     if runtime_paths.control_state_root is None:
         raise HTTPException(status_code=503, detail="External trigger replay store is not available")
-    return ExternalTriggerReplayStore(runtime_paths.control_state_root)
+    return _replay_store_for_root(runtime_paths.control_state_root)
+
+
+@lru_cache(maxsize=8)
+def _replay_store_for_root(control_state_root: Path) -> ExternalTriggerReplayStore:
+    """Share one replay store, and so one SQLite connection, per control-state root."""
+    return ExternalTriggerReplayStore(control_state_root)
 
 
 def _validate_snapshot_policy_and_auth(
@@ -0,0 +1,15 @@
+"""Plugin hook observability endpoints."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter
+
+from mindroom.hooks import hook_health
+
+router = APIRouter(prefix="/api/hooks", tags=["hooks"])
+
+
+@router.get("/health")
+async def hooks_health() -> dict[str, list[dict[str, object]]]:
+    """Report each invoked hook's latency, failures and circuit breaker state."""
+    return {"hooks": hook_health().snapshot()}
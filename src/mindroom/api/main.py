@@ -26,10 +26,14 @@ from mindroom.api.dynamic_workflows import router as dynamic_workflows_router
 from mindroom.api.external_triggers import router as external_triggers_router
 from mindroom.api.frontend import router as frontend_router
 from mindroom.api.homeassistant_integration import router as homeassistant_router
+from mindroom.api.hooks import router as hooks_router
 from mindroom.api.integrations import router as integrations_router
 from mindroom.api.knowledge import router as knowledge_router
+from mindroom.api.matrix_appservice import router as matrix_appservice_router
 from mindroom.api.matrix_operations import router as matrix_router
+from mindroom.api.mcp import router as mcp_router
 from mindroom.api.oauth import router as oauth_router
+from mindroom.api.openai_compat import openai_session_lock_stats, shutdown_openai_batches
 from mindroom.api.openai_compat import router as openai_compat_router
 from mindroom.api.report_publishing import public_router as report_publishing_public_router
 from mindroom.api.schedules import router as schedules_router
@@ -59,6 +63,7 @@ if TYPE_CHECKING:
     from mindroom.agent_reply_membership import AgentReplyMembershipIndex
     from mindroom.config.main import Config
     from mindroom.external_triggers.store import TriggerDeliverySnapshot
+    from mindroom.matrix.shared_ingestion import SharedSyncFanout
     from mindroom.response_admission import ResponseAdmissionGate
     from mindroom.script_runs.broker import ScriptToolBroker
     from mindroom.workers.backend import WorkerBackend
@@ -516,6 +521,7 @@ async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
         await watch_task
     with suppress(asyncio.CancelledError):
         await worker_cleanup_task
+    await shutdown_openai_batches()
     if standalone_knowledge_source_watcher is not None:
         await standalone_knowledge_source_watcher.shutdown()
     if api_owned_knowledge_refresh_scheduler is not None:
@@ -530,6 +536,11 @@ def bind_orchestrator_knowledge_refresh_scheduler(
     config_lifecycle.app_state(api_app).orchestrator_knowledge_refresh_scheduler = scheduler
 
 
+def bind_shared_sync_fanout(api_app: FastAPI, fanout: SharedSyncFanout) -> None:
+    """Attach the orchestrator-owned shared Matrix ingress to the bundled API app."""
+    config_lifecycle.ensure_app_state(api_app).shared_sync_fanout = fanout
+
+
 def bind_external_trigger_runtime(
     api_app: FastAPI,
     client: object,
@@ -702,8 +713,10 @@ def _set_config_generation_header(response: Response, generation: int) -> None:
 app.include_router(auth_router)
 app.include_router(credentials_router, dependencies=[Depends(verify_user)])
 app.include_router(homeassistant_router, dependencies=[Depends(verify_user)])
+app.include_router(hooks_router, dependencies=[Depends(verify_user)])
 app.include_router(integrations_router, dependencies=[Depends(verify_user)])
 app.include_router(matrix_router, dependencies=[Depends(verify_user)])
+app.include_router(mcp_router, dependencies=[Depends(verify_user)])
 app.include_router(oauth_router)
 app.include_router(schedules_router, dependencies=[Depends(verify_user)])
 app.include_router(knowledge_router, dependencies=[Depends(verify_user)])
@@ -713,6 +726,7 @@ app.include_router(workers_router, dependencies=[Depends(verify_user)])
 app.include_router(openai_compat_router)  # Uses its own bearer auth, not verify_user
 app.include_router(report_publishing_public_router)
 app.include_router(external_triggers_router)
+app.include_router(matrix_appservice_router)  # Uses the application-service homeserver token
 app.include_router(script_gateway_router)
 app.include_router(dynamic_workflows_router, dependencies=[Depends(verify_user)])
 
@@ -731,6 +745,7 @@ async def health_check(request: Request) -> JSONResponse:
         "status": "healthy",
         "last_sync_time": sync_health.last_sync_time.isoformat() if sync_health.last_sync_time is not None else None,
         "e2ee": e2ee_stats().as_dict(),
+        "openai_sessions": openai_session_lock_stats().as_dict(),
     }
     if sync_health.stale_entities:
         response["stale_sync_entities"] = list(sync_health.stale_entities)
@@ -0,0 +1,74 @@
+"""Application-service transaction endpoint feeding the shared Matrix ingress."""
+
+from __future__ import annotations
+
+import json
+import secrets
+from typing import TYPE_CHECKING
+
+from fastapi import APIRouter, HTTPException, Request
+
+from mindroom.api import config_lifecycle
+from mindroom.logging_config import get_logger
+from mindroom.matrix.shared_ingestion import SharedIngestionUnavailableError
+from mindroom.runtime_env_policy import MATRIX_APPSERVICE_HS_TOKEN_ENV
+
+if TYPE_CHECKING:
+    from mindroom.matrix.shared_ingestion import SharedSyncFanout
+
+router = APIRouter(prefix="/_matrix/app/v1", tags=["matrix-appservice"])
+logger = get_logger(__name__)
+
+
+def _request_hs_token(request: Request) -> str | None:
+    """Return the homeserver token from the Authorization header or the legacy query parameter."""
+    authorization = request.headers.get("authorization", "")
+    scheme, _, credentials = authorization.partition(" ")
+    if scheme.lower() == "bearer" and credentials.strip():
+        return credentials.strip()
+    return request.query_params.get("access_token")
+
+
+def _require_shared_sync_fanout(request: Request) -> SharedSyncFanout:
+    try:
+        config, runtime_paths = config_lifecycle.read_committed_runtime_config(request)
+    except HTTPException as exc:
+        raise HTTPException(status_code=503, detail="Matrix configuration is not available") from exc
+    if not config.matrix_sync.shared_ingestion:
+        raise HTTPException(status_code=404, detail="Shared Matrix ingestion is not enabled")
+    expected_token = (runtime_paths.env_value(MATRIX_APPSERVICE_HS_TOKEN_ENV) or "").strip()
+    if not expected_token:
+        raise HTTPException(status_code=503, detail=f"{MATRIX_APPSERVICE_HS_TOKEN_ENV} is not configured")
+    token = _request_hs_token(request)
+    if token is None or not secrets.compare_digest(token, expected_token):
+        raise HTTPException(status_code=403, detail="Invalid homeserver token")
+    fanout = config_lifecycle.ensure_app_state(request.app).shared_sync_fanout
+    if fanout is None:
+        raise HTTPException(status_code=503, detail="Shared Matrix ingestion is not running")
+    return fanout
+
+
+@router.put("/transactions/{transaction_id}")
+async def put_appservice_transaction(transaction_id: str, request: Request) -> dict[str, object]:
+    """Admit one application-service transaction for every joined agent account."""
+    fanout = _require_shared_sync_fanout(request)
+    try:
+        payload = json.loads(await request.body())
+    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise HTTPException(status_code=400, detail="Transaction body is not valid JSON") from exc
+    events = payload.get("events") if isinstance(payload, dict) else None
+    if not isinstance(events, list):
+        raise HTTPException(status_code=400, detail="Transaction body must contain an events list")
+    try:
+        admissions = await fanout.ingest_transaction(transaction_id, events)
+    except SharedIngestionUnavailableError as exc:
+        # Anything but 200 makes the homeserver retry the same transaction, which
+        # is what keeps an event no account has admitted from being acknowledged.
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
+    logger.debug(
+        "appservice_transaction_admitted",
+        transaction_id=transaction_id,
+        event_count=len(events),
+        admissions=admissions,
+    )
+    return {}
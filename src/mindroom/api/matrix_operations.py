@@ -13,6 +13,8 @@ from mindroom.api.config_lifecycle import read_committed_config_and_runtime, rea
 from mindroom.entity_rooms import get_rooms_for_entity
 from mindroom.logging_config import get_logger
 from mindroom.matrix.client_room_admin import get_joined_rooms, get_room_name, leave_room
+from mindroom.matrix.edit_cadence import edit_cadence_snapshots
+from mindroom.matrix.outbound_edits import outbound_edit_snapshots
 from mindroom.matrix.rooms import filter_non_dm_rooms
 from mindroom.matrix.state import resolve_room_aliases
 from mindroom.matrix.users import create_agent_user, login_agent_user
@@ -150,6 +152,18 @@ async def _get_agent_matrix_rooms(
     )
 
 
+@router.get("/edit-cadence")
+async def get_edit_cadence() -> dict[str, Any]:
+    """Report the adaptive streaming edit cadence for every homeserver this process has edited on."""
+    return {"homeservers": [snapshot.as_dict() for snapshot in edit_cadence_snapshots()]}
+
+
+@router.get("/outbound-edits")
+async def get_outbound_edits() -> dict[str, Any]:
+    """Report per-room outbound edit scheduling: waiting edits, superseded edits and queue latency."""
+    return {"rooms": [snapshot.as_dict() for snapshot in outbound_edit_snapshots()]}
+
+
 @router.get("/agents/rooms")
 async def get_all_agents_rooms(request: Request) -> AllAgentsRoomsResponse:
     """Get room information for all configured agents and teams.
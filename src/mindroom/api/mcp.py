@@ -0,0 +1,16 @@
+"""MCP server observability endpoints."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter
+
+from mindroom.mcp.toolkit import require_mcp_server_manager
+
+router = APIRouter(prefix="/api/mcp", tags=["mcp"])
+
+
+@router.get("/result-cache")
+async def mcp_result_cache() -> dict[str, dict[str, dict[str, int]]]:
+    """Report each MCP server's result cache hits, misses and cached entries."""
+    manager = require_mcp_server_manager()
+    return {"servers": manager.result_cache_stats() if manager is not None else {}}
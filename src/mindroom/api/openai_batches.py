@@ -0,0 +1,324 @@
+"""Batch jobs for the OpenAI-compatible chat completions API.
+
+Offline evaluation and back-fill jobs send thousands of independent prompts.
+A batch takes them as one OpenAI batch-format JSONL upload, runs every line
+through the same non-streaming agent and team paths as ``/v1/chat/completions``
+with bounded concurrency and an optional per-model request rate, and appends
+each result to a JSONL output file as soon as it finishes, so clients can poll
+progress and read partial output while the rest is still running.
+
+Jobs live in the API process: the registry is not persisted, and a restart
+drops running batches while their partial output files stay on disk. A
+finished batch's output file is deleted once the batch is evicted from the
+registry.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+from uuid import uuid4
+
+from mindroom.logging_config import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from pathlib import Path
+
+logger = get_logger(__name__)
+
+_OPENAI_BATCH_ENDPOINT = "/v1/chat/completions"
+# Finished batches stay pollable until this many newer batches have finished.
+_FINISHED_BATCH_RETENTION = 256
+
+type _OpenAIBatchStatus = Literal["in_progress", "completed", "cancelling", "cancelled", "failed"]
+type _OpenAIBatchExecutor = Callable[["OpenAIBatchRequest"], Awaitable[tuple[int, dict[str, object]]]]
+
+
+class OpenAIBatchInputError(ValueError):
+    """One batch upload is not a valid OpenAI batch-format JSONL file."""
+
+
+@dataclass(frozen=True, slots=True)
+class OpenAIBatchRequest:
+    """One chat completion request line from a batch upload."""
+
+    custom_id: str
+    body: dict[str, object]
+
+    @property
+    def model(self) -> str:
+        """Return the requested model name, for rate limiting."""
+        model = self.body.get("model")
+        return model if isinstance(model, str) else ""
+
+
+def _parse_batch_line(line_number: int, line: str) -> OpenAIBatchRequest:
+    try:
+        entry = json.loads(line)
+    except json.JSONDecodeError as exc:
+        msg = f"Line {line_number} is not valid JSON"
+        raise OpenAIBatchInputError(msg) from exc
+    if not isinstance(entry, dict):
+        msg = f"Line {line_number} must be a JSON object"
+        raise OpenAIBatchInputError(msg)
+    custom_id = entry.get("custom_id")
+    if not isinstance(custom_id, str) or not custom_id:
+        msg = f"Line {line_number} needs a non-empty custom_id"
+        raise OpenAIBatchInputError(msg)
+    if entry.get("method", "POST") != "POST" or entry.get("url", _OPENAI_BATCH_ENDPOINT) != _OPENAI_BATCH_ENDPOINT:
+        msg = f"Line {line_number} must be a POST to {_OPENAI_BATCH_ENDPOINT}"
+        raise OpenAIBatchInputError(msg)
+    body = entry.get("body")
+    if not isinstance(body, dict):
+        msg = f"Line {line_number} needs an object body"
+        raise OpenAIBatchInputError(msg)
+    return OpenAIBatchRequest(custom_id=custom_id, body=body)
+
+
+def parse_openai_batch_input(data: bytes, *, max_requests: int) -> list[OpenAIBatchRequest]:
+    """Parse one OpenAI batch-format JSONL upload into chat completion requests."""
+    try:
+        text = data.decode("utf-8-sig")
+    except UnicodeDecodeError as exc:
+        msg = "Batch input must be UTF-8 JSONL"
+        raise OpenAIBatchInputError(msg) from exc
+    requests: list[OpenAIBatchRequest] = []
+    seen_custom_ids: set[str] = set()
+    for line_number, line in enumerate(text.splitlines(), start=1):
+        if not line.strip():
+            continue
+        batch_request = _parse_batch_line(line_number, line)
+        if batch_request.custom_id in seen_custom_ids:
+            msg = f"Line {line_number} repeats custom_id {batch_request.custom_id!r}"
+            raise OpenAIBatchInputError(msg)
+        seen_custom_ids.add(batch_request.custom_id)
+        requests.append(batch_request)
+        if len(requests) > max_requests:
+            msg = f"Batch exceeds the limit of {max_requests} requests"
+            raise OpenAIBatchInputError(msg)
+    if not requests:
+        msg = "Batch input contains no requests"
+        raise OpenAIBatchInputError(msg)
+    return requests
+
+
+class _ModelRateLimiter:
+    """Spaces request starts per model so no model exceeds a requests-per-minute budget."""
+
+    def __init__(self, requests_per_minute: int, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self._interval = 0.0
+        self._clock = clock
+        self._next_start: dict[str, float] = {}
+        self.set_requests_per_minute(requests_per_minute)
+
+    def set_requests_per_minute(self, requests_per_minute: int) -> None:
+        """Apply a new per-model budget to every later request start (``0`` disables spacing)."""
+        self._interval = 60.0 / requests_per_minute if requests_per_minute > 0 else 0.0
+
+    async def wait(self, model: str) -> None:
+        """Wait until ``model`` may start one more request."""
+        if self._interval <= 0:
+            return
+        now = self._clock()
+        start_at = max(now, self._next_start.get(model, now))
+        # Reserve the slot before sleeping so concurrent waiters queue behind it.
+        self._next_start[model] = start_at + self._interval
+        if start_at > now:
+            await asyncio.sleep(start_at - now)
+
+
+class OpenAIBatch:
+    """One running or finished batch job and its progress counters."""
+
+    def __init__(
+        self,
+        *,
+        owner: str,
+        requests: list[OpenAIBatchRequest],
+        output_dir: Path,
+    ) -> None:
+        self.id = f"batch_{uuid4().hex}"
+        self.owner = owner
+        self.output_path = output_dir / f"{self.id}.jsonl"
+        self.status: _OpenAIBatchStatus = "in_progress"
+        self.created_at = int(time.time())
+        self.finished_at: int | None = None
+        self.total = len(requests)
+        self.completed = 0
+        self.failed = 0
+        self._requests = requests
+        self._cancel_requested = False
+        self.task: asyncio.Task[None] | None = None
+
+    def as_dict(self) -> dict[str, object]:
+        """Return the OpenAI batch object for this job."""
+        return {
+            "id": self.id,
+            "object": "batch",
+            "endpoint": _OPENAI_BATCH_ENDPOINT,
+            "status": self.status,
+            "created_at": self.created_at,
+            "completed_at": self.finished_at if self.status == "completed" else None,
+            "cancelled_at": self.finished_at if self.status == "cancelled" else None,
+            "failed_at": self.finished_at if self.status == "failed" else None,
+            "request_counts": {"total": self.total, "completed": self.completed, "failed": self.failed},
+        }
+
+    @property
+    def finished(self) -> bool:
+        """Return whether the job has stopped running."""
+        return self.status in {"completed", "cancelled", "failed"}
+
+    @property
+    def cancel_requested(self) -> bool:
+        """Return whether the job was asked to stop starting new requests."""
+        return self._cancel_requested
+
+    def request_cancel(self) -> None:
+        """Stop starting new requests; requests already running finish and are written."""
+        self._cancel_requested = True
+        self.status = "cancelling"
+
+    async def run(
+        self,
+        execute: _OpenAIBatchExecutor,
+        *,
+        concurrency: int,
+        rate_limiter: _ModelRateLimiter,
+    ) -> None:
+        """Execute every request and append each result to the output file as it finishes."""
+        pending: asyncio.Queue[OpenAIBatchRequest] = asyncio.Queue()
+        for batch_request in self._requests:
+            pending.put_nowait(batch_request)
+        self._requests = []
+        with self.output_path.open("a", encoding="utf-8") as output:
+
+            async def worker() -> None:
+                while not self._cancel_requested and not pending.empty():
+                    batch_request = pending.get_nowait()
+                    await rate_limiter.wait(batch_request.model)
+                    if self._cancel_requested:
+                        return
+                    status_code, body = await self._execute_one(execute, batch_request)
+                    output.write(_output_line(batch_request.custom_id, status_code, body))
+                    output.flush()
+                    if status_code == 200:
+                        self.completed += 1
+                    else:
+                        self.failed += 1
+
+            # The task group cancels and awaits every sibling when one worker fails,
+            # so no worker is left writing after the output file closes.
+            async with asyncio.TaskGroup() as workers:
+                for _ in range(min(concurrency, pending.qsize())):
+                    workers.create_task(worker())
+
+    @staticmethod
+    async def _execute_one(
+        execute: _OpenAIBatchExecutor,
+        batch_request: OpenAIBatchRequest,
+    ) -> tuple[int, dict[str, object]]:
+        try:
+            return await execute(batch_request)
+        except Exception as exc:
+            logger.exception("OpenAI batch request failed", custom_id=batch_request.custom_id)
+            return 500, {"error": {"message": str(exc) or type(exc).__name__, "type": "server_error"}}
+
+
+def _output_line(custom_id: str, status_code: int, body: dict[str, object]) -> str:
+    line = {
+        "id": f"batch_req_{uuid4().hex}",
+        "custom_id": custom_id,
+        "response": {"status_code": status_code, "request_id": uuid4().hex, "body": body},
+        "error": None,
+    }
+    return json.dumps(line, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+class OpenAIBatchRegistry:
+    """In-process registry that starts, tracks, and cancels batch jobs."""
+
+    def __init__(self) -> None:
+        self._batches: OrderedDict[str, OpenAIBatch] = OrderedDict()
+        # One limiter for every batch, so concurrent batches share each model's budget.
+        self._rate_limiter = _ModelRateLimiter(0)
+
+    def start(
+        self,
+        batch: OpenAIBatch,
+        execute: _OpenAIBatchExecutor,
+        *,
+        concurrency: int,
+        requests_per_minute: int,
+    ) -> None:
+        """Register ``batch`` and start running it in the background."""
+        batch.output_path.parent.mkdir(parents=True, exist_ok=True)
+        batch.output_path.write_bytes(b"")
+        self._batches[batch.id] = batch
+        self._rate_limiter.set_requests_per_minute(requests_per_minute)
+        batch.task = asyncio.create_task(
+            self._run(batch, execute, concurrency=concurrency, rate_limiter=self._rate_limiter),
+            name=f"openai_batch:{batch.id}",
+        )
+
+    async def _run(
+        self,
+        batch: OpenAIBatch,
+        execute: _OpenAIBatchExecutor,
+        *,
+        concurrency: int,
+        rate_limiter: _ModelRateLimiter,
+    ) -> None:
+        logger.info("OpenAI batch started", batch_id=batch.id, requests=batch.total, concurrency=concurrency)
+        try:
+            await batch.run(execute, concurrency=concurrency, rate_limiter=rate_limiter)
+        except asyncio.CancelledError:
+            batch.status = "cancelled"
+            raise
+        except Exception:
+            logger.exception("OpenAI batch failed", batch_id=batch.id)
+            batch.status = "failed"
+        else:
+            batch.status = "cancelled" if batch.cancel_requested else "completed"
+        finally:
+            batch.finished_at = int(time.time())
+            self._evict_finished()
+            logger.info(
+                "OpenAI batch finished",
+                batch_id=batch.id,
+                status=batch.status,
+                completed=batch.completed,
+                failed=batch.failed,
+            )
+
+    def get(self, batch_id: str, *, owner: str) -> OpenAIBatch | None:
+        """Return one batch owned by ``owner``."""
+        batch = self._batches.get(batch_id)
+        return batch if batch is not None and batch.owner == owner else None
+
+    def cancel(self, batch: OpenAIBatch) -> None:
+        """Stop scheduling new requests for ``batch``; running requests finish and stay in its output."""
+        if batch.finished or batch.task is None:
+            return
+        batch.request_cancel()
+
+    async def shutdown(self) -> None:
+        """Cancel every running batch and wait for it to stop."""
+        tasks = [batch.task for batch in self._batches.values() if batch.task is not None and not batch.task.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _evict_finished(self) -> None:
+        finished = [batch_id for batch_id, batch in self._batches.items() if batch.finished]
+        for batch_id in finished[: max(len(finished) - _FINISHED_BATCH_RETENTION, 0)]:
+            batch = self._batches.pop(batch_id)
+            try:
+                batch.output_path.unlink(missing_ok=True)
+            except OSError:
+                logger.warning("Failed to delete evicted OpenAI batch output", batch_id=batch_id, exc_info=True)
@@ -11,8 +11,8 @@ protocol formatting (``openai_streaming_protocol``).
 from __future__ import annotations
 
 import asyncio
+import json
 import time
-import weakref
 from contextlib import ExitStack
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Annotated, cast
@@ -24,13 +24,20 @@ from agno.run.team import RunContentEvent as TeamContentEvent
 from agno.run.team import RunErrorEvent as TeamRunErrorEvent
 from agno.run.team import TeamRunOutput
 from fastapi import APIRouter, Header, Request
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
 from starlette.background import BackgroundTask
 
 from mindroom.agent_run_context import prepend_knowledge_availability_notice
 from mindroom.ai import AIStreamChunk, ResponseTurnContext, ai_response, stream_agent_response
 from mindroom.api import config_lifecycle
+from mindroom.api.openai_batches import (
+    OpenAIBatch,
+    OpenAIBatchInputError,
+    OpenAIBatchRegistry,
+    OpenAIBatchRequest,
+    parse_openai_batch_input,
+)
 from mindroom.api.openai_request_parsing import (
     AUTO_MODEL_NAME,
     RESERVED_MODEL_NAMES,
@@ -51,6 +58,10 @@ from mindroom.api.openai_request_parsing import (
 from mindroom.api.openai_request_parsing import (
     openai_incompatible_agents as _openai_incompatible_agents,
 )
+from mindroom.api.openai_request_parsing import (
+    session_key_namespace as _session_key_namespace,
+)
+from mindroom.api.openai_session_locks import OpenAISessionLockStats, OpenAISessionLockTable
 from mindroom.api.openai_streaming_protocol import (
     SSE_DONE,
     CompletionStreamState,
@@ -123,13 +134,22 @@ router = APIRouter(prefix="/v1", tags=["OpenAI Compatible"])
 
 # Per-session completion locks keep same-session /v1 completions from
 # interleaving Agno session writes and post-response history compaction.
-# The mapping holds weak references: every in-flight request keeps a strong
-# reference to its lock (locally and via the attached response finalizer),
-# so an entry lives exactly as long as some request for that session is
-# still running and the cache is bounded by in-flight concurrency.
-_OPENAI_COMPLETION_LOCKS: weakref.WeakValueDictionary[tuple[str, str, str], asyncio.Lock] = (
-    weakref.WeakValueDictionary()
-)
+_OPENAI_COMPLETION_LOCKS = OpenAISessionLockTable()
+_OPENAI_COMPAT_MAX_QUEUED_PER_SESSION_ENV = "OPENAI_COMPAT_MAX_QUEUED_PER_SESSION"
+_DEFAULT_MAX_QUEUED_PER_SESSION = 8
+
+# Batch jobs run in this process; see ``openai_batches`` for the job model.
+_OPENAI_BATCHES = OpenAIBatchRegistry()
+_OPENAI_COMPAT_BATCH_CONCURRENCY_ENV = "OPENAI_COMPAT_BATCH_CONCURRENCY"
+_OPENAI_COMPAT_BATCH_REQUESTS_PER_MINUTE_ENV = "OPENAI_COMPAT_BATCH_REQUESTS_PER_MINUTE"
+_OPENAI_COMPAT_BATCH_MAX_REQUESTS_ENV = "OPENAI_COMPAT_BATCH_MAX_REQUESTS"
+_DEFAULT_BATCH_CONCURRENCY = 4
+_DEFAULT_BATCH_MAX_REQUESTS = 50_000
+
+
+def openai_session_lock_stats() -> OpenAISessionLockStats:
+    """Return process-wide counters for same-session completion serialization."""
+    return _OPENAI_COMPLETION_LOCKS.stats()
 
 
 def _openai_completion_lock(
@@ -139,12 +159,32 @@ def _openai_completion_lock(
     session_id: str,
 ) -> asyncio.Lock:
     """Return the shared lock serializing completions for one agent session."""
-    key = (str(runtime_paths.storage_root), agent_name, session_id)
-    lock = _OPENAI_COMPLETION_LOCKS.get(key)
-    if lock is None:
-        lock = asyncio.Lock()
-        _OPENAI_COMPLETION_LOCKS[key] = lock
-    return lock
+    return _OPENAI_COMPLETION_LOCKS.lock_for((str(runtime_paths.storage_root), agent_name, session_id))
+
+
+def _env_int(runtime_paths: RuntimePaths, name: str, *, default: int, minimum: int) -> int:
+    """Return one integer runtime knob, falling back to ``default`` when unset or invalid."""
+    raw = (runtime_paths.env_value(name) or "").strip()
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        value = minimum - 1
+    if value < minimum:
+        logger.warning("Invalid OpenAI-compatible API limit, using default", env=name, value=raw, default=default)
+        return default
+    return value
+
+
+def _max_queued_per_session(runtime_paths: RuntimePaths) -> int:
+    """Return how many completions may wait behind one running same-session completion."""
+    return _env_int(
+        runtime_paths,
+        _OPENAI_COMPAT_MAX_QUEUED_PER_SESSION_ENV,
+        default=_DEFAULT_MAX_QUEUED_PER_SESSION,
+        minimum=0,
+    )
 
 
 def _release_openai_completion_lock(completion_lock: asyncio.Lock) -> None:
@@ -428,7 +468,7 @@ async def list_models(
 
 
 @router.post("/chat/completions", response_model=None)
-async def chat_completions(  # noqa: C901, PLR0912
+async def chat_completions(
     request: Request,
     authorization: Annotated[str | None, Header()] = None,
 ) -> JSONResponse | StreamingResponse:
@@ -481,7 +521,17 @@ async def chat_completions(  # noqa: C901, PLR0912
         agent_name=agent_name,
         session_id=session_id,
     )
-    await completion_lock.acquire()
+    if not await _OPENAI_COMPLETION_LOCKS.acquire(
+        completion_lock,
+        max_waiting=_max_queued_per_session(runtime_paths),
+    ):
+        logger.warning("OpenAI-compatible session queue full", model=agent_name, session_id=session_id)
+        return _error_response(
+            429,
+            "Too many concurrent requests for this session; retry after the current completion finishes",
+            error_type="rate_limit_error",
+            code="session_busy",
+        )
 
     try:
         # Team execution path
@@ -515,23 +565,14 @@ async def chat_completions(  # noqa: C901, PLR0912
                         refresh_scheduler=knowledge_refresh_scheduler,
                     )
         else:
-            # Resolve knowledge base for this agent
-            try:
-                knowledge_resolution = resolve_agent_knowledge_access(
-                    agent_name,
-                    config,
-                    runtime_paths,
-                    refresh_scheduler=knowledge_refresh_scheduler,
-                    execution_identity=execution_identity,
-                )
-            except Exception:
-                logger.warning("Knowledge resolution failed, proceeding without knowledge", exc_info=True)
-                knowledge = None
-                unavailable_bases: dict[str, KnowledgeAvailabilityDetail] = {}
-            else:
-                knowledge = knowledge_resolution.knowledge
-                unavailable_bases = dict(knowledge_resolution.unavailable)
-            prompt = prepend_knowledge_availability_notice(prompt, unavailable_bases)
+            knowledge, prompt = _resolve_request_knowledge(
+                agent_name,
+                prompt,
+                config,
+                runtime_paths,
+                execution_identity=execution_identity,
+                refresh_scheduler=knowledge_refresh_scheduler,
+            )
             if req.stream:
                 response = await _stream_completion(
                     agent_name,
@@ -566,6 +607,241 @@ async def chat_completions(  # noqa: C901, PLR0912
     return _attach_openai_completion_lock_release(response, completion_lock)
 
 
+# ---------------------------------------------------------------------------
+# Batches
+# ---------------------------------------------------------------------------
+
+
+@router.post("/batches", response_model=None)
+async def create_batch(
+    request: Request,
+    authorization: Annotated[str | None, Header()] = None,
+) -> JSONResponse:
+    """Start one batch of chat completions from an OpenAI batch-format JSONL body."""
+    runtime_paths = config_lifecycle.bind_current_request_snapshot(request).runtime_paths
+    auth_error = _authenticate_request(authorization, runtime_paths)
+    if auth_error is not None:
+        return auth_error
+
+    try:
+        batch_requests = parse_openai_batch_input(
+            await request.body(),
+            max_requests=_env_int(
+                runtime_paths,
+                _OPENAI_COMPAT_BATCH_MAX_REQUESTS_ENV,
+                default=_DEFAULT_BATCH_MAX_REQUESTS,
+                minimum=1,
+            ),
+        )
+    except OpenAIBatchInputError as exc:
+        return _error_response(400, str(exc))
+
+    # Every line runs against the config committed when the batch was accepted.
+    config, runtime_paths = _load_config(request, runtime_paths=runtime_paths)
+    batch = OpenAIBatch(
+        owner=_session_key_namespace(request),
+        requests=batch_requests,
+        output_dir=runtime_paths.storage_root / "openai_batches",
+    )
+    knowledge_refresh_scheduler = _request_knowledge_refresh_scheduler(request)
+
+    async def execute(batch_request: OpenAIBatchRequest) -> tuple[int, dict[str, object]]:
+        return await _execute_batch_request(
+            batch_request,
+            session_id=f"{batch.owner}:{batch.id}:{batch_request.custom_id}",
+            config=config,
+            runtime_paths=runtime_paths,
+            refresh_scheduler=knowledge_refresh_scheduler,
+        )
+
+    _OPENAI_BATCHES.start(
+        batch,
+        execute,
+        concurrency=_env_int(
+            runtime_paths,
+            _OPENAI_COMPAT_BATCH_CONCURRENCY_ENV,
+            default=_DEFAULT_BATCH_CONCURRENCY,
+            minimum=1,
+        ),
+        requests_per_minute=_env_int(runtime_paths, _OPENAI_COMPAT_BATCH_REQUESTS_PER_MINUTE_ENV, default=0, minimum=0),
+    )
+    return JSONResponse(content=batch.as_dict())
+
+
+def _owned_batch(
+    request: Request,
+    batch_id: str,
+    authorization: str | None,
+) -> OpenAIBatch | JSONResponse:
+    """Return one batch created with the caller's API key, or an OpenAI-style error."""
+    runtime_paths = config_lifecycle.bind_current_request_snapshot(request).runtime_paths
+    auth_error = _authenticate_request(authorization, runtime_paths)
+    if auth_error is not None:
+        return auth_error
+    batch = _OPENAI_BATCHES.get(batch_id, owner=_session_key_namespace(request))
+    if batch is None:
+        return _error_response(404, f"No batch found with id '{batch_id}'", code="batch_not_found")
+    return batch
+
+
+@router.get("/batches/{batch_id}", response_model=None)
+async def retrieve_batch(
+    batch_id: str,
+    request: Request,
+    authorization: Annotated[str | None, Header()] = None,
+) -> JSONResponse:
+    """Return one batch's status and request counts, for progress polling."""
+    batch = _owned_batch(request, batch_id, authorization)
+    if isinstance(batch, JSONResponse):
+        return batch
+    return JSONResponse(content=batch.as_dict())
+
+
+@router.get("/batches/{batch_id}/output", response_model=None)
+async def retrieve_batch_output(
+    batch_id: str,
+    request: Request,
+    authorization: Annotated[str | None, Header()] = None,
+) -> Response:
+    """Return the JSONL results written so far, one line per finished request."""
+    batch = _owned_batch(request, batch_id, authorization)
+    if isinstance(batch, JSONResponse):
+        return batch
+    content = await asyncio.to_thread(batch.output_path.read_bytes)
+    return Response(content=content, media_type="application/jsonl")
+
+
+@router.post("/batches/{batch_id}/cancel", response_model=None)
+async def cancel_batch(
+    batch_id: str,
+    request: Request,
+    authorization: Annotated[str | None, Header()] = None,
+) -> JSONResponse:
+    """Stop starting new requests for one batch; finished results stay in its output."""
+    batch = _owned_batch(request, batch_id, authorization)
+    if isinstance(batch, JSONResponse):
+        return batch
+    _OPENAI_BATCHES.cancel(batch)
+    return JSONResponse(content=batch.as_dict())
+
+
+async def shutdown_openai_batches() -> None:
+    """Cancel every running batch job at API shutdown."""
+    await _OPENAI_BATCHES.shutdown()
+
+
+def _response_payload(response: JSONResponse) -> tuple[int, dict[str, object]]:
+    """Return one completion response as a batch output status code and body."""
+    return response.status_code, json.loads(bytes(response.body))
+
+
+async def _execute_batch_request(
+    batch_request: OpenAIBatchRequest,
+    *,
+    session_id: str,
+    config: Config,
+    runtime_paths: RuntimePaths,
+    refresh_scheduler: KnowledgeRefreshScheduler | None,
+) -> tuple[int, dict[str, object]]:
+    """Run one batch line through the same non-streaming paths as ``/v1/chat/completions``.
+
+    Every line gets its own session, so lines never share history and need no
+    per-session completion lock.
+    """
+    req = parse_chat_completion_body(json.dumps(batch_request.body).encode())
+    if isinstance(req, JSONResponse):
+        return _response_payload(req)
+    if req.stream:
+        return _response_payload(_error_response(400, "Streaming is not supported in batch requests", param="stream"))
+    validation_error = validate_chat_request(req, config)
+    if validation_error is not None:
+        return _response_payload(validation_error)
+    prompt, thread_history = _convert_messages(req.messages)
+    if not prompt:
+        return _response_payload(_error_response(400, "No user message content found in messages"))
+
+    agent_name = req.model
+    if agent_name == AUTO_MODEL_NAME:
+        routed = await _resolve_auto_route(prompt, config, runtime_paths, thread_history)
+        if isinstance(routed, JSONResponse):
+            return _response_payload(routed)
+        agent_name = routed
+    execution_identity = build_tool_execution_identity(
+        channel="openai_compat",
+        agent_name=agent_name,
+        session_id=session_id,
+        runtime_paths=runtime_paths,
+        requester_id=None,
+        room_id=None,
+        thread_id=None,
+        resolved_thread_id=None,
+    )
+    with tool_execution_identity(execution_identity):
+        if agent_name.startswith(TEAM_MODEL_PREFIX):
+            response = await _non_stream_team_completion(
+                agent_name.removeprefix(TEAM_MODEL_PREFIX),
+                agent_name,
+                prompt,
+                session_id,
+                config,
+                runtime_paths,
+                thread_history,
+                req.user,
+                execution_identity=execution_identity,
+                refresh_scheduler=refresh_scheduler,
+            )
+        else:
+            knowledge, prompt = _resolve_request_knowledge(
+                agent_name,
+                prompt,
+                config,
+                runtime_paths,
+                execution_identity=execution_identity,
+                refresh_scheduler=refresh_scheduler,
+            )
+            response = await _non_stream_completion(
+                agent_name,
+                prompt,
+                session_id,
+                config,
+                runtime_paths,
+                thread_history,
+                req.user,
+                knowledge,
+                execution_identity=execution_identity,
+                refresh_scheduler=refresh_scheduler,
+            )
+    return _response_payload(response)
+
+
+def _resolve_request_knowledge(
+    agent_name: str,
+    prompt: str,
+    config: Config,
+    runtime_paths: RuntimePaths,
+    *,
+    execution_identity: ToolExecutionIdentity,
+    refresh_scheduler: KnowledgeRefreshScheduler | None,
+) -> tuple[Knowledge | None, str]:
+    """Resolve one agent's knowledge and return it with the prompt carrying any availability notice."""
+    try:
+        knowledge_resolution = resolve_agent_knowledge_access(
+            agent_name,
+            config,
+            runtime_paths,
+            refresh_scheduler=refresh_scheduler,
+            execution_identity=execution_identity,
+        )
+    except Exception:
+        logger.warning("Knowledge resolution failed, proceeding without knowledge", exc_info=True)
+        knowledge = None
+        unavailable_bases: dict[str, KnowledgeAvailabilityDetail] = {}
+    else:
+        knowledge = knowledge_resolution.knowledge
+        unavailable_bases = dict(knowledge_resolution.unavailable)
+    return knowledge, prepend_knowledge_availability_notice(prompt, unavailable_bases)
+
+
 # ---------------------------------------------------------------------------
 # Non-streaming completion
 # ---------------------------------------------------------------------------
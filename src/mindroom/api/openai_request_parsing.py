@@ -173,6 +173,12 @@ def convert_messages(
     return prompt, thread_history
 
 
+def session_key_namespace(request: Request) -> str:
+    """Return the API-key namespace that keeps sessions and batches from crossing keys."""
+    auth = request.headers.get("authorization", "")
+    return hashlib.sha256(auth.encode()).hexdigest()[:8] if auth else "noauth"
+
+
 def derive_session_id(
     model: str,
     request: Request,
@@ -184,9 +190,7 @@ def derive_session_id(
     2. X-LibreChat-Conversation-Id header + model
     3. Random UUID fallback (collision-safe default when no conversation ID is provided)
     """
-    # Namespace prefix from API key to prevent session hijack across keys
-    auth = request.headers.get("authorization", "")
-    key_namespace = hashlib.sha256(auth.encode()).hexdigest()[:8] if auth else "noauth"
+    key_namespace = session_key_namespace(request)
 
     # 1. Explicit session ID (namespaced to prevent cross-key collision)
     session_id = request.headers.get("x-session-id")
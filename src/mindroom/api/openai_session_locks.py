@@ -0,0 +1,118 @@
+"""Per-session completion locks for the OpenAI-compatible API.
+
+Same-session ``/v1`` completions are serialized so Agno session writes and
+post-response history compaction never interleave. Locks are held weakly:
+every in-flight request keeps a strong reference to its lock (locally and via
+the attached response finalizer), so an entry lives exactly as long as some
+request for that session is running or queued and the table is bounded by
+in-flight concurrency, however many distinct session ids clients invent.
+
+The queue behind one session is bounded too. A client that fires many
+requests at one session gets fast rejections instead of an unbounded line of
+parked coroutines, and wait times are counted so a slow queue is visible in
+``/api/health`` rather than only as client-side latency.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+type _SessionKey = tuple[str, str, str]
+
+
+@dataclass(frozen=True, slots=True)
+class OpenAISessionLockStats:
+    """Process-wide counters for OpenAI-compatible session serialization."""
+
+    active_sessions: int
+    waiting: int
+    acquisitions: int
+    contended_acquisitions: int
+    rejected: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+
+    def as_dict(self) -> dict[str, int | float]:
+        """Return the counters for health reporting."""
+        return {
+            "active_sessions": self.active_sessions,
+            "waiting": self.waiting,
+            "acquisitions": self.acquisitions,
+            "contended_acquisitions": self.contended_acquisitions,
+            "rejected": self.rejected,
+            "wait_seconds_total": round(self.wait_seconds_total, 6),
+            "wait_seconds_max": round(self.wait_seconds_max, 6),
+        }
+
+
+class OpenAISessionLockTable:
+    """Weakly held per-session locks with bounded wait queues and wait-time counters."""
+
+    def __init__(self, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._locks: weakref.WeakValueDictionary[_SessionKey, asyncio.Lock] = weakref.WeakValueDictionary()
+        self._waiting: weakref.WeakKeyDictionary[asyncio.Lock, int] = weakref.WeakKeyDictionary()
+        self._acquisitions = 0
+        self._contended_acquisitions = 0
+        self._rejected = 0
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether some in-flight request still holds the lock for ``key``."""
+        return key in self._locks
+
+    def lock_for(self, key: _SessionKey) -> asyncio.Lock:
+        """Return the shared lock for one session key."""
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[key] = lock
+        return lock
+
+    async def acquire(self, lock: asyncio.Lock, *, max_waiting: int) -> bool:
+        """Acquire ``lock`` unless ``max_waiting`` requests already queue behind its holder.
+
+        Returns False, without waiting, when the queue is full.
+        """
+        contended = lock.locked()
+        waiting = self._waiting.get(lock, 0)
+        if contended and waiting >= max_waiting:
+            self._rejected += 1
+            return False
+        self._waiting[lock] = waiting + 1
+        started_at = self._clock()
+        try:
+            await lock.acquire()
+        finally:
+            remaining = self._waiting.get(lock, 1) - 1
+            if remaining > 0:
+                self._waiting[lock] = remaining
+            else:
+                self._waiting.pop(lock, None)
+        waited = self._clock() - started_at
+        self._acquisitions += 1
+        if contended:
+            self._contended_acquisitions += 1
+        self._wait_seconds_total += waited
+        self._wait_seconds_max = max(self._wait_seconds_max, waited)
+        return True
+
+    def stats(self) -> OpenAISessionLockStats:
+        """Return a snapshot of the table's counters."""
+        return OpenAISessionLockStats(
+            active_sessions=len(self._locks),
+            waiting=sum(self._waiting.values()),
+            acquisitions=self._acquisitions,
+            contended_acquisitions=self._contended_acquisitions,
+            rejected=self._rejected,
+            wait_seconds_total=self._wait_seconds_total,
+            wait_seconds_max=self._wait_seconds_max,
+        )
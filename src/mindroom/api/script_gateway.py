@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Annotated, Protocol, cast
+from typing import TYPE_CHECKING, Annotated, Protocol, cast
 
-from fastapi import APIRouter, FastAPI, Header, HTTPException, Request, Response
+from fastapi import APIRouter, FastAPI, Header, HTTPException, Query, Request, Response
 from pydantic import BaseModel, ConfigDict, Field, JsonValue, ValidationError
 
 from mindroom.script_runs.broker import (
@@ -22,16 +22,27 @@ from mindroom.script_runs.store import (
     ScriptRunNotFoundError,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 __all__ = [
+    "ScriptCallBatchItemResponse",
+    "ScriptCallBatchResponse",
     "ScriptCallReceiptResponse",
+    "ScriptToolCallBatchRequestModel",
     "ScriptToolCallRequestModel",
     "bind_script_tool_broker",
     "get_script_call",
     "router",
     "submit_script_call",
+    "submit_script_call_batch",
 ]
 
 _MAX_REQUEST_BYTES = 64 * 1024
+# A batch carries at most this many calls, each still within the single-call bound.
+_MAX_BATCH_CALLS = 32
+_MAX_BATCH_REQUEST_BYTES = 512 * 1024
+_MAX_RECEIPT_WAIT_SECONDS = 30.0
 
 
 class _ScriptGatewayBroker(Protocol):
@@ -45,6 +56,25 @@ class _ScriptGatewayBroker(Protocol):
         """Authenticate and durably claim one stable call."""
         ...
 
+    async def accept_many_authenticated(
+        self,
+        requests: Sequence[ScriptToolCallRequest],
+        authorization: str | None,
+    ) -> list[ScriptCallRecord | BaseException]:
+        """Authenticate and durably claim independent calls, one outcome per request."""
+        ...
+
+    async def wait_authenticated(
+        self,
+        run_id: str,
+        call_id: str,
+        authorization: str | None,
+        *,
+        timeout_seconds: float,
+    ) -> None:
+        """Authenticate and wait a bounded time for one call's execution to finish."""
+        ...
+
     async def get_authenticated(
         self,
         run_id: str,
@@ -76,6 +106,14 @@ class ScriptToolCallRequestModel(BaseModel):
         )
 
 
+class ScriptToolCallBatchRequestModel(BaseModel):
+    """Strict untrusted wire payload for independent calls of one run."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    calls: list[ScriptToolCallRequestModel] = Field(min_length=1, max_length=_MAX_BATCH_CALLS)
+
+
 class ScriptCallReceiptResponse(BaseModel):
     """Bounded JSON receipt returned to the stdlib SDK."""
 
@@ -105,6 +143,21 @@ class ScriptCallReceiptResponse(BaseModel):
         )
 
 
+class ScriptCallBatchItemResponse(BaseModel):
+    """One batched call's outcome, carrying the status its own request would have had."""
+
+    call_id: str
+    status_code: int
+    receipt: ScriptCallReceiptResponse | None = None
+    detail: str | None = None
+
+
+class ScriptCallBatchResponse(BaseModel):
+    """Per-call outcomes in request order."""
+
+    results: list[ScriptCallBatchItemResponse]
+
+
 router = APIRouter(prefix="/api/script-gateway", tags=["script-gateway"])
 
 
@@ -127,31 +180,62 @@ def _app_script_tool_broker(app: FastAPI) -> _ScriptGatewayBroker:
     return cast("_ScriptGatewayBroker", broker)
 
 
-async def _bounded_payload(request: Request) -> ScriptToolCallRequestModel:
+async def _bounded_body(request: Request, *, max_bytes: int) -> bytes:
     content_length = request.headers.get("content-length")
     if content_length is not None:
         try:
             declared_bytes = int(content_length)
         except ValueError as exc:
             raise HTTPException(status_code=400, detail="Invalid Content-Length header.") from exc
-        if declared_bytes > _MAX_REQUEST_BYTES:
+        if declared_bytes > max_bytes:
             raise HTTPException(status_code=413, detail="Script call request is too large.")
 
     body = bytearray()
     async for chunk in request.stream():
         body.extend(chunk)
-        if len(body) > _MAX_REQUEST_BYTES:
+        if len(body) > max_bytes:
             raise HTTPException(status_code=413, detail="Script call request is too large.")
+    return bytes(body)
+
+
+async def _bounded_payload(request: Request) -> ScriptToolCallRequestModel:
+    body = await _bounded_body(request, max_bytes=_MAX_REQUEST_BYTES)
     try:
-        return ScriptToolCallRequestModel.model_validate_json(bytes(body))
+        return ScriptToolCallRequestModel.model_validate_json(body)
     except ValidationError as exc:
         raise HTTPException(status_code=422, detail=exc.errors(include_url=False)) from exc
 
 
+async def _bounded_batch_payload(request: Request) -> ScriptToolCallBatchRequestModel:
+    body = await _bounded_body(request, max_bytes=_MAX_BATCH_REQUEST_BYTES)
+    try:
+        payload = ScriptToolCallBatchRequestModel.model_validate_json(body)
+    except ValidationError as exc:
+        raise HTTPException(status_code=422, detail=exc.errors(include_url=False)) from exc
+    if len({call.run_id for call in payload.calls}) != 1:
+        raise HTTPException(status_code=422, detail="A script call batch must belong to one run.")
+    if len({call.call_id for call in payload.calls}) != len(payload.calls):
+        raise HTTPException(status_code=422, detail="A script call batch cannot repeat a call ID.")
+    return payload
+
+
 def _unavailable() -> HTTPException:
     return HTTPException(status_code=404, detail="Background script call is unavailable.")
 
 
+def _acceptance_error(exc: BaseException) -> HTTPException | None:
+    """Map a broker acceptance failure to the response a script sees, if it is an expected one."""
+    if isinstance(exc, (ScriptBrokerAuthenticationError, ScriptCapabilityError, ScriptRunNotFoundError)):
+        return _unavailable()
+    if isinstance(exc, ScriptRuntimeUnavailableError):
+        return HTTPException(status_code=503, detail=str(exc))
+    if isinstance(exc, ScriptCallConflictError):
+        return HTTPException(status_code=409, detail="Stable call ID conflicts with its accepted request.")
+    if isinstance(exc, ScriptCallRateLimitError):
+        return HTTPException(status_code=429, detail=str(exc))
+    return None
+
+
 @router.post("/calls", response_model=ScriptCallReceiptResponse)
 async def submit_script_call(
     request: Request,
@@ -163,29 +247,84 @@ async def submit_script_call(
     broker = _app_script_tool_broker(request.app)
     try:
         receipt = await broker.accept_authenticated(payload.to_domain(), authorization)
-    except (ScriptBrokerAuthenticationError, ScriptCapabilityError, ScriptRunNotFoundError) as exc:
-        raise _unavailable() from exc
-    except ScriptRuntimeUnavailableError as exc:
-        raise HTTPException(status_code=503, detail=str(exc)) from exc
-    except ScriptCallConflictError as exc:
-        raise HTTPException(status_code=409, detail="Stable call ID conflicts with its accepted request.") from exc
-    except ScriptCallRateLimitError as exc:
-        raise HTTPException(status_code=429, detail=str(exc)) from exc
+    except Exception as exc:
+        error = _acceptance_error(exc)
+        if error is None:
+            raise
+        raise error from exc
     if receipt.state is ScriptCallState.PENDING:
         response.status_code = 202
     return ScriptCallReceiptResponse.from_domain(receipt)
 
 
+@router.post("/calls/batch", response_model=ScriptCallBatchResponse)
+async def submit_script_call_batch(
+    request: Request,
+    authorization: Annotated[str | None, Header()] = None,
+) -> ScriptCallBatchResponse:
+    """Authenticate and accept independent stable calls of one run in one request.
+
+    Each call keeps the single-call size bound and is answered with the status
+    its own ``POST /calls`` would have returned, so one refused call does not
+    refuse the batch.
+    """
+    payload = await _bounded_batch_payload(request)
+    broker = _app_script_tool_broker(request.app)
+    admitted = [call for call in payload.calls if len(call.model_dump_json().encode()) <= _MAX_REQUEST_BYTES]
+    outcomes = dict(
+        zip(
+            (call.call_id for call in admitted),
+            await broker.accept_many_authenticated([call.to_domain() for call in admitted], authorization),
+            strict=True,
+        ),
+    )
+    results: list[ScriptCallBatchItemResponse] = []
+    for call in payload.calls:
+        outcome = outcomes.get(call.call_id)
+        if outcome is None:
+            results.append(
+                ScriptCallBatchItemResponse(
+                    call_id=call.call_id,
+                    status_code=413,
+                    detail="Script call request is too large.",
+                ),
+            )
+        elif isinstance(outcome, ScriptCallRecord):
+            results.append(
+                ScriptCallBatchItemResponse(
+                    call_id=call.call_id,
+                    status_code=202 if outcome.state is ScriptCallState.PENDING else 200,
+                    receipt=ScriptCallReceiptResponse.from_domain(outcome),
+                ),
+            )
+        else:
+            error = _acceptance_error(outcome)
+            if error is None:
+                raise outcome
+            results.append(
+                ScriptCallBatchItemResponse(call_id=call.call_id, status_code=error.status_code, detail=error.detail),
+            )
+    return ScriptCallBatchResponse(results=results)
+
+
 @router.get("/runs/{run_id}/calls/{call_id}", response_model=ScriptCallReceiptResponse)
 async def get_script_call(
     request: Request,
     run_id: str,
     call_id: str,
     authorization: Annotated[str | None, Header()] = None,
+    wait_seconds: Annotated[float, Query(ge=0, le=_MAX_RECEIPT_WAIT_SECONDS)] = 0.0,
 ) -> ScriptCallReceiptResponse:
-    """Authenticate and return the current stable receipt for one logical call."""
+    """Authenticate and return the current stable receipt for one logical call.
+
+    With ``wait_seconds``, a call this gateway is still executing is awaited up
+    to that long first, so the script learns of its result when it lands
+    instead of on its next poll.
+    """
     broker = _app_script_tool_broker(request.app)
     try:
+        if wait_seconds > 0:
+            await broker.wait_authenticated(run_id, call_id, authorization, timeout_seconds=wait_seconds)
         receipt = await broker.get_authenticated(run_id, call_id, authorization)
     except (ScriptBrokerAuthenticationError, ScriptCallNotFoundError, ScriptRunNotFoundError) as exc:
         raise _unavailable() from exc
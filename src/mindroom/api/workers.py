@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import JSONResponse
 
 from mindroom.api import config_lifecycle
 from mindroom.api.worker_responses import (
@@ -13,6 +14,7 @@ from mindroom.api.worker_responses import (
     SandboxWorkerResponse,
     serialize_sandbox_worker_response,
 )
+from mindroom.workers.backend import worker_claim_stats
 from mindroom.workers.runtime import lease_configured_primary_worker_manager
 
 if TYPE_CHECKING:
@@ -26,6 +28,7 @@ __all__ = [
     "cleanup_idle_workers",
     "list_workers",
     "router",
+    "worker_claims",
 ]
 
 router = APIRouter(prefix="/api/workers", tags=["workers"])
@@ -67,3 +70,13 @@ async def cleanup_idle_workers(request: Request) -> SandboxWorkerCleanupResponse
         idle_timeout_seconds=worker_manager.idle_timeout_seconds,
         cleaned_workers=cleaned_workers,
     )
+
+
+@router.get("/claims")
+async def worker_claims(request: Request) -> JSONResponse:
+    """Report warm and cold worker claim latencies from the configured backend."""
+    with _worker_manager_lease(request) as worker_manager:
+        stats = worker_claim_stats(worker_manager)
+    if stats is None:
+        raise HTTPException(status_code=404, detail="Worker backend does not record claim latencies.")
+    return JSONResponse(content=stats.as_dict())
@@ -53,6 +53,7 @@ from mindroom.matrix.health import (
 from mindroom.matrix.presence import build_agent_status_message, set_presence_status
 from mindroom.matrix.room_cleanup import cleanup_all_orphaned_bots
 from mindroom.matrix.rooms import leave_non_dm_rooms
+from mindroom.matrix.shared_ingestion import shared_ingestion_sync_filter
 from mindroom.matrix.state import resolve_room_aliases
 from mindroom.matrix.sync_certification import (
     SyncCertificationDecision,
@@ -81,6 +82,7 @@ from mindroom.runtime_shutdown import (
 )
 from mindroom.stop import StopManager
 from mindroom.teams import TeamMode, TeamOutcome, resolve_configured_team
+from mindroom.thread_tags import forget_thread_tags_sync, observe_thread_tags_sync
 from mindroom.timestamp_formatting import format_timestamp_ms
 from mindroom.tool_approval import is_process_active_approval_card
 from mindroom.tool_system.runtime_context import ToolRuntimeSupport
@@ -110,6 +112,7 @@ from .event_journal import (
     EventClass,
     EventJournalStore,
     EventKind,
+    InflightStreamRecoveryView,
     MembershipFence,
     PrincipalStore,
     SemanticConsumer,
@@ -952,6 +955,24 @@ class AgentBot:
         """Return whether this bot generation completed its first sync."""
         return self._first_sync_done
 
+    def shared_ingestion_room_ids(self) -> frozenset[str]:
+        """Return the rooms whose shared-ingress events this account must admit."""
+        configured_room_ids = frozenset(room_id for room_id in self.rooms if room_id.startswith("!"))
+        client = self.client
+        if client is None:
+            return configured_room_ids
+        # A configured room this account has not joined yet still belongs to
+        # it: its own sync filter no longer downloads those events.
+        return configured_room_ids | frozenset(client.rooms)
+
+    def shared_ingestion_ready(self) -> bool:
+        """Return whether shared-ingress events can be admitted for this account now."""
+        return self.running and self.client is not None and self._first_sync_done
+
+    async def admit_shared_event(self, room_id: str, event: nio.Event) -> None:
+        """Durably admit one event the process-wide shared ingress received for this account."""
+        await self._journal_dispatcher.admit_shared_event(room_id, event)
+
     @property
     def config(self) -> Config:
         """Return the canonical live config."""
@@ -989,6 +1010,11 @@ class AgentBot:
         """Return this bot principal's complete event-journal view."""
         return self._journal_store.principal(self._journal_principal_id)
 
+    @property
+    def inflight_stream_index(self) -> InflightStreamRecoveryView:
+        """Return this bot principal's journal index of streams startup recovery must visit."""
+        return self._journal_store.principal(self._journal_principal_id)
+
     @property
     def runtime_started_at(self) -> float:
         """Return when this bot runtime started."""
@@ -1863,6 +1889,7 @@ class AgentBot:
         if self._sync_shutting_down:
             return
 
+        observe_thread_tags_sync(self.agent_user.user_id, _response)
         if isinstance(_response, nio.SyncResponse):
             (
                 room_member_join_hook_plan,
@@ -2249,6 +2276,7 @@ class AgentBot:
         self._room_member_join_hooks_armed = False
         self._room_member_callback_registered = False
         clear_matrix_sync_state(self.agent_name)
+        forget_thread_tags_sync(self.agent_user.user_id)
         await self._emit_agent_lifecycle_event(EVENT_AGENT_STOPPED, stop_reason=shutdown_intent.stop_reason)
 
         call_manager = self._call_manager
@@ -2434,7 +2462,11 @@ class AgentBot:
                     agent_name=self.agent_name,
                     room_ids=self.rooms,
                     timeout_ms=_SYNC_TIMEOUT_MS,
-                    sync_filter=_SYNC_FILTER,
+                    sync_filter=(
+                        shared_ingestion_sync_filter(_SYNC_FILTER)
+                        if self.config.matrix_sync.shared_ingestion
+                        else _SYNC_FILTER
+                    ),
                     first_sync_done=self._first_sync_done and not self._classic_sync_rebuild_pending,
                 )
             finally:
@@ -0,0 +1,72 @@
+"""Per-entity resolution results compiled once for a validated ``Config``.
+
+Dispatching one turn resolves the same handful of per-entity values again and
+again: the agent's tool config entries, its history and compaction settings,
+its knowledge base IDs and its delegation closure. Each resolution rebuilds
+lists and dicts from the pydantic models, and the delegation closure rebuilds
+the policy seeds of every agent first, so the cost of preparing one dispatch
+grows with the size of the whole config.
+
+A validated config is immutable: hot reload and every API or tool edit build
+a new one. ``Config.validate_with_runtime`` therefore compiles this index once,
+as its last step, and the resolution methods answer from it with one dictionary
+lookup, falling back to resolving from the models for names the index does not
+hold. Configs built without runtime validation (``Config(...)``,
+``model_validate``, ``model_copy``) carry no index and resolve every call. Code
+that needs different values must revalidate or construct a new config; editing
+a validated config in place leaves its index serving the old values.
+
+Cached values are shared between callers. List-valued results are handed out
+as fresh lists, but the entries themselves (frozen dataclasses, the compaction
+config model) must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from mindroom.config.main import Config
+    from mindroom.config.models import CompactionConfig, EffectiveToolConfig
+    from mindroom.history.types import ResolvedHistorySettings
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledEntityIndex:
+    """Resolution results for every configured agent and team of one config."""
+
+    authored_tool_configs: Mapping[str, tuple[EffectiveToolConfig, ...]]
+    tool_configs: Mapping[str, tuple[EffectiveToolConfig, ...]]
+    history_settings: Mapping[str, ResolvedHistorySettings]
+    compaction_configs: Mapping[str, CompactionConfig]
+    knowledge_base_ids: Mapping[str, tuple[str, ...]]
+    delegation_closures: Mapping[str, frozenset[str]]
+    configured_rooms: frozenset[str]
+
+
+def compile_entity_index(config: Config) -> CompiledEntityIndex:
+    """Resolve every per-entity value the dispatch path reads, once."""
+    entity_names = [*config.agents, *config.teams]
+    authored_tool_configs = {
+        agent_name: tuple(config._resolve_agent_authored_tool_configs(agent_name)) for agent_name in config.agents
+    }
+    closures: dict[str, frozenset[str]] = {}
+    for agent_name in config.agents:
+        config._resolve_agent_delegation_closure(agent_name, closures=closures)
+    return CompiledEntityIndex(
+        authored_tool_configs=authored_tool_configs,
+        tool_configs={
+            agent_name: tuple(config._expand_agent_tool_configs(entries))
+            for agent_name, entries in authored_tool_configs.items()
+        },
+        history_settings={name: config._resolve_entity_history_settings(name) for name in entity_names},
+        compaction_configs={name: config._resolve_entity_compaction_config(name) for name in entity_names},
+        knowledge_base_ids={
+            agent_name: tuple(config._resolve_agent_knowledge_base_ids(agent_name)) for agent_name in config.agents
+        },
+        delegation_closures={agent_name: closures[agent_name] for agent_name in config.agents},
+        configured_rooms=frozenset(config._resolve_all_configured_rooms()),
+    )
@@ -26,10 +26,11 @@ class ResolvedEntityView:
     Every field is a resolved value: defaults applied and entity-vs-default fallbacks already collapsed.
     Construction never validates `name`; each field raises the same error the underlying resolution
     raises for unknown entities.
-    Views are cheap per-call snapshots over one loaded ``Config``; config hot-reload replaces the
+    Views are cheap handles over one loaded ``Config``; config hot-reload replaces the
     ``Config`` object, so never store a view beyond the current operation.
-    Views compare by identity (``eq=False``): each `resolve_entity` call returns a fresh view,
-    and every field access resolves fresh values, so nothing survives a config reload by accident.
+    Views compare by identity (``eq=False``). A runtime-validated config hands out one view per
+    name and answers fields from its compiled entity index; any other config returns a fresh view
+    per `resolve_entity` call that resolves every field access from the models.
     """
 
     _config: Config = field(repr=False)
@@ -93,6 +93,13 @@ class KnowledgeBaseConfig(BaseModel):
         ge=0,
         description="Number of overlapping characters between adjacent chunks",
     )
+    hybrid_search: bool = Field(
+        default=False,
+        description=(
+            "Also build a BM25 lexical index from the indexed chunks and fuse it with vector search, "
+            "so exact identifiers such as error codes, function names, and ticket ids are found"
+        ),
+    )
     include_extensions: list[str] | None = Field(
         default=None,
         description="Optional file extensions to index instead of the default text-like set, for example ['.md', '.py']",
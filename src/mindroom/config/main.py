@@ -6,7 +6,7 @@ import re
 from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, ClassVar, Literal, cast
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, Self, cast
 
 import yaml
 from pydantic import (
@@ -33,6 +33,7 @@ from mindroom.config.agent import AgentConfig, CultureConfig, RoomConfig, TeamCo
 from mindroom.config.approval import ToolApprovalConfig
 from mindroom.config.auth import AuthorizationConfig
 from mindroom.config.calls import CallsConfig, CascadedCallProfile
+from mindroom.config.entity_index import CompiledEntityIndex, compile_entity_index
 from mindroom.config.entity_view import ResolvedEntityView
 from mindroom.config.external_trigger_policy import ExternalTriggerPolicyConfig
 from mindroom.config.knowledge import KnowledgeBaseConfig
@@ -93,7 +94,7 @@ from mindroom.tool_system.worker_routing import unsupported_shared_only_integrat
 from mindroom.workspaces import validate_workspace_template_dir
 
 if TYPE_CHECKING:
-    from collections.abc import Collection
+    from collections.abc import Collection, Iterable, Mapping
 
     from mindroom.tool_system.catalog import ToolValidationInfo
     from mindroom.tool_system.worker_routing import WorkerScope
@@ -382,6 +383,8 @@ class Config(BaseModel):
     _runtime_approved_egress_injected_default_tool: bool = PrivateAttr(default=False)
     _runtime_approved_egress_injected_approval_rule: bool = PrivateAttr(default=False)
     _runtime_knowledge_base_overlays: dict[str, KnowledgeBaseConfig] = PrivateAttr(default_factory=dict)
+    _entity_index: CompiledEntityIndex | None = PrivateAttr(default=None)
+    _entity_views: dict[str | None, ResolvedEntityView] = PrivateAttr(default_factory=dict)
 
     PRIVATE_KNOWLEDGE_BASE_ID_PREFIX: ClassVar[str] = "__agent_private__:"
     TOOL_PRESETS: ClassVar[dict[str, tuple[str, ...]]] = {
@@ -1084,6 +1087,18 @@ class Config(BaseModel):
                 config._validate_authored_tool_entries(runtime_paths)
         except (PluginValidationError, ToolConfigOverrideError, ToolMetadataValidationError) as exc:
             raise ConfigRuntimeValidationError(str(exc)) from exc
+        config._entity_index = compile_entity_index(config)
+        return config
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Return a copy that resolves per-entity values from its own fields.
+
+        A copy may change the fields the compiled entity index was built from,
+        so it starts without one (see ``mindroom.config.entity_index``).
+        """
+        config = super().model_copy(update=update, deep=deep)
+        config._entity_index = None
+        config._entity_views = {}
         return config
 
     def authored_model_dump(self) -> dict[str, Any]:
@@ -1119,6 +1134,8 @@ class Config(BaseModel):
             **self._runtime_knowledge_base_overlays,
             base_id: base_config,
         }
+        # An overlay only adds a knowledge base; every per-entity value is unchanged.
+        config._entity_index = self._entity_index
         return config
 
     def runtime_knowledge_base_overlay(self, base_id: str) -> KnowledgeBaseConfig | None:
@@ -1164,6 +1181,13 @@ class Config(BaseModel):
 
     def _entity_history_settings(self, entity_name: str) -> ResolvedHistorySettings:
         """Return effective replay settings for one configured agent or team."""
+        index = self._entity_index
+        if index is not None and entity_name in index.history_settings:
+            return index.history_settings[entity_name]
+        return self._resolve_entity_history_settings(entity_name)
+
+    def _resolve_entity_history_settings(self, entity_name: str) -> ResolvedHistorySettings:
+        """Resolve effective replay settings for one configured agent or team from the models."""
         if entity_name in self.agents:
             entity = self.get_agent(entity_name)
         elif entity_name in self.teams:
@@ -1204,6 +1228,13 @@ class Config(BaseModel):
 
     def _entity_compaction_config(self, entity_name: str) -> CompactionConfig:
         """Return the effective destructive compaction config for one configured agent or team."""
+        index = self._entity_index
+        if index is not None and entity_name in index.compaction_configs:
+            return index.compaction_configs[entity_name]
+        return self._resolve_entity_compaction_config(entity_name)
+
+    def _resolve_entity_compaction_config(self, entity_name: str) -> CompactionConfig:
+        """Resolve the effective destructive compaction config for one configured agent or team."""
         base = self.defaults.compaction
         defaults_enabled = base.enabled if base is not None else False
         merged = base.model_dump() if base is not None else {}
@@ -1250,7 +1281,12 @@ class Config(BaseModel):
 
     def resolve_entity(self, entity_name: str | None) -> ResolvedEntityView:
         """Return the resolved config view for one entity, or the defaults-only scope for None."""
-        return ResolvedEntityView(_config=self, name=entity_name)
+        if self._entity_index is None:
+            return ResolvedEntityView(_config=self, name=entity_name)
+        view = self._entity_views.get(entity_name)
+        if view is None:
+            view = self._entity_views.setdefault(entity_name, ResolvedEntityView(_config=self, name=entity_name))
+        return view
 
     def get_model_context_window(self, model_name: str) -> int | None:
         """Return the configured context window for one model name, when known."""
@@ -1362,6 +1398,13 @@ class Config(BaseModel):
 
     def _agent_knowledge_base_ids(self, agent_name: str) -> list[str]:
         """Return shared and private knowledge base IDs assigned to one agent."""
+        index = self._entity_index
+        if index is not None and agent_name in index.knowledge_base_ids:
+            return list(index.knowledge_base_ids[agent_name])
+        return self._resolve_agent_knowledge_base_ids(agent_name)
+
+    def _resolve_agent_knowledge_base_ids(self, agent_name: str) -> list[str]:
+        """Resolve shared and private knowledge base IDs assigned to one agent from the models."""
         agent_config = self.get_agent(agent_name)
         base_ids = list(agent_config.knowledge_bases)
         private_base_id = self._agent_private_knowledge_base_id(agent_name)
@@ -1502,6 +1545,13 @@ class Config(BaseModel):
 
     def _get_agent_authored_tool_configs(self, agent_name: str) -> list[EffectiveToolConfig]:
         """Return effective authored tool config entries before preset/implied expansion."""
+        index = self._entity_index
+        if index is not None and agent_name in index.authored_tool_configs:
+            return list(index.authored_tool_configs[agent_name])
+        return self._resolve_agent_authored_tool_configs(agent_name)
+
+    def _resolve_agent_authored_tool_configs(self, agent_name: str) -> list[EffectiveToolConfig]:
+        """Resolve effective authored tool config entries from the models."""
         from mindroom.tool_system.catalog import apply_authored_overrides  # noqa: PLC0415
 
         agent_config = self.get_agent(agent_name)
@@ -1562,8 +1612,15 @@ class Config(BaseModel):
 
     def _agent_tool_configs(self, agent_name: str) -> list[EffectiveToolConfig]:
         """Return effective runtime tool config entries for each authored owner."""
+        index = self._entity_index
+        if index is not None and agent_name in index.tool_configs:
+            return list(index.tool_configs[agent_name])
+        return self._expand_agent_tool_configs(self._get_agent_authored_tool_configs(agent_name))
+
+    def _expand_agent_tool_configs(self, authored_entries: Iterable[EffectiveToolConfig]) -> list[EffectiveToolConfig]:
+        """Expand authored tool config entries into one runtime entry per preset/implied tool."""
         effective_entries = []
-        for authored_entry in self._get_agent_authored_tool_configs(agent_name):
+        for authored_entry in authored_entries:
             if not self._tool_name_is_available(authored_entry.name):
                 continue
             effective_entries.extend(
@@ -1656,6 +1713,21 @@ class Config(BaseModel):
         closures: dict[str, frozenset[str]] | None = None,
     ) -> frozenset[str]:
         """Return one agent plus all agents reachable through transitive delegation."""
+        index = self._entity_index
+        if index is not None and agent_name in index.delegation_closures:
+            closure = index.delegation_closures[agent_name]
+            if closures is not None:
+                closures.setdefault(agent_name, closure)
+            return closure
+        return self._resolve_agent_delegation_closure(agent_name, closures=closures)
+
+    def _resolve_agent_delegation_closure(
+        self,
+        agent_name: str,
+        *,
+        closures: dict[str, frozenset[str]] | None = None,
+    ) -> frozenset[str]:
+        """Resolve one agent's transitive delegation closure from the models."""
         return get_agent_delegation_closure(
             agent_name,
             build_agent_policy_seeds(
@@ -1786,6 +1858,12 @@ class Config(BaseModel):
             Set of all unique room references from room, agent, and team configurations
 
         """
+        if self._entity_index is not None:
+            return set(self._entity_index.configured_rooms)
+        return self._resolve_all_configured_rooms()
+
+    def _resolve_all_configured_rooms(self) -> set[str]:
+        """Collect every configured room reference from the models."""
         all_room_aliases = set(self.rooms)
         for agent_config in self.agents.values():
             all_room_aliases.update(agent_config.rooms)
@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Literal, Self
 
-from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator, model_validator
 
 from mindroom.config.validation import duplicate_items
 from mindroom.matrix_identifiers import managed_room_key_from_alias_localpart, room_alias_localpart
@@ -42,6 +42,22 @@ class MatrixSyncConfig(BaseModel):
             " connection-scoped, so this also bounds how many per-room events a restarted connection can replay."
         ),
     )
+    shared_ingestion: bool = Field(
+        default=False,
+        description=(
+            "Receive plaintext room events once through the application-service transaction endpoint and fan them"
+            " out to every joined agent account. Per-account classic syncs keep state, membership, encrypted"
+            " events, and to-device traffic. Requires mode 'classic' and MATRIX_APPSERVICE_HS_TOKEN."
+        ),
+    )
+
+    @model_validator(mode="after")
+    def validate_shared_ingestion_mode(self) -> Self:
+        """Reject shared ingestion on transports that cannot exclude fanned-out event types."""
+        if self.shared_ingestion and self.mode != "classic":
+            msg = "matrix_sync.shared_ingestion requires matrix_sync.mode 'classic'"
+            raise ValueError(msg)
+        return self
 
 
 class MindRoomUserConfig(BaseModel):
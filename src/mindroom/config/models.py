@@ -58,6 +58,18 @@ class StreamingConfig(BaseModel):
             "a background timer)."
         ),
     )
+    adaptive_cadence: bool = Field(
+        default=True,
+        description=(
+            "Pace streamed edits by the homeserver's observed edit round-trip time and rate limits, "
+            "on top of the fixed intervals above"
+        ),
+    )
+    target_inflight_edits: float = Field(
+        default=2.0,
+        gt=0,
+        description="Edits the adaptive cadence aims to keep in flight per homeserver across all streams",
+    )
 
 
 class CoalescingConfig(BaseModel):
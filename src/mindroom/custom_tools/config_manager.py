@@ -1152,11 +1152,11 @@ class ConfigManagerTools(Toolkit):
             )
 
             # Add to config
-            config.agents[agent_name] = new_agent
+            updated_config = config.model_copy(update={"agents": {**config.agents, agent_name: new_agent}})
 
             # Save config
             persisted_config = validate_and_persist_config_payload(
-                config.authored_model_dump(),
+                updated_config.authored_model_dump(),
                 self.runtime_paths,
             )
 
@@ -1344,10 +1344,10 @@ class ConfigManagerTools(Toolkit):
             )
 
             # Add to config
-            config.teams[team_name] = new_team
+            updated_config = config.model_copy(update={"teams": {**config.teams, team_name: new_team}})
 
             # Save config
-            validate_and_persist_config_payload(config.authored_model_dump(), self.runtime_paths)
+            validate_and_persist_config_payload(updated_config.authored_model_dump(), self.runtime_paths)
 
             return (
                 f"✅ Successfully created team '{team_name}'!\n\n"
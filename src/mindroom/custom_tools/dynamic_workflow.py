@@ -78,6 +78,11 @@ _TOOL_DESCRIPTIONS = {
     ),
     "update_workflow": "Create and publish a new Dynamic Workflow revision from a patch.",
     "run_workflow": "Run a Dynamic Workflow and persist step outputs plus report artifacts.",
+    "resume_workflow_run": (
+        "Resume a failed or interrupted Dynamic Workflow run as a new run with the same revision and input. "
+        "Steps the earlier run completed are replayed instead of executed again; "
+        "the workflow spec must set resumable: true or memoize_ttl_seconds."
+    ),
     "get_workflow_run": "Read one Dynamic Workflow run record.",
     "list_workflows": "List Dynamic Workflows available in one scope.",
     "list_workflow_revisions": "List immutable revisions for one Dynamic Workflow.",
@@ -118,6 +123,15 @@ _TOOL_PARAMETERS: dict[str, dict[str, object]] = {
         },
         "required": ["workflow_id", "input"],
     },
+    "resume_workflow_run": {
+        "type": "object",
+        "properties": {
+            "workflow_id": {"type": "string"},
+            "run_id": {"type": "string"},
+            "scope": {"type": "string"},
+        },
+        "required": ["workflow_id", "run_id"],
+    },
     "get_workflow_run": {
         "type": "object",
         "properties": {
@@ -157,6 +171,7 @@ class DynamicWorkflowTools(Toolkit):
                 "validate_workflow": self.validate_workflow,
                 "update_workflow": self.update_workflow,
                 "run_workflow": self.run_workflow,
+                "resume_workflow_run": self.resume_workflow_run,
                 "get_workflow_run": self.get_workflow_run,
                 "list_workflows": self.list_workflows,
                 "list_workflow_revisions": self.list_workflow_revisions,
@@ -166,6 +181,7 @@ class DynamicWorkflowTools(Toolkit):
                 "validate_workflow": self.avalidate_workflow,
                 "update_workflow": self.aupdate_workflow,
                 "run_workflow": self.arun_workflow,
+                "resume_workflow_run": self.aresume_workflow_run,
                 "get_workflow_run": self.aget_workflow_run,
                 "list_workflows": self.alist_workflows,
                 "list_workflow_revisions": self.alist_workflow_revisions,
@@ -313,6 +329,50 @@ class DynamicWorkflowTools(Toolkit):
             step_count=len(run.steps),
         )
 
+    def resume_workflow_run(
+        self,
+        workflow_id: str,
+        run_id: str,
+        scope: str = "agent",
+    ) -> str:
+        """Resume a failed or interrupted Dynamic Workflow run, replaying the steps it completed."""
+        context = get_tool_runtime_context()
+        if context is None:
+            return self._context_error()
+        try:
+            store, owner_id = dynamic_workflow_store_and_owner(context, scope)
+            previous_run = store.get_workflow_run(
+                workflow_id=workflow_id,
+                scope=scope,
+                owner_id=owner_id,
+                run_id=run_id,
+            )
+            authorize_dynamic_workflow_run(context, previous_run)
+            service = DynamicWorkflowService(
+                store,
+                participant_executor=_participant_executor(context, workflow_id),
+                spec_validator=lambda spec: _validate_workflow_policy_for_context(context, spec),
+            )
+            run = service.resume_workflow_run(
+                previous_run,
+                requested_by=context.requester_id,
+                base_url=context.runtime_paths.env_value("MINDROOM_PUBLIC_URL"),
+            )
+        except DynamicWorkflowError as exc:
+            return self._payload("error", workflow_id=workflow_id, run_id=run_id, message=str(exc))
+        return self._payload(
+            run.status,
+            workflow_id=run.workflow_id,
+            run_id=run.run_id,
+            resumed_run_id=run_id,
+            revision=run.revision,
+            report_url=run.report_url,
+            artifacts=run.artifacts,
+            outputs=run.outputs,
+            error=run.error,
+            step_count=len(run.steps),
+        )
+
     def get_workflow_run(
         self,
         workflow_id: str,
@@ -450,6 +510,50 @@ class DynamicWorkflowTools(Toolkit):
             step_count=len(run.steps),
         )
 
+    async def aresume_workflow_run(
+        self,
+        workflow_id: str,
+        run_id: str,
+        scope: str = "agent",
+    ) -> str:
+        """Resume a failed or interrupted Dynamic Workflow run, replaying the steps it completed."""
+        context = get_tool_runtime_context()
+        if context is None:
+            return self._context_error()
+        try:
+            store, owner_id = dynamic_workflow_store_and_owner(context, scope)
+            previous_run = store.get_workflow_run(
+                workflow_id=workflow_id,
+                scope=scope,
+                owner_id=owner_id,
+                run_id=run_id,
+            )
+            authorize_dynamic_workflow_run(context, previous_run)
+            service = DynamicWorkflowService(
+                store,
+                async_participant_executor=_aparticipant_executor(context, workflow_id),
+                spec_validator=lambda spec: _validate_workflow_policy_for_context(context, spec),
+            )
+            run = await service.aresume_workflow_run(
+                previous_run,
+                requested_by=context.requester_id,
+                base_url=context.runtime_paths.env_value("MINDROOM_PUBLIC_URL"),
+            )
+        except DynamicWorkflowError as exc:
+            return self._payload("error", workflow_id=workflow_id, run_id=run_id, message=str(exc))
+        return self._payload(
+            run.status,
+            workflow_id=run.workflow_id,
+            run_id=run.run_id,
+            resumed_run_id=run_id,
+            revision=run.revision,
+            report_url=run.report_url,
+            artifacts=run.artifacts,
+            outputs=run.outputs,
+            error=run.error,
+            step_count=len(run.steps),
+        )
+
     async def aget_workflow_run(
         self,
         workflow_id: str,
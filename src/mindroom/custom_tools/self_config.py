@@ -203,9 +203,9 @@ class SelfConfigTools(Toolkit):
         if not updates:
             return "No changes made. All provided values match the current configuration."
 
-        config.agents[self.agent_name] = validated_agent
+        updated_config = config.model_copy(update={"agents": {**config.agents, self.agent_name: validated_agent}})
         try:
-            validate_and_persist_config_payload(config.authored_model_dump(), self.runtime_paths)
+            validate_and_persist_config_payload(updated_config.authored_model_dump(), self.runtime_paths)
         except (ValidationError, ConfigRuntimeValidationError) as exc:
             return format_invalid_config_message(exc, footer=_CONFIG_CHANGE_REJECTED_MESSAGE)
         except Exception as e:
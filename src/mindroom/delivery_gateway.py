@@ -8,6 +8,7 @@ from copy import deepcopy
 from dataclasses import dataclass, field, replace
 from html import escape as html_escape
 from typing import TYPE_CHECKING, Any, Literal
+from uuid import uuid4
 from weakref import WeakValueDictionary
 
 import nio
@@ -75,6 +76,7 @@ from mindroom.streaming import (
     PROGRESS_PLACEHOLDER,
     FinalTextTransform,
     StreamingResponse,
+    StreamStateObserver,
     TerminalEdit,
     TerminalSend,
     build_cancelled_response_update,
@@ -83,10 +85,11 @@ from mindroom.streaming import (
     classify_cancel_source,
     interactive_response_for_visible_body,
     send_streaming_response,
+    stream_needs_restart_recovery,
 )
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Awaitable, Callable
+    from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
 
     import structlog
 
@@ -114,6 +117,11 @@ _PLACEHOLDER_DELIVERY_FAILURE_REASONS = frozenset(
 )
 
 
+def _pending_stream_key() -> str:
+    """Return an in-flight stream index key for a stream that has no event ID yet."""
+    return f"pending:{uuid4().hex}"
+
+
 def _is_placeholder_delivery_failure(failure_reason: str) -> bool:
     """Return whether a placeholder-only error came from Matrix delivery itself."""
     return failure_reason in _PLACEHOLDER_DELIVERY_FAILURE_REASONS or failure_reason.startswith(
@@ -415,6 +423,8 @@ _MATRIX_DELIVERY_FAILURE_REASONS: dict[MatrixDeliveryFailureKind, str] = {
     MatrixDeliveryFailureKind.ENCRYPTION_GUARD: "encrypted delivery rejected by local trust policy",
     MatrixDeliveryFailureKind.UNKNOWN_ENCRYPTION_STATE: "room encryption state unknown",
     MatrixDeliveryFailureKind.PAYLOAD_TOO_LARGE: "matrix event exceeds the hard size limit",
+    MatrixDeliveryFailureKind.RATE_LIMITED: "matrix homeserver rate-limited the delivery",
+    MatrixDeliveryFailureKind.SUPERSEDED: "a terminal edit of the same event replaced the delivery",
     MatrixDeliveryFailureKind.SEND_EXCEPTION: "matrix delivery raised a local exception",
     MatrixDeliveryFailureKind.UNEXPECTED_RESPONSE: "matrix delivery returned an unexpected response",
 }
@@ -954,6 +964,8 @@ class DeliveryGateway:
         if request.skip_mentions:
             content[SKIP_MENTIONS_KEY] = True
         failure_reason = "durable Matrix delivery was refused"
+        pending_stream_key = _pending_stream_key()
+        await self._index_open_stream(resolved_target.room_id, pending_stream_key, content)
         try:
             outcome = await self._send_content(request, resolved_target.room_id, content)
         except SendRetryError:
@@ -965,6 +977,12 @@ class DeliveryGateway:
                 failure_reason = _matrix_delivery_failure_reason(outcome)
         if delivered is not None:
             self.deps.logger.info("Sent response", event_id=delivered.event_id, **resolved_target.log_context)
+            await self._note_stream_state(
+                resolved_target.room_id,
+                delivered.event_id,
+                content,
+                pending_stream_key=pending_stream_key,
+            )
             return delivered.event_id
         self.deps.logger.error(
             "Failed to send response to room",
@@ -1102,6 +1120,7 @@ class DeliveryGateway:
         )
 
         failure_reason = "durable Matrix edit was refused"
+        await self._index_open_stream(target.room_id, request.event_id, content)
         try:
             outcome = await self._edit_content(request, target.room_id, content)
         except SendRetryError:
@@ -1113,6 +1132,7 @@ class DeliveryGateway:
                 failure_reason = _matrix_delivery_failure_reason(outcome)
         if delivered is not None:
             self.deps.logger.info("Edited message", event_id=request.event_id, **target.log_context)
+            await self._note_stream_state(target.room_id, request.event_id, content)
             return True
         self.deps.logger.error(
             "Failed to edit message",
@@ -1602,10 +1622,86 @@ class DeliveryGateway:
             terminal_send=self._durable_terminal_send(delivery_turn_id, request.target),
             final_text_transform=self._final_text_transform(request.identity),
             transport_is_current=self._stream_transport_gate(delivery_turn_id, request.target.room_id),
+            stream_state_observer=self._stream_state_observer(request.target.room_id),
             interactive_creator_agent=self.deps.agent_name,
             interactive_source_event_id=delivery_turn_id,
         )
 
+    def _stream_state_observer(self, room_id: str) -> StreamStateObserver:
+        """Return the in-flight stream index observer for one streamed response."""
+        pending_stream_key = _pending_stream_key()
+
+        async def observe(event_id: str | None, content: dict[str, Any], *, delivered: bool) -> None:
+            if not delivered:
+                await self._index_open_stream(room_id, event_id or pending_stream_key, content)
+            elif event_id is not None:
+                await self._note_stream_state(room_id, event_id, content, pending_stream_key=pending_stream_key)
+
+        return observe
+
+    async def _index_open_stream(self, room_id: str, stream_key: str, content: Mapping[str, Any]) -> None:
+        """Index a stream revision that will leave restart-recovery work, before it is sent.
+
+        Writing first means a crash right after the send still leaves the room
+        indexed. A revision sent without an event ID yet is keyed by its
+        pending stream key until the send lands.
+        """
+        if constants.STREAM_STATUS_KEY not in content or not stream_needs_restart_recovery(content):
+            return
+        try:
+            await self.deps.outbox.record_inflight_stream(room_id=room_id, event_id=stream_key)
+        except Exception:
+            self.deps.logger.warning(
+                "Failed to index an open stream",
+                room_id=room_id,
+                event_id=stream_key,
+                exc_info=True,
+            )
+            await self._revoke_inflight_stream_coverage()
+
+    async def _note_stream_state(
+        self,
+        room_id: str,
+        event_id: str,
+        content: Mapping[str, Any],
+        *,
+        pending_stream_key: str | None = None,
+    ) -> None:
+        """Bring the in-flight stream index up to date after one delivered stream event.
+
+        A send that opened a stream moves its row from the pending stream key
+        to the event ID the homeserver assigned, and a revision that leaves
+        nothing to recover clears the row.
+        """
+        if constants.STREAM_STATUS_KEY not in content:
+            return
+        try:
+            if not stream_needs_restart_recovery(content):
+                await self.deps.outbox.clear_inflight_stream(event_id)
+            elif pending_stream_key is not None:
+                await self.deps.outbox.record_inflight_stream(room_id=room_id, event_id=event_id)
+                await self.deps.outbox.clear_inflight_stream(pending_stream_key)
+        except Exception:
+            self.deps.logger.warning(
+                "Failed to update the in-flight stream index",
+                room_id=room_id,
+                event_id=event_id,
+                exc_info=True,
+            )
+            await self._revoke_inflight_stream_coverage()
+
+    async def _revoke_inflight_stream_coverage(self) -> None:
+        """Make the next restart sweep room history after an index write failed.
+
+        The index only narrows which rooms restart recovery visits, so a
+        failed write never fails the delivery it describes; the index may now
+        be missing a stream, though, so it stops being trusted.
+        """
+        try:
+            await self.deps.outbox.revoke_inflight_stream_coverage()
+        except Exception:
+            self.deps.logger.warning("Failed to revoke in-flight stream index coverage", exc_info=True)
+
     def _stream_transport_gate(
         self,
         turn_id: str,
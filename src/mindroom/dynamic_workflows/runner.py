@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import re
 from collections.abc import Awaitable, Mapping
@@ -9,6 +10,8 @@ from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Protocol, cast
 
+from mindroom.dynamic_workflows.validation import workflow_step_dependencies
+
 _TEMPLATE_REF_RE = re.compile(r"\{([a-zA-Z0-9_.-]+)\}")
 
 
@@ -44,6 +47,16 @@ class AsyncParticipantExecutor(Protocol):
         """Run one participant with rendered prompt and prior step outputs."""
 
 
+class _StepCheckpoints(Protocol):
+    """Persisted step results that a run records and may replay instead of re-executing."""
+
+    def replay(self, step_id: str, step_outputs: Mapping[str, object]) -> Mapping[str, object] | None:
+        """Return a stored completed step that saw the same upstream outputs, if one may be reused."""
+
+    def record(self, step: Mapping[str, object], step_outputs: Mapping[str, object]) -> None:
+        """Store one completed step together with the upstream outputs it saw."""
+
+
 @dataclass(frozen=True)
 class _DynamicWorkflowStepResult:
     """Execution result for one Dynamic Workflow step."""
@@ -89,31 +102,39 @@ def execute_workflow_spec(
     input_data: dict[str, object],
     *,
     participant_executor: ParticipantExecutor | None = None,
+    checkpoints: _StepCheckpoints | None = None,
 ) -> _DynamicWorkflowExecution:
     """Execute a declarative Dynamic Workflow spec sequentially."""
     steps: list[_DynamicWorkflowStepResult] = []
     step_outputs: dict[str, object] = {}
     participants_by_id = _participants_by_id(spec)
+    raw_steps = _workflow_steps(spec)
+    ancestors = _step_ancestors(workflow_step_dependencies(raw_steps))
 
-    for raw_step in _workflow_steps(spec):
-        try:
-            result = execute_workflow_step(
-                raw_step,
-                input_data=input_data,
-                step_outputs=step_outputs,
-                participant_executor=participant_executor,
-                participants_by_id=participants_by_id,
-            )
-        except DynamicWorkflowExecutionError as exc:
-            failed_step = _failed_step(raw_step, str(exc))
-            steps.append(failed_step)
-            return _DynamicWorkflowExecution(
-                status="failed",
-                steps=steps,
-                outputs={},
-                report_markdown=_failed_report_markdown(spec, input_data, steps, str(exc)),
-                error=str(exc),
-            )
+    for raw_step in raw_steps:
+        step_id = _required_text(raw_step, "id")
+        upstream_outputs = {ancestor: step_outputs[ancestor] for ancestor in ancestors[step_id]}
+        result = _replayed_step(checkpoints, step_id, upstream_outputs)
+        if result is None:
+            try:
+                result = execute_workflow_step(
+                    raw_step,
+                    input_data=input_data,
+                    step_outputs=step_outputs,
+                    participant_executor=participant_executor,
+                    participants_by_id=participants_by_id,
+                )
+            except DynamicWorkflowExecutionError as exc:
+                failed_step = _failed_step(raw_step, str(exc))
+                steps.append(failed_step)
+                return _DynamicWorkflowExecution(
+                    status="failed",
+                    steps=steps,
+                    outputs={},
+                    report_markdown=_failed_report_markdown(spec, input_data, steps, str(exc)),
+                    error=str(exc),
+                )
+            _record_step(checkpoints, result, upstream_outputs)
         steps.append(result)
         step_outputs[result.step_id] = result.content
 
@@ -131,34 +152,49 @@ async def async_execute_workflow_spec(
     input_data: dict[str, object],
     *,
     participant_executor: AsyncParticipantExecutor | None = None,
+    max_concurrent_agents: int = 1,
+    checkpoints: _StepCheckpoints | None = None,
 ) -> _DynamicWorkflowExecution:
-    """Execute a declarative Dynamic Workflow spec sequentially on the current event loop."""
-    steps: list[_DynamicWorkflowStepResult] = []
-    step_outputs: dict[str, object] = {}
-    participants_by_id = _participants_by_id(spec)
+    """Execute a declarative Dynamic Workflow spec on the current event loop.
+
+    Each step starts once the steps it depends on have completed, with at most
+    ``max_concurrent_agents`` participant runs in flight. A step sees only the
+    outputs of the steps it depends on, and results are reported in spec order,
+    so the outcome does not depend on which independent step finishes first.
+    On failure no further steps start, in-flight steps are cancelled, and the
+    earliest failed step in spec order is reported. With ``checkpoints``, every
+    completed step is recorded, and a step whose stored result saw the same
+    upstream outputs is replayed instead of executed.
+    """
+    raw_steps = _workflow_steps(spec)
+    if participant_executor is not None:
+        participant_executor = _slot_limited(participant_executor, asyncio.Semaphore(max_concurrent_agents))
+    results, failures = await _run_step_graph(
+        raw_steps,
+        input_data=input_data,
+        participant_executor=participant_executor,
+        participants_by_id=_participants_by_id(spec),
+        checkpoints=checkpoints,
+    )
 
-    for raw_step in _workflow_steps(spec):
-        try:
-            result = await _async_execute_workflow_step(
-                raw_step,
-                input_data=input_data,
-                step_outputs=step_outputs,
-                participant_executor=participant_executor,
-                participants_by_id=participants_by_id,
-            )
-        except DynamicWorkflowExecutionError as exc:
-            failed_step = _failed_step(raw_step, str(exc))
-            steps.append(failed_step)
-            return _DynamicWorkflowExecution(
-                status="failed",
-                steps=steps,
-                outputs={},
-                report_markdown=_failed_report_markdown(spec, input_data, steps, str(exc)),
-                error=str(exc),
-            )
-        steps.append(result)
-        step_outputs[result.step_id] = result.content
+    if failures:
+        failed_index = min(failures)
+        error = str(failures[failed_index])
+        steps = [
+            results[_required_text(raw_step, "id")] if index != failed_index else _failed_step(raw_step, error)
+            for index, raw_step in enumerate(raw_steps)
+            if index == failed_index or _required_text(raw_step, "id") in results
+        ]
+        return _DynamicWorkflowExecution(
+            status="failed",
+            steps=steps,
+            outputs={},
+            report_markdown=_failed_report_markdown(spec, input_data, steps, error),
+            error=error,
+        )
 
+    steps = [results[_required_text(raw_step, "id")] for raw_step in raw_steps]
+    step_outputs = {result.step_id: result.content for result in steps}
     outputs = _collect_outputs(spec, step_outputs)
     return _DynamicWorkflowExecution(
         status="completed",
@@ -168,6 +204,128 @@ async def async_execute_workflow_spec(
     )
 
 
+async def _run_step_graph(
+    raw_steps: list[dict[str, object]],
+    *,
+    input_data: dict[str, object],
+    participant_executor: AsyncParticipantExecutor | None,
+    participants_by_id: Mapping[str, dict[str, object]],
+    checkpoints: _StepCheckpoints | None,
+) -> tuple[dict[str, _DynamicWorkflowStepResult], dict[int, DynamicWorkflowExecutionError]]:
+    """Run steps as their dependencies complete and stop launching after the first failure."""
+    dependencies = workflow_step_dependencies(raw_steps)
+    ancestors = _step_ancestors(dependencies)
+    results: dict[str, _DynamicWorkflowStepResult] = {}
+    failures: dict[int, DynamicWorkflowExecutionError] = {}
+    waiting = dict(enumerate(raw_steps))
+    running: dict[asyncio.Task[_DynamicWorkflowStepResult], tuple[int, dict[str, object]]] = {}
+    try:
+        while (waiting or running) and not failures:
+            for index, raw_step in list(waiting.items()):
+                step_id = _required_text(raw_step, "id")
+                if any(dependency not in results for dependency in dependencies[step_id]):
+                    continue
+                del waiting[index]
+                upstream_outputs = {ancestor: results[ancestor].content for ancestor in ancestors[step_id]}
+                replayed = _replayed_step(checkpoints, step_id, upstream_outputs)
+                if replayed is not None:
+                    results[step_id] = replayed
+                    continue
+                step_task = asyncio.create_task(
+                    _async_execute_workflow_step(
+                        raw_step,
+                        input_data=input_data,
+                        step_outputs=upstream_outputs,
+                        participant_executor=participant_executor,
+                        participants_by_id=participants_by_id,
+                    ),
+                )
+                running[step_task] = (index, upstream_outputs)
+            if not running:
+                continue
+            done, _pending = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for step_task in sorted(done, key=lambda task: running[task][0]):
+                index, upstream_outputs = running.pop(step_task)
+                try:
+                    result = step_task.result()
+                except DynamicWorkflowExecutionError as exc:
+                    failures[index] = exc
+                    continue
+                results[result.step_id] = result
+                _record_step(checkpoints, result, upstream_outputs)
+    finally:
+        for step_task in running:
+            step_task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+    return results, failures
+
+
+def _record_step(
+    checkpoints: _StepCheckpoints | None,
+    result: _DynamicWorkflowStepResult,
+    upstream_outputs: Mapping[str, object],
+) -> None:
+    if checkpoints is not None:
+        checkpoints.record(result.to_json(), upstream_outputs)
+
+
+def _replayed_step(
+    checkpoints: _StepCheckpoints | None,
+    step_id: str,
+    upstream_outputs: Mapping[str, object],
+) -> _DynamicWorkflowStepResult | None:
+    if checkpoints is None:
+        return None
+    stored = checkpoints.replay(step_id, upstream_outputs)
+    if stored is None:
+        return None
+    return _DynamicWorkflowStepResult(
+        step_id=step_id,
+        step_type=str(stored.get("type", "agent_step")),
+        status="completed",
+        content=stored.get("content"),
+        started_at=str(stored.get("started_at", "")),
+        completed_at=str(stored.get("completed_at", "")),
+    )
+
+
+def _step_ancestors(dependencies: Mapping[str, tuple[str, ...]]) -> dict[str, tuple[str, ...]]:
+    """Return every step each step transitively depends on, in spec order."""
+    positions = {step_id: position for position, step_id in enumerate(dependencies)}
+    ancestors: dict[str, tuple[str, ...]] = {}
+    for step_id, direct_dependencies in dependencies.items():
+        found = set(direct_dependencies)
+        for dependency in direct_dependencies:
+            found.update(ancestors[dependency])
+        ancestors[step_id] = tuple(sorted(found, key=positions.__getitem__))
+    return ancestors
+
+
+def _slot_limited(
+    participant_executor: AsyncParticipantExecutor,
+    slots: asyncio.Semaphore,
+) -> AsyncParticipantExecutor:
+    """Wrap one participant executor so at most ``slots`` runs are in flight."""
+
+    async def execute(
+        *,
+        participant: dict[str, object],
+        prompt: str,
+        input_data: dict[str, object],
+        step_outputs: dict[str, object],
+    ) -> object:
+        async with slots:
+            return await participant_executor(
+                participant=participant,
+                prompt=prompt,
+                input_data=input_data,
+                step_outputs=step_outputs,
+            )
+
+    return execute
+
+
 def execute_workflow_step(
     step: dict[str, object],
     *,
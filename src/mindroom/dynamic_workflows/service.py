@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import math
 import signal
 import threading
 import time
@@ -14,6 +15,9 @@ from mindroom.dynamic_workflows.validation import (
     DynamicWorkflowError,
     validate_workflow_input,
     validate_workflow_spec,
+    workflow_checkpoint_retention_seconds,
+    workflow_concurrent_agents,
+    workflow_memoize_ttl_seconds,
     workflow_runtime_seconds,
 )
 
@@ -21,7 +25,11 @@ if TYPE_CHECKING:
     from collections.abc import Callable, Iterator
 
     from mindroom.dynamic_workflows.runner import AsyncParticipantExecutor, ParticipantExecutor
-    from mindroom.dynamic_workflows.store import DynamicWorkflowRun, DynamicWorkflowStore
+    from mindroom.dynamic_workflows.store import (
+        DynamicWorkflowRun,
+        DynamicWorkflowStepCheckpoints,
+        DynamicWorkflowStore,
+    )
 
 
 class _SyncWorkflowTimeoutError(TimeoutError):
@@ -68,19 +76,11 @@ class DynamicWorkflowService:
             base_url=base_url,
         )
         try:
-            spec = self._store.load_workflow_revision(
-                workflow_id=workflow_id,
-                scope=scope,
-                owner_id=owner_id,
-                revision=run.revision,
-            )
-            spec = validate_workflow_spec(spec)
-            self._validate_spec_policy(spec)
-            validate_workflow_input(spec, input_data)
+            spec = self._load_run_spec(run)
         except Exception as exc:  # Persist validation failures as run records.
             return self._store.fail_workflow_run(run, error=str(exc))
 
-        return self._execute_and_persist(run, spec, input_data)
+        return self._execute_and_persist(run, spec, input_data, resume=False)
 
     async def arun_workflow(
         self,
@@ -102,53 +102,151 @@ class DynamicWorkflowService:
             base_url=base_url,
         )
         try:
-            spec = self._store.load_workflow_revision(
-                workflow_id=workflow_id,
-                scope=scope,
-                owner_id=owner_id,
-                revision=run.revision,
-            )
-            spec = validate_workflow_spec(spec)
-            self._validate_spec_policy(spec)
-            validate_workflow_input(spec, input_data)
+            spec = self._load_run_spec(run)
+        except Exception as exc:
+            return self._store.fail_workflow_run(run, error=str(exc))
+
+        return await self._aexecute_and_persist(run, spec, input_data, resume=False)
+
+    def resume_workflow_run(
+        self,
+        previous_run: DynamicWorkflowRun,
+        *,
+        requested_by: str,
+        base_url: str | None = None,
+    ) -> DynamicWorkflowRun:
+        """Re-run a failed or interrupted run on the synchronous path, replaying the steps it completed."""
+        run = self._start_resumed_run(previous_run, requested_by=requested_by, base_url=base_url)
+        try:
+            spec = self._load_run_spec(run)
+        except Exception as exc:  # Persist validation failures as run records.
+            return self._store.fail_workflow_run(run, error=str(exc))
+
+        return self._execute_and_persist(run, spec, run.input_data, resume=True)
+
+    async def aresume_workflow_run(
+        self,
+        previous_run: DynamicWorkflowRun,
+        *,
+        requested_by: str,
+        base_url: str | None = None,
+    ) -> DynamicWorkflowRun:
+        """Re-run a failed or interrupted run on the current event loop, replaying the steps it completed.
+
+        The new run pins the previous run's revision and input, so steps that
+        already completed are replayed from their checkpoints regardless of age
+        and execution continues with the first step that has no stored result.
+        """
+        run = self._start_resumed_run(previous_run, requested_by=requested_by, base_url=base_url)
+        try:
+            spec = self._load_run_spec(run)
         except Exception as exc:
             return self._store.fail_workflow_run(run, error=str(exc))
 
-        return await self._aexecute_and_persist(run, spec, input_data)
+        return await self._aexecute_and_persist(run, spec, run.input_data, resume=True)
+
+    def _start_resumed_run(
+        self,
+        previous_run: DynamicWorkflowRun,
+        *,
+        requested_by: str,
+        base_url: str | None,
+    ) -> DynamicWorkflowRun:
+        if previous_run.status == "completed":
+            msg = f"Run '{previous_run.run_id}' already completed; start a new run instead of resuming it."
+            raise DynamicWorkflowError(msg)
+        previous_spec = self._store.load_workflow_revision(
+            workflow_id=previous_run.workflow_id,
+            scope=previous_run.scope,
+            owner_id=previous_run.owner_id,
+            revision=previous_run.revision,
+        )
+        if workflow_checkpoint_retention_seconds(previous_spec) is None:
+            msg = (
+                f"Run '{previous_run.run_id}' recorded no step checkpoints; "
+                "set 'resumable: true' or 'memoize_ttl_seconds' on the workflow to resume its runs."
+            )
+            raise DynamicWorkflowError(msg)
+        return self._store.start_workflow_run(
+            workflow_id=previous_run.workflow_id,
+            scope=previous_run.scope,
+            owner_id=previous_run.owner_id,
+            input_data=previous_run.input_data,
+            requested_by=requested_by,
+            base_url=base_url,
+            revision=previous_run.revision,
+        )
+
+    def _load_run_spec(self, run: DynamicWorkflowRun) -> dict[str, object]:
+        spec = self._store.load_workflow_revision(
+            workflow_id=run.workflow_id,
+            scope=run.scope,
+            owner_id=run.owner_id,
+            revision=run.revision,
+        )
+        spec = validate_workflow_spec(spec)
+        self._validate_spec_policy(spec)
+        validate_workflow_input(spec, run.input_data)
+        return spec
 
     def _validate_spec_policy(self, spec: dict[str, object]) -> None:
         if self._spec_validator is not None:
             self._spec_validator(spec)
 
+    def _step_checkpoints(
+        self,
+        run: DynamicWorkflowRun,
+        spec: dict[str, object],
+        *,
+        resume: bool,
+    ) -> DynamicWorkflowStepCheckpoints:
+        """Record steps when the spec memoises or is resumable; replay any stored step when resuming, or fresh ones when memoising."""
+        replay_max_age_seconds = math.inf if resume else workflow_memoize_ttl_seconds(spec)
+        return self._store.step_checkpoints(
+            run,
+            spec,
+            replay_max_age_seconds=replay_max_age_seconds,
+            retention_seconds=workflow_checkpoint_retention_seconds(spec),
+        )
+
     def _execute_and_persist(
         self,
         run: DynamicWorkflowRun,
         spec: dict[str, object],
         input_data: dict[str, object],
+        *,
+        resume: bool,
     ) -> DynamicWorkflowRun:
+        checkpoints = self._step_checkpoints(run, spec, resume=resume)
         try:
             with _sync_workflow_runtime_limit(spec):
                 execution = execute_workflow_spec(
                     spec,
                     input_data,
                     participant_executor=self._participant_executor,
+                    checkpoints=checkpoints,
                 )
         except Exception as exc:  # Persist runtime failures from participant code.
             return self._store.fail_workflow_run(run, error=str(exc))
-        return self._complete_or_fail(run, execution)
+        return self._complete_or_fail(run, spec, execution, checkpoints)
 
     async def _aexecute_and_persist(
         self,
         run: DynamicWorkflowRun,
         spec: dict[str, object],
         input_data: dict[str, object],
+        *,
+        resume: bool,
     ) -> DynamicWorkflowRun:
         timeout_seconds = workflow_runtime_seconds(spec)
+        checkpoints = self._step_checkpoints(run, spec, resume=resume)
         execution_task = asyncio.create_task(
             async_execute_workflow_spec(
                 spec,
                 input_data,
                 participant_executor=self._async_participant_executor,
+                max_concurrent_agents=workflow_concurrent_agents(spec),
+                checkpoints=checkpoints,
             ),
         )
         try:
@@ -165,13 +263,23 @@ class DynamicWorkflowService:
             raise
         except Exception as exc:
             return self._store.fail_workflow_run(run, error=str(exc))
-        return self._complete_or_fail(run, execution)
+        return self._complete_or_fail(run, spec, execution, checkpoints)
 
-    def _complete_or_fail(self, run: DynamicWorkflowRun, execution: object) -> DynamicWorkflowRun:
+    def _complete_or_fail(
+        self,
+        run: DynamicWorkflowRun,
+        spec: dict[str, object],
+        execution: object,
+        checkpoints: DynamicWorkflowStepCheckpoints,
+    ) -> DynamicWorkflowRun:
         try:
-            return self._store.complete_workflow_run(run, execution)
+            completed_run = self._store.complete_workflow_run(run, execution)
         except Exception as exc:
             return self._store.fail_workflow_run(run, error=str(exc))
+        # Resume checkpoints are only needed until the run completes; memoised ones live out their TTL.
+        if completed_run.status == "completed" and workflow_memoize_ttl_seconds(spec) is None:
+            checkpoints.discard()
+        return completed_run
 
 
 @contextmanager
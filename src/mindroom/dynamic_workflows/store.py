@@ -8,7 +8,9 @@ import hashlib
 import html
 import json
 import re
-from contextlib import contextmanager
+import shutil
+import time
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -72,6 +74,71 @@ class DynamicWorkflowRun:
     error: str | None = None
 
 
+@dataclass(frozen=True)
+class DynamicWorkflowStepCheckpoints:
+    """Completed step results shared by every run of one spec with the same input.
+
+    Each completed step is stored in its own file keyed by step ID, together with
+    a digest of the upstream outputs it saw. A stored step is replayed only when
+    that digest still matches, so a reused result never follows an upstream step
+    that produced something different in this run. Steps are recorded only when
+    ``retention_seconds`` is set, and each file expires that long after it was
+    written.
+    """
+
+    directory: Path
+    run_id: str
+    replay_max_age_seconds: float | None = None
+    retention_seconds: float | None = None
+
+    def replay(self, step_id: str, step_outputs: Mapping[str, object]) -> dict[str, object] | None:
+        """Return the stored step when replay is enabled, fresh enough, and saw the same upstream outputs."""
+        if self.replay_max_age_seconds is None:
+            return None
+        try:
+            checkpoint = _load_json_mapping(self._step_path(step_id))
+        except DynamicWorkflowError:
+            return None
+        step = checkpoint.get("step")
+        recorded_at = checkpoint.get("recorded_at")
+        if (
+            not isinstance(step, dict)
+            or not isinstance(recorded_at, (int, float))
+            or time.time() - recorded_at > self.replay_max_age_seconds
+            or checkpoint.get("upstream_digest") != _json_digest(step_outputs)
+        ):
+            return None
+        return object_mapping(cast("Mapping[object, object]", step))
+
+    def record(self, step: Mapping[str, object], step_outputs: Mapping[str, object]) -> None:
+        """Persist one completed step with the digest of the upstream outputs it saw, when recording is on."""
+        if self.retention_seconds is None:
+            return
+        recorded_at = time.time()
+        write_json_file_durable(
+            self._step_path(str(step["id"])),
+            {
+                "step": dict(step),
+                "upstream_digest": _json_digest(step_outputs),
+                "run_id": self.run_id,
+                "recorded_at": recorded_at,
+                "expires_at": recorded_at + self.retention_seconds,
+            },
+            indent=2,
+            sort_keys=True,
+            trailing_newline=True,
+        )
+
+    def discard(self) -> None:
+        """Delete every stored step of this spec and input, once no later run needs them."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+        _remove_empty_directory(self.directory.parent)
+
+    def _step_path(self, step_id: str) -> Path:
+        validate_id(step_id, "step_id")
+        return self.directory / f"{step_id}.json"
+
+
 class DynamicWorkflowStore:
     """Persist Dynamic Workflow specs, revisions, runs, and artifacts under one storage root."""
 
@@ -224,17 +291,23 @@ class DynamicWorkflowStore:
         input_data: dict[str, object],
         requested_by: str,
         base_url: str | None = None,
+        revision: str | None = None,
     ) -> DynamicWorkflowRun:
-        """Persist a running workflow run record before execution starts."""
-        summary = self.get_workflow(workflow_id=workflow_id, scope=scope, owner_id=owner_id)
-        _validate_revision(summary.active_revision)
+        """Persist a running workflow run record before execution starts.
+
+        The run uses the workflow's active revision unless ``revision`` pins an
+        earlier one, as resuming a run does.
+        """
+        if revision is None:
+            revision = self.get_workflow(workflow_id=workflow_id, scope=scope, owner_id=owner_id).active_revision
+        _validate_revision(revision)
         run_id = f"run_{uuid4().hex}"
         run = DynamicWorkflowRun(
             run_id=run_id,
             workflow_id=workflow_id,
             scope=scope,
             owner_id=owner_id,
-            revision=summary.active_revision,
+            revision=revision,
             status="running",
             input_data=dict(input_data),
             steps=[],
@@ -310,6 +383,29 @@ class DynamicWorkflowStore:
         self._write_run(failed)
         return failed
 
+    def step_checkpoints(
+        self,
+        run: DynamicWorkflowRun,
+        spec: dict[str, object],
+        *,
+        replay_max_age_seconds: float | None = None,
+        retention_seconds: float | None = None,
+    ) -> DynamicWorkflowStepCheckpoints:
+        """Return step checkpoints keyed by the digests of the run's spec and input.
+
+        ``replay_max_age_seconds`` of None replays no stored step, and
+        ``retention_seconds`` of None records none. Expired checkpoints of the
+        workflow are pruned first.
+        """
+        step_results_dir = self._workflow_dir(run.scope, run.owner_id, run.workflow_id) / "step_results"
+        _prune_expired_step_checkpoints(step_results_dir)
+        return DynamicWorkflowStepCheckpoints(
+            directory=step_results_dir / _json_digest(spec) / _json_digest(run.input_data),
+            run_id=run.run_id,
+            replay_max_age_seconds=replay_max_age_seconds,
+            retention_seconds=retention_seconds,
+        )
+
     def get_workflow_run(
         self,
         *,
@@ -564,6 +660,11 @@ def _run_from_json(data: dict[str, object]) -> DynamicWorkflowRun:
     )
 
 
+def _json_digest(value: object) -> str:
+    encoded = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
 def _validate_scope(scope: str) -> None:
     if scope not in _SCOPES:
         msg = f"Unsupported Dynamic Workflow scope '{scope}'."
@@ -621,6 +722,30 @@ def _load_yaml_mapping(path: Path) -> dict[str, object]:
     return data
 
 
+def _prune_expired_step_checkpoints(step_results_dir: Path) -> None:
+    """Delete checkpoint files past their expiry, or unreadable, and the directories they leave empty."""
+    if not step_results_dir.is_dir():
+        return
+    now = time.time()
+    for checkpoint_path in step_results_dir.glob("*/*/*.json"):
+        try:
+            expires_at = _load_json_mapping(checkpoint_path).get("expires_at")
+        except DynamicWorkflowError:
+            expires_at = None
+        if not isinstance(expires_at, (int, float)) or expires_at <= now:
+            checkpoint_path.unlink(missing_ok=True)
+    for spec_dir in step_results_dir.iterdir():
+        if spec_dir.is_dir():
+            for input_dir in spec_dir.iterdir():
+                _remove_empty_directory(input_dir)
+            _remove_empty_directory(spec_dir)
+
+
+def _remove_empty_directory(path: Path) -> None:
+    with suppress(OSError):
+        path.rmdir()
+
+
 def _load_json_mapping(path: Path) -> dict[str, object]:
     try:
         data = json.loads(path.read_text(encoding="utf-8"))
@@ -23,6 +23,9 @@ _MAX_WORKFLOW_STEPS = 64
 _MAX_WORKFLOW_AGENT_STEPS = 16
 _MAX_WORKFLOW_RUNTIME_SECONDS = 3600
 _MAX_WORKFLOW_CONCURRENT_AGENTS = 8
+_MAX_WORKFLOW_MEMOIZE_TTL_SECONDS = 7 * 24 * 3600
+# How long a resumable workflow keeps the checkpoints of a run that did not complete.
+_RESUMABLE_CHECKPOINT_RETENTION_SECONDS = 7 * 24 * 3600
 _PERMISSION_KEYS = frozenset(
     {
         "max_runtime_seconds",
@@ -45,6 +48,8 @@ _SPEC_KEYS = frozenset(
         "workflow",
         "outputs",
         "permissions",
+        "memoize_ttl_seconds",
+        "resumable",
     },
 )
 _ROOM_AGENT_PARTICIPANT_KEYS = frozenset({"id", "kind", "agent", "model", "tools"})
@@ -93,6 +98,8 @@ def _validate_and_normalize_workflow_spec(
     _collect_error(errors, partial(_validate_workflow_id_field, normalized))
     _collect_error(errors, partial(_validate_workflow_name_field, normalized))
     _collect_error(errors, partial(_validate_workflow_kind_field, normalized))
+    _collect_error(errors, partial(workflow_memoize_ttl_seconds, normalized))
+    _collect_error(errors, partial(_workflow_resumable, normalized))
     _collect_error(errors, partial(_validate_input_schema, normalized))
 
     participants = _collect_value(errors, partial(_required_mapping_list, normalized, "participants", "Participant"))
@@ -187,6 +194,87 @@ def workflow_runtime_seconds(spec: dict[str, object]) -> int:
     return _positive_int_permission(value, "max_runtime_seconds", maximum=_MAX_WORKFLOW_RUNTIME_SECONDS)
 
 
+def workflow_memoize_ttl_seconds(spec: dict[str, object]) -> int | None:
+    """Return how long completed step results may be reused by later runs, or None when memoisation is off."""
+    value = spec.get("memoize_ttl_seconds")
+    if value is None:
+        return None
+    if not isinstance(value, int) or isinstance(value, bool) or value < 1 or value > _MAX_WORKFLOW_MEMOIZE_TTL_SECONDS:
+        msg = (
+            "Workflow spec field 'memoize_ttl_seconds' must be an integer between 1 and "
+            f"{_MAX_WORKFLOW_MEMOIZE_TTL_SECONDS}."
+        )
+        raise DynamicWorkflowError(msg)
+    return value
+
+
+def _workflow_resumable(spec: dict[str, object]) -> bool:
+    """Return whether runs of one workflow spec checkpoint their steps so a failed run can be resumed."""
+    value = spec.get("resumable", False)
+    if not isinstance(value, bool):
+        msg = "Workflow spec field 'resumable' must be true or false."
+        raise DynamicWorkflowError(msg)
+    return value
+
+
+def workflow_checkpoint_retention_seconds(spec: dict[str, object]) -> int | None:
+    """Return how long step checkpoints of one workflow spec are kept, or None when runs record none."""
+    retention_seconds = workflow_memoize_ttl_seconds(spec)
+    if _workflow_resumable(spec):
+        retention_seconds = max(retention_seconds or 0, _RESUMABLE_CHECKPOINT_RETENTION_SECONDS)
+    return retention_seconds
+
+
+def workflow_concurrent_agents(spec: dict[str, object]) -> int:
+    """Return how many agent steps of one workflow spec may run at once."""
+    permissions = _permissions_mapping(spec)
+    value = permissions.get("max_concurrent_agents")
+    if value is None:
+        return 1
+    return _positive_int_permission(value, "max_concurrent_agents", maximum=_MAX_WORKFLOW_CONCURRENT_AGENTS)
+
+
+def workflow_step_dependencies(steps: list[dict[str, object]]) -> dict[str, tuple[str, ...]]:
+    """Return the prior steps each workflow step must wait for, keyed in spec order.
+
+    A step depends on every prior step its templates or ``from_step`` name. An
+    agent step also depends on the previous agent step of the same participant,
+    because both run in that participant's session. Validation only admits
+    references to prior steps, so the result is acyclic and spec order is a
+    topological order; references to unknown or later steps are ignored here and
+    fail when the step renders.
+    """
+    dependencies: dict[str, tuple[str, ...]] = {}
+    last_step_by_participant: dict[str, str] = {}
+    for step in steps:
+        step_id = str(step.get("id", "")).strip()
+        referenced = [step_ref for step_ref in _step_references(step) if step_ref in dependencies]
+        participant = step.get("participant")
+        if step.get("type", "agent_step") == "agent_step" and isinstance(participant, str):
+            previous_step = last_step_by_participant.get(participant.strip())
+            if previous_step is not None:
+                referenced.append(previous_step)
+            last_step_by_participant[participant.strip()] = step_id
+        dependencies[step_id] = tuple(dict.fromkeys(referenced))
+    return dependencies
+
+
+def _step_references(step: dict[str, object]) -> list[str]:
+    references: list[str] = []
+    for field_name in (*_AGENT_STEP_TEMPLATE_FIELDS, "text", "body_template", "title"):
+        template = step.get(field_name)
+        if not isinstance(template, str):
+            continue
+        for match in _TEMPLATE_REF_RE.finditer(template):
+            parts = match.group(1).split(".")
+            if parts[0] == "steps" and len(parts) in (2, 3):
+                references.append(parts[1])
+    from_step = step.get("from_step")
+    if isinstance(from_step, str) and from_step.strip():
+        references.append(from_step.strip())
+    return references
+
+
 def _input_schema(spec: dict[str, object]) -> dict[str, object] | None:
     raw_inputs = spec.get("inputs")
     if raw_inputs is None:
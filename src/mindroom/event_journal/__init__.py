@@ -63,6 +63,7 @@ from .views import (
     DispatchView,
     HistoryRecoveryRecordView,
     HydrationView,
+    InflightStreamRecoveryView,
     MatrixDeliveryView,
     PendingTurnView,
     RelationView,
@@ -100,6 +101,7 @@ __all__ = [
     "HydrationPolicy",
     "HydrationView",
     "InboundEvent",
+    "InflightStreamRecoveryView",
     "InteractiveSelection",
     "JournalEvent",
     "MatrixDelivery",
@@ -0,0 +1,125 @@
+"""Which rooms still hold a stream that restart recovery has to look at.
+
+Startup stale-stream recovery used to find interrupted streams by paging back
+through every joined room's history. The answer it was looking for is
+something this process knew when it sent the message: a stream is open from
+the moment its first non-terminal event lands until a terminal edit lands, and
+a row here says so for exactly that interval. Recovery then visits only rooms
+that hold a row.
+
+A stream cut short by a restart is the one exception to deleting on a
+terminal edit. Its final body carries the restart note and still owes an
+auto-resume, which only a recovery visit sends, so its row stays until that
+visit has happened.
+
+The index is only trustworthy once it has been kept for a whole run. Streams
+sent by a release that predates it left no rows, so an empty result from a
+principal without a coverage row means "unknown", not "none". Coverage is
+written after one full history sweep has finished for the principal; from then
+on every stream the sweep did not already see was sent by code that records
+it.
+
+A stream is recorded before the send that opens it, so a crash between the
+send and the write still leaves its room indexed. Until the homeserver assigns
+the event ID the row is keyed by a pending stream key, and it moves to the real
+event ID once the send lands. A write that fails anyway revokes coverage, so
+the next restart sweeps room history instead of trusting an index that may be
+missing a stream.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+    from .backend import Transaction
+
+
+def record(transaction: Transaction, principal_id: str, *, room_id: str, event_id: str) -> None:
+    """Record that one stream still needs recovery if this process stops now."""
+    transaction.execute(
+        """
+        INSERT INTO inflight_streams (principal_id, event_id, room_id, recorded_at_ms)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT (principal_id, event_id) DO NOTHING
+        """,
+        (principal_id, event_id, room_id, time.time_ns() // 1_000_000),
+    )
+
+
+def clear(transaction: Transaction, principal_id: str, *, event_id: str) -> None:
+    """Forget one stream that ended without leaving recovery work."""
+    transaction.execute(
+        "DELETE FROM inflight_streams WHERE principal_id = ? AND event_id = ?",
+        (principal_id, event_id),
+    )
+
+
+def room_ids(transaction: Transaction, principal_id: str) -> frozenset[str] | None:
+    """Return rooms holding an open stream, or ``None`` while the index lacks coverage."""
+    covered = transaction.fetchone(
+        "SELECT tracked_since_ms FROM inflight_stream_coverage WHERE principal_id = ?",
+        (principal_id,),
+    )
+    if covered is None:
+        return None
+    rows = transaction.fetchall(
+        "SELECT DISTINCT room_id FROM inflight_streams WHERE principal_id = ?",
+        (principal_id,),
+    )
+    return frozenset(str(row["room_id"]) for row in rows)
+
+
+def mark_covered(transaction: Transaction, principal_id: str, *, tracked_since_ms: int) -> None:
+    """Record that every stream this principal could still owe recovery is indexed."""
+    transaction.execute(
+        """
+        INSERT INTO inflight_stream_coverage (principal_id, tracked_since_ms)
+        VALUES (?, ?)
+        ON CONFLICT (principal_id) DO NOTHING
+        """,
+        (principal_id, tracked_since_ms),
+    )
+
+
+def revoke_coverage(transaction: Transaction, principal_id: str) -> None:
+    """Stop trusting this principal's index until another full history sweep finishes."""
+    transaction.execute(
+        "DELETE FROM inflight_stream_coverage WHERE principal_id = ?",
+        (principal_id,),
+    )
+
+
+def settle(
+    transaction: Transaction,
+    principal_id: str,
+    *,
+    recovered_room_ids: Collection[str],
+    recorded_before_ms: int,
+    expired_before_ms: int,
+) -> int:
+    """Drop rows a recovery pass has dealt with, and return how many.
+
+    Only rows older than the pass qualify: a stream this process started after
+    its cutoff is still running, and the pass deliberately left it alone. A row
+    in a room the pass never reached survives until ``expired_before_ms``, so a
+    room that failed or deferred its auto-resume is visited again next time,
+    while one the bot has since left does not hold its row forever.
+    """
+    sorted_room_ids = sorted(recovered_room_ids)
+    placeholders = ", ".join("?" for _ in sorted_room_ids)
+    recovered_clause = f"room_id IN ({placeholders}) OR " if sorted_room_ids else ""
+    removed = transaction.fetchall(
+        f"""
+        DELETE FROM inflight_streams
+        WHERE principal_id = ?
+          AND recorded_at_ms < ?
+          AND ({recovered_clause}recorded_at_ms < ?)
+        RETURNING event_id
+        """,  # noqa: S608 - placeholders are generated, values are still bound
+        (principal_id, recorded_before_ms, *sorted_room_ids, expired_before_ms),
+    )
+    return len(removed)
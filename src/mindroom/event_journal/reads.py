@@ -270,6 +270,84 @@ def conversation_is_complete(
     return row is not None and bool(row["complete"]) and row["recovery_state"] is None
 
 
+_WATERMARK_AGGREGATES = """
+    COUNT(*) AS messages,
+    COUNT(content_json) AS bodies,
+    COUNT(refresh_token) AS refreshes_owed,
+    COALESCE(SUM(revision_ts), 0) AS revision_ts_sum,
+    COALESCE(MAX(revision_ts), 0) AS revision_ts_max,
+    COALESCE(SUM(LENGTH(revision_event_id)), 0) AS revision_id_length,
+    COALESCE(SUM(LENGTH(content_json)), 0) AS content_length
+"""
+
+
+def conversation_watermark(
+    transaction: Transaction,
+    principal_id: str,
+    *,
+    room_id: str,
+    thread_id: str | None,
+) -> str | None:
+    """Return a token that changes whenever this conversation's strict read would.
+
+    An export pass asks this before reading a thread, and skips the read, the
+    serialization and the file comparison when the token matches the one it
+    recorded beside the file it last wrote. So the token has to move on
+    everything a page is built from: a message admitted or deleted, a new
+    revision, a body withheld or restored. Each of those changes a row count,
+    a revision, or a body length below.
+
+    Nothing is returned -- so the caller reads -- whenever a read could change
+    the conversation rather than merely report it: no complete walk under the
+    current membership, or a message still owing a refetch, both of which a
+    strict read repairs first.
+
+    Two aggregates, not a page: one over the thread's own range of the page
+    index, one a primary-key lookup of its root, which lives in the room
+    conversation. Each returns exactly one row however long the thread is.
+    """
+    hydration = _current_hydration(transaction, principal_id, room_id=room_id, thread_id=thread_id)
+    if hydration is None or not bool(hydration["complete"]) or hydration["recovery_state"] is not None:
+        return None
+    rows = [
+        transaction.fetchone(
+            f"""
+            SELECT {_WATERMARK_AGGREGATES} FROM visible_messages
+            WHERE principal_id = ? AND room_id = ? AND thread_id = ?
+            """,  # noqa: S608 - a fixed aggregate list, not input
+            (principal_id, room_id, encode_thread_id(thread_id)),
+        ),
+    ]
+    if thread_id is not None:
+        rows.append(
+            transaction.fetchone(
+                f"""
+                SELECT {_WATERMARK_AGGREGATES} FROM visible_messages
+                WHERE principal_id = ? AND room_id = ? AND logical_event_id = ?
+                """,  # noqa: S608 - a fixed aggregate list, not input
+                (principal_id, room_id, thread_id),
+            ),
+        )
+    parts = [str(int(hydration["hydrated_epoch"]))]
+    for row in rows:
+        if row is None:
+            continue
+        if int(row["refreshes_owed"]):
+            return None
+        parts.extend(
+            str(int(row[column]))
+            for column in (
+                "messages",
+                "bodies",
+                "revision_ts_sum",
+                "revision_ts_max",
+                "revision_id_length",
+                "content_length",
+            )
+        )
+    return ":".join(parts)
+
+
 def conversation_hydration_coverage(
     transaction: Transaction,
     principal_id: str,
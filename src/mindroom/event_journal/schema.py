@@ -223,6 +223,28 @@ _TABLES = (
     )
     """,
     """
+    CREATE TABLE IF NOT EXISTS inflight_streams (
+        -- One row per self-authored stream whose last delivered event still
+        -- promised another revision, or whose restart-interrupted ending still
+        -- owes an auto-resume. Restart recovery visits only the rooms named
+        -- here instead of paging through every joined room's history.
+        principal_id TEXT NOT NULL,
+        event_id TEXT NOT NULL,
+        room_id TEXT NOT NULL,
+        recorded_at_ms BIGINT NOT NULL,
+        PRIMARY KEY (principal_id, event_id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS inflight_stream_coverage (
+        -- Present once a full history sweep has finished for this principal
+        -- with the index already being kept. Without it an empty index cannot
+        -- tell "no open streams" from "opened by a release that kept none".
+        principal_id TEXT NOT NULL PRIMARY KEY,
+        tracked_since_ms BIGINT NOT NULL
+    )
+    """,
+    """
     CREATE TABLE IF NOT EXISTS matrix_delivery_outbox (
         principal_id TEXT NOT NULL,
         delivery_id TEXT NOT NULL,
@@ -21,6 +21,7 @@ from . import (
     approval_continuations,
     approvals,
     background_approvals,
+    inflight_streams,
     interactive_questions,
     journal,
     outbox,
@@ -46,7 +47,7 @@ from .models import AdmissionResult, DeliveryAcknowledgement, DeliveryProjection
 from .projection import discard_delivery_event, drop_refetched_message, install_refetched_revision, project
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Collection, Mapping, Sequence
     from pathlib import Path
 
     from mindroom.interactive_models import InteractivePrompt
@@ -397,6 +398,17 @@ class PrincipalStore:
             ),
         )
 
+    async def conversation_watermark(self, *, room_id: str, thread_id: str | None) -> str | None:
+        """Return a token that changes whenever this conversation's strict read would, or nothing."""
+        return await self._backend.read(
+            lambda transaction: reads.conversation_watermark(
+                transaction,
+                self._principal_id,
+                room_id=room_id,
+                thread_id=thread_id,
+            ),
+        )
+
     async def conversation_hydration_coverage(
         self,
         *,
@@ -576,6 +588,63 @@ class PrincipalStore:
             ),
         )
 
+    async def record_inflight_stream(self, *, room_id: str, event_id: str) -> None:
+        """Record one stream that restart recovery must visit if it is left open."""
+        await self._backend.write(
+            lambda transaction: inflight_streams.record(
+                transaction,
+                self._principal_id,
+                room_id=room_id,
+                event_id=event_id,
+            ),
+        )
+
+    async def clear_inflight_stream(self, event_id: str) -> None:
+        """Forget one stream that ended without leaving restart-recovery work."""
+        await self._backend.write(
+            lambda transaction: inflight_streams.clear(transaction, self._principal_id, event_id=event_id),
+        )
+
+    async def inflight_stream_room_ids(self) -> frozenset[str] | None:
+        """Return rooms holding an open stream, or ``None`` until the index has coverage."""
+        return await self._backend.read(
+            lambda transaction: inflight_streams.room_ids(transaction, self._principal_id),
+        )
+
+    async def mark_inflight_streams_covered(self, *, tracked_since_ms: int) -> None:
+        """Record that a full history sweep finished while the index was being kept."""
+        await self._backend.write(
+            lambda transaction: inflight_streams.mark_covered(
+                transaction,
+                self._principal_id,
+                tracked_since_ms=tracked_since_ms,
+            ),
+        )
+
+    async def revoke_inflight_stream_coverage(self) -> None:
+        """Make restart recovery sweep room history until the index is covered again."""
+        await self._backend.write(
+            lambda transaction: inflight_streams.revoke_coverage(transaction, self._principal_id),
+        )
+
+    async def settle_inflight_streams(
+        self,
+        *,
+        recovered_room_ids: Collection[str],
+        recorded_before_ms: int,
+        expired_before_ms: int,
+    ) -> int:
+        """Drop rows one recovery pass has dealt with, and return how many."""
+        return await self._backend.write(
+            lambda transaction: inflight_streams.settle(
+                transaction,
+                self._principal_id,
+                recovered_room_ids=recovered_room_ids,
+                recorded_before_ms=recorded_before_ms,
+                expired_before_ms=expired_before_ms,
+            ),
+        )
+
     async def enqueue_matrix_delivery(
         self,
         *,
@@ -19,7 +19,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Collection, Mapping
     from typing import Any, Literal
 
     from mindroom.history_recovery import (
@@ -390,6 +390,45 @@ class MatrixDeliveryView(Protocol):
         """Return deliveries whose Matrix outcome is unknown, oldest first."""
         ...
 
+    async def record_inflight_stream(self, *, room_id: str, event_id: str) -> None:
+        """Record one stream that restart recovery must visit if it is left open."""
+        ...
+
+    async def clear_inflight_stream(self, event_id: str) -> None:
+        """Forget one stream that ended without leaving restart-recovery work."""
+        ...
+
+    async def revoke_inflight_stream_coverage(self) -> None:
+        """Make restart recovery sweep room history until the index is covered again."""
+        ...
+
+
+class InflightStreamRecoveryView(Protocol):
+    """The stream index as restart recovery reads and settles it."""
+
+    @property
+    def principal_id(self) -> str:
+        """Return the principal whose streams this view indexes."""
+        ...
+
+    async def inflight_stream_room_ids(self) -> frozenset[str] | None:
+        """Return rooms holding an open stream, or ``None`` until the index has coverage."""
+        ...
+
+    async def mark_inflight_streams_covered(self, *, tracked_since_ms: int) -> None:
+        """Record that a full history sweep finished while the index was being kept."""
+        ...
+
+    async def settle_inflight_streams(
+        self,
+        *,
+        recovered_room_ids: Collection[str],
+        recorded_before_ms: int,
+        expired_before_ms: int,
+    ) -> int:
+        """Drop rows one recovery pass has dealt with, and return how many."""
+        ...
+
 
 class ApprovalDeliveryView(MatrixDeliveryView, Protocol):
     """Approval-domain state plus the generic delivery operations it uses."""
@@ -487,6 +526,7 @@ __all__ = [
     "DispatchView",
     "HistoryRecoveryRecordView",
     "HydrationView",
+    "InflightStreamRecoveryView",
     "MatrixDeliveryView",
     "PendingTurnView",
     "RelationView",
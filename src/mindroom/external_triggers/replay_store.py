@@ -1,19 +1,34 @@
-"""Durable replay tracking for external triggers."""
+"""Durable replay tracking for external triggers.
+
+Nonce and event-id claims live in one indexed SQLite table, so a webhook claim
+is a single upsert in a short transaction instead of a read-modify-write of a
+whole state file. The upsert only overwrites a row whose ``expires_at`` has
+passed, which keeps "first unexpired claim wins" atomic across threads and API
+processes. Every claim also deletes a bounded batch of expired rows, so the
+table tracks the live replay window without a separate sweeper.
+
+Replay state written by earlier versions to ``replay.json`` is imported once
+and the file is then removed; a malformed legacy file fails closed rather than
+silently resetting replay protection.
+"""
 
 from __future__ import annotations
 
 import json
+import sqlite3
+import threading
 from collections.abc import Mapping
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import TYPE_CHECKING, Literal, TypedDict, TypeGuard, cast
 
-from mindroom.durable_write import write_json_file_durable
-from mindroom.file_locks import advisory_file_lock
-
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
+_PRUNE_BATCH_SIZE = 256
+
 
 class ExternalTriggerEventClaim(StrEnum):
     """State returned when claiming an external trigger event id."""
@@ -43,28 +58,25 @@ class _SerializedReplayStore(TypedDict):
 
 @dataclass
 class ExternalTriggerReplayStore:
-    """JSON-backed replay store for external trigger nonces and event ids."""
+    """SQLite-backed replay store for external trigger nonces and event ids."""
 
     control_state_root: Path
-    _store_path: Path = field(init=False)
-    _lock_path: Path = field(init=False)
+    _database_path: Path = field(init=False)
+    _legacy_store_path: Path = field(init=False)
+    _connection: sqlite3.Connection | None = field(init=False, default=None)
+    _lock: threading.Lock = field(init=False, default_factory=threading.Lock)
 
     def __post_init__(self) -> None:
         """Bind this store to its durable state path."""
-        self._store_path = self.control_state_root / "external_triggers" / "replay.json"
-        self._lock_path = self._store_path.with_suffix(".json.lock")
+        replay_dir = self.control_state_root / "external_triggers"
+        self._database_path = replay_dir / "replay.sqlite3"
+        self._legacy_store_path = replay_dir / "replay.json"
 
     def claim_nonce(self, replay_scope: str, nonce: str, *, now: int, ttl_seconds: int) -> bool:
         """Return True only for the first unexpired nonce claim."""
-        with advisory_file_lock(self._lock_path):
-            store = self._read_store()
-            _prune_expired(store, now=now)
-            replay_nonces = store["nonces"].setdefault(replay_scope, {})
-            if nonce in replay_nonces:
-                return False
-            replay_nonces[nonce] = {"expires_at": now + ttl_seconds}
-            self._write_store(store)
-            return True
+        with self._transaction() as connection:
+            _prune_expired(connection, now=now)
+            return _claim(connection, "nonce", replay_scope, nonce, state="claimed", now=now, ttl_seconds=ttl_seconds)
 
     def claim_event_id(
         self,
@@ -75,71 +87,209 @@ class ExternalTriggerReplayStore:
         ttl_seconds: int,
     ) -> ExternalTriggerEventClaim:
         """Claim one external event id and return its replay state."""
-        with advisory_file_lock(self._lock_path):
-            store = self._read_store()
-            _prune_expired(store, now=now)
-            replay_events = store["events"].setdefault(replay_scope, {})
-            event = replay_events.get(event_id)
-            if event is not None:
-                if event["state"] == "delivered":
-                    return ExternalTriggerEventClaim.DELIVERED
-                return ExternalTriggerEventClaim.IN_PROGRESS
-            replay_events[event_id] = {
-                "state": ExternalTriggerEventClaim.IN_PROGRESS.value,
-                "expires_at": now + ttl_seconds,
-            }
-            self._write_store(store)
-            return ExternalTriggerEventClaim.FRESH
+        with self._transaction() as connection:
+            _prune_expired(connection, now=now)
+            if _claim(
+                connection,
+                "event",
+                replay_scope,
+                event_id,
+                state=ExternalTriggerEventClaim.IN_PROGRESS.value,
+                now=now,
+                ttl_seconds=ttl_seconds,
+            ):
+                return ExternalTriggerEventClaim.FRESH
+            row = connection.execute(
+                """
+                SELECT state FROM external_trigger_replay
+                WHERE kind = 'event' AND replay_scope = ? AND replay_key = ?
+                """,
+                (replay_scope, event_id),
+            ).fetchone()
+        if row is not None and row[0] == ExternalTriggerEventClaim.DELIVERED.value:
+            return ExternalTriggerEventClaim.DELIVERED
+        return ExternalTriggerEventClaim.IN_PROGRESS
 
     def mark_event_delivered(self, replay_scope: str, event_id: str, *, now: int, ttl_seconds: int) -> None:
         """Record that one external event id reached Matrix delivery."""
-        with advisory_file_lock(self._lock_path):
-            store = self._read_store()
-            _prune_expired(store, now=now)
-            replay_events = store["events"].setdefault(replay_scope, {})
-            replay_events[event_id] = {
-                "state": ExternalTriggerEventClaim.DELIVERED.value,
-                "expires_at": now + ttl_seconds,
-            }
-            self._write_store(store)
+        with self._transaction() as connection:
+            _prune_expired(connection, now=now)
+            connection.execute(
+                """
+                INSERT INTO external_trigger_replay (kind, replay_scope, replay_key, state, expires_at)
+                VALUES ('event', ?, ?, 'delivered', ?)
+                ON CONFLICT (kind, replay_scope, replay_key) DO UPDATE
+                SET state = excluded.state, expires_at = excluded.expires_at
+                """,
+                (replay_scope, event_id, now + ttl_seconds),
+            )
 
     def release_event_id(self, replay_scope: str, event_id: str) -> None:
         """Remove an event id claim after delivery failure."""
-        with advisory_file_lock(self._lock_path):
-            store = self._read_store()
-            replay_events = store["events"].get(replay_scope)
-            if replay_events is None:
-                return
-            replay_events.pop(event_id, None)
-            if not replay_events:
-                store["events"].pop(replay_scope, None)
-            self._write_store(store)
-
-    def _read_store(self) -> _SerializedReplayStore:
-        try:
-            raw_store_text = self._store_path.read_text(encoding="utf-8")
-        except FileNotFoundError:
-            return _empty_store()
-        except OSError as exc:
-            msg = "external trigger replay store is unavailable"
-            raise ExternalTriggerReplayStoreError(msg) from exc
+        with self._transaction() as connection:
+            connection.execute(
+                """
+                DELETE FROM external_trigger_replay
+                WHERE kind = 'event' AND replay_scope = ? AND replay_key = ?
+                """,
+                (replay_scope, event_id),
+            )
+
+    def close(self) -> None:
+        """Close the store's connection; the next claim reopens it."""
+        with self._lock:
+            self._drop_connection()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            try:
+                connection = self._open_connection()
+                connection.execute("BEGIN IMMEDIATE")
+                try:
+                    yield connection
+                except BaseException:
+                    connection.execute("ROLLBACK")
+                    raise
+                connection.execute("COMMIT")
+            except (sqlite3.Error, OSError) as exc:
+                self._drop_connection()
+                msg = "external trigger replay store is unavailable"
+                raise ExternalTriggerReplayStoreError(msg) from exc
+
+    def _open_connection(self) -> sqlite3.Connection:
+        if self._connection is not None:
+            return self._connection
+        self._database_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = _connect(self._database_path)
         try:
-            raw_store = json.loads(raw_store_text)
-        except json.JSONDecodeError as exc:
-            msg = "invalid external trigger replay store JSON"
-            raise ExternalTriggerReplayStoreError(msg) from exc
-        return _normalize_store(raw_store)
-
-    def _write_store(self, store: _SerializedReplayStore) -> None:
-        try:
-            write_json_file_durable(self._store_path, store, indent=2, sort_keys=True)
-        except OSError as exc:
-            msg = "external trigger replay store is unavailable"
-            raise ExternalTriggerReplayStoreError(msg) from exc
-
-
-def _empty_store() -> _SerializedReplayStore:
-    return {"nonces": {}, "events": {}}
+            _initialize_database(connection, self._legacy_store_path)
+        except BaseException:
+            connection.close()
+            raise
+        self._connection = connection
+        return connection
+
+    def _drop_connection(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+_SCHEMA_STATEMENTS = (
+    """
+    CREATE TABLE IF NOT EXISTS external_trigger_replay (
+        kind TEXT NOT NULL CHECK (kind IN ('nonce', 'event')),
+        replay_scope TEXT NOT NULL,
+        replay_key TEXT NOT NULL,
+        state TEXT NOT NULL CHECK (state IN ('claimed', 'in_progress', 'delivered')),
+        expires_at INTEGER NOT NULL,
+        UNIQUE (kind, replay_scope, replay_key)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS external_trigger_replay_expiry ON external_trigger_replay (expires_at)",
+)
+
+
+def _connect(database_path: Path) -> sqlite3.Connection:
+    # Claims run on whichever thread `asyncio.to_thread` picks, one at a time
+    # under the store's lock.
+    connection = sqlite3.connect(database_path, isolation_level=None, timeout=10, check_same_thread=False)
+    connection.execute("PRAGMA busy_timeout = 10000")
+    connection.execute("PRAGMA journal_mode = WAL")
+    connection.execute("PRAGMA synchronous = FULL")
+    return connection
+
+
+def _initialize_database(connection: sqlite3.Connection, legacy_store_path: Path) -> None:
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        for statement in _SCHEMA_STATEMENTS:
+            connection.execute(statement)
+        legacy_store = _read_legacy_store(legacy_store_path)
+        if legacy_store is not None:
+            _import_legacy_store(connection, legacy_store)
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    connection.execute("COMMIT")
+    if legacy_store is not None:
+        # Import is idempotent, so a crash before this unlink only repeats it.
+        legacy_store_path.unlink(missing_ok=True)
+
+
+def _claim(
+    connection: sqlite3.Connection,
+    kind: Literal["nonce", "event"],
+    replay_scope: str,
+    replay_key: str,
+    *,
+    state: str,
+    now: int,
+    ttl_seconds: int,
+) -> bool:
+    """Insert a claim, or take over an expired one; return whether this call now holds it."""
+    cursor = connection.execute(
+        """
+        INSERT INTO external_trigger_replay (kind, replay_scope, replay_key, state, expires_at)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT (kind, replay_scope, replay_key) DO UPDATE
+        SET state = excluded.state, expires_at = excluded.expires_at
+        WHERE external_trigger_replay.expires_at < ?
+        """,
+        (kind, replay_scope, replay_key, state, now + ttl_seconds, now),
+    )
+    return cursor.rowcount == 1
+
+
+def _prune_expired(connection: sqlite3.Connection, *, now: int) -> None:
+    connection.execute(
+        """
+        DELETE FROM external_trigger_replay WHERE rowid IN (
+            SELECT rowid FROM external_trigger_replay WHERE expires_at < ? ORDER BY expires_at LIMIT ?
+        )
+        """,
+        (now, _PRUNE_BATCH_SIZE),
+    )
+
+
+def _import_legacy_store(connection: sqlite3.Connection, store: _SerializedReplayStore) -> None:
+    rows = [
+        ("nonce", replay_scope, nonce, "claimed", record["expires_at"])
+        for replay_scope, nonces in store["nonces"].items()
+        for nonce, record in nonces.items()
+    ]
+    rows.extend(
+        ("event", replay_scope, event_id, record["state"], record["expires_at"])
+        for replay_scope, events in store["events"].items()
+        for event_id, record in events.items()
+    )
+    connection.executemany(
+        """
+        INSERT INTO external_trigger_replay (kind, replay_scope, replay_key, state, expires_at)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT (kind, replay_scope, replay_key) DO UPDATE
+        SET state = excluded.state, expires_at = excluded.expires_at
+        WHERE excluded.expires_at > external_trigger_replay.expires_at
+        """,
+        rows,
+    )
+
+
+def _read_legacy_store(store_path: Path) -> _SerializedReplayStore | None:
+    try:
+        raw_store_text = store_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    except OSError as exc:
+        msg = "external trigger replay store is unavailable"
+        raise ExternalTriggerReplayStoreError(msg) from exc
+    try:
+        raw_store = json.loads(raw_store_text)
+    except json.JSONDecodeError as exc:
+        msg = "invalid external trigger replay store JSON"
+        raise ExternalTriggerReplayStoreError(msg) from exc
+    return _normalize_store(raw_store)
 
 
 def _normalize_store(raw_store: object) -> _SerializedReplayStore:
@@ -209,19 +359,3 @@ def _normalize_events(raw_events: Mapping[object, object]) -> dict[str, dict[str
         if normalized_trigger_events:
             events[trigger_id] = normalized_trigger_events
     return events
-
-
-def _prune_expired(store: _SerializedReplayStore, *, now: int) -> None:
-    for trigger_id, trigger_nonces in list(store["nonces"].items()):
-        store["nonces"][trigger_id] = {
-            nonce: record for nonce, record in trigger_nonces.items() if record["expires_at"] >= now
-        }
-        if not store["nonces"][trigger_id]:
-            store["nonces"].pop(trigger_id)
-
-    for trigger_id, trigger_events in list(store["events"].items()):
-        store["events"][trigger_id] = {
-            event_id: record for event_id, record in trigger_events.items() if record["expires_at"] >= now
-        }
-        if not store["events"][trigger_id]:
-            store["events"].pop(trigger_id)
@@ -1,4 +1,11 @@
-"""Primary-runtime store for tool-managed external triggers."""
+"""Primary-runtime store for tool-managed external triggers.
+
+Records live in one durably replaced JSON document. Every inbound webhook
+looks its trigger up, so parsed records are kept in a process-wide index keyed
+by trigger id and owner. The index is validated against the file's inode,
+mtime, and size before each use and updated write-through by this process, so
+the delivery path only re-reads the document after another process changed it.
+"""
 
 from __future__ import annotations
 
@@ -6,10 +13,12 @@ import base64
 import binascii
 import hashlib
 import json
+import os
 import re
 import time
 import uuid
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Literal
 
 from cryptography.exceptions import UnsupportedAlgorithm
@@ -48,6 +57,8 @@ _ED25519_PUBLIC_KEY_BYTES = 32
 _EXTERNAL_TRIGGER_STATE_DIR = "external_triggers"
 _TRIGGER_RECORDS_FILENAME = "triggers.json"
 
+type _RecordsSignature = tuple[int, int, int]
+
 
 class ExternalTriggerStoreError(RuntimeError):
     """Raised when trigger records cannot be read or trusted."""
@@ -229,6 +240,33 @@ class _SerializedTriggerRecords(BaseModel):
         return self
 
 
+@dataclass(frozen=True)
+class _TriggerRecordIndex:
+    """Parsed trigger records for one file signature, indexed by id and owner."""
+
+    signature: _RecordsSignature | None
+    triggers: Mapping[str, ExternalTriggerRecord]
+    by_owner: Mapping[str, tuple[ExternalTriggerRecord, ...]]
+
+    @classmethod
+    def build(
+        cls,
+        signature: _RecordsSignature | None,
+        triggers: Mapping[str, ExternalTriggerRecord],
+    ) -> _TriggerRecordIndex:
+        by_owner: dict[str, list[ExternalTriggerRecord]] = {}
+        for record in triggers.values():
+            by_owner.setdefault(record.owner_user_id, []).append(record)
+        return cls(
+            signature=signature,
+            triggers=dict(triggers),
+            by_owner={owner: tuple(records) for owner, records in by_owner.items()},
+        )
+
+
+_RECORD_INDEXES: dict[Path, _TriggerRecordIndex] = {}
+
+
 class ExternalTriggerStore:
     """JSON-backed trigger record store under primary control state."""
 
@@ -249,11 +287,10 @@ class ExternalTriggerStore:
 
     def list_records(self, *, owner_user_id: str | None = None) -> list[ExternalTriggerRecord]:
         """Return trigger records, optionally filtered by owner."""
-        with advisory_file_lock(self._lock_path, exclusive=False):
-            records = list(self._read_records().triggers.values())
+        index = self._current_index()
         if owner_user_id is None:
-            return records
-        return [record for record in records if record.owner_user_id == owner_user_id]
+            return list(index.triggers.values())
+        return list(index.by_owner.get(owner_user_id, ()))
 
     def create_record(
         self,
@@ -446,8 +483,7 @@ class ExternalTriggerStore:
         config_generation: int,
     ) -> TriggerDeliverySnapshot | None:
         """Return one delivery snapshot after revalidating against current config."""
-        with advisory_file_lock(self._lock_path, exclusive=False):
-            record = self._read_records().triggers.get(trigger_id)
+        record = self._current_index().triggers.get(trigger_id)
         if record is None:
             return None
         try:
@@ -502,15 +538,51 @@ class ExternalTriggerStore:
         _validate_owner(record.owner_user_id, config, self._runtime_paths)
         _validate_target(record, config, self._runtime_paths)
 
-    def _read_records(self) -> _SerializedTriggerRecords:
+    def _current_index(self) -> _TriggerRecordIndex:
+        """Return the record index for read-only callers, reloading it only when the file changed."""
+        index = self._cached_index()
+        if index is not None:
+            return index
+        with advisory_file_lock(self._lock_path, exclusive=False):
+            return self._load_index()
+
+    def _cached_index(self) -> _TriggerRecordIndex | None:
+        signature = self._records_signature()
+        index = _RECORD_INDEXES.get(self._store_path)
+        if index is None or index.signature != signature:
+            return None
+        return index
+
+    def _records_signature(self) -> _RecordsSignature | None:
+        try:
+            stat = self._store_path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        except OSError as exc:
+            msg = "invalid external trigger store"
+            raise ExternalTriggerStoreError(msg) from exc
+        return _stat_signature(stat)
+
+    def _load_index(self) -> _TriggerRecordIndex:
+        """Parse the record file into a fresh index; the caller holds the file lock."""
         try:
-            if not self._store_path.exists():
-                return _SerializedTriggerRecords()
-            raw = json.loads(self._store_path.read_text(encoding="utf-8"))
-            return _SerializedTriggerRecords.model_validate(raw)
+            with self._store_path.open("rb") as handle:
+                signature = _stat_signature(os.fstat(handle.fileno()))
+                raw = json.loads(handle.read())
+            records = _SerializedTriggerRecords.model_validate(raw)
+        except (FileNotFoundError, NotADirectoryError):
+            signature, records = None, _SerializedTriggerRecords()
         except (OSError, json.JSONDecodeError, ValueError) as exc:
             msg = "invalid external trigger store"
             raise ExternalTriggerStoreError(msg) from exc
+        index = _TriggerRecordIndex.build(signature, records.triggers)
+        _RECORD_INDEXES[self._store_path] = index
+        return index
+
+    def _read_records(self) -> _SerializedTriggerRecords:
+        """Return a mutable copy of the records; the caller holds the exclusive file lock."""
+        index = self._cached_index() or self._load_index()
+        return _SerializedTriggerRecords.model_construct(triggers=dict(index.triggers))
 
     def _write_records(self, records: _SerializedTriggerRecords) -> None:
         try:
@@ -521,9 +593,17 @@ class ExternalTriggerStore:
                 indent=2,
                 sort_keys=True,
             )
-        except OSError as exc:
+            signature = self._records_signature()
+        except (OSError, ExternalTriggerStoreError) as exc:
+            _RECORD_INDEXES.pop(self._store_path, None)
             msg = "external trigger store is unavailable"
             raise ExternalTriggerStoreError(msg) from exc
+        _RECORD_INDEXES[self._store_path] = _TriggerRecordIndex.build(signature, records.triggers)
+
+
+def _stat_signature(stat: os.stat_result) -> _RecordsSignature:
+    """Identify one version of the record file; durable writes replace the inode."""
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
 
 
 def _validate_trigger_id(trigger_id: str) -> str:
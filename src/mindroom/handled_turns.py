@@ -27,11 +27,12 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import heapq
 import json
 import threading
 import time
 import typing
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass, field
 from types import MappingProxyType
 from typing import Any
@@ -337,11 +338,192 @@ class TurnRecordCodec:
         )
 
 
+type _GroupKey = tuple[str, ...]
+
+
+def _record_owns_unfinished_work(record: TurnRecord) -> bool:
+    """Return whether one record still owns durable work that retention must not drop."""
+    return (
+        bool(record.pending_redaction_cleanup_event_ids)
+        or (not record.completed and bool(record.replay_source_event_ids))
+        or (
+            record.user_stop_receipt_order is not None
+            and (record.user_stop_settled_receipt_order or 0) < record.user_stop_receipt_order
+        )
+    )
+
+
+class _TurnRecordIndex(Mapping[str, TurnRecord]):
+    """Records by indexed event ID, plus the secondary indexes the ledger's reads need.
+
+    Edit, redaction and regeneration handling look turns up by conversation and
+    by visible response, and retention walks turns oldest first. Answering those
+    by scanning every record costs up to ``max_events`` records per question, so
+    each entry is also filed under its session, its response and visible echo
+    event IDs, and its group: the entries whose record has the same
+    ``indexed_event_ids``, which is the unit retention keeps or drops whole.
+
+    Groups are ordered by their newest record in a heap. A group whose
+    timestamp changes is pushed again and its older heap entry goes stale, to
+    be skipped when it surfaces and dropped when the heap is rebuilt.
+    """
+
+    def __init__(self, records: Mapping[str, TurnRecord] | None = None) -> None:
+        self._records: dict[str, TurnRecord] = {}
+        self._by_session: dict[str, dict[str, TurnRecord]] = {}
+        self._by_response_event_id: dict[str, dict[str, TurnRecord]] = {}
+        self._groups: dict[_GroupKey, dict[str, TurnRecord]] = {}
+        self._group_timestamps: dict[_GroupKey, float] = {}
+        self._groups_by_age: list[tuple[float, _GroupKey]] = []
+        self._groups_owning_work: set[_GroupKey] = set()
+        for event_id, record in (records or {}).items():
+            self.set(event_id, record)
+
+    def __getitem__(self, event_id: str) -> TurnRecord:
+        return self._records[event_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def set(self, event_id: str, record: TurnRecord) -> None:
+        """File one record under ``event_id`` and every secondary index it belongs to."""
+        previous = self._records.get(event_id)
+        if previous is record:
+            return
+        if previous is not None:
+            self._unindex(event_id, previous)
+        self._records[event_id] = record
+        target = record.conversation_target
+        if target is not None:
+            self._by_session.setdefault(target.session_id, {})[event_id] = record
+        for response_event_id in _visible_response_event_ids(record):
+            self._by_response_event_id.setdefault(response_event_id, {})[event_id] = record
+        group_key = record.indexed_event_ids
+        self._groups.setdefault(group_key, {})[event_id] = record
+        self._refresh_group(group_key)
+
+    def pop(self, event_id: str) -> TurnRecord | None:
+        """Forget one entry and return the record it held."""
+        record = self._records.pop(event_id, None)
+        if record is not None:
+            self._unindex(event_id, record)
+        return record
+
+    def records_for_session(self, session_id: str) -> tuple[TurnRecord, ...]:
+        """Return unique records whose conversation target is this session."""
+        entries = self._by_session.get(session_id, {})
+        return tuple({record.indexed_event_ids: record for record in entries.values()}.values())
+
+    def records_for_response_event_id(self, response_event_id: str) -> tuple[TurnRecord, ...]:
+        """Return unique records whose response or visible echo has this event ID."""
+        entries = self._by_response_event_id.get(response_event_id, {})
+        return tuple({record.indexed_event_ids: record for record in entries.values()}.values())
+
+    def pending_redaction_cleanup_event_ids(self) -> tuple[str, ...]:
+        """Return every redaction cleanup intent; only groups owning work can hold one."""
+        return canonical_source_event_ids(
+            tuple(
+                event_id
+                for group_key in self._groups_owning_work
+                for record in self._groups[group_key].values()
+                for event_id in record.pending_redaction_cleanup_event_ids
+            ),
+        )
+
+    def expired_event_ids(
+        self,
+        *,
+        now: float,
+        max_events: int,
+        max_age_seconds: float,
+        unsettled_source_event_ids: Collection[str],
+    ) -> tuple[str, ...]:
+        """Return entries retention drops, walking groups oldest first and stopping early.
+
+        A group is dropped when it is older than ``max_age_seconds``, or when
+        more than ``max_events`` groups would otherwise remain, oldest first.
+        Groups that own unfinished durable work, or that contain one of
+        ``unsettled_source_event_ids``, are always kept and do not count
+        towards ``max_events``. Nothing is removed here: the caller deletes the
+        rows first and then pops the returned entries.
+        """
+        retained = set(self._groups_owning_work)
+        retained.update(
+            record.indexed_event_ids
+            for event_id in unsettled_source_event_ids
+            if (record := self._records.get(event_id)) is not None
+        )
+        ordinary_group_count = len(self._groups) - len(retained)
+        visited: set[tuple[float, _GroupKey]] = set()
+        dropped: list[_GroupKey] = []
+        while self._groups_by_age:
+            timestamp, group_key = self._groups_by_age[0]
+            if self._group_timestamps.get(group_key) != timestamp or (timestamp, group_key) in visited:
+                heapq.heappop(self._groups_by_age)
+                continue
+            if now - timestamp < max_age_seconds and ordinary_group_count <= max_events:
+                break
+            visited.add(heapq.heappop(self._groups_by_age))
+            if group_key in retained:
+                continue
+            dropped.append(group_key)
+            ordinary_group_count -= 1
+        # Every visited entry goes back, so the order survives a failed delete;
+        # the dropped groups' entries go stale once their records are popped.
+        for entry in visited:
+            heapq.heappush(self._groups_by_age, entry)
+        return tuple(sorted(event_id for group_key in dropped for event_id in self._groups[group_key]))
+
+    def _unindex(self, event_id: str, record: TurnRecord) -> None:
+        target = record.conversation_target
+        if target is not None:
+            _discard_entry(self._by_session, target.session_id, event_id)
+        for response_event_id in _visible_response_event_ids(record):
+            _discard_entry(self._by_response_event_id, response_event_id, event_id)
+        group_key = record.indexed_event_ids
+        _discard_entry(self._groups, group_key, event_id)
+        self._refresh_group(group_key)
+
+    def _refresh_group(self, group_key: _GroupKey) -> None:
+        entries = self._groups.get(group_key)
+        if not entries:
+            self._group_timestamps.pop(group_key, None)
+            self._groups_owning_work.discard(group_key)
+            return
+        timestamp = max(record.timestamp for record in entries.values())
+        if self._group_timestamps.get(group_key) != timestamp:
+            self._group_timestamps[group_key] = timestamp
+            heapq.heappush(self._groups_by_age, (timestamp, group_key))
+            if len(self._groups_by_age) > 4 * len(self._group_timestamps) + 64:
+                self._groups_by_age = [(ts, key) for key, ts in self._group_timestamps.items()]
+                heapq.heapify(self._groups_by_age)
+        if any(_record_owns_unfinished_work(record) for record in entries.values()):
+            self._groups_owning_work.add(group_key)
+        else:
+            self._groups_owning_work.discard(group_key)
+
+
+def _visible_response_event_ids(record: TurnRecord) -> set[str]:
+    return {event_id for event_id in (record.response_event_id, record.visible_echo_event_id) if event_id}
+
+
+def _discard_entry[K](index: dict[K, dict[str, TurnRecord]], key: K, event_id: str) -> None:
+    entries = index.get(key)
+    if entries is None:
+        return
+    entries.pop(event_id, None)
+    if not entries:
+        del index[key]
+
+
 @dataclass
 class _LedgerState:
     """In-memory canonical records shared by every ledger for one agent."""
 
-    responses: dict[str, TurnRecord] = field(default_factory=dict)
+    responses: _TurnRecordIndex = field(default_factory=_TurnRecordIndex)
     lock: threading.RLock = field(default_factory=threading.RLock, repr=False)
     # Held across a whole update: the in-memory mutation and the row it
     # implies. Without it two concurrent updates can reach the database in the
@@ -410,12 +592,12 @@ class HandledTurnLedger:
         self._state = _shared_ledger_state(self.records.state_key, self.agent_name)
 
     @property
-    def _responses(self) -> dict[str, TurnRecord]:
+    def _responses(self) -> _TurnRecordIndex:
         return self._state.responses
 
     @_responses.setter
-    def _responses(self, responses: dict[str, TurnRecord]) -> None:
-        self._state.responses = responses
+    def _responses(self, responses: Mapping[str, TurnRecord]) -> None:
+        self._state.responses = _TurnRecordIndex(responses)
 
     async def load(self) -> None:
         """Read every stored record into memory, once per process.
@@ -515,7 +697,7 @@ class HandledTurnLedger:
                     event_id: self._responses.get(event_id) for event_id in persisted_record.indexed_event_ids
                 }
                 for event_id in persisted_record.indexed_event_ids:
-                    self._responses[event_id] = persisted_record
+                    self._responses.set(event_id, persisted_record)
             # Canonicalization derives an anchor from the sources whenever one was
             # not supplied, and a record with no sources was already rejected above.
             assert persisted_record.anchor_event_id is not None
@@ -686,9 +868,9 @@ class HandledTurnLedger:
                 if self._responses.get(event_id) is not published:
                     continue
                 if previous is None:
-                    self._responses.pop(event_id, None)
+                    self._responses.pop(event_id)
                 else:
-                    self._responses[event_id] = previous
+                    self._responses.set(event_id, previous)
 
     def _require_loaded(self) -> None:
         """Fail loudly if a reader arrives before the records are in memory.
@@ -725,13 +907,7 @@ class HandledTurnLedger:
         """Return every durable redaction cleanup intent still awaiting completion."""
         with self._state.lock:
             self._require_loaded()
-            return canonical_source_event_ids(
-                tuple(
-                    event_id
-                    for record in self._responses.values()
-                    for event_id in record.pending_redaction_cleanup_event_ids
-                ),
-            )
+            return self._responses.pending_redaction_cleanup_event_ids()
 
     def turn_records_for_conversation(
         self,
@@ -741,27 +917,17 @@ class HandledTurnLedger:
         """Return unique records that can identify persisted scopes for one conversation."""
         with self._state.lock:
             self._require_loaded()
-            unique_records: dict[tuple[str, ...], TurnRecord] = {}
-            for record in self._responses.values():
-                target = record.conversation_target
-                if target is None or target.session_id != session_id:
-                    continue
-                unique_records[record.indexed_event_ids] = record
-            return tuple(unique_records.values())
+            return self._responses.records_for_session(session_id)
 
     def turn_record_for_response_event_id(self, response_event_id: str) -> TurnRecord | None:
         """Return the sole turn whose visible response has this Matrix event ID."""
         with self._state.lock:
             self._require_loaded()
-            matches = {
-                record.indexed_event_ids: record
-                for record in self._responses.values()
-                if response_event_id in {record.response_event_id, record.visible_echo_event_id}
-            }
+            matches = self._responses.records_for_response_event_id(response_event_id)
         if len(matches) > 1:
             msg = f"Multiple turns own visible response {response_event_id!r}"
             raise RuntimeError(msg)
-        return next(iter(matches.values()), None)
+        return matches[0] if matches else None
 
     async def _cleanup_old_events(
         self,
@@ -772,9 +938,11 @@ class HandledTurnLedger:
     ) -> None:
         """Drop stale records by age and count, in memory and in the database.
 
-        The retained set is computed from what is already in memory rather than
+        The dropped set is computed from what is already in memory rather than
         re-read first, because memory is now the authority a reader answers
-        from and the database agrees with it after every awaited write.
+        from and the database agrees with it after every awaited write. The
+        in-memory index keeps turns ordered by age, so a pass visits only the
+        turns it drops and the retained ones older than the first survivor.
 
         Only the dropped ids are deleted, rather than rewriting the whole set.
         The old ledger had to rewrite its file wholesale because that was the
@@ -793,17 +961,17 @@ class HandledTurnLedger:
         async with self._state.write_lock:
             with self._state.lock:
                 self._require_loaded()
-                retained = _cleaned_responses(
-                    dict(self._responses),
+                dropped = self._responses.expired_event_ids(
+                    now=time.time(),
                     max_events=max_events,
-                    max_age_days=max_age_days,
+                    max_age_seconds=max_age_days * 24 * 60 * 60,
                     unsettled_source_event_ids=unsettled_source_event_ids,
                 )
-                dropped = tuple(sorted(set(self._responses) - set(retained)))
             if dropped:
                 await self.records.forget(index_event_ids=dropped)
             with self._state.lock:
-                self._responses = retained
+                for event_id in dropped:
+                    self._responses.pop(event_id)
         logger.info(
             "handled_turn_cleanup_completed",
             agent=self.agent_name,
@@ -944,81 +1112,3 @@ def _positive_int_or_none(value: object) -> int | None:
 def _mapping_or_none(value: object) -> Mapping[str, Any] | None:
     """Return a typed mapping for codec input."""
     return typing.cast("Mapping[str, Any]", value) if isinstance(value, Mapping) else None
-
-
-@dataclass(frozen=True)
-class _ResponseGroup:
-    """Logical handled-turn group keyed by its complete indexed identity."""
-
-    timestamp: float
-    records: dict[str, TurnRecord]
-
-
-def _response_group_requires_retention(
-    group: _ResponseGroup,
-    unsettled_source_event_ids: frozenset[str],
-) -> bool:
-    """Return whether one group still owns unfinished durable work."""
-    return (
-        not unsettled_source_event_ids.isdisjoint(group.records)
-        or any(record.pending_redaction_cleanup_event_ids for record in group.records.values())
-        or any(not record.completed and record.replay_source_event_ids for record in group.records.values())
-        or any(
-            record.user_stop_receipt_order is not None
-            and (record.user_stop_settled_receipt_order or 0) < record.user_stop_receipt_order
-            for record in group.records.values()
-        )
-    )
-
-
-def _cleaned_responses(
-    responses: dict[str, TurnRecord],
-    *,
-    max_events: int,
-    max_age_days: int,
-    unsettled_source_event_ids: Collection[str] = (),
-) -> dict[str, TurnRecord]:
-    """Remove stale turn groups while keeping coalesced groups intact."""
-    current_time = time.time()
-    max_age_seconds = max_age_days * 24 * 60 * 60
-    retained_source_event_ids = frozenset(unsettled_source_event_ids)
-    fresh_groups = [
-        group
-        for group in _response_groups(responses)
-        if _response_group_requires_retention(group, retained_source_event_ids)
-        or current_time - group.timestamp < max_age_seconds
-    ]
-    if len(fresh_groups) > max_events:
-        retained_groups = [
-            group for group in fresh_groups if _response_group_requires_retention(group, retained_source_event_ids)
-        ]
-        retained_group_ids = {id(group) for group in retained_groups}
-        ordinary_groups = [group for group in fresh_groups if id(group) not in retained_group_ids]
-        kept_ordinary_groups = ordinary_groups[-max_events:] if max_events else []
-        fresh_groups = sorted((*retained_groups, *kept_ordinary_groups), key=lambda group: group.timestamp)
-    cleaned_responses: dict[str, TurnRecord] = {}
-    for group in fresh_groups:
-        cleaned_responses.update(group.records)
-    return cleaned_responses
-
-
-def _response_groups(responses: dict[str, TurnRecord]) -> list[_ResponseGroup]:
-    """Return handled turns grouped by canonical sources and discovery aliases."""
-    grouped_records: dict[tuple[str, ...], dict[str, TurnRecord]] = {}
-    grouped_timestamps: dict[tuple[str, ...], float] = {}
-    for event_id, record in responses.items():
-        grouped_records.setdefault(record.indexed_event_ids, {})[event_id] = record
-        grouped_timestamps[record.indexed_event_ids] = max(
-            grouped_timestamps.get(record.indexed_event_ids, 0.0),
-            record.timestamp,
-        )
-    return sorted(
-        (
-            _ResponseGroup(
-                timestamp=grouped_timestamps[indexed_event_ids],
-                records=records,
-            )
-            for indexed_event_ids, records in grouped_records.items()
-        ),
-        key=lambda group: group.timestamp,
-    )
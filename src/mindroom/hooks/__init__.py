@@ -42,6 +42,7 @@ from .context import (
 from .decorators import get_hook_metadata, hook, iter_module_hooks
 from .enrichment import render_enrichment_block, render_system_enrichment_block, render_transient_context
 from .execution import emit, emit_collect, emit_final_response_transform, emit_gate, emit_transform
+from .health import HookHealthTracker, hook_health
 from .ingress import HookIngressPolicy, hook_ingress_policy
 from .registry import HookRegistry, HookRegistryPlugin, HookRegistryState
 from .sender import build_hook_message_sender, send_hook_message, send_matrix_message
@@ -123,6 +124,7 @@ __all__ = [
     "HookCallback",
     "HookContext",
     "HookContextSupport",
+    "HookHealthTracker",
     "HookIngressPolicy",
     "HookMatrixAdmin",
     "HookMessageSender",
@@ -161,6 +163,7 @@ __all__ = [
     "emit_transform",
     "get_hook_metadata",
     "hook",
+    "hook_health",
     "hook_ingress_policy",
     "is_automation_source_kind",
     "is_voice_event",
@@ -33,6 +33,7 @@ from .context import (
     ToolBeforeCallContext,
     message_envelope_for_hook_context,
 )
+from .health import hook_health
 from .types import EVENT_MESSAGE_RECEIVED, EnrichmentItem, RegisteredHook, default_timeout_ms_for_event
 
 if TYPE_CHECKING:
@@ -99,20 +100,6 @@ def _scope_room_ids(context: _HookExecutionContext) -> tuple[str, ...]:  # noqa:
     return ()
 
 
-def _hook_in_scope(hook: RegisteredHook, context: _HookExecutionContext) -> bool:
-    if hook.agents is not None:
-        agent_name = _scope_agent_name(context)
-        if agent_name is None or agent_name not in hook.agents:
-            return False
-
-    if hook.rooms is not None:
-        room_ids = _scope_room_ids(context)
-        if not any(room_id in hook.rooms for room_id in room_ids):
-            return False
-
-    return True
-
-
 def _context_logger(hook: RegisteredHook) -> object:
     return get_logger("mindroom.hooks").bind(
         plugin_name=hook.plugin_name,
@@ -200,15 +187,18 @@ def _effective_timeout_ms(hook: RegisteredHook) -> int:
 
 
 async def _invoke_hook(hook: RegisteredHook, context: _HookExecutionContext) -> _HookInvocationResult:
+    health = hook_health()
+    if not health.admit(hook):
+        context.logger.debug("Hook skipped while its circuit breaker is open", correlation_id=context.correlation_id)
+        return _HookInvocationResult(succeeded=False)
     timeout_seconds = _effective_timeout_ms(hook) / 1000
     started_at = time.monotonic()
     try:
         async with asyncio.timeout(timeout_seconds):
             result = await hook.callback(context)
-    except asyncio.CancelledError:
-        raise
-    except (Exception, SystemExit):
+    except (Exception, SystemExit) as exc:
         duration_ms = elapsed_ms_since(started_at, ndigits=2)
+        health.record_failure(hook, duration_ms, exc)
         context.logger.exception(
             "Hook execution failed",
             correlation_id=context.correlation_id,
@@ -216,8 +206,13 @@ async def _invoke_hook(hook: RegisteredHook, context: _HookExecutionContext) ->
             timeout_ms=_effective_timeout_ms(hook),
         )
         return _HookInvocationResult(succeeded=False)
+    except BaseException:
+        # Cancellation and interpreter exits say nothing about the hook's health.
+        health.release(hook)
+        raise
 
     duration_ms = elapsed_ms_since(started_at, ndigits=2)
+    health.record_success(hook, duration_ms)
     context.logger.debug(
         "Hook execution succeeded",
         correlation_id=context.correlation_id,
@@ -231,22 +226,13 @@ def _eligible_hooks(
     event_name: str,
     context: _HookExecutionContext,
 ) -> tuple[RegisteredHook, ...]:
-    hooks = registry.hooks_for(event_name)
-    if not hooks:
+    if not registry.has_hooks(event_name):
         return ()
 
-    eligible_hooks: list[RegisteredHook] = []
-    for hook in hooks:
-        if not _hook_in_scope(hook, context):
-            continue
-        if (
-            isinstance(context, MessageReceivedContext)
-            and event_name == EVENT_MESSAGE_RECEIVED
-            and hook.plugin_name in context.skip_plugin_names
-        ):
-            continue
-        eligible_hooks.append(hook)
-    return tuple(eligible_hooks)
+    hooks = registry.hooks_in_scope(event_name, _scope_agent_name(context), _scope_room_ids(context))
+    if isinstance(context, MessageReceivedContext) and event_name == EVENT_MESSAGE_RECEIVED:
+        return tuple(hook for hook in hooks if hook.plugin_name not in context.skip_plugin_names)
+    return hooks
 
 
 async def emit(
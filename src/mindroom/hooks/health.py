@@ -0,0 +1,182 @@
+"""Per-hook health accounting and circuit breakers.
+
+A plugin hook that fails or times out is isolated from the turn that emitted
+it, but without memory of that failure the next emission calls it again and
+waits out its full timeout again. A hook stuck against a dead backend then adds
+its timeout to every message.
+
+This module records each hook's recent latency and failures and trips a
+circuit breaker after ``_FAILURE_THRESHOLD`` consecutive failures. An open
+breaker skips the hook outright; after ``_OPEN_COOL_DOWN_SECONDS`` it
+half-opens and admits exactly one probe invocation, whose outcome closes the
+breaker again or reopens it for another cool-down.
+
+Health is keyed by ``(plugin_name, hook_name)``, not by registry snapshot, so
+counters survive config reloads that recompile the registry. A reload that
+brings a new callback for the hook closes its breaker: the fix a plugin author
+just saved is invoked on the next event rather than after the cool-down.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal
+
+from mindroom.logging_config import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .types import RegisteredHook
+
+logger = get_logger(__name__)
+
+type _HookBreakerState = Literal["closed", "open", "half_open"]
+
+#: Consecutive failures that open a hook's breaker.
+_FAILURE_THRESHOLD = 5
+#: Seconds an open breaker skips its hook before admitting one probe.
+_OPEN_COOL_DOWN_SECONDS = 30.0
+#: Recent invocation latencies kept per hook for the reported percentiles.
+_LATENCY_WINDOW = 100
+
+
+@dataclass
+class _HookHealth:
+    """Rolling health and breaker state for one plugin hook."""
+
+    plugin_name: str
+    hook_name: str
+    event_name: str
+    invocations: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    skipped: int = 0
+    consecutive_failures: int = 0
+    state: _HookBreakerState = "closed"
+    opened_at: float | None = None
+    last_error: str | None = None
+    callback: object | None = field(default=None, repr=False)
+    latencies_ms: deque[float] = field(default_factory=lambda: deque(maxlen=_LATENCY_WINDOW), repr=False)
+    probe_in_flight: bool = field(default=False, repr=False)
+
+    def _latency_percentile(self, fraction: float) -> float | None:
+        if not self.latencies_ms:
+            return None
+        ordered = sorted(self.latencies_ms)
+        return ordered[min(math.ceil(fraction * len(ordered)) - 1, len(ordered) - 1)]
+
+    def as_dict(self) -> dict[str, object]:
+        """Return this hook's health for API reporting."""
+        return {
+            "plugin_name": self.plugin_name,
+            "hook_name": self.hook_name,
+            "event_name": self.event_name,
+            "state": self.state,
+            "invocations": self.invocations,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "skipped": self.skipped,
+            "consecutive_failures": self.consecutive_failures,
+            "latency_p50_ms": self._latency_percentile(0.5),
+            "latency_p95_ms": self._latency_percentile(0.95),
+            "last_error": self.last_error,
+        }
+
+
+@dataclass
+class HookHealthTracker:
+    """Process-wide health table consulted before and after every hook invocation."""
+
+    failure_threshold: int = _FAILURE_THRESHOLD
+    cool_down_seconds: float = _OPEN_COOL_DOWN_SECONDS
+    clock: Callable[[], float] = time.monotonic
+    _hooks: dict[tuple[str, str], _HookHealth] = field(default_factory=dict, repr=False)
+
+    def _health(self, hook: RegisteredHook) -> _HookHealth:
+        key = (hook.plugin_name, hook.hook_name)
+        health = self._hooks.get(key)
+        if health is None:
+            health = self._hooks[key] = _HookHealth(
+                plugin_name=hook.plugin_name,
+                hook_name=hook.hook_name,
+                event_name=hook.event_name,
+            )
+        if health.callback is not hook.callback:
+            health.callback = hook.callback
+            health.state = "closed"
+            health.opened_at = None
+            health.consecutive_failures = 0
+            health.probe_in_flight = False
+        return health
+
+    def admit(self, hook: RegisteredHook) -> bool:
+        """Return whether this hook may run now, claiming the probe of a half-open breaker."""
+        health = self._health(hook)
+        if health.state == "open":
+            if health.opened_at is not None and self.clock() - health.opened_at < self.cool_down_seconds:
+                health.skipped += 1
+                return False
+            health.state = "half_open"
+        if health.state == "half_open":
+            # Concurrent collectors must not all probe a backend that was just dead.
+            if health.probe_in_flight:
+                health.skipped += 1
+                return False
+            health.probe_in_flight = True
+        return True
+
+    def record_success(self, hook: RegisteredHook, duration_ms: float) -> None:
+        """Record one completed invocation, closing a half-open breaker."""
+        health = self._health(hook)
+        health.invocations += 1
+        health.latencies_ms.append(duration_ms)
+        health.consecutive_failures = 0
+        health.probe_in_flight = False
+        if health.state != "closed":
+            logger.info("Hook circuit breaker closed", plugin_name=hook.plugin_name, hook_name=hook.hook_name)
+            health.state = "closed"
+            health.opened_at = None
+
+    def record_failure(self, hook: RegisteredHook, duration_ms: float, error: BaseException) -> None:
+        """Record one failed or timed-out invocation, opening the breaker past the threshold."""
+        health = self._health(hook)
+        health.invocations += 1
+        health.failures += 1
+        if isinstance(error, TimeoutError):
+            health.timeouts += 1
+        health.latencies_ms.append(duration_ms)
+        health.consecutive_failures += 1
+        health.last_error = repr(error)
+        health.probe_in_flight = False
+        if health.state == "half_open" or (
+            health.state == "closed" and health.consecutive_failures >= self.failure_threshold
+        ):
+            logger.warning(
+                "Hook circuit breaker opened; skipping hook during cool-down",
+                plugin_name=hook.plugin_name,
+                hook_name=hook.hook_name,
+                consecutive_failures=health.consecutive_failures,
+                cool_down_seconds=self.cool_down_seconds,
+            )
+            health.state = "open"
+            health.opened_at = self.clock()
+
+    def release(self, hook: RegisteredHook) -> None:
+        """Release a claimed probe whose invocation was cancelled before it finished."""
+        self._health(hook).probe_in_flight = False
+
+    def snapshot(self) -> list[dict[str, object]]:
+        """Return every tracked hook's health, ordered by plugin and hook name."""
+        return [self._hooks[key].as_dict() for key in sorted(self._hooks)]
+
+
+_tracker = HookHealthTracker()
+
+
+def hook_health() -> HookHealthTracker:
+    """Return the process-wide hook health tracker."""
+    return _tracker
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Protocol, cast
 
 from mindroom.logging_config import get_logger
@@ -12,7 +12,7 @@ from .decorators import get_hook_metadata
 from .types import HookCallback, RegisteredHook
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Sequence
 
     from mindroom.config.plugin import PluginEntryConfig
 
@@ -32,11 +32,61 @@ def _callback_source_lineno(callback: HookCallback) -> int:
     return cast("Any", callback).__code__.co_firstlineno
 
 
+def _hook_matches_scope(hook: RegisteredHook, agent_name: str | None, room_ids: Sequence[str]) -> bool:
+    if hook.agents is not None and (agent_name is None or agent_name not in hook.agents):
+        return False
+    return hook.rooms is None or any(room_id in hook.rooms for room_id in room_ids)
+
+
+@dataclass(frozen=True, slots=True)
+class _EventScopeIndex:
+    """Positions of one event's ordered hooks, bucketed by the scope that admits them."""
+
+    unscoped: tuple[int, ...]
+    by_agent: dict[str, tuple[int, ...]]
+    by_room: dict[str, tuple[int, ...]]
+
+    @classmethod
+    def compile(cls, hooks: tuple[RegisteredHook, ...]) -> _EventScopeIndex | None:
+        """Return the index for one event, or ``None`` when no hook is scoped."""
+        if all(hook.agents is None and hook.rooms is None for hook in hooks):
+            return None
+        unscoped: list[int] = []
+        by_agent: defaultdict[str, list[int]] = defaultdict(list)
+        by_room: defaultdict[str, list[int]] = defaultdict(list)
+        for position, hook in enumerate(hooks):
+            # Agent-scoped hooks are filed by agent only; their room filter is
+            # checked at lookup, which touches just that agent's bucket.
+            if hook.agents is not None:
+                for agent_name in set(hook.agents):
+                    by_agent[agent_name].append(position)
+            elif hook.rooms is not None:
+                for room_id in set(hook.rooms):
+                    by_room[room_id].append(position)
+            else:
+                unscoped.append(position)
+        return cls(
+            unscoped=tuple(unscoped),
+            by_agent={agent_name: tuple(positions) for agent_name, positions in by_agent.items()},
+            by_room={room_id: tuple(positions) for room_id, positions in by_room.items()},
+        )
+
+
 @dataclass(frozen=True, slots=True)
 class HookRegistry:
     """Compiled immutable event -> hooks mapping."""
 
     _hooks_by_event: dict[str, tuple[RegisteredHook, ...]]
+    _scope_index_by_event: dict[str, _EventScopeIndex] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompile the per-event scope index from the ordered hooks."""
+        scope_index_by_event: dict[str, _EventScopeIndex] = {}
+        for event_name, hooks in self._hooks_by_event.items():
+            scope_index = _EventScopeIndex.compile(hooks)
+            if scope_index is not None:
+                scope_index_by_event[event_name] = scope_index
+        object.__setattr__(self, "_scope_index_by_event", scope_index_by_event)
 
     @classmethod
     def empty(cls) -> HookRegistry:
@@ -113,6 +163,28 @@ class HookRegistry:
         """Return compiled hooks for one event name."""
         return self._hooks_by_event.get(event_name, ())
 
+    def hooks_in_scope(
+        self,
+        event_name: str,
+        agent_name: str | None,
+        room_ids: Sequence[str],
+    ) -> tuple[RegisteredHook, ...]:
+        """Return one event's hooks whose agent and room filters admit this scope, in order."""
+        hooks = self.hooks_for(event_name)
+        scope_index = self._scope_index_by_event.get(event_name)
+        if scope_index is None:
+            return hooks
+        positions = set(scope_index.unscoped)
+        if agent_name is not None:
+            positions.update(
+                position
+                for position in scope_index.by_agent.get(agent_name, ())
+                if _hook_matches_scope(hooks[position], agent_name, room_ids)
+            )
+        for room_id in room_ids:
+            positions.update(scope_index.by_room.get(room_id, ()))
+        return tuple(hooks[position] for position in sorted(positions))
+
     def has_hooks(self, event_name: str) -> bool:
         """Return whether any hooks are registered for one event."""
         return bool(self.hooks_for(event_name))
@@ -174,6 +174,10 @@ class JournalDispatcher:
         """Install durable admission ahead of every other callback."""
         self._ingress.register(client)
 
+    async def admit_shared_event(self, room_id: str, event: nio.Event) -> None:
+        """Admit one event fanned out by the process-wide shared ingress."""
+        await self._ingress.admit_shared(self.room_for_id(room_id), event)
+
     def start(self) -> None:
         """Begin draining everything that does not need the agent fleet."""
         self._worker.start()
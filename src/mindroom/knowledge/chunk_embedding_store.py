@@ -0,0 +1,227 @@
+"""Content-addressed embeddings of knowledge chunks, kept across refreshes.
+
+Published vectors are reused per file: a file whose signature is unchanged is
+copied from the published collection, but a changed file is re-read and every
+one of its chunks is embedded again. For a large document where one paragraph
+changed, nearly all of that work reproduces vectors the base already paid for.
+
+This store remembers each chunk's vector keyed by the embedder signature and a
+SHA-256 of the chunk text, so a changed file only sends its new or edited
+chunks to the provider. The key is the text itself, not its file or position:
+a chunk that moved within a file, or between files, is still a hit. Rows from
+other embedder signatures are never returned, and the least recently used rows
+are pruned after each publication so the store stays proportional to the
+corpus.
+
+The store is an optimization only. Any SQLite failure is logged once and turns
+the store off for the rest of the refresh; chunks then go to the embedder as
+they would without it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from array import array
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from mindroom.logging_config import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+    from pathlib import Path
+
+logger = get_logger(__name__)
+
+#: SQLite caps bound parameters per statement; lookups are issued in slices.
+_LOOKUP_SLICE = 500
+#: Rows retained per chunk of the published collection: every live chunk plus
+#: as many superseded ones, so recently replaced text can still be a hit.
+_RETAINED_ROWS_PER_PUBLISHED_CHUNK = 2
+#: Floor on retained rows, so small bases are never pruned to nothing.
+_MIN_RETAINED_ROWS = 10_000
+_SCHEMA_STATEMENTS = (
+    """
+    CREATE TABLE IF NOT EXISTS chunk_embeddings (
+        embedder TEXT NOT NULL,
+        chunk_hash TEXT NOT NULL,
+        vector BLOB NOT NULL,
+        last_used_at INTEGER NOT NULL,
+        PRIMARY KEY (embedder, chunk_hash)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS chunk_embeddings_last_used ON chunk_embeddings (last_used_at)",
+)
+
+
+def _chunk_hash(text: str) -> str:
+    """Return the content address of one chunk text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _encode_vector(vector: list[float]) -> bytes:
+    # Chroma stores float32, so narrowing here loses nothing a reader could see.
+    return array("f", vector).tobytes()
+
+
+def _decode_vector(blob: bytes) -> list[float] | None:
+    if not blob or len(blob) % 4:
+        return None
+    vector = array("f")
+    vector.frombytes(blob)
+    return vector.tolist()
+
+
+@dataclass
+class ChunkEmbeddingStore:
+    """SQLite store of chunk vectors for one knowledge base and embedder."""
+
+    path: Path
+    embedder_signature: str
+    _connection: sqlite3.Connection | None = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _disabled: bool = field(default=False, init=False, repr=False)
+
+    def lookup(self, texts: Iterable[str]) -> dict[str, list[float]]:
+        """Return the stored vector of every given text that has one."""
+        hashes: dict[str, str] = {}
+        for text in texts:
+            hashes.setdefault(_chunk_hash(text), text)
+        if not hashes:
+            return {}
+        found: dict[str, list[float]] = {}
+        keys = list(hashes)
+        with self._lock:
+            connection = self._open()
+            if connection is None:
+                return {}
+            try:
+                now = int(time.time())
+                with connection:
+                    for start in range(0, len(keys), _LOOKUP_SLICE):
+                        batch = keys[start : start + _LOOKUP_SLICE]
+                        placeholders = ", ".join("?" * len(batch))
+                        rows = connection.execute(
+                            "SELECT chunk_hash, vector FROM chunk_embeddings "  # noqa: S608 - placeholders only
+                            f"WHERE embedder = ? AND chunk_hash IN ({placeholders})",
+                            (self.embedder_signature, *batch),
+                        ).fetchall()
+                        hits = [(key, vector) for key, blob in rows if (vector := _decode_vector(blob)) is not None]
+                        for key, vector in hits:
+                            found[hashes[key]] = vector
+                        if hits:
+                            # Touching hits is what lets pruning keep the rows a base still uses.
+                            connection.executemany(
+                                "UPDATE chunk_embeddings SET last_used_at = ? WHERE embedder = ? AND chunk_hash = ?",
+                                [(now, self.embedder_signature, key) for key, _vector in hits],
+                            )
+            except sqlite3.Error as exc:
+                self._disable("lookup", exc)
+                return {}
+        return found
+
+    def store(self, vectors: Mapping[str, list[float]]) -> None:
+        """Remember freshly embedded chunk vectors."""
+        if not vectors:
+            return
+        now = int(time.time())
+        rows = [
+            (self.embedder_signature, _chunk_hash(text), _encode_vector(vector), now)
+            for text, vector in vectors.items()
+        ]
+        with self._lock:
+            connection = self._open()
+            if connection is None:
+                return
+            try:
+                with connection:
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO chunk_embeddings (embedder, chunk_hash, vector, last_used_at) "
+                        "VALUES (?, ?, ?, ?)",
+                        rows,
+                    )
+            except sqlite3.Error as exc:
+                self._disable("store", exc)
+
+    def forget_embedder(self) -> None:
+        """Drop every vector of this embedder, for a rebuild that must not trust them."""
+        with self._lock:
+            connection = self._open()
+            if connection is None:
+                return
+            try:
+                with connection:
+                    connection.execute("DELETE FROM chunk_embeddings WHERE embedder = ?", (self.embedder_signature,))
+            except sqlite3.Error as exc:
+                self._disable("forget", exc)
+
+    def prune(self, *, published_chunks: int) -> int:
+        """Delete least recently used rows beyond what the published corpus needs; return how many went."""
+        max_rows = max(published_chunks * _RETAINED_ROWS_PER_PUBLISHED_CHUNK, _MIN_RETAINED_ROWS)
+        with self._lock:
+            connection = self._open()
+            if connection is None:
+                return 0
+            try:
+                with connection:
+                    (total,) = connection.execute("SELECT COUNT(*) FROM chunk_embeddings").fetchone()
+                    excess = total - max_rows
+                    if excess <= 0:
+                        return 0
+                    connection.execute(
+                        "DELETE FROM chunk_embeddings WHERE rowid IN "
+                        "(SELECT rowid FROM chunk_embeddings ORDER BY last_used_at LIMIT ?)",
+                        (excess,),
+                    )
+            except sqlite3.Error as exc:
+                self._disable("prune", exc)
+                return 0
+        return excess
+
+    def close(self) -> None:
+        """Close the connection; the next call reopens it unless the store was disabled."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _open(self) -> sqlite3.Connection | None:
+        if self._disabled:
+            return None
+        if self._connection is not None:
+            return self._connection
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Agno embeds from whichever worker thread runs the insert, one
+            # call at a time under the store's lock.
+            connection = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            try:
+                connection.execute("PRAGMA journal_mode = WAL")
+                # Losing the last few rows to a crash only costs re-embedding them.
+                connection.execute("PRAGMA synchronous = NORMAL")
+                with connection:
+                    for statement in _SCHEMA_STATEMENTS:
+                        connection.execute(statement)
+            except BaseException:
+                connection.close()
+                raise
+        except (sqlite3.Error, OSError) as exc:
+            self._disable("open", exc)
+            return None
+        self._connection = connection
+        return connection
+
+    def _disable(self, operation: str, exc: Exception) -> None:
+        logger.warning(
+            "Knowledge chunk embedding store failed; embedding without it for this refresh",
+            path=str(self.path),
+            operation=operation,
+            error=str(exc),
+        )
+        self._disabled = True
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
@@ -18,6 +18,7 @@ from agno.vectordb.chroma import ChromaDb
 from chromadb.errors import InternalError, NotFoundError
 
 from mindroom.knowledge.indexing_config import storage_key_for_base
+from mindroom.knowledge.lexical_index import delete_lexical_index
 from mindroom.logging_config import get_logger
 from mindroom.strict_knowledge import StrictInsertKnowledge as Knowledge
 
@@ -278,6 +279,7 @@ async def delete_collection(space: CollectionSpace, collection_name: str) -> boo
 
 def _delete_collection_sync(space: CollectionSpace, collection_name: str) -> bool:
     """Delete one collection, treating an already-absent one as success."""
+    delete_lexical_index(space.storage_path, collection_name)
     vector_db = build_vector_db(space, collection_name)
     if vector_db.delete():
         return True
@@ -334,6 +336,7 @@ def cleanup_superseded_collections(
                 unowned.append(collection_name)
             continue
         try:
+            delete_lexical_index(space.storage_path, collection_name)
             build_vector_db(space, collection_name).delete()
         except Exception:
             logger.warning(
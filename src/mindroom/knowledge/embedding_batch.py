@@ -17,10 +17,18 @@ files to Agno, whose per-chunk embed calls become cache hits.
 Cache misses fall through to the wrapped embedder unchanged, so behavior is
 identical (only slower) for providers without batch support, for content that
 changed between planning and insertion, and for query-time embedding.
+
+When a refresh attaches a ``ChunkEmbeddingStore``, both paths consult it before
+the provider, and every vector the provider returns is written back to it, so
+chunks that survived an edit are not embedded again. A stored vector is only
+reused once its width matches one the configuration or the provider confirmed
+for this run; until then the first stored text is embedded by the provider to
+confirm it.
 """
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
@@ -37,7 +45,9 @@ from mindroom.embedding_errors import (
 from mindroom.logging_config import get_logger
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Sequence
+    from collections.abc import Iterable, Mapping, Sequence
+
+    from mindroom.knowledge.chunk_embedding_store import ChunkEmbeddingStore
 
 logger = get_logger(__name__)
 
@@ -92,6 +102,13 @@ class BatchPrefetchEmbedder(Embedder):
     """Embedder that serves prefetched chunk embeddings from a bounded cache."""
 
     inner: Embedder = field(default_factory=Embedder)
+    store: ChunkEmbeddingStore | None = None
+    #: Vector width explicitly configured for a provider that honors it, if any.
+    configured_dimensions: int | None = None
+    #: Chunks served from ``store`` and chunks sent to the provider, for
+    #: reporting how much of a refresh's embedding work was reused.
+    reused_chunks: int = field(default=0, init=False)
+    embedded_chunks: int = field(default=0, init=False)
     _cache: dict[str, list[float]] = field(default_factory=dict, init=False, repr=False)
     _batching_disabled: bool = field(default=False, init=False, repr=False)
     _observed_dimensions: int | None = field(default=None, init=False, repr=False)
@@ -100,6 +117,7 @@ class BatchPrefetchEmbedder(Embedder):
         """Mirror the wrapped embedder's dimensions so vector writes stay consistent."""
         self.dimensions = self.inner.dimensions
         self.batch_size = self.inner.batch_size
+        self._observed_dimensions = self.configured_dimensions
 
     def supports_batching(self) -> bool:
         """Return whether the wrapped embedder can still embed a batch in one request."""
@@ -113,14 +131,77 @@ class BatchPrefetchEmbedder(Embedder):
         """Return the distinct texts that still need embedding, in first-seen order."""
         return list(dict.fromkeys(text for text in texts if text not in self._cache))
 
+    def restore_stored(self, texts: Iterable[str]) -> int:
+        """Cache the stored vectors of any of these texts and return how many were found."""
+        if self.store is None:
+            return 0
+        pending = self.uncached(texts)
+        stored = self.store.lookup(pending)
+        if not stored:
+            return 0
+        # Probe with a text the provider has to embed anyway, when there is one.
+        probe_text = next((text for text in pending if text not in stored), pending[0])
+        dimensions = self._confirmed_dimensions(probe_text)
+        restored = 0
+        for text, embedding in stored.items():
+            if text not in self._cache and len(embedding) == dimensions:
+                self._cache[text] = embedding
+                restored += 1
+        self.reused_chunks += restored
+        return restored
+
+    def _confirmed_dimensions(self, probe_text: str) -> int | None:
+        """Return the vector width confirmed for this run, embedding ``probe_text`` to learn it if needed.
+
+        Stored vectors never set the width themselves: a store still holding a
+        previous model's vectors would otherwise make the provider's correct
+        vectors look inconsistent for the rest of the run. The probe's vector
+        is cached like any other provider result. When the probe fails, the
+        width stays unconfirmed, stored vectors are not reused, and the
+        failure resurfaces on the normal embedding path.
+        """
+        if self._observed_dimensions is None:
+            try:
+                self._embed_into_cache(probe_text)
+            except Exception:
+                logger.debug("Could not confirm the embedder's vector width", exc_info=True)
+        return self._observed_dimensions
+
+    def _embed_into_cache(self, text: str) -> None:
+        embedding = self._cache[text] = self._validated(self.inner.get_embedding(text))
+        self._remember({text: embedding})
+
+    def _from_store(self, text: str) -> list[float] | None:
+        """Return one text's stored vector on a cache miss, counting the reuse.
+
+        Until the width is confirmed this returns nothing, so the caller's own
+        provider request for ``text`` is the probe. A failure then surfaces
+        once, from the file that owns the text, instead of being swallowed by
+        a separate probe and followed by a second request.
+        """
+        if self.store is None or self._observed_dimensions is None:
+            return None
+        embedding = self.store.lookup((text,)).get(text)
+        if embedding is None or len(embedding) != self._observed_dimensions:
+            return None
+        self.reused_chunks += 1
+        return embedding
+
+    def _remember(self, embeddings: Mapping[str, list[float]]) -> None:
+        """Count provider-embedded texts and keep their vectors for later refreshes."""
+        self.embedded_chunks += len(embeddings)
+        if self.store is not None:
+            self.store.store(embeddings)
+
     def _validated(self, embedding: list[float]) -> list[float]:
         """Reject a vector that is empty or inconsistent with the ones before it.
 
-        Width is checked against the first vector this adapter actually saw,
-        not against ``Embedder.dimensions``: that field is a declared default
-        (agno ships 1536) which real providers routinely contradict, so
-        trusting it would reject correct vectors. Consistency still catches the
-        case that matters here, a provider changing width mid-run.
+        Width is checked against ``configured_dimensions`` or, without one,
+        the first vector the provider returned, not against
+        ``Embedder.dimensions``: that field is a declared default (agno ships
+        1536) which real providers routinely contradict, so trusting it would
+        reject correct vectors. Consistency still catches the case that
+        matters here, a provider changing width mid-run.
         """
         if not embedding:
             raise EmbedderRequestError(EMBEDDER_EMPTY_VECTOR_DETAIL)
@@ -143,17 +224,18 @@ class BatchPrefetchEmbedder(Embedder):
         credential rejection is re-raised: that is provably global, and
         grinding one doomed request per remaining chunk would bury the cause.
         """
-        cached = 0
-        for text in pending:
-            try:
-                self._cache[text] = self._validated(self.inner.get_embedding(text))
-            except Exception as exc:
-                if is_embedder_auth_failure_detail(describe_embedder_error(exc)):
-                    raise
-                logger.debug("Leaving one chunk unembedded for the per-file path", exc_info=True)
-                continue
-            cached += 1
-        return cached
+        embedded: dict[str, list[float]] = {}
+        try:
+            for text in pending:
+                try:
+                    embedded[text] = self._cache[text] = self._validated(self.inner.get_embedding(text))
+                except Exception as exc:
+                    if is_embedder_auth_failure_detail(describe_embedder_error(exc)):
+                        raise
+                    logger.debug("Leaving one chunk unembedded for the per-file path", exc_info=True)
+        finally:
+            self._remember(embedded)
+        return len(embedded)
 
     def embed_batch_into_cache(self, texts: Sequence[str]) -> int:
         """Embed one planned batch, falling back to per-item when batching is unusable.
@@ -208,6 +290,7 @@ class BatchPrefetchEmbedder(Embedder):
 
         for text, embedding in zip(pending, embeddings, strict=True):
             self._cache[text] = self._validated(embedding)
+        self._remember({text: self._cache[text] for text in pending})
         return len(pending)
 
     def _disable_batching(self, reason: str) -> None:
@@ -215,13 +298,17 @@ class BatchPrefetchEmbedder(Embedder):
         logger.warning("Knowledge embedder does not support batching; using one request per chunk", reason=reason)
 
     def get_embedding(self, text: str) -> list[float]:
-        """Return a prefetched embedding, or delegate to the wrapped embedder."""
+        """Return a prefetched or stored embedding, or delegate to the wrapped embedder."""
         cached = self._cache.get(text)
+        if cached is None:
+            cached = self._from_store(text)
         if cached is not None:
             return cached
         # Validated here too: this is the path Agno's writer actually uses, so
         # skipping it would let an unusable vector reach the collection.
-        return self._validated(self.inner.get_embedding(text))
+        embedding = self._validated(self.inner.get_embedding(text))
+        self._remember({text: embedding})
+        return embedding
 
     def get_embedding_and_usage(self, text: str) -> tuple[list[float], dict[str, Any] | None]:
         """Return a prefetched embedding without usage, or delegate for a miss.
@@ -231,22 +318,34 @@ class BatchPrefetchEmbedder(Embedder):
         again per chunk would double-count it.
         """
         cached = self._cache.get(text)
+        if cached is None:
+            cached = self._from_store(text)
         if cached is not None:
             return cached, None
         embedding, usage = self.inner.get_embedding_and_usage(text)
-        return self._validated(embedding), usage
+        embedding = self._validated(embedding)
+        self._remember({text: embedding})
+        return embedding, usage
 
     async def async_get_embedding(self, text: str) -> list[float]:
         """Async variant of ``get_embedding``."""
         cached = self._cache.get(text)
+        if cached is None:
+            cached = await asyncio.to_thread(self._from_store, text)
         if cached is not None:
             return cached
-        return self._validated(await self.inner.async_get_embedding(text))
+        embedding = self._validated(await self.inner.async_get_embedding(text))
+        await asyncio.to_thread(self._remember, {text: embedding})
+        return embedding
 
     async def async_get_embedding_and_usage(self, text: str) -> tuple[list[float], dict[str, Any] | None]:
         """Async variant of ``get_embedding_and_usage``."""
         cached = self._cache.get(text)
+        if cached is None:
+            cached = await asyncio.to_thread(self._from_store, text)
         if cached is not None:
             return cached, None
         embedding, usage = await self.inner.async_get_embedding_and_usage(text)
-        return self._validated(embedding), usage
+        embedding = self._validated(embedding)
+        await asyncio.to_thread(self._remember, {text: embedding})
+        return embedding, usage
@@ -0,0 +1,137 @@
+"""BM25 lexical index published next to one knowledge collection.
+
+Embedding search is weak on exact tokens -- error codes, function names,
+ticket ids -- that carry little meaning for an embedder. Bases that opt into
+``hybrid_search`` also get an SQLite FTS5 index of the same chunks, ranked by
+BM25 and fused with the vector results at query time.
+
+The index is rebuilt from the chunks stored in a candidate collection right
+before that collection is published, and is written to a temporary file that
+is renamed into place. It is named after the collection, so a reader can never
+pair it with another collection's vectors, and a reader that finds no index
+for the published collection simply searches vectors only.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import uuid
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, cast
+
+from agno.knowledge.document import Document
+
+from mindroom.durable_write import replace_file_durable
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from agno.vectordb.chroma import ChromaDb
+
+_LEXICAL_INDEX_DIR = "lexical"
+#: Chunks read from the collection per Chroma ``get`` while building.
+_BUILD_PAGE_ROWS = 512
+#: Query terms beyond this add cost without changing which chunks rank first.
+_MAX_QUERY_TERMS = 32
+#: Words, digits and underscores, matching the FTS5 tokenizer below so that
+#: snake_case identifiers such as ``fetch_orders_v2`` stay one term.
+_QUERY_TERM_PATTERN = re.compile(r"\w+")
+_CREATE_CHUNKS_TABLE = (
+    "CREATE VIRTUAL TABLE chunks USING fts5("
+    "chunk_id UNINDEXED, content, metadata UNINDEXED, tokenize = \"unicode61 tokenchars '_'\")"
+)
+
+
+def lexical_index_path(storage_path: Path, collection_name: str) -> Path:
+    """Return where the lexical index for one collection lives."""
+    return storage_path / _LEXICAL_INDEX_DIR / f"{collection_name}.sqlite3"
+
+
+def build_lexical_index(vector_db: ChromaDb, storage_path: Path) -> int:
+    """Index every chunk stored in one collection and return how many were indexed."""
+    collection = vector_db.client.get_collection(name=vector_db.collection_name)
+    target = lexical_index_path(storage_path, vector_db.collection_name)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = target.with_name(f".{target.name}.{uuid.uuid4().hex}.tmp")
+    indexed = 0
+    try:
+        connection = sqlite3.connect(temp_path, isolation_level=None)
+        try:
+            connection.execute(_CREATE_CHUNKS_TABLE)
+            connection.execute("BEGIN")
+            offset = 0
+            while True:
+                page = collection.get(limit=_BUILD_PAGE_ROWS, offset=offset, include=["documents", "metadatas"])
+                ids = page["ids"]
+                if not ids:
+                    break
+                offset += len(ids)
+                documents = cast("list[str | None]", page["documents"])
+                metadatas = cast("list[dict[str, Any] | None]", page["metadatas"])
+                connection.executemany(
+                    "INSERT INTO chunks (chunk_id, content, metadata) VALUES (?, ?, ?)",
+                    [
+                        (chunk_id, document or "", json.dumps(metadata or {}, sort_keys=True))
+                        for chunk_id, document, metadata in zip(ids, documents, metadatas, strict=True)
+                    ],
+                )
+                indexed += len(ids)
+            connection.execute("INSERT INTO chunks (chunks) VALUES ('optimize')")
+            connection.execute("COMMIT")
+        finally:
+            connection.close()
+        replace_file_durable(temp_path, target)
+    finally:
+        temp_path.unlink(missing_ok=True)
+    return indexed
+
+
+def delete_lexical_index(storage_path: Path, collection_name: str) -> None:
+    """Remove the lexical index of a collection that is being deleted."""
+    lexical_index_path(storage_path, collection_name).unlink(missing_ok=True)
+
+
+def _match_expression(query: str) -> str | None:
+    """Return an FTS5 query matching any term of a free-text query, or None when it has none."""
+    terms = list(dict.fromkeys(term.lower() for term in _QUERY_TERM_PATTERN.findall(query)))
+    if not terms:
+        return None
+    return " OR ".join(f'"{term}"' for term in terms[:_MAX_QUERY_TERMS])
+
+
+@dataclass(frozen=True)
+class LexicalIndex:
+    """Read handle for one published lexical index."""
+
+    path: Path
+
+    def search(self, *, query: str, limit: int) -> list[Document]:
+        """Return the chunks that best match the query terms, best BM25 score first."""
+        match = _match_expression(query)
+        if match is None or limit <= 0:
+            return []
+        connection = sqlite3.connect(f"{self.path.as_uri()}?mode=ro", uri=True)
+        try:
+            rows = connection.execute(
+                "SELECT chunk_id, content, metadata FROM chunks WHERE chunks MATCH ? ORDER BY bm25(chunks) LIMIT ?",
+                (match, limit),
+            ).fetchall()
+        finally:
+            connection.close()
+        return [_document_from_row(chunk_id, content, metadata) for chunk_id, content, metadata in rows]
+
+
+def _document_from_row(chunk_id: str, content: str, metadata_json: str) -> Document:
+    """Shape one indexed chunk the way Agno's Chroma search returns it."""
+    metadata = json.loads(metadata_json)
+    name = metadata.pop("name", None)
+    content_id = metadata.pop("content_id", None)
+    return Document(
+        id=chunk_id,
+        name=None if name is None else str(name),
+        meta_data=metadata,
+        content=content,
+        content_id=None if content_id is None else str(content_id),
+    )
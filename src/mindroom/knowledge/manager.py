@@ -46,6 +46,7 @@ from mindroom.knowledge.candidate_checkpoint import (
     load_candidate_checkpoint,
     save_candidate_checkpoint,
 )
+from mindroom.knowledge.chunk_embedding_store import ChunkEmbeddingStore
 from mindroom.knowledge.collections import (
     SOURCE_DIGEST_KEY,
     SOURCE_MTIME_NS_KEY,
@@ -89,6 +90,7 @@ from mindroom.knowledge.indexing_config import (
     indexing_settings_key,
     storage_key_for_base,
 )
+from mindroom.knowledge.lexical_index import build_lexical_index, lexical_index_path
 from mindroom.knowledge.redaction import redact_credentials_in_text
 from mindroom.knowledge.refresh_outcome import RefreshOutcome
 from mindroom.logging_config import get_logger
@@ -175,6 +177,7 @@ _MAX_CANDIDATE_RECONCILE_ROUNDS = 4
 #: Journal appends tolerated before the candidate snapshot is recompacted.
 _CANDIDATE_JOURNAL_COMPACT_ENTRIES = 5_000
 _PROGRESS_LOG_INTERVAL_FILES = 500
+_CHUNK_EMBEDDING_STORE_FILE = "chunk_embeddings.sqlite3"
 _PROGRESS_LOG_INTERVAL_SECONDS = 30.0
 #: Consecutive classified embedder rejections, with no success in between,
 #: taken as proof the fault is global rather than specific to a few files.
@@ -266,6 +269,10 @@ class _CandidateProgress:
     retrying: int = 0
     #: Files this pass actually embedded, as opposed to reused from the candidate.
     indexed_this_run: int = 0
+    #: Chunks of those files served from the chunk embedding store, and chunks
+    #: sent to the embedder.
+    chunks_reused: int = 0
+    chunks_embedded: int = 0
     started_at: float = field(default_factory=time.monotonic)
     _last_logged_at: float = field(default_factory=time.monotonic, repr=False)
     _last_logged_completed: int = field(default=0, repr=False)
@@ -275,10 +282,22 @@ class _CandidateProgress:
         """Return files still owed by the candidate."""
         return max(self.total - self.completed, 0)
 
+    @property
+    def chunk_reuse_ratio(self) -> float | None:
+        """Return the share of chunks that needed no embedding, or None before any chunk."""
+        chunks = self.chunks_reused + self.chunks_embedded
+        return self.chunks_reused / chunks if chunks else None
+
     def elapsed_seconds(self) -> float:
         """Return wall-clock seconds since this refresh started working."""
         return max(time.monotonic() - self.started_at, 0.0)
 
+    def count_chunks(self, embedder: BatchPrefetchEmbedder | None) -> None:
+        """Take the chunk counts this refresh's embedder has accumulated so far."""
+        if embedder is not None:
+            self.chunks_reused = embedder.reused_chunks
+            self.chunks_embedded = embedder.embedded_chunks
+
     def _fields(self) -> dict[str, object]:
         return {
             "base_id": self.base_id,
@@ -288,6 +307,9 @@ class _CandidateProgress:
             "total": self.total,
             "completed": self.completed,
             "indexed_this_run": self.indexed_this_run,
+            "chunks_reused": self.chunks_reused,
+            "chunks_embedded": self.chunks_embedded,
+            "chunk_reuse_ratio": None if self.chunk_reuse_ratio is None else round(self.chunk_reuse_ratio, 3),
             "pending": self.pending,
             "failed": self.failed,
             "retrying": self.retrying,
@@ -455,6 +477,13 @@ def _reusable_row_signature(
     return source_path, signature
 
 
+def _embedder_signature(settings: IndexingSettings) -> str:
+    """Return the embedder identity stored chunk vectors are keyed by."""
+    return json.dumps(
+        [settings.embedder_provider, settings.embedder_model, settings.embedder_host, settings.embedder_dimensions],
+    )
+
+
 def _source_signature_from_file_signatures(file_signatures: Mapping[str, FileSignature]) -> str:
     """Return the same corpus signature from already-indexed relative path signatures."""
     digest = hashlib.sha256()
@@ -773,6 +802,9 @@ class KnowledgeManager:
         source_signature: str,
         publish_state: _CandidatePublishState,
     ) -> None:
+        # The lexical index lands before the metadata names the candidate, so
+        # a published hybrid base always has one for its current collection.
+        await self._build_lexical_index(candidate_vector_db)
         publish_cancelled = await self._save_candidate_publish_metadata(
             candidate_vector_db=candidate_vector_db,
             indexed_count=indexed_count,
@@ -787,6 +819,44 @@ class KnowledgeManager:
         if publish_cancelled:
             _raise_cancelled()
 
+    async def _build_lexical_index(self, vector_db: ChromaDb) -> None:
+        """Index one collection's chunks for BM25 search when this base opts into hybrid search.
+
+        The lexical index only adds recall, so a failed build is logged and
+        the collection is still published; searches of it stay vector-only.
+        """
+        if not self.config.get_knowledge_base_config(self.base_id).hybrid_search:
+            return
+        try:
+            chunks = await asyncio.to_thread(build_lexical_index, vector_db, self._base_storage_path)
+        except Exception:
+            logger.warning(
+                "Knowledge lexical index build failed; searches stay vector-only",
+                base_id=self.base_id,
+                collection=vector_db.collection_name,
+                exc_info=True,
+            )
+            return
+        logger.info(
+            "Built knowledge lexical index",
+            base_id=self.base_id,
+            collection=vector_db.collection_name,
+            chunks=chunks,
+        )
+
+    async def ensure_lexical_index(self, collection_name: str) -> None:
+        """Build a missing lexical index for an already-published collection.
+
+        Turning ``hybrid_search`` on for an unchanged base republishes the
+        existing collection without a candidate, so this is the only point
+        where its lexical index can be created without re-embedding.
+        """
+        if not self.config.get_knowledge_base_config(self.base_id).hybrid_search:
+            return
+        if await asyncio.to_thread(lexical_index_path(self._base_storage_path, collection_name).exists):
+            return
+        await self._build_lexical_index(build_vector_db(self._collections, collection_name))
+
     async def _index_file_locked(
         self,
         resolved_path: Path,
@@ -1000,6 +1070,7 @@ class KnowledgeManager:
         chunk_texts = await asyncio.to_thread(self._chunk_texts_for_batch, list(files))
         if not chunk_texts:
             return
+        await asyncio.to_thread(embedder.restore_stored, chunk_texts)
 
         for planned_batch in plan_embedding_batches(
             embedder.uncached(chunk_texts),
@@ -1485,7 +1556,22 @@ class KnowledgeManager:
             await asyncio.to_thread(delete_candidate_checkpoint, self._base_storage_path)
             checkpoint = None
 
-        embedder = BatchPrefetchEmbedder(inner=create_configured_embedder(self.config, self.runtime_paths))
+        # Only an explicit width override the provider honors confirms a width;
+        # model defaults are declarations that compatible backends contradict.
+        configured_dimensions = (
+            self.config.memory.embedder.config.dimensions if self._indexing_settings.embedder_dimensions else None
+        )
+        store = ChunkEmbeddingStore(
+            self._base_storage_path / _CHUNK_EMBEDDING_STORE_FILE,
+            embedder_signature=_embedder_signature(self._indexing_settings),
+        )
+        if force_reindex:
+            await asyncio.to_thread(store.forget_embedder)
+        embedder = BatchPrefetchEmbedder(
+            inner=create_configured_embedder(self.config, self.runtime_paths),
+            store=store,
+            configured_dimensions=configured_dimensions,
+        )
         rebuild = checkpoint is None
         if checkpoint is None:
             checkpoint = CandidateCheckpoint(
@@ -1799,6 +1885,9 @@ class KnowledgeManager:
                 raise
             finally:
                 progress.retrying = self._embedding_retry_count
+                progress.count_chunks(run.embedder)
+                if run.embedder is not None and run.embedder.store is not None:
+                    run.embedder.store.close()
                 outcome = RefreshOutcome(
                     indexed_count=progress.indexed_this_run,
                     published=run.published,
@@ -1880,6 +1969,7 @@ class KnowledgeManager:
                     progress.completed = len(active_run.completed)
                     progress.failed = len(active_run.failed)
                     progress.retrying = self._embedding_retry_count
+                    progress.count_chunks(active_run.embedder)
                     progress.maybe_log()
 
                 async def _record_batch(batch: Sequence[Path], active_run: _CandidateRun = run) -> None:
@@ -1965,3 +2055,16 @@ class KnowledgeManager:
             vector_db=self._knowledge.vector_db,
             preserved=frozenset({run.vector_db.collection_name}),
         )
+        if run.embedder is not None and run.embedder.store is not None:
+            await asyncio.to_thread(self._prune_chunk_embeddings, run.vector_db, run.embedder.store)
+
+    def _prune_chunk_embeddings(self, vector_db: ChromaDb, store: ChunkEmbeddingStore) -> None:
+        """Bound the chunk embedding store by the size of the collection just published."""
+        try:
+            published_chunks = vector_db.client.get_collection(name=vector_db.collection_name).count()
+        except Exception:
+            logger.warning("Skipping knowledge chunk embedding pruning", base_id=self.base_id, exc_info=True)
+            return
+        pruned = store.prune(published_chunks=published_chunks)
+        if pruned:
+            logger.debug("Pruned knowledge chunk embeddings", base_id=self.base_id, pruned=pruned)
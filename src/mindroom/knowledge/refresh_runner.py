@@ -948,6 +948,8 @@ async def _publish_unchanged_index(
         )
     if updated_state != state:
         await asyncio.to_thread(save_published_index_state, published_index_metadata_path(key), updated_state)
+    if updated_state.collection is not None:
+        await manager.ensure_lexical_index(updated_state.collection)
     index = publish_knowledge_index_from_state(
         key,
         state=updated_state,
@@ -26,6 +26,7 @@ from mindroom.knowledge.indexing_config import (
     indexing_settings_key,
     storage_key_for_base,
 )
+from mindroom.knowledge.lexical_index import LexicalIndex, lexical_index_path
 from mindroom.logging_config import get_logger
 from mindroom.runtime_resolution import resolve_knowledge_binding
 from mindroom.strict_knowledge import StrictSearchKnowledge
@@ -239,6 +240,14 @@ def published_index_metadata_path(key: PublishedIndexKey) -> Path:
     return published_index_storage_path(key) / "indexing_settings.json"
 
 
+def published_lexical_index(key: PublishedIndexKey, state: PublishedIndexState) -> LexicalIndex | None:
+    """Return the lexical index published with one collection, if it has one."""
+    if state.collection is None:
+        return None
+    path = lexical_index_path(published_index_storage_path(key), state.collection)
+    return LexicalIndex(path) if path.is_file() else None
+
+
 def published_index_refresh_state(
     state: PublishedIndexState | None,
     *,
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import sqlite3
 import time
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
@@ -18,7 +19,7 @@ from mindroom.knowledge.refresh_policy import (
     refresh_cooldown_key,
     refresh_trigger,
 )
-from mindroom.knowledge.registry import PublishedIndexResolution, get_published_index
+from mindroom.knowledge.registry import PublishedIndexResolution, get_published_index, published_lexical_index
 from mindroom.knowledge_source_descriptions import KnowledgeSourceDescription, KnowledgeWithSourceDescriptions
 from mindroom.logging_config import get_logger
 from mindroom.runtime_protocols import SupportsConfigOrchestrator  # noqa: TC001
@@ -31,12 +32,15 @@ if TYPE_CHECKING:
 
     from mindroom.config.main import Config
     from mindroom.constants import RuntimePaths
+    from mindroom.knowledge.lexical_index import LexicalIndex
     from mindroom.knowledge.refresh_scheduler import KnowledgeRefreshScheduler
     from mindroom.tool_system.worker_routing import ToolExecutionIdentity
 
 logger = get_logger(__name__)
 _MAX_REFRESH_SCHEDULED_COOLDOWNS = 512
 _MAX_MERGED_SOURCE_COVERAGE_RESULTS = 20
+#: Reciprocal-rank-fusion constant; 60 is the value the RRF literature settled on.
+_RRF_RANK_OFFSET = 60
 _refresh_scheduled_at: dict[RefreshCooldownKey, float] = {}
 
 
@@ -199,6 +203,17 @@ def _semantic_agent_knowledge_base_ids(agent_name: str, config: Config) -> tuple
     )
 
 
+def _lexical_index_for_base(
+    base_id: str,
+    lookup: PublishedIndexResolution | None,
+    config: Config,
+) -> LexicalIndex | None:
+    """Return the published lexical index for a base that opted into hybrid search."""
+    if lookup is None or lookup.index is None or not config.get_knowledge_base_config(base_id).hybrid_search:
+        return None
+    return published_lexical_index(lookup.key, lookup.index.state)
+
+
 def _resolve_base_knowledge(
     base_id: str,
     *,
@@ -206,8 +221,8 @@ def _resolve_base_knowledge(
     runtime_paths: RuntimePaths,
     refresh_scheduler: KnowledgeRefreshScheduler | None,
     execution_identity: ToolExecutionIdentity | None,
-) -> tuple[Knowledge | None, KnowledgeAvailability, str | None]:
-    """Resolve one knowledge base handle with its effective availability and last error."""
+) -> tuple[Knowledge | None, LexicalIndex | None, KnowledgeAvailability, str | None]:
+    """Resolve one knowledge base handle with its lexical index, effective availability and last error."""
     lookup = _lookup_knowledge_for_base(
         base_id,
         config=config,
@@ -235,7 +250,7 @@ def _resolve_base_knowledge(
             wall_now=wall_now,
         )
     last_error = lookup.state.last_error if lookup is not None and lookup.state is not None else None
-    return knowledge, availability, last_error
+    return knowledge, _lexical_index_for_base(base_id, lookup, config), availability, last_error
 
 
 def resolve_agent_knowledge_access(
@@ -262,8 +277,9 @@ def resolve_agent_knowledge_access(
     missing_base_ids: list[str] = []
     unavailable_bases: dict[str, KnowledgeAvailabilityDetail] = {}
     knowledges: list[Knowledge] = []
+    lexical_indexes: list[LexicalIndex | None] = []
     for base_id in base_ids:
-        knowledge, availability, last_error = _resolve_base_knowledge(
+        knowledge, lexical_index, availability, last_error = _resolve_base_knowledge(
             base_id,
             config=effective_config,
             runtime_paths=runtime_paths,
@@ -280,6 +296,7 @@ def resolve_agent_knowledge_access(
             missing_base_ids.append(base_id)
             continue
         knowledges.append(knowledge)
+        lexical_indexes.append(lexical_index)
 
     if missing_base_ids:
         logger.warning(
@@ -288,7 +305,7 @@ def resolve_agent_knowledge_access(
             knowledge_bases=missing_base_ids,
         )
     return _KnowledgeResolution(
-        knowledge=_merge_knowledge(agent_name, knowledges),
+        knowledge=_merge_knowledge(agent_name, knowledges, lexical_indexes),
         unavailable=unavailable_bases,
     )
 
@@ -425,6 +442,9 @@ class _MultiKnowledgeVectorDb:
     # Agno Knowledge.__post_init__ calls exists()/create(); this adapter intentionally
     # presents already-published read handles as initialized.
     vector_dbs: list[_KnowledgeVectorDb]
+    #: BM25 index per source, parallel to ``vector_dbs``; a source with one has
+    #: its vector and lexical rankings fused before sources are interleaved.
+    lexical_indexes: list[LexicalIndex | None] = field(default_factory=list)
 
     def _resolved_vector_dbs(self) -> list[_KnowledgeVectorDb]:
         """Return the current vector DB instances for every merged source."""
@@ -453,7 +473,7 @@ class _MultiKnowledgeVectorDb:
         """
         results_by_db: list[list[Document]] = []
         first_error: Exception | None = None
-        for vector_db in self._resolved_vector_dbs():
+        for position, vector_db in enumerate(self._resolved_vector_dbs()):
             try:
                 results = vector_db.search(query=query, limit=limit, filters=filters)
             except Exception as exc:
@@ -465,7 +485,8 @@ class _MultiKnowledgeVectorDb:
                     exc_info=True,
                 )
                 continue
-            results_by_db.append(results)
+            lexical_results = self._lexical_results(position, query=query, limit=limit, filters=filters)
+            results_by_db.append(_fuse_rankings([results, lexical_results], limit))
         if first_error is not None and not results_by_db:
             raise first_error
         return _interleave_documents(results_by_db, limit)
@@ -480,6 +501,7 @@ class _MultiKnowledgeVectorDb:
         """Async variant of ``search`` that searches DBs concurrently."""
 
         async def _search_one(
+            position: int,
             vdb: _KnowledgeVectorDb,
         ) -> tuple[list[Document] | None, Exception | None]:
             results: list[Document]
@@ -498,9 +520,18 @@ class _MultiKnowledgeVectorDb:
                     exc_info=True,
                 )
                 return None, exc
-            return results, None
+            lexical_results = await asyncio.to_thread(
+                self._lexical_results,
+                position,
+                query=query,
+                limit=limit,
+                filters=filters,
+            )
+            return _fuse_rankings([results, lexical_results], limit), None
 
-        outcomes = await asyncio.gather(*[_search_one(vdb) for vdb in self._resolved_vector_dbs()])
+        outcomes = await asyncio.gather(
+            *[_search_one(position, vdb) for position, vdb in enumerate(self._resolved_vector_dbs())],
+        )
         results_by_db = [results for results, _error in outcomes if results is not None]
         if not results_by_db:
             for _results, error in outcomes:
@@ -508,6 +539,48 @@ class _MultiKnowledgeVectorDb:
                     raise error
         return _interleave_documents(results_by_db, limit)
 
+    def _lexical_results(
+        self,
+        position: int,
+        *,
+        query: str,
+        limit: int,
+        filters: dict[str, Any] | list[Any] | None,
+    ) -> list[Document]:
+        """Return BM25 matches from one source's lexical index, or nothing when it has none.
+
+        Metadata filters cannot be applied to the lexical index, so filtered
+        searches stay vector-only rather than returning chunks the filter excludes.
+        """
+        lexical_index = self.lexical_indexes[position] if position < len(self.lexical_indexes) else None
+        if lexical_index is None or filters is not None:
+            return []
+        try:
+            return lexical_index.search(query=query, limit=limit)
+        except (sqlite3.Error, OSError):
+            logger.warning("Knowledge lexical index search failed", path=str(lexical_index.path), exc_info=True)
+            return []
+
+
+def _fuse_rankings(rankings: list[list[Document]], limit: int) -> list[Document]:
+    """Merge rankings of one source by reciprocal rank fusion.
+
+    Chunks are matched by content, which both rankings return verbatim. A chunk
+    both rankings found outranks one only a single ranking found at a similar
+    position; ties keep vector order because the vector ranking is first.
+    """
+    if not any(rankings[1:]):
+        return rankings[0]
+    scores: dict[str, float] = {}
+    documents: dict[str, Document] = {}
+    for ranking in rankings:
+        for rank, document in enumerate(ranking):
+            key = document.content
+            scores[key] = scores.get(key, 0.0) + 1.0 / (_RRF_RANK_OFFSET + rank + 1)
+            documents.setdefault(key, document)
+    ordered = sorted(scores, key=scores.__getitem__, reverse=True)
+    return [documents[key] for key in ordered[:limit]]
+
 
 def _interleave_documents(results_by_db: list[list[Document]], limit: int) -> list[Document]:
     """Interleave per-db results so one knowledge base cannot dominate top-k."""
@@ -530,13 +603,26 @@ def _interleave_documents(results_by_db: list[list[Document]], limit: int) -> li
     return merged
 
 
-def _merge_knowledge(agent_name: str, knowledges: list[Knowledge]) -> Knowledge | None:
-    """Return a single Knowledge instance, merging when multiple bases are assigned."""
+def _merge_knowledge(
+    agent_name: str,
+    knowledges: list[Knowledge],
+    lexical_indexes: list[LexicalIndex | None],
+) -> Knowledge | None:
+    """Return a single Knowledge instance, merging when multiple bases are assigned.
+
+    A single base is wrapped as well when it has a lexical index, because
+    fusing the lexical ranking happens in the merged vector DB.
+    """
     if not knowledges:
         return None
-    if len(knowledges) == 1:
+    if len(knowledges) == 1 and lexical_indexes[0] is None:
         return knowledges[0]
-    queryable_knowledges = [knowledge for knowledge in knowledges if knowledge.vector_db is not None]
+    queryable = [
+        (knowledge, lexical_index)
+        for knowledge, lexical_index in zip(knowledges, lexical_indexes, strict=True)
+        if knowledge.vector_db is not None
+    ]
+    queryable_knowledges = [knowledge for knowledge, _lexical_index in queryable]
     vector_db_sources: list[_KnowledgeVectorDb] = [
         cast("_KnowledgeVectorDb", knowledge.vector_db) for knowledge in queryable_knowledges
     ]
@@ -551,7 +637,10 @@ def _merge_knowledge(agent_name: str, knowledges: list[Knowledge]) -> Knowledge
     )
     return KnowledgeWithSourceDescriptions(
         name=f"{agent_name}_multi_knowledge",
-        vector_db=_MultiKnowledgeVectorDb(vector_dbs=vector_db_sources),
+        vector_db=_MultiKnowledgeVectorDb(
+            vector_dbs=vector_db_sources,
+            lexical_indexes=[lexical_index for _knowledge, lexical_index in queryable],
+        ),
         max_results=max(
             min(len(queryable_knowledges), _MAX_MERGED_SOURCE_COVERAGE_RESULTS),
             *(knowledge.max_results for knowledge in queryable_knowledges),
@@ -16,9 +16,11 @@ from nio.api import Api
 from nio.exceptions import OlmTrustError
 
 from mindroom.logging_config import get_logger
+from mindroom.matrix.edit_cadence import edit_cadence_for_homeserver
 from mindroom.matrix.large_messages import MatrixEventTooLargeError, prepare_large_message
 from mindroom.matrix.media import upload_content_uri, upload_media_bytes
 from mindroom.matrix.message_builder import build_matrix_edit_content
+from mindroom.matrix.outbound_edits import run_scheduled_edit
 from mindroom.timing import emit_timing_event
 
 if TYPE_CHECKING:
@@ -50,6 +52,8 @@ class MatrixDeliveryFailureKind(enum.Enum):
     ENCRYPTION_GUARD = "encryption_guard"
     UNKNOWN_ENCRYPTION_STATE = "unknown_encryption_state"
     PAYLOAD_TOO_LARGE = "payload_too_large"
+    RATE_LIMITED = "rate_limited"
+    SUPERSEDED = "superseded"
     SEND_EXCEPTION = "send_exception"
     UNEXPECTED_RESPONSE = "unexpected_response"
 
@@ -65,6 +69,10 @@ class MatrixDeliveryFailure:
 type MatrixSendOutcome = DeliveredMatrixEvent | MatrixDeliveryFailure
 
 
+class MatrixEditSupersededError(Exception):
+    """A terminal edit of the same event replaced a waiting progress edit before it was sent."""
+
+
 @dataclass(frozen=True, slots=True)
 class _PreparedMatrixMessage:
     """Prepared content plus the transport path that must send it."""
@@ -509,6 +517,9 @@ async def send_message_outcome(
     if isinstance(response, nio.RoomSendError) and response.status_code == "M_TOO_LARGE":
         failure_kind = MatrixDeliveryFailureKind.PAYLOAD_TOO_LARGE
         failure_detail = response.message
+    elif isinstance(response, nio.RoomSendError) and response.status_code == "M_LIMIT_EXCEEDED":
+        failure_kind = MatrixDeliveryFailureKind.RATE_LIMITED
+        failure_detail = response.message
     emit_timing_event(
         "Matrix send timing",
         phase="send_finish",
@@ -859,8 +870,15 @@ async def edit_message_outcome(
     extra_content: dict[str, Any] | None = None,
     retry_sync_recovery: bool = False,
     transaction_id: str | None = None,
+    nonterminal: bool = False,
 ) -> MatrixSendOutcome:
-    """Edit an existing Matrix message and return the delivered payload or a typed failure."""
+    """Edit an existing Matrix message and return the delivered payload or a typed failure.
+
+    The edit waits for its turn in the room's outbound edit schedule (see
+    ``mindroom.matrix.outbound_edits``). ``nonterminal`` marks a streaming
+    progress edit: it yields to terminal edits, and a terminal edit of the
+    same event that arrives while it waits supersedes it.
+    """
     edit_content = build_edit_event_content(
         event_id=event_id,
         new_content=new_content,
@@ -868,14 +886,38 @@ async def edit_message_outcome(
         extra_content=extra_content,
     )
 
-    return await send_message_outcome(
-        client,
-        room_id,
-        edit_content,
-        operation="edit_message",
-        retry_sync_recovery=retry_sync_recovery,
-        transaction_id=transaction_id,
-    )
+    async def send_edit() -> MatrixSendOutcome:
+        cadence = edit_cadence_for_homeserver(getattr(client, "homeserver", None))
+        started_at = cadence.edit_started(event_id) if cadence is not None else 0.0
+        outcome: MatrixSendOutcome | None = None
+        try:
+            outcome = await send_message_outcome(
+                client,
+                room_id,
+                edit_content,
+                operation="edit_message",
+                retry_sync_recovery=retry_sync_recovery,
+                transaction_id=transaction_id,
+            )
+        finally:
+            if cadence is not None:
+                cadence.edit_finished(
+                    started_at,
+                    delivered=isinstance(outcome, DeliveredMatrixEvent),
+                    rate_limited=(
+                        isinstance(outcome, MatrixDeliveryFailure)
+                        and outcome.kind is MatrixDeliveryFailureKind.RATE_LIMITED
+                    ),
+                )
+        return outcome
+
+    outcome = await run_scheduled_edit(room_id, event_id, send_edit, terminal=not nonterminal)
+    if outcome is None:
+        return MatrixDeliveryFailure(
+            MatrixDeliveryFailureKind.SUPERSEDED,
+            "a terminal edit of the same event replaced this progress edit before it was sent",
+        )
+    return outcome
 
 
 async def edit_message_result(
@@ -888,8 +930,14 @@ async def edit_message_result(
     extra_content: dict[str, Any] | None = None,
     retry_sync_recovery: bool = False,
     transaction_id: str | None = None,
+    nonterminal: bool = False,
 ) -> DeliveredMatrixEvent | None:
-    """Edit an existing Matrix message and return the exact delivered payload."""
+    """Edit an existing Matrix message and return the exact delivered payload.
+
+    Raises ``MatrixEditSupersededError`` instead of returning ``None`` when a
+    ``nonterminal`` edit was superseded: nothing failed, and the caller must
+    neither report nor retry it.
+    """
     outcome = await edit_message_outcome(
         client,
         room_id,
@@ -899,7 +947,10 @@ async def edit_message_result(
         extra_content=extra_content,
         retry_sync_recovery=retry_sync_recovery,
         transaction_id=transaction_id,
+        nonterminal=nonterminal,
     )
+    if isinstance(outcome, MatrixDeliveryFailure) and outcome.kind is MatrixDeliveryFailureKind.SUPERSEDED:
+        raise MatrixEditSupersededError(outcome.detail)
     return outcome if isinstance(outcome, DeliveredMatrixEvent) else None
 
 
@@ -907,6 +958,7 @@ __all__ = [
     "DeliveredMatrixEvent",
     "MatrixDeliveryFailure",
     "MatrixDeliveryFailureKind",
+    "MatrixEditSupersededError",
     "MatrixSendOutcome",
     "build_edit_event_content",
     "cached_room",
@@ -0,0 +1,178 @@
+"""Per-homeserver pacing for streaming message edits.
+
+A streamed reply becomes visible through repeated edits of one event, and
+each stream sends them from a single delivery owner, one at a time. The fixed
+``defaults.streaming`` knobs decide how often that owner may send, without
+regard to how long the homeserver takes to accept an edit. On a slow or
+rate-limited homeserver, edits take longer than the interval between them.
+New content then piles up behind the edit in flight, and every stream in the
+process competes for the same homeserver. On a fast one, the fixed character
+gate holds back updates the homeserver could easily take.
+
+Every edit sent through ``client_delivery`` reports its round trip here,
+keyed by the client's homeserver. The controller keeps a smoothed round-trip
+time and the number of distinct messages edited recently, i.e. the streams
+currently sharing the homeserver. With those it paces each stream so that,
+across all of them, about ``target_inflight_edits`` edits are in flight at
+once. By Little's law that is one edit per stream every
+``active_streams * round_trip / target_inflight_edits`` seconds.
+
+A rate-limit response (``M_LIMIT_EXCEEDED``) doubles a backoff factor on top
+of that interval, and each accepted edit decays it back toward one. nio
+itself sleeps and retries on most rate-limit responses before returning, and
+those retries show up here as a longer round trip, which slows the pace just
+the same.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Weight of the newest round trip in the smoothed value.
+_RTT_SMOOTHING = 0.2
+# A message edited within this window counts as an active stream.
+_ACTIVE_STREAM_WINDOW_SECONDS = 10.0
+_MAX_BACKOFF_FACTOR = 16.0
+_BACKOFF_RECOVERY = 0.8
+# Bounds on the paced interval, whatever the homeserver reports.
+_MIN_PACED_INTERVAL_SECONDS = 0.15
+_MAX_PACED_INTERVAL_SECONDS = 60.0
+
+
+@dataclass(frozen=True, slots=True)
+class _EditCadenceSnapshot:
+    """Current edit pacing state for one homeserver."""
+
+    homeserver: str
+    edits: int
+    rate_limited_edits: int
+    inflight_edits: int
+    active_streams: int
+    smoothed_rtt_seconds: float | None
+    backoff_factor: float
+    paced_interval_seconds: float | None
+    target_inflight_edits: float
+
+    def as_dict(self) -> dict[str, object]:
+        """Return the snapshot as JSON-ready data."""
+        return {
+            "homeserver": self.homeserver,
+            "edits": self.edits,
+            "rate_limited_edits": self.rate_limited_edits,
+            "inflight_edits": self.inflight_edits,
+            "active_streams": self.active_streams,
+            "smoothed_rtt_seconds": (
+                round(self.smoothed_rtt_seconds, 4) if self.smoothed_rtt_seconds is not None else None
+            ),
+            "backoff_factor": round(self.backoff_factor, 3),
+            "paced_interval_seconds": (
+                round(self.paced_interval_seconds, 4) if self.paced_interval_seconds is not None else None
+            ),
+            "target_inflight_edits": self.target_inflight_edits,
+        }
+
+
+class _EditCadenceController:
+    """Edit round trips and rate limits observed for one homeserver.
+
+    Controllers are used from the event loop only, so they keep no locks.
+    """
+
+    def __init__(self, homeserver: str, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self.homeserver = homeserver
+        self._clock = clock
+        self._smoothed_rtt: float | None = None
+        self._backoff_factor = 1.0
+        self._inflight = 0
+        self._edits = 0
+        self._rate_limited_edits = 0
+        # Ordered oldest edit first, so inactive streams are pruned from the front.
+        self._last_edit_at_by_event_id: dict[str, float] = {}
+        self._last_target_inflight_edits = 2.0
+
+    def edit_started(self, event_id: str) -> float:
+        """Record that one edit of ``event_id`` is being sent and return its start time."""
+        now = self._clock()
+        self._inflight += 1
+        self._last_edit_at_by_event_id.pop(event_id, None)
+        self._last_edit_at_by_event_id[event_id] = now
+        self._forget_inactive_streams(now)
+        return now
+
+    def edit_finished(self, started_at: float, *, delivered: bool, rate_limited: bool = False) -> None:
+        """Record how one edit started at ``started_at`` ended."""
+        now = self._clock()
+        self._inflight = max(0, self._inflight - 1)
+        self._edits += 1
+        if rate_limited:
+            self._rate_limited_edits += 1
+            self._backoff_factor = min(_MAX_BACKOFF_FACTOR, self._backoff_factor * 2)
+            return
+        if not delivered:
+            # A local failure says nothing about how fast the homeserver is.
+            return
+        rtt = max(0.0, now - started_at)
+        self._smoothed_rtt = (
+            rtt if self._smoothed_rtt is None else (1 - _RTT_SMOOTHING) * self._smoothed_rtt + _RTT_SMOOTHING * rtt
+        )
+        self._backoff_factor = max(1.0, self._backoff_factor * _BACKOFF_RECOVERY)
+
+    def _forget_inactive_streams(self, now: float) -> None:
+        cutoff = now - _ACTIVE_STREAM_WINDOW_SECONDS
+        while self._last_edit_at_by_event_id:
+            event_id, edited_at = next(iter(self._last_edit_at_by_event_id.items()))
+            if edited_at >= cutoff:
+                return
+            del self._last_edit_at_by_event_id[event_id]
+
+    def _active_streams(self, now: float) -> int:
+        self._forget_inactive_streams(now)
+        return len(self._last_edit_at_by_event_id)
+
+    def paced_interval(self, *, target_inflight_edits: float) -> float | None:
+        """Return the seconds one stream should leave between edits, or ``None`` before any round trip."""
+        self._last_target_inflight_edits = target_inflight_edits
+        if self._smoothed_rtt is None:
+            return None
+        streams = max(1, self._active_streams(self._clock()))
+        interval = streams * self._smoothed_rtt / target_inflight_edits * self._backoff_factor
+        return min(_MAX_PACED_INTERVAL_SECONDS, max(_MIN_PACED_INTERVAL_SECONDS, interval))
+
+    def snapshot(self) -> _EditCadenceSnapshot:
+        """Return the current pacing state."""
+        target_inflight_edits = self._last_target_inflight_edits
+        return _EditCadenceSnapshot(
+            homeserver=self.homeserver,
+            edits=self._edits,
+            rate_limited_edits=self._rate_limited_edits,
+            inflight_edits=self._inflight,
+            active_streams=self._active_streams(self._clock()),
+            smoothed_rtt_seconds=self._smoothed_rtt,
+            backoff_factor=self._backoff_factor,
+            paced_interval_seconds=self.paced_interval(target_inflight_edits=target_inflight_edits),
+            target_inflight_edits=target_inflight_edits,
+        )
+
+
+_CONTROLLERS: dict[str, _EditCadenceController] = {}
+
+
+def edit_cadence_for_homeserver(homeserver: object) -> _EditCadenceController | None:
+    """Return the controller for one client's homeserver, or ``None`` when the client names none."""
+    if not isinstance(homeserver, str) or not homeserver:
+        return None
+    controller = _CONTROLLERS.get(homeserver)
+    if controller is None:
+        controller = _EditCadenceController(homeserver)
+        _CONTROLLERS[homeserver] = controller
+    return controller
+
+
+def edit_cadence_snapshots() -> list[_EditCadenceSnapshot]:
+    """Return the pacing state of every homeserver this process has edited on."""
+    return [_CONTROLLERS[homeserver].snapshot() for homeserver in sorted(_CONTROLLERS)]
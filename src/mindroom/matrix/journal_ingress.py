@@ -351,6 +351,15 @@ class JournalIngress:
         """Install durable admission ahead of every other callback."""
         client.add_event_admission_callback(self._admit)
 
+    async def admit_shared(self, room: nio.MatrixRoom, event: nio.Event) -> None:
+        """Admit one event the shared ingress received on this account's behalf.
+
+        The homeserver pushes application-service transactions as events
+        happen, so they are live by construction; what the sync callback learns
+        from nio's provenance is given here by the transport itself.
+        """
+        await self._admit(room, event, nio.TimelineEventProvenance.LIVE)
+
     def _admission_kind(self, event: nio.Event) -> EventKind | None:
         """Return the kind this event is admitted as, or nothing."""
         kind = _event_kind(event)
@@ -7,6 +7,10 @@ JSON and send a compact preview event with a pointer to that sidecar.
 from __future__ import annotations
 
 import json
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from itertools import accumulate
 from time import monotonic
 from typing import TYPE_CHECKING, Any
 
@@ -77,6 +81,9 @@ _FILE_FALLBACK_KEYS = ("url", "file", "filename", "info")
 _NONTERMINAL_STREAM_STATUSES = frozenset({STREAM_STATUS_PENDING, STREAM_STATUS_STREAMING})
 _NONTERMINAL_STREAM_PREVIEW_BYTES = 12000
 _MATRIX_EVENT_HARD_LIMIT = 64000
+_EVENT_METADATA_OVERHEAD_BYTES = 2000  # Event metadata, signatures, etc. around the content.
+# Characters whose UTF-8 or escaped JSON width is not exactly one byte.
+_IRREGULAR_JSON_CHARACTER = re.compile(r"[^\x20\x21\x23-\x5b\x5d-\x7e]")
 _MEGOLM_AES_BLOCK_BYTES = 16
 _MEGOLM_MAX_MESSAGE_INDEX_VARINT_BYTES = 5
 _MEGOLM_BASE64_KEY_LENGTH = 43
@@ -221,7 +228,16 @@ def _calculate_event_size(content: dict[str, Any]) -> int:
     # Convert to canonical JSON (sorted keys, no spaces)
     canonical = json.dumps(content, sort_keys=True, separators=(",", ":"))
     # Add ~2KB overhead for event metadata, signatures, etc.
-    return len(canonical.encode("utf-8")) + 2000
+    return len(canonical.encode("utf-8")) + _EVENT_METADATA_OVERHEAD_BYTES
+
+
+def _serialized_content_bytes(content: dict[str, Any]) -> int:
+    """Return the compact JSON byte length shared by plaintext and Megolm size estimates.
+
+    Key order never changes the length, so this matches both the canonical
+    form and nio's insertion-ordered plaintext.
+    """
+    return len(json.dumps(content, separators=(",", ":")).encode("utf-8"))
 
 
 def _calculate_delivery_event_size(
@@ -250,6 +266,17 @@ def _calculate_delivery_event_size(
         },
     )
     plaintext_bytes = len(plaintext.encode("utf-8"))
+    return _megolm_envelope_size(content, device_id=device_id) + _megolm_ciphertext_bytes(plaintext_bytes)
+
+
+def _megolm_plaintext_overhead_bytes(room_id: str) -> int:
+    """Return the plaintext bytes nio wraps around serialized content before encryption."""
+    envelope = nio.Api.to_json({"content": {}, "type": "m.room.message", "room_id": room_id})
+    return len(envelope.encode("utf-8")) - len("{}")
+
+
+def _megolm_ciphertext_bytes(plaintext_bytes: int) -> int:
+    """Return the unpadded base64 length of one Megolm message for a plaintext length."""
     padded_bytes = ((plaintext_bytes // _MEGOLM_AES_BLOCK_BYTES) + 1) * _MEGOLM_AES_BLOCK_BYTES
     ciphertext_length_varint_bytes = max(1, (padded_bytes.bit_length() + 6) // 7)
     signed_message_bytes = (
@@ -262,11 +289,18 @@ def _calculate_delivery_event_size(
         + 8  # HMAC-SHA-256 truncated MAC.
         + 64  # Ed25519 signature.
     )
-    ciphertext_bytes = ((signed_message_bytes + 2) // 3) * 4
+    return ((signed_message_bytes + 2) // 3) * 4
+
+
+def _megolm_envelope_size(content: dict[str, Any], *, device_id: str | None) -> int:
+    """Return the encrypted event size without its ciphertext.
+
+    Base64 ciphertext is plain ASCII, so it adds exactly its length to this.
+    """
     estimated_content: dict[str, Any] = {
         "algorithm": "m.megolm.v1.aes-sha2",
         "sender_key": "s" * _MEGOLM_BASE64_KEY_LENGTH,
-        "ciphertext": "c" * ciphertext_bytes,
+        "ciphertext": "",
         "session_id": "i" * _MEGOLM_BASE64_KEY_LENGTH,
         "device_id": device_id,
     }
@@ -277,28 +311,48 @@ def _calculate_delivery_event_size(
     return _calculate_event_size(estimated_content)
 
 
+@dataclass(frozen=True, slots=True)
+class _DeliveryEventSizer:
+    """Delivery size estimate bound to the currently observed delivery fields."""
+
+    room_id: str
+    room_encrypted: bool
+    device_id: str | None
+
+    def __call__(self, candidate: dict[str, Any]) -> int:
+        return _calculate_delivery_event_size(
+            candidate,
+            room_id=self.room_id,
+            room_encrypted=self.room_encrypted,
+            device_id=self.device_id,
+        )
+
+    def content_bytes_sizer(self, template: dict[str, Any]) -> Callable[[int], int]:
+        """Return the delivery size of ``template`` as a function of its serialized content bytes.
+
+        Fitting only changes preview text, so the encrypted envelope's relation
+        and visible metadata are serialized once, from the template.
+        """
+        if not self.room_encrypted:
+            return lambda content_bytes: content_bytes + _EVENT_METADATA_OVERHEAD_BYTES
+        envelope_size = _megolm_envelope_size(template, device_id=self.device_id)
+        plaintext_overhead_bytes = _megolm_plaintext_overhead_bytes(self.room_id)
+        return lambda content_bytes: envelope_size + _megolm_ciphertext_bytes(content_bytes + plaintext_overhead_bytes)
+
+
 def _delivery_event_size_calculator(
     client: nio.AsyncClient,
     *,
     room_id: str,
     room_encrypted: bool,
-) -> Callable[[dict[str, Any]], int]:
+) -> _DeliveryEventSizer:
     """Bind the currently observed delivery fields for size estimation."""
     device_id: str | None = None
     if room_encrypted:
         olm = client.olm
         raw_device_id = olm.device_id if olm is not None else client.device_id
         device_id = raw_device_id if isinstance(raw_device_id, str) else None
-
-    def calculate(candidate: dict[str, Any]) -> int:
-        return _calculate_delivery_event_size(
-            candidate,
-            room_id=room_id,
-            room_encrypted=room_encrypted,
-            device_id=device_id,
-        )
-
-    return calculate
+    return _DeliveryEventSizer(room_id=room_id, room_encrypted=room_encrypted, device_id=device_id)
 
 
 def _is_edit_message(content: dict[str, Any]) -> bool:
@@ -407,7 +461,7 @@ def _build_terminal_edit_preview(
     preview_text: str,
     *,
     continuation_indicator: str,
-    calculate_event_size: Callable[[dict[str, Any]], int],
+    calculate_event_size: _DeliveryEventSizer,
 ) -> dict[str, Any]:
     """Fit a terminal edit after all replacement and wrapper metadata is present."""
     preview_body = preview_content.get("body")
@@ -446,26 +500,45 @@ def _build_terminal_edit_preview(
     def fits(inner_content: dict[str, Any], outer_limit: int) -> bool:
         return calculate_event_size(build_event(inner_content, outer_limit)) <= _MATRIX_EVENT_HARD_LIMIT
 
-    empty_inner = build_inner(0)
-    if not fits(empty_inner, 0):
-        raise MatrixEventTooLargeError(_UNREPRESENTABLE_MESSAGE_ERROR)
-
-    maximum_inner_limit = len(preview_body.encode("utf-8"))
-    full_inner = build_inner(maximum_inner_limit)
-    if fits(full_inner, 0):
-        fitted_inner = full_inner
-    else:
+    def fit_limits(limits_fit: Callable[[int, int], bool]) -> dict[str, Any]:
         inner_limit = _largest_fitting_limit(
             maximum_inner_limit,
-            lambda candidate_limit: fits(build_inner(candidate_limit), 0),
+            lambda candidate_limit: limits_fit(candidate_limit, 0),
         )
         fitted_inner = build_inner(inner_limit)
+        outer_limit = _largest_fitting_limit(
+            len(fitted_inner["body"].encode("utf-8")),
+            lambda candidate_limit: limits_fit(inner_limit, candidate_limit),
+        )
+        return build_event(fitted_inner, outer_limit)
 
-    outer_limit = _largest_fitting_limit(
-        len(fitted_inner["body"].encode("utf-8")),
-        lambda candidate_limit: fits(fitted_inner, candidate_limit),
+    empty_inner = build_inner(0)
+    empty_event = build_event(empty_inner, 0)
+    empty_size = calculate_event_size(empty_event)
+    if empty_size > _MATRIX_EVENT_HARD_LIMIT:
+        raise MatrixEventTooLargeError(_UNREPRESENTABLE_MESSAGE_ERROR)
+
+    maximum_inner_limit = len(preview_body.encode("utf-8"))
+    empty_content_bytes = _serialized_content_bytes(empty_event)
+    modelled_size = calculate_event_size.content_bytes_sizer(empty_event)
+    size_model = _PreviewSizeModel(preview_text, continuation_indicator, max_bytes=maximum_inner_limit)
+    tracks_preview_size = isinstance(empty_inner.get("io.mindroom.long_text"), dict)
+
+    def modelled_fits(inner_limit: int, outer_limit: int) -> bool:
+        content_bytes = (
+            empty_content_bytes
+            + size_model.content_growth(inner_limit, tracks_preview_size=tracks_preview_size)
+            + size_model.content_growth(outer_limit, body_prefix="* ")
+        )
+        return modelled_size(content_bytes) <= _MATRIX_EVENT_HARD_LIMIT
+
+    fitted_event = fit_limits(modelled_fits)
+    if calculate_event_size(fitted_event) <= _MATRIX_EVENT_HARD_LIMIT:
+        return fitted_event
+    logger.warning("large_message_size_model_mismatch", is_edit=True, room_id=calculate_event_size.room_id)
+    return fit_limits(
+        lambda inner_limit, outer_limit: fits(build_inner(inner_limit), outer_limit),
     )
-    return build_event(fitted_inner, outer_limit)
 
 
 def _fit_regular_preview(
@@ -473,7 +546,7 @@ def _fit_regular_preview(
     preview_text: str,
     *,
     continuation_indicator: str,
-    calculate_event_size: Callable[[dict[str, Any]], int],
+    calculate_event_size: _DeliveryEventSizer,
 ) -> dict[str, Any]:
     """Fit a non-edit preview after all metadata and relations are present."""
     preview_body = preview_content.get("body")
@@ -507,6 +580,23 @@ def _fit_regular_preview(
     full_preview = build_event(maximum_preview_limit)
     if calculate_event_size(full_preview) <= _MATRIX_EVENT_HARD_LIMIT:
         return full_preview
+
+    empty_content_bytes = _serialized_content_bytes(empty_preview)
+    modelled_size = calculate_event_size.content_bytes_sizer(empty_preview)
+    size_model = _PreviewSizeModel(preview_text, continuation_indicator, max_bytes=maximum_preview_limit)
+    tracks_preview_size = isinstance(empty_preview.get("io.mindroom.long_text"), dict)
+
+    def modelled_fits(preview_limit: int) -> bool:
+        content_bytes = empty_content_bytes + size_model.content_growth(
+            preview_limit,
+            tracks_preview_size=tracks_preview_size,
+        )
+        return modelled_size(content_bytes) <= _MATRIX_EVENT_HARD_LIMIT
+
+    fitted_preview = build_event(_largest_fitting_limit(maximum_preview_limit, modelled_fits))
+    if calculate_event_size(fitted_preview) <= _MATRIX_EVENT_HARD_LIMIT:
+        return fitted_preview
+    logger.warning("large_message_size_model_mismatch", is_edit=False, room_id=calculate_event_size.room_id)
     preview_limit = _largest_fitting_limit(
         maximum_preview_limit,
         lambda candidate_limit: calculate_event_size(build_event(candidate_limit)) <= _MATRIX_EVENT_HARD_LIMIT,
@@ -594,6 +684,84 @@ def _create_preview(
     return _prefix_by_bytes(text, target_bytes) + continuation_indicator
 
 
+class _EscapedTextWidths:
+    """Prefix widths of one text in UTF-8 bytes and in escaped JSON string bytes.
+
+    Only characters whose width differs from one byte are recorded, so mostly
+    ASCII text costs one regex scan and a handful of list entries.
+    """
+
+    def __init__(self, text: str) -> None:
+        self.length = len(text)
+        irregular = _IRREGULAR_JSON_CHARACTER.findall(text)
+        regular_runs = _IRREGULAR_JSON_CHARACTER.split(text)[:-1]
+        # One past each irregular character's index: the prefix length that first includes it.
+        self._prefix_ends = list(accumulate(map((1).__add__, map(len, regular_runs))))
+        distinct = set(irregular)
+        utf8_extra = {character: len(character.encode("utf-8")) - 1 for character in distinct}
+        escaped_extra = {character: len(json.dumps(character)) - 3 for character in distinct}
+        self._utf8_extra = list(accumulate(map(utf8_extra.__getitem__, irregular), initial=0))
+        self._escaped_extra = list(accumulate(map(escaped_extra.__getitem__, irregular), initial=0))
+
+    def utf8_bytes(self, prefix_length: int) -> int:
+        """Return the UTF-8 size of the first ``prefix_length`` characters."""
+        return prefix_length + self._utf8_extra[bisect_right(self._prefix_ends, prefix_length)]
+
+    def escaped_bytes(self, prefix_length: int) -> int:
+        """Return the escaped JSON size of the first ``prefix_length`` characters, without quotes."""
+        return prefix_length + self._escaped_extra[bisect_right(self._prefix_ends, prefix_length)]
+
+    def longest_prefix_within(self, max_bytes: int) -> int:
+        """Return the character count ``_prefix_by_bytes`` keeps for ``max_bytes``."""
+        return _largest_fitting_limit(
+            min(self.length, max(0, max_bytes)),
+            lambda prefix_length: self.utf8_bytes(prefix_length) <= max_bytes,
+        )
+
+
+class _PreviewSizeModel:
+    """Escaped JSON size of ``_create_preview`` output for any byte limit, without building it."""
+
+    def __init__(self, text: str, continuation_indicator: str, *, max_bytes: int) -> None:
+        # No preview within max_bytes can hold more characters than bytes.
+        self._text = _EscapedTextWidths(text[:max_bytes])
+        self._text_bytes = len(text.encode("utf-8"))
+        self._indicator_bytes = len(continuation_indicator.encode("utf-8"))
+        self._indicator = (len(json.dumps(continuation_indicator)) - 2, len(continuation_indicator))
+        stripped_indicator = continuation_indicator.lstrip()
+        self._stripped_indicator = (len(json.dumps(stripped_indicator)) - 2, len(stripped_indicator))
+
+    def escaped_preview(self, max_bytes: int) -> tuple[int, int]:
+        """Return the escaped byte and character counts of the preview for ``max_bytes``.
+
+        A limit of zero is the empty preview, as in the fitting callers.
+        """
+        if max_bytes <= 0:
+            return 0, 0
+        if self._text_bytes <= max_bytes:
+            return self._text.escaped_bytes(self._text.length), self._text.length
+        target_bytes = max_bytes - self._indicator_bytes
+        if target_bytes <= 0:
+            return self._stripped_indicator
+        prefix_length = self._text.longest_prefix_within(target_bytes)
+        indicator_bytes, indicator_characters = self._indicator
+        return self._text.escaped_bytes(prefix_length) + indicator_bytes, prefix_length + indicator_characters
+
+    def content_growth(self, max_bytes: int, *, tracks_preview_size: bool = False, body_prefix: str = "") -> int:
+        """Return the bytes one preview adds to a template serialized with an empty body.
+
+        ``body_prefix`` is prepended to non-empty previews, and
+        ``tracks_preview_size`` counts the wider ``preview_size`` sidecar field.
+        """
+        if max_bytes <= 0:
+            return 0
+        escaped_bytes, characters = self.escaped_preview(max_bytes)
+        growth = len(json.dumps(body_prefix)) - 2 + escaped_bytes
+        if tracks_preview_size:
+            growth += len(str(characters)) - len("0")
+        return growth
+
+
 async def _upload_text_as_mxc(
     client: nio.AsyncClient,
     text: str,
@@ -851,7 +1019,7 @@ def _fit_large_message_preview(
     *,
     is_edit: bool,
     continuation_indicator: str,
-    calculate_event_size: Callable[[dict[str, Any]], int],
+    calculate_event_size: _DeliveryEventSizer,
 ) -> dict[str, Any]:
     """Attach relations and fit one regular or replacement preview."""
     if "m.relates_to" in content:
@@ -0,0 +1,266 @@
+"""Per-room scheduling of outbound Matrix edits.
+
+Every streamed reply is a chain of edits of one event, and a team run or
+several agents answering in parallel put several such chains into the same
+room at once. Each stream used to send its edits as soon as its own throttle
+allowed, so the streams raced each other for the homeserver, one chatty stream
+could hold the room while the others waited, and a terminal edit carrying an
+answer queued behind progress edits that were already out of date.
+
+Every edit sent through ``client_delivery`` now asks this module for a turn in
+its room before it goes out, and the caller sends it once the turn is granted:
+
+- At most ``_MAX_INFLIGHT_EDITS_PER_ROOM`` edits of one room are in flight,
+  and never two edits of the same event, so edits of one event reach the
+  homeserver in the order they were sent.
+- Terminal edits (anything that is not a streaming progress edit) are granted
+  before every waiting progress edit.
+- Waiting progress edits are granted in the order they asked, so each stream
+  gets its turn in rotation.
+- A terminal edit of an event supersedes a progress edit of the same event
+  that is still waiting. The progress caller gets ``None`` back and its edit
+  is never sent.
+
+Progress edits of one stream are not coalesced here: the stream's single
+delivery owner already sends one edit at a time and merges the updates that
+queued behind it (``streaming._drive_stream_delivery``), so one event never has
+two progress edits waiting at once. The owner reports how many updates it
+merged through ``record_coalesced_edits`` so the room's counters show them.
+
+A room whose edits have all finished stays listed for reporting, but only the
+``_IDLE_ROOM_RETENTION`` most recently active idle rooms are kept per loop.
+
+All state lives on the event loop, so the scheduler keeps no locks.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from mindroom.logging_config import get_logger
+from mindroom.timing import elapsed_ms_between
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+logger = get_logger(__name__)
+
+_MAX_INFLIGHT_EDITS_PER_ROOM = 2
+# Idle rooms kept for reporting; older idle rooms are dropped.
+_IDLE_ROOM_RETENTION = 256
+# Queue latency samples kept per room for the reported percentiles.
+_QUEUE_LATENCY_SAMPLES = 256
+
+
+@dataclass(frozen=True, slots=True)
+class _OutboundEditSnapshot:
+    """Current outbound edit scheduling state for one room."""
+
+    room_id: str
+    waiting_edits: int
+    inflight_edits: int
+    sent_edits: int
+    terminal_edits: int
+    superseded_edits: int
+    coalesced_edits: int
+    queue_latency_p50_ms: float | None
+    queue_latency_p95_ms: float | None
+
+    def as_dict(self) -> dict[str, object]:
+        """Return the snapshot as JSON-ready data."""
+        return {
+            "room_id": self.room_id,
+            "waiting_edits": self.waiting_edits,
+            "inflight_edits": self.inflight_edits,
+            "sent_edits": self.sent_edits,
+            "terminal_edits": self.terminal_edits,
+            "superseded_edits": self.superseded_edits,
+            "coalesced_edits": self.coalesced_edits,
+            "queue_latency_p50_ms": self.queue_latency_p50_ms,
+            "queue_latency_p95_ms": self.queue_latency_p95_ms,
+        }
+
+
+@dataclass(eq=False, slots=True)
+class _WaitingEdit:
+    """One edit waiting for its turn; ``turn`` resolves True to send, False when superseded."""
+
+    event_id: str
+    terminal: bool
+    turn: asyncio.Future[bool]
+    queued_at: float
+
+
+@dataclass(slots=True)
+class _RoomOutboundEdits:
+    """Waiting and in-flight edits of one room."""
+
+    room_id: str
+    terminal: deque[_WaitingEdit] = field(default_factory=deque)
+    progress: deque[_WaitingEdit] = field(default_factory=deque)
+    inflight_event_ids: set[str] = field(default_factory=set)
+    sent_edits: int = 0
+    terminal_edits: int = 0
+    superseded_edits: int = 0
+    coalesced_edits: int = 0
+    queue_latencies: deque[float] = field(default_factory=lambda: deque(maxlen=_QUEUE_LATENCY_SAMPLES))
+
+    @property
+    def idle(self) -> bool:
+        """Return whether the room has no waiting or in-flight edits."""
+        return not self.terminal and not self.progress and not self.inflight_event_ids
+
+    def supersede_progress_edits(self, event_id: str) -> None:
+        """Drop the waiting progress edits of ``event_id`` in favour of its terminal edit."""
+        superseded = [waiting for waiting in self.progress if waiting.event_id == event_id]
+        for waiting in superseded:
+            self.progress.remove(waiting)
+            self.superseded_edits += 1
+            if not waiting.turn.done():
+                waiting.turn.set_result(False)
+            logger.debug("outbound_edit_superseded", room_id=self.room_id, event_id=event_id)
+
+    def _next_grantable(self) -> _WaitingEdit | None:
+        for queue in (self.terminal, self.progress):
+            for waiting in queue:
+                if waiting.event_id not in self.inflight_event_ids:
+                    queue.remove(waiting)
+                    return waiting
+        return None
+
+    def grant_turns(self) -> None:
+        """Start as many waiting edits as the room's in-flight budget allows."""
+        while len(self.inflight_event_ids) < _MAX_INFLIGHT_EDITS_PER_ROOM:
+            waiting = self._next_grantable()
+            if waiting is None:
+                return
+            self.inflight_event_ids.add(waiting.event_id)
+            self.queue_latencies.append(time.monotonic() - waiting.queued_at)
+            waiting.turn.set_result(True)
+
+    def forget(self, waiting: _WaitingEdit) -> None:
+        """Remove an edit whose caller stopped waiting for its turn."""
+        queue = self.terminal if waiting.terminal else self.progress
+        if waiting in queue:
+            queue.remove(waiting)
+
+    def snapshot(self) -> _OutboundEditSnapshot:
+        """Return the current scheduling state."""
+        latencies = sorted(self.queue_latencies)
+        return _OutboundEditSnapshot(
+            room_id=self.room_id,
+            waiting_edits=len(self.terminal) + len(self.progress),
+            inflight_edits=len(self.inflight_event_ids),
+            sent_edits=self.sent_edits,
+            terminal_edits=self.terminal_edits,
+            superseded_edits=self.superseded_edits,
+            coalesced_edits=self.coalesced_edits,
+            queue_latency_p50_ms=_percentile_ms(latencies, 0.50),
+            queue_latency_p95_ms=_percentile_ms(latencies, 0.95),
+        )
+
+
+def _percentile_ms(sorted_seconds: list[float], fraction: float) -> float | None:
+    if not sorted_seconds:
+        return None
+    index = min(len(sorted_seconds) - 1, max(0, round(fraction * len(sorted_seconds)) - 1))
+    return elapsed_ms_between(0.0, sorted_seconds[index], ndigits=3)
+
+
+# Turns are futures of one event loop, so rooms are scheduled per loop.
+_ROOMS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, _RoomOutboundEdits]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _room(loop: asyncio.AbstractEventLoop, room_id: str) -> _RoomOutboundEdits:
+    rooms = _ROOMS.setdefault(loop, {})
+    room = rooms.get(room_id)
+    if room is None:
+        room = _RoomOutboundEdits(room_id)
+        rooms[room_id] = room
+    return room
+
+
+def _retire_if_idle(loop: asyncio.AbstractEventLoop, room: _RoomOutboundEdits) -> None:
+    """Move an idle room to the back of its loop's rooms and drop the oldest idle rooms past retention."""
+    rooms = _ROOMS.get(loop)
+    if rooms is None or not room.idle or rooms.get(room.room_id) is not room:
+        return
+    del rooms[room.room_id]
+    rooms[room.room_id] = room
+    idle_room_ids = [room_id for room_id, candidate in rooms.items() if candidate.idle]
+    for room_id in idle_room_ids[: max(len(idle_room_ids) - _IDLE_ROOM_RETENTION, 0)]:
+        del rooms[room_id]
+
+
+def record_coalesced_edits(room_id: str, count: int) -> None:
+    """Count ``count`` progress updates a stream merged into its next edit instead of sending."""
+    if count <= 0:
+        return
+    loop = asyncio.get_running_loop()
+    room = _room(loop, room_id)
+    room.coalesced_edits += count
+    _retire_if_idle(loop, room)
+
+
+async def run_scheduled_edit[T](
+    room_id: str,
+    event_id: str,
+    send: Callable[[], Awaitable[T]],
+    *,
+    terminal: bool,
+) -> T | None:
+    """Run ``send`` once the room grants this edit a turn.
+
+    Returns ``None`` without calling ``send`` when a terminal edit of the
+    same event superseded this progress edit while it waited.
+    """
+    loop = asyncio.get_running_loop()
+    room = _room(loop, room_id)
+    waiting = _WaitingEdit(
+        event_id=event_id,
+        terminal=terminal,
+        turn=loop.create_future(),
+        queued_at=time.monotonic(),
+    )
+    if terminal:
+        room.supersede_progress_edits(event_id)
+        room.terminal.append(waiting)
+    else:
+        room.progress.append(waiting)
+    room.grant_turns()
+    try:
+        granted = await waiting.turn
+    except asyncio.CancelledError:
+        if waiting.turn.done() and not waiting.turn.cancelled() and waiting.turn.result():
+            # The turn was granted just before the cancellation landed.
+            room.inflight_event_ids.discard(event_id)
+        else:
+            room.forget(waiting)
+        room.grant_turns()
+        _retire_if_idle(loop, room)
+        raise
+    if not granted:
+        _retire_if_idle(loop, room)
+        return None
+    try:
+        return await send()
+    finally:
+        room.sent_edits += 1
+        if terminal:
+            room.terminal_edits += 1
+        room.inflight_event_ids.discard(event_id)
+        room.grant_turns()
+        _retire_if_idle(loop, room)
+
+
+def outbound_edit_snapshots() -> list[_OutboundEditSnapshot]:
+    """Return the outbound edit scheduling state of every room this process has edited in."""
+    rooms = [room for loop_rooms in list(_ROOMS.values()) for room in loop_rooms.values()]
+    return [room.snapshot() for room in sorted(rooms, key=lambda room: room.room_id)]
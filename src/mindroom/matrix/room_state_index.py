@@ -0,0 +1,108 @@
+"""Sync-maintained per-account projection of one custom room state event type.
+
+Reading one custom state type through ``/state`` downloads every state event
+in the room, which in a busy room is megabytes per read. This index keeps the
+``state_key -> content`` map of a single event type per ``(account, room)``
+current from the classic sync stream instead, so reads are answered locally
+and the full-state fetch happens only once per room, to prime it.
+
+A room is served locally only while every state change since its priming
+fetch is known to have been applied. The entry is dropped, so the next read
+refetches, when sync reports a limited timeline for the room, when the account
+leaves it, when the account switches to sliding sync (whose required-state
+filter may not carry the type), and when its bot stops syncing. A priming
+fetch that races a sync update for the same room is used for that read only
+and not stored, because it may predate the update.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, cast
+
+import nio
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+type _RoomKey = tuple[str, str]
+type RoomStateEntries = dict[str, Mapping[str, object]]
+
+
+def state_entries_from_events(event_type: str, events: Iterable[Mapping[str, object]]) -> RoomStateEntries:
+    """Return the ``state_key -> content`` map of ``event_type`` from raw state events."""
+    entries: RoomStateEntries = {}
+    for event in events:
+        if event.get("type") != event_type:
+            continue
+        state_key = event.get("state_key")
+        content = event.get("content")
+        if isinstance(state_key, str) and isinstance(content, Mapping):
+            entries[state_key] = cast("Mapping[str, object]", content)
+    return entries
+
+
+class RoomStateIndex:
+    """Per-account, per-room state map of one event type, kept current from classic sync."""
+
+    def __init__(self, event_type: str) -> None:
+        self._event_type = event_type
+        self._rooms: dict[_RoomKey, RoomStateEntries] = {}
+        self._generations: dict[_RoomKey, int] = {}
+        self._syncing_user_ids: set[str] = set()
+
+    def room_state(self, user_id: str, room_id: str) -> RoomStateEntries | None:
+        """Return a copy of the indexed state for one room, or None when it must be fetched."""
+        entries = self._rooms.get((user_id, room_id))
+        return dict(entries) if entries is not None else None
+
+    def generation(self, user_id: str, room_id: str) -> int:
+        """Return the change counter a priming fetch must see unchanged to be stored."""
+        return self._generations.get((user_id, room_id), 0)
+
+    def prime(self, user_id: str, room_id: str, entries: RoomStateEntries, *, generation: int) -> None:
+        """Store one full-state fetch unless the room changed while it was in flight."""
+        if user_id not in self._syncing_user_ids or self.generation(user_id, room_id) != generation:
+            return
+        self._rooms[user_id, room_id] = dict(entries)
+
+    def observe_sync(self, user_id: str, response: nio.SyncResponse | nio.SlidingSyncResponse) -> None:
+        """Apply one sync response's state changes for ``user_id``."""
+        if not isinstance(response, nio.SyncResponse):
+            self.forget_user(user_id)
+            return
+        self._syncing_user_ids.add(user_id)
+        for room_id, join_info in response.rooms.join.items():
+            if join_info.timeline.limited:
+                self._invalidate(user_id, room_id)
+                continue
+            changes = state_entries_from_events(
+                self._event_type,
+                (event.source for event in (*join_info.state, *join_info.timeline.events)),
+            )
+            if changes:
+                self._apply(user_id, room_id, changes)
+        for room_id in response.rooms.leave:
+            self._invalidate(user_id, room_id)
+
+    def record_write(self, user_id: str, room_id: str, state_key: str, content: Mapping[str, object]) -> None:
+        """Apply this account's own successful state write ahead of its sync echo."""
+        self._apply(user_id, room_id, {state_key: content})
+
+    def forget_user(self, user_id: str) -> None:
+        """Drop every room of one account and stop priming for it until it syncs again."""
+        self._syncing_user_ids.discard(user_id)
+        for key in [key for key in self._rooms if key[0] == user_id]:
+            self._invalidate(*key)
+
+    def _apply(self, user_id: str, room_id: str, changes: RoomStateEntries) -> None:
+        key = (user_id, room_id)
+        self._generations[key] = self._generations.get(key, 0) + 1
+        entries = self._rooms.get(key)
+        if entries is not None:
+            entries.update(changes)
+
+    def _invalidate(self, user_id: str, room_id: str) -> None:
+        key = (user_id, room_id)
+        self._generations[key] = self._generations.get(key, 0) + 1
+        self._rooms.pop(key, None)
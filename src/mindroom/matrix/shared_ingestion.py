@@ -0,0 +1,186 @@
+"""Process-wide fan-out of plaintext room events to every joined agent account.
+
+Without it each account's classic sync downloads and parses the same room
+timeline, so a deployment with thirty agents in one room pays for every
+message thirty times. With ``matrix_sync.shared_ingestion`` the homeserver
+pushes each event once, as an application-service transaction, and this
+module parses it once and hands the same object to the journal ingress of
+every account that is joined to the room or configured for it.
+
+Per-account sync keeps everything this cannot deliver: room state and
+membership, encrypted events that only the recipient's devices can decrypt,
+and to-device traffic. Its checkpoint semantics are untouched because the
+fanned-out types are simply filtered out of its timeline. The transaction is
+acknowledged only once every relevant account has durably admitted every
+event, so a refused admission makes the homeserver retry the whole
+transaction, exactly as a refused sync admission keeps nio's checkpoint where
+it was. Journal admission is idempotent, so accounts that already admitted an
+event on the first attempt see a duplicate rather than a second turn.
+
+An account that is configured for a room but has no running bot yet, or whose
+bot has not finished its first sync, cannot admit anything, and its own sync
+will never download the events it is missing. Such an account defers the
+transaction too, so nothing is acknowledged on its behalf.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Protocol, cast
+
+import nio
+
+from mindroom.logging_config import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping, Sequence
+
+logger = get_logger(__name__)
+
+# Unencrypted timeline types that can start or shape a turn. Encrypted rooms
+# deliver all of these as `m.room.encrypted`, which stays on per-account sync.
+_SHARED_INGESTION_EVENT_TYPES: tuple[str, ...] = (
+    "m.room.message",
+    "m.reaction",
+    "m.room.redaction",
+    "io.mindroom.tool_approval_response",
+)
+# Homeservers retry an unacknowledged transaction with the same id; remembering
+# completed ids turns a retry that raced its own acknowledgement into a no-op.
+_COMPLETED_TRANSACTION_ID_LIMIT = 1024
+
+
+class SharedIngestionUnavailableError(RuntimeError):
+    """One transaction could not be admitted by every relevant account yet."""
+
+
+class _SharedIngestionTarget(Protocol):
+    """One agent account that can durably admit fanned-out room events."""
+
+    @property
+    def agent_name(self) -> str:
+        """Return the configured entity name, for logs."""
+        ...
+
+    def shared_ingestion_room_ids(self) -> frozenset[str]:
+        """Return the rooms this account is joined to or configured for."""
+        ...
+
+    def shared_ingestion_ready(self) -> bool:
+        """Return whether this account's journal can admit events now."""
+        ...
+
+    async def admit_shared_event(self, room_id: str, event: nio.Event) -> None:
+        """Durably admit one live event, raising when the journal refuses it."""
+        ...
+
+
+def shared_ingestion_sync_filter(sync_filter: Mapping[str, object]) -> dict[str, object]:
+    """Return one classic sync filter that leaves fanned-out timeline types to the shared ingress."""
+    room_filter = sync_filter.get("room")
+    room = dict(room_filter) if isinstance(room_filter, dict) else {}
+    timeline_filter = room.get("timeline")
+    timeline = dict(timeline_filter) if isinstance(timeline_filter, dict) else {}
+    existing_not_types = timeline.get("not_types")
+    not_types = list(existing_not_types) if isinstance(existing_not_types, list) else []
+    not_types.extend(event_type for event_type in _SHARED_INGESTION_EVENT_TYPES if event_type not in not_types)
+    timeline["not_types"] = not_types
+    room["timeline"] = timeline
+    return {**sync_filter, "room": room}
+
+
+def _parse_transaction_event(source: object) -> tuple[str, nio.Event] | None:
+    """Parse one transaction event the shared ingress owns into its room and typed event."""
+    if not isinstance(source, dict):
+        return None
+    event_source = cast("dict[str, object]", source)
+    if event_source.get("type") not in _SHARED_INGESTION_EVENT_TYPES:
+        return None
+    room_id = event_source.get("room_id")
+    if not isinstance(room_id, str) or not isinstance(event_source.get("event_id"), str):
+        return None
+    event = nio.Event.parse_event(event_source)
+    return (room_id, event) if isinstance(event, nio.Event) else None
+
+
+class SharedSyncFanout:
+    """Decode application-service transactions once and admit them for every joined account."""
+
+    def __init__(
+        self,
+        targets: Callable[[], Iterable[_SharedIngestionTarget]],
+        *,
+        configured_room_ids: Callable[[], Mapping[str, frozenset[str]]] = dict,
+    ) -> None:
+        self._targets = targets
+        self._configured_room_ids = configured_room_ids
+        self._transaction_lock = asyncio.Lock()
+        self._completed_transaction_ids: OrderedDict[str, None] = OrderedDict()
+
+    async def ingest_transaction(self, transaction_id: str, events: Sequence[object]) -> int:
+        """Admit one transaction for every relevant account and return the number of admissions.
+
+        Transactions are processed one at a time so every account sees events
+        in the order the homeserver sent them.
+        """
+        async with self._transaction_lock:
+            if transaction_id in self._completed_transaction_ids:
+                return 0
+            parsed = [entry for source in events if (entry := _parse_transaction_event(source)) is not None]
+            admissions = await self._fan_out(parsed) if parsed else 0
+            self._completed_transaction_ids[transaction_id] = None
+            while len(self._completed_transaction_ids) > _COMPLETED_TRANSACTION_ID_LIMIT:
+                self._completed_transaction_ids.popitem(last=False)
+            return admissions
+
+    async def _fan_out(self, parsed: list[tuple[str, nio.Event]]) -> int:
+        plans: list[tuple[_SharedIngestionTarget, list[tuple[str, nio.Event]]]] = []
+        unavailable: list[str] = []
+        targets = tuple(self._targets())
+        registered = {target.agent_name for target in targets}
+        transaction_room_ids = {room_id for room_id, _event in parsed}
+        for agent_name, room_ids in self._configured_room_ids().items():
+            if agent_name not in registered and not room_ids.isdisjoint(transaction_room_ids):
+                # No running bot admits for this account yet, and its sync
+                # will not download these events once it starts.
+                unavailable.append(agent_name)
+        for target in targets:
+            joined_room_ids = target.shared_ingestion_room_ids()
+            relevant = [(room_id, event) for room_id, event in parsed if room_id in joined_room_ids]
+            if not relevant:
+                continue
+            if not target.shared_ingestion_ready():
+                # Acknowledging now would lose events this account's own sync
+                # no longer downloads, so the homeserver has to retry instead.
+                unavailable.append(target.agent_name)
+                continue
+            plans.append((target, relevant))
+        if unavailable:
+            msg = f"Shared ingestion targets are not ready: {', '.join(sorted(unavailable))}"
+            raise SharedIngestionUnavailableError(msg)
+        results = await asyncio.gather(
+            *(self._admit_in_order(target, relevant) for target, relevant in plans),
+            return_exceptions=True,
+        )
+        failures = [
+            (target.agent_name, result)
+            for (target, _relevant), result in zip(plans, results, strict=True)
+            if isinstance(result, BaseException)
+        ]
+        if failures:
+            for agent_name, error in failures:
+                logger.warning(
+                    "shared_ingestion_admission_refused",
+                    agent_name=agent_name,
+                    error_type=type(error).__name__,
+                    error=str(error),
+                )
+            msg = f"Shared ingestion admission refused for: {', '.join(sorted(name for name, _ in failures))}"
+            raise SharedIngestionUnavailableError(msg)
+        return sum(len(relevant) for _target, relevant in plans)
+
+    @staticmethod
+    async def _admit_in_order(target: _SharedIngestionTarget, relevant: list[tuple[str, nio.Event]]) -> None:
+        for room_id, event in relevant:
+            await target.admit_shared_event(room_id, event)
@@ -56,10 +56,11 @@ from mindroom.streaming import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Iterable, Sequence
+    from collections.abc import AsyncIterator, Iterable, Mapping, Sequence
 
     from mindroom.config.main import Config
     from mindroom.constants import RuntimePaths
+    from mindroom.event_journal import InflightStreamRecoveryView
 
 logger = get_logger(__name__)
 
@@ -105,6 +106,11 @@ class _StaleStreamRecoveryResult:
     room_count: int
     cleaned_count: int
     resumed_count: int
+    # Joined rooms left unvisited because no account's stream index named them.
+    skipped_room_count: int = 0
+    # Accounts whose every joined room was listed and, where visited, finished.
+    # Bookkeeping for the stream index, not part of the sweep's outcome.
+    fully_swept_user_ids: frozenset[str] = field(default=frozenset(), compare=False)
 
 
 @dataclass
@@ -146,6 +152,7 @@ class _JoinedRoomState:
 
     room_actors: dict[str, dict[str, nio.AsyncClient]]
     resume_room_ids: frozenset[str] | None
+    unlisted_user_ids: frozenset[str] = frozenset()
 
 
 def _cleanup_scan_policy(
@@ -223,18 +230,37 @@ async def recover_stale_streaming_messages(
     startup_cutoff_ms: int | None,
     scanned_room_ids: set[str],
     target_room_ids: set[str] | None = None,
+    indexed_room_ids: Mapping[str, frozenset[str] | None] | None = None,
     room_concurrency: int = _RECOVERY_ROOM_CONCURRENCY,
 ) -> _StaleStreamRecoveryResult:
-    """Recover stale streams through one concurrent Matrix-history path."""
+    """Recover stale streams through one concurrent Matrix-history path.
+
+    ``indexed_room_ids`` maps an actor's user ID to the rooms its journal says
+    hold an open or resumable stream, or to ``None`` when that journal predates
+    the index. A room is then scanned only if some joined actor's index names
+    it or cannot vouch for it; without the mapping every joined room is.
+    """
     joined_room_state = await _joined_room_actors(actors, resume_client=resume_client)
-    room_actors = {
+    candidate_room_actors = {
         room_id: joined_actors
         for room_id, joined_actors in joined_room_state.room_actors.items()
         if room_id not in scanned_room_ids and (target_room_ids is None or room_id in target_room_ids)
     }
+    room_actors = {
+        room_id: joined_actors
+        for room_id, joined_actors in candidate_room_actors.items()
+        if _room_may_hold_stale_streams(room_id, joined_actors, indexed_room_ids)
+    }
+    skipped_room_count = len(candidate_room_actors) - len(room_actors)
     scanned_room_ids.update(room_actors)
     if not room_actors:
-        return _StaleStreamRecoveryResult(room_count=0, cleaned_count=0, resumed_count=0)
+        return _StaleStreamRecoveryResult(
+            room_count=0,
+            cleaned_count=0,
+            resumed_count=0,
+            skipped_room_count=skipped_room_count,
+            fully_swept_user_ids=frozenset(actors) - joined_room_state.unlisted_user_ids,
+        )
 
     semaphore = asyncio.Semaphore(max(1, room_concurrency))
     all_bot_user_ids = set(actors)
@@ -299,13 +325,77 @@ async def recover_stale_streaming_messages(
                 task.cancel()
         await asyncio.gather(*tasks, return_exceptions=True)
 
+    unfinished_user_ids = {
+        user_id
+        for room_id, joined_actors in room_actors.items()
+        if room_id not in scanned_room_ids
+        for user_id in joined_actors
+    }
     return _StaleStreamRecoveryResult(
         room_count=len(room_actors),
         cleaned_count=cleaned_count,
         resumed_count=resumed_count,
+        skipped_room_count=skipped_room_count,
+        fully_swept_user_ids=frozenset(actors) - joined_room_state.unlisted_user_ids - unfinished_user_ids,
     )
 
 
+def _room_may_hold_stale_streams(
+    room_id: str,
+    joined_actors: Mapping[str, nio.AsyncClient],
+    indexed_room_ids: Mapping[str, frozenset[str] | None] | None,
+) -> bool:
+    """Return whether any joined actor's stream index names this room or cannot rule it out."""
+    if indexed_room_ids is None:
+        return True
+    for user_id in joined_actors:
+        actor_room_ids = indexed_room_ids.get(user_id)
+        if actor_room_ids is None or room_id in actor_room_ids:
+            return True
+    return False
+
+
+async def read_inflight_stream_index(
+    stores: Mapping[str, InflightStreamRecoveryView],
+) -> dict[str, frozenset[str] | None]:
+    """Return each actor's indexed stream rooms, or ``None`` where its index cannot narrow the scan."""
+    indexed_room_ids: dict[str, frozenset[str] | None] = {}
+    for user_id, store in stores.items():
+        try:
+            indexed_room_ids[user_id] = await store.inflight_stream_room_ids()
+        except Exception:
+            logger.warning("Failed to read the in-flight stream index", user_id=user_id, exc_info=True)
+            indexed_room_ids[user_id] = None
+    return indexed_room_ids
+
+
+async def settle_inflight_stream_index(
+    stores: Mapping[str, InflightStreamRecoveryView],
+    *,
+    indexed_room_ids: Mapping[str, frozenset[str] | None],
+    result: _StaleStreamRecoveryResult,
+    recovered_room_ids: set[str],
+    startup_cutoff_ms: int,
+) -> None:
+    """Drop index rows a startup pass dealt with, and grant coverage after a full sweep.
+
+    Coverage is only granted to an account whose journal could not narrow
+    this pass and whose every joined room was nonetheless swept to the end,
+    because only then is every stream older than the pass accounted for.
+    """
+    for user_id, store in stores.items():
+        try:
+            await store.settle_inflight_streams(
+                recovered_room_ids=recovered_room_ids,
+                recorded_before_ms=startup_cutoff_ms,
+                expired_before_ms=startup_cutoff_ms - _STALE_STREAM_LOOKBACK_MS,
+            )
+            if indexed_room_ids.get(user_id) is None and user_id in result.fully_swept_user_ids:
+                await store.mark_inflight_streams_covered(tracked_since_ms=startup_cutoff_ms)
+        except Exception:
+            logger.warning("Failed to settle the in-flight stream index", user_id=user_id, exc_info=True)
+
+
 async def _joined_room_actors(
     actors: dict[str, nio.AsyncClient],
     *,
@@ -337,14 +427,21 @@ async def _joined_room_actors(
     )
     room_actors: dict[str, dict[str, nio.AsyncClient]] = {}
     resume_room_ids: frozenset[str] | None = None
+    unlisted_user_ids: set[str] = set()
     for bot_user_id, client, joined_room_ids in joined_room_results:
         if bot_user_id == resume_user_id and joined_room_ids is not None:
             resume_room_ids = frozenset(joined_room_ids)
         if bot_user_id not in actors:
             continue
+        if joined_room_ids is None:
+            unlisted_user_ids.add(bot_user_id)
         for room_id in joined_room_ids or []:
             room_actors.setdefault(room_id, {})[bot_user_id] = client
-    return _JoinedRoomState(room_actors=room_actors, resume_room_ids=resume_room_ids)
+    return _JoinedRoomState(
+        room_actors=room_actors,
+        resume_room_ids=resume_room_ids,
+        unlisted_user_ids=frozenset(unlisted_user_ids),
+    )
 
 
 async def _auto_resume_interrupted_threads(
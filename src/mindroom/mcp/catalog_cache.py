@@ -0,0 +1,153 @@
+"""Persisted MCP catalogs for fast restarts.
+
+Starting the runtime used to wait for every configured MCP server to be
+spawned or connected, initialized, and asked for its tool list before any bot
+was created, and a config reload that recreated the manager did the same. For
+a few stdio servers started through ``npx`` or ``uvx`` that is seconds of
+startup spent rediscovering catalogs that almost never change between boots.
+
+Every catalog the manager publishes is now written to
+``<storage>/mcp/catalog_cache.json``, keyed by server ID together with a
+fingerprint of that server's config. On the next boot a server whose config
+fingerprint matches is seeded with its cached catalog and marked stale, so its
+tools are available to the first bots immediately, while the manager connects
+and rediscovers in the background. When the live catalog differs from the
+cached one, the usual catalog-change notification reloads the entities that
+use the server; when discovery fails, the entry is dropped so the next boot
+waits for discovery again.
+
+Only servers without OAuth that are not ``required`` are seeded. OAuth
+catalogs depend on the requester's credentials, and required servers are
+documented to block dependent agents until they are reachable.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any
+
+from mindroom.durable_write import write_json_file_durable
+from mindroom.logging_config import get_logger
+from mindroom.mcp.types import MCPDiscoveredTool, MCPServerCatalog
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from mindroom.constants import RuntimePaths
+    from mindroom.mcp.config import MCPServerConfig
+
+logger = get_logger(__name__)
+
+_CACHE_VERSION = 1
+
+
+def mcp_catalog_cache_path(runtime_paths: RuntimePaths) -> Path:
+    """Return the persisted MCP catalog cache path for one runtime."""
+    return runtime_paths.storage_root / "mcp" / "catalog_cache.json"
+
+
+def _mcp_server_config_fingerprint(server_id: str, server_config: MCPServerConfig) -> str:
+    """Return a stable fingerprint of everything that shapes one server's catalog."""
+    payload = {"server_id": server_id, "config": server_config.model_dump(mode="json")}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _catalog_payload(catalog: MCPServerCatalog) -> dict[str, object]:
+    return {
+        "server_id": catalog.server_id,
+        "tool_name": catalog.tool_name,
+        "tool_prefix": catalog.tool_prefix,
+        "tools": [asdict(tool) for tool in catalog.tools],
+        "instructions": catalog.instructions,
+        "catalog_hash": catalog.catalog_hash,
+    }
+
+
+def _catalog_from_payload(payload: dict[str, Any]) -> MCPServerCatalog:
+    tools = payload["tools"]
+    if not isinstance(tools, list):
+        msg = "cached MCP catalog tools must be a list"
+        raise TypeError(msg)
+    instructions = payload["instructions"]
+    return MCPServerCatalog(
+        server_id=str(payload["server_id"]),
+        tool_name=str(payload["tool_name"]),
+        tool_prefix=str(payload["tool_prefix"]),
+        tools=tuple(MCPDiscoveredTool(**tool) for tool in tools),
+        instructions=instructions if isinstance(instructions, str) else None,
+        catalog_hash=str(payload["catalog_hash"]),
+    )
+
+
+class MCPCatalogCache:
+    """Fingerprint-keyed catalogs of the last successful discovery per server."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._entries: dict[str, dict[str, Any]] | None = None
+        self._write_lock = asyncio.Lock()
+
+    def _load_entries(self) -> dict[str, dict[str, Any]]:
+        if self._entries is not None:
+            return self._entries
+        entries: dict[str, dict[str, Any]] = {}
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            raw = None
+        except (OSError, UnicodeError, json.JSONDecodeError) as exc:
+            logger.warning("MCP catalog cache unreadable; ignoring it", path=str(self.path), error=str(exc))
+            raw = None
+        if isinstance(raw, dict) and raw.get("version") == _CACHE_VERSION and isinstance(raw.get("servers"), dict):
+            entries = {
+                server_id: entry
+                for server_id, entry in raw["servers"].items()
+                if isinstance(server_id, str) and isinstance(entry, dict)
+            }
+        self._entries = entries
+        return entries
+
+    def load(self, server_id: str, server_config: MCPServerConfig) -> MCPServerCatalog | None:
+        """Return the cached catalog of one server when its config fingerprint still matches."""
+        entry = self._load_entries().get(server_id)
+        if entry is None or entry.get("fingerprint") != _mcp_server_config_fingerprint(server_id, server_config):
+            return None
+        catalog_payload = entry.get("catalog")
+        if not isinstance(catalog_payload, dict):
+            return None
+        try:
+            return _catalog_from_payload(catalog_payload)
+        except (KeyError, TypeError) as exc:
+            logger.warning("MCP catalog cache entry malformed; ignoring it", server_id=server_id, error=str(exc))
+            return None
+
+    async def store(self, server_id: str, server_config: MCPServerConfig, catalog: MCPServerCatalog) -> None:
+        """Persist one freshly discovered catalog unless the cached copy is already identical."""
+        entry = {
+            "fingerprint": _mcp_server_config_fingerprint(server_id, server_config),
+            "catalog": _catalog_payload(catalog),
+        }
+        async with self._write_lock:
+            entries = self._load_entries()
+            if entries.get(server_id) == entry:
+                return
+            entries[server_id] = entry
+            await self._write(entries)
+
+    async def evict(self, server_id: str) -> None:
+        """Forget one server's catalog so the next boot waits for live discovery."""
+        async with self._write_lock:
+            entries = self._load_entries()
+            if entries.pop(server_id, None) is None:
+                return
+            await self._write(entries)
+
+    async def _write(self, entries: dict[str, dict[str, Any]]) -> None:
+        payload = {"version": _CACHE_VERSION, "servers": dict(entries)}
+        try:
+            await asyncio.to_thread(write_json_file_durable, self.path, payload, sort_keys=True)
+        except OSError as exc:
+            logger.warning("MCP catalog cache write failed", path=str(self.path), error=str(exc))
@@ -104,6 +104,37 @@ class MCPOAuthConfig(BaseModel):
         return normalized
 
 
+class MCPResultCacheConfig(BaseModel):
+    """Opt-in result caching for read-only MCP tools."""
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    enabled: bool = Field(default=True, description="Whether cacheable tool results are reused")
+    ttl_seconds: float = Field(default=60.0, gt=0, description="How long one cached result stays valid")
+    max_entries: int = Field(default=256, ge=1, description="Maximum cached results kept for this server")
+    use_annotations: bool = Field(
+        default=True,
+        description="Cache tools that advertise the MCP readOnlyHint annotation",
+    )
+    tools: list[str] = Field(default_factory=list, description="Remote tool names to cache regardless of annotations")
+
+    @field_validator("tools", mode="before")
+    @classmethod
+    def normalize_tools(cls, value: object) -> object:
+        """Strip cached tool names at parse time so matching stays predictable."""
+        if value is None or not isinstance(value, list):
+            return value
+        normalized: list[str] = []
+        for entry in value:
+            if not isinstance(entry, str):
+                msg = "MCP result_cache tools must be strings"
+                raise TypeError(msg)
+            stripped = entry.strip()
+            if stripped:
+                normalized.append(stripped)
+        return normalized
+
+
 class MCPServerConfig(BaseModel):
     """Config for one MCP server connection."""
 
@@ -133,6 +164,10 @@ class MCPServerConfig(BaseModel):
     call_timeout_seconds: float = Field(default=120.0, gt=0, description="Default call timeout")
     max_concurrent_calls: int = Field(default=1, ge=1, description="Maximum concurrent calls")
     auto_reconnect: bool = Field(default=True, description="Whether to reconnect automatically")
+    result_cache: MCPResultCacheConfig | None = Field(
+        default=None,
+        description="Optional result cache for read-only tools",
+    )
 
     @field_validator("description")
     @classmethod
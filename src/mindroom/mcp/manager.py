@@ -18,6 +18,7 @@ from mcp import ClientSession
 from mindroom.background_tasks import run_coroutine_until_complete
 from mindroom.credentials import get_runtime_credentials_manager
 from mindroom.logging_config import get_logger
+from mindroom.mcp.catalog_cache import MCPCatalogCache, mcp_catalog_cache_path
 from mindroom.mcp.config import (
     MCPServerConfig,
     resolved_mcp_tool_prefix,
@@ -33,6 +34,11 @@ from mindroom.mcp.errors import (
 )
 from mindroom.mcp.oauth import mcp_oauth_provider, mcp_oauth_provider_id
 from mindroom.mcp.registry import mcp_tool_name
+from mindroom.mcp.result_cache import (
+    MCPToolResultCache,
+    canonical_tool_arguments,
+    mcp_tool_result_cacheable,
+)
 from mindroom.mcp.results import tool_result_from_call_result
 from mindroom.mcp.surface_projection import (
     MCPFunctionSurfaceContext,
@@ -223,6 +229,8 @@ class MCPServerManager:
         self._state_lifecycle_lock = asyncio.Lock()
         self._sync_lock = asyncio.Lock()
         self._on_catalog_change = on_catalog_change
+        self._result_cache = MCPToolResultCache()
+        self._catalog_cache = MCPCatalogCache(mcp_catalog_cache_path(runtime_paths))
         self._config: Config | None = None
         self._last_config_generation = 0
         self._shutdown = False
@@ -244,6 +252,10 @@ class MCPServerManager:
         """Return failed servers configured to block dependent agent startup."""
         return {server_id for server_id in self.failed_server_ids() if self._states[server_id].config.required}
 
+    def result_cache_stats(self) -> dict[str, dict[str, int]]:
+        """Return result cache hit, miss, and entry counts by server id."""
+        return {server_id: stats.as_dict() for server_id, stats in sorted(self._result_cache.stats().items())}
+
     def get_catalog(self, server_id: str) -> MCPServerCatalog:
         """Return the cached catalog for one server."""
         state = self._require_state(server_id)
@@ -283,6 +295,9 @@ class MCPServerManager:
                     continue
 
                 retry_pending = state.refresh_task is not None and not state.refresh_task.done()
+                if not retry_pending and self._restore_cached_catalog(state):
+                    changed_server_ids.add(server_id)
+                    continue
                 if (
                     (state.catalog is None or state.stale or state.last_error is not None or not state.connected)
                     and not retry_pending
@@ -298,6 +313,37 @@ class MCPServerManager:
             changed_server_ids.difference_update(self.failed_server_ids())
             return changed_server_ids
 
+    def _restore_cached_catalog(self, state: MCPServerState) -> bool:
+        """Publish the persisted catalog of a never-discovered server and revalidate it in the background."""
+        if (
+            state.catalog is not None
+            or state.last_error is not None
+            or state.consecutive_failures > 0
+            or state.config.required
+        ):
+            return False
+        catalog = self._catalog_cache.load(state.server_id, state.config)
+        if catalog is None:
+            return False
+        state.catalog = catalog
+        state.stale = True
+        state.restored_from_cache = True
+        self._invalidate_result_cache(state.server_id)
+        logger.info(
+            "MCP server catalog restored from startup cache",
+            server_id=state.server_id,
+            transport=state.config.transport,
+            tool_count=len(catalog.tools),
+        )
+        self._schedule_refresh_task(state)
+        return True
+
+    async def _await_cached_catalog_revalidation(self, state: MCPServerState) -> None:
+        """Let a call against a restored catalog use the connection its revalidation is opening."""
+        refresh_task = state.refresh_task
+        if state.restored_from_cache and refresh_task is not None and not refresh_task.done():
+            await asyncio.wait({refresh_task})
+
     def _track_retiring_state(
         self,
         state: MCPServerState,
@@ -352,6 +398,7 @@ class MCPServerManager:
                 ):
                     continue
                 self._states.pop(server_id)
+                self._invalidate_result_cache(server_id)
                 self._track_retiring_state(state, retired_states)
                 for key, scoped_state in tuple(self._scoped_states.items()):
                     if key.server_id == server_id:
@@ -430,6 +477,7 @@ class MCPServerManager:
             async with self._state_lifecycle_lock:
                 self._states.clear()
                 self._scoped_states.clear()
+                self._result_cache.clear()
                 self._retiring_states.clear()
                 self._scope_retirement_locks.clear()
                 self._retired_scope_keys.clear()
@@ -485,6 +533,8 @@ class MCPServerManager:
             msg = f"MCP server '{server_id}' authorization changed repeatedly during tool dispatch"
             raise MCPConnectionError(server_id, msg)
 
+        if state.catalog is None or state.session is None or not state.connected:
+            await self._await_cached_catalog_revalidation(state)
         if state.catalog is None or state.session is None or not state.connected:
             await self._refresh_server_catalog(state, notify=False)
         return await self._call_tool_once_or_reconnect(
@@ -992,28 +1042,94 @@ class MCPServerManager:
         include_tools: Collection[str] | None = None,
         exclude_tools: Collection[str] | None = None,
     ) -> ToolResult:
+        cache_arguments = await self._cacheable_call_arguments(
+            state,
+            remote_tool_name,
+            arguments,
+            authorization_lease=authorization_lease,
+            include_tools=include_tools,
+            exclude_tools=exclude_tools,
+        )
+        oauth_scope = authorization_lease.session_key.oauth_scope_key if authorization_lease is not None else None
+        if cache_arguments is not None:
+            # A hit never queues behind a concurrency slot or a catalog refresh.
+            cached_result = self._result_cache.get(
+                state.server_id,
+                config_generation=state.config_generation,
+                remote_tool_name=remote_tool_name,
+                arguments=cache_arguments,
+                oauth_scope=oauth_scope,
+            )
+            if cached_result is not None:
+                return cached_result
         async with state.semaphore, state.call_lock.read():
-            self._require_desired_oauth_lease(state, authorization_lease)
-            self._require_active_state(state)
-            if state.last_error is not None:
-                raise state.last_error
-            await self._validate_authoritative_oauth_lease(state, authorization_lease)
-            self._require_session_oauth_lease(state, authorization_lease)
-            if state.session is None or state.catalog is None or not state.connected:
-                msg = f"MCP server '{state.server_id}' is not connected"
-                raise MCPConnectionError(state.server_id, msg)
-            self._require_catalog_tool(
+            await self._require_callable_session(state, authorization_lease)
+            tool = self._require_catalog_tool(
                 state,
                 remote_tool_name,
                 include_tools=include_tools,
                 exclude_tools=exclude_tools,
             )
-            return await self._call_tool_once(
+            result = await self._call_tool_once(
                 state,
                 remote_tool_name,
                 arguments,
                 timeout_seconds=timeout_seconds,
             )
+            cache_config = state.config.result_cache
+            if (
+                cache_config is not None
+                and cache_arguments is not None
+                and mcp_tool_result_cacheable(tool, cache_config)
+            ):
+                self._result_cache.put(
+                    state.server_id,
+                    cache_config,
+                    config_generation=state.config_generation,
+                    remote_tool_name=remote_tool_name,
+                    arguments=cache_arguments,
+                    oauth_scope=oauth_scope,
+                    result=result,
+                )
+            return result
+
+    async def _require_callable_session(
+        self,
+        state: MCPServerState,
+        authorization_lease: _MCPAuthorizationLease | None,
+    ) -> None:
+        self._require_desired_oauth_lease(state, authorization_lease)
+        self._require_active_state(state)
+        if state.last_error is not None:
+            raise state.last_error
+        await self._validate_authoritative_oauth_lease(state, authorization_lease)
+        self._require_session_oauth_lease(state, authorization_lease)
+        if state.session is None or state.catalog is None or not state.connected:
+            msg = f"MCP server '{state.server_id}' is not connected"
+            raise MCPConnectionError(state.server_id, msg)
+
+    async def _cacheable_call_arguments(
+        self,
+        state: MCPServerState,
+        remote_tool_name: str,
+        arguments: dict[str, object],
+        *,
+        authorization_lease: _MCPAuthorizationLease | None,
+        include_tools: Collection[str] | None,
+        exclude_tools: Collection[str] | None,
+    ) -> str | None:
+        """Return the cache key arguments of one authorized call, or None when its result is not cached."""
+        cache_config = state.config.result_cache
+        if cache_config is None or not cache_config.enabled:
+            return None
+        await self._require_callable_session(state, authorization_lease)
+        tool = self._require_catalog_tool(
+            state,
+            remote_tool_name,
+            include_tools=include_tools,
+            exclude_tools=exclude_tools,
+        )
+        return canonical_tool_arguments(arguments) if mcp_tool_result_cacheable(tool, cache_config) else None
 
     async def _request_catalog_with_lock(
         self,
@@ -1174,6 +1290,8 @@ class MCPServerManager:
         invalid_server_ids = await self._validate_global_function_names()
         if state.server_id in invalid_server_ids:
             return False
+        if state.config.auth is None and state.catalog is not None and state.connected:
+            await self._catalog_cache.store(state.server_id, state.config, state.catalog)
         if outcome.should_notify_catalog_change and self._on_catalog_change is not None:
             await self._on_catalog_change(state.server_id)
         if state.config.auth is None and state.stale and state.refresh_task is None and not self._shutdown:
@@ -1203,6 +1321,8 @@ class MCPServerManager:
                     authorization_lease.version if authorization_lease is not None else None
                 )
                 state.catalog = catalog
+                state.restored_from_cache = False
+                self._invalidate_result_cache(state.server_id)
                 state.connected = True
                 state.last_error = None
                 state.function_validation_error = False
@@ -1237,10 +1357,13 @@ class MCPServerManager:
         )
         state.connected = False
         state.catalog = None
+        state.restored_from_cache = False
         state.function_validation_error = function_validation_error
         state.consecutive_failures += 1
         state.last_error = error
         self._log_discovery_failure(state, error, repeated_error=repeated_error)
+        if state.config.auth is None:
+            await self._catalog_cache.evict(state.server_id)
         if state.config.auth is None and not state.function_validation_error:
             self._schedule_refresh_task(
                 state,
@@ -1387,6 +1510,7 @@ class MCPServerManager:
                     input_schema=tool.inputSchema,
                     output_schema=tool.outputSchema,
                     title=(tool.annotations.title if tool.annotations is not None else tool.title),
+                    read_only=tool.annotations is not None and tool.annotations.readOnlyHint is True,
                 ),
             )
 
@@ -1397,6 +1521,7 @@ class MCPServerManager:
                 "description": tool.description,
                 "input_schema": tool.input_schema,
                 "output_schema": tool.output_schema,
+                "read_only": tool.read_only,
             }
             for tool in filtered_tools
         ]
@@ -1602,6 +1727,18 @@ class MCPServerManager:
         owner_task.cancel()
         await asyncio.gather(owner_task, return_exceptions=True)
 
+    def _invalidate_result_cache(self, server_id: str) -> None:
+        """Drop cached results for one server and report its lifetime counters."""
+        stats = self._result_cache.invalidate_server(server_id)
+        if stats is not None and (stats.hits or stats.misses):
+            logger.info(
+                "MCP result cache invalidated",
+                server_id=server_id,
+                hits=stats.hits,
+                misses=stats.misses,
+                dropped_entries=stats.entries,
+            )
+
     def _require_state(self, server_id: str) -> MCPServerState:
         state = self._states.get(server_id)
         if state is None:
@@ -1616,7 +1753,7 @@ class MCPServerManager:
         *,
         include_tools: Collection[str] | None,
         exclude_tools: Collection[str] | None,
-    ) -> None:
+    ) -> MCPDiscoveredTool:
         self._require_active_state(state)
         catalog = state.catalog
         if catalog is None:
@@ -1624,15 +1761,15 @@ class MCPServerManager:
             raise MCPConnectionError(state.server_id, msg)
         included = set(include_tools or ())
         excluded = set(exclude_tools or ())
-        available_tools = tuple(
-            sorted(
-                tool.remote_name
-                for tool in catalog.tools
-                if (not included or tool.remote_name in included) and (not excluded or tool.remote_name not in excluded)
-            ),
-        )
-        if remote_tool_name not in available_tools:
-            raise MCPToolUnavailableError(state.server_id, remote_tool_name, available_tools)
+        available_tools = {
+            tool.remote_name: tool
+            for tool in catalog.tools
+            if (not included or tool.remote_name in included) and (not excluded or tool.remote_name not in excluded)
+        }
+        tool = available_tools.get(remote_tool_name)
+        if tool is None:
+            raise MCPToolUnavailableError(state.server_id, remote_tool_name, tuple(sorted(available_tools)))
+        return tool
 
     def _require_desired_oauth_lease(
         self,
@@ -0,0 +1,153 @@
+"""Opt-in result cache for read-only MCP tool calls."""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Mapping
+
+    from agno.tools.function import ToolResult
+
+    from mindroom.mcp.config import MCPResultCacheConfig
+    from mindroom.mcp.types import MCPDiscoveredTool
+
+
+@dataclass(frozen=True, slots=True)
+class _ResultCacheStats:
+    """Hit, miss, and occupancy counters for one server's result cache."""
+
+    hits: int
+    misses: int
+    entries: int
+
+    def as_dict(self) -> dict[str, int]:
+        """Return these counters for API reporting."""
+        return {"hits": self.hits, "misses": self.misses, "entries": self.entries}
+
+
+@dataclass(frozen=True, slots=True)
+class _ResultCacheKey:
+    """Identity of one cacheable remote call."""
+
+    config_generation: int
+    remote_tool_name: str
+    arguments: str
+    oauth_scope: Hashable | None
+
+
+@dataclass(frozen=True, slots=True)
+class _ResultCacheEntry:
+    result: ToolResult
+    expires_at: float
+
+
+class _ServerResultCache:
+    """LRU of unexpired results for one server."""
+
+    def __init__(self) -> None:
+        self.entries: OrderedDict[_ResultCacheKey, _ResultCacheEntry] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+
+def canonical_tool_arguments(arguments: Mapping[str, object]) -> str | None:
+    """Return one stable JSON encoding of call arguments, or None when they cannot be encoded."""
+    try:
+        return json.dumps(arguments, sort_keys=True, separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+    except (TypeError, ValueError):
+        return None
+
+
+def mcp_tool_result_cacheable(tool: MCPDiscoveredTool, cache_config: MCPResultCacheConfig | None) -> bool:
+    """Return whether results of one discovered tool may be served from the cache."""
+    if cache_config is None or not cache_config.enabled:
+        return False
+    if tool.remote_name in cache_config.tools:
+        return True
+    return cache_config.use_annotations and tool.read_only
+
+
+class MCPToolResultCache:
+    """Per-server TTL and size-bounded cache of successful read-only tool results."""
+
+    def __init__(self, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._servers: dict[str, _ServerResultCache] = {}
+
+    def get(
+        self,
+        server_id: str,
+        *,
+        config_generation: int,
+        remote_tool_name: str,
+        arguments: str,
+        oauth_scope: Hashable | None,
+    ) -> ToolResult | None:
+        """Return one unexpired cached result and count the lookup as a hit or miss."""
+        server_cache = self._servers.setdefault(server_id, _ServerResultCache())
+        key = _ResultCacheKey(config_generation, remote_tool_name, arguments, oauth_scope)
+        entry = server_cache.entries.get(key)
+        if entry is not None and entry.expires_at <= self._clock():
+            del server_cache.entries[key]
+            entry = None
+        if entry is None:
+            server_cache.misses += 1
+            return None
+        server_cache.entries.move_to_end(key)
+        server_cache.hits += 1
+        return entry.result.model_copy(deep=True)
+
+    def put(
+        self,
+        server_id: str,
+        cache_config: MCPResultCacheConfig,
+        *,
+        config_generation: int,
+        remote_tool_name: str,
+        arguments: str,
+        oauth_scope: Hashable | None,
+        result: ToolResult,
+    ) -> None:
+        """Store one successful result and evict the least recently used entries over the limit."""
+        server_cache = self._servers.setdefault(server_id, _ServerResultCache())
+        key = _ResultCacheKey(config_generation, remote_tool_name, arguments, oauth_scope)
+        server_cache.entries[key] = _ResultCacheEntry(
+            result=result.model_copy(deep=True),
+            expires_at=self._clock() + cache_config.ttl_seconds,
+        )
+        server_cache.entries.move_to_end(key)
+        while len(server_cache.entries) > cache_config.max_entries:
+            server_cache.entries.popitem(last=False)
+
+    def invalidate_server(self, server_id: str) -> _ResultCacheStats | None:
+        """Drop every cached result for one server and return its counters before the drop."""
+        server_cache = self._servers.get(server_id)
+        if server_cache is None:
+            return None
+        stats = _ResultCacheStats(
+            hits=server_cache.hits,
+            misses=server_cache.misses,
+            entries=len(server_cache.entries),
+        )
+        server_cache.entries.clear()
+        return stats
+
+    def clear(self) -> None:
+        """Drop all cached results and counters."""
+        self._servers.clear()
+
+    def stats(self) -> dict[str, _ResultCacheStats]:
+        """Return hit, miss, and entry counts by server id."""
+        return {
+            server_id: _ResultCacheStats(
+                hits=server_cache.hits,
+                misses=server_cache.misses,
+                entries=len(server_cache.entries),
+            )
+            for server_id, server_cache in self._servers.items()
+        }
@@ -73,6 +73,7 @@ class MCPDiscoveredTool:
     input_schema: dict[str, Any]
     output_schema: dict[str, Any] | None
     title: str | None = None
+    read_only: bool = False
 
 
 @dataclass(frozen=True)
@@ -124,6 +125,7 @@ class MCPServerState:
     semaphore: asyncio.Semaphore = field(init=False)
     connected: bool = False
     stale: bool = False
+    restored_from_cache: bool = False
     last_error: MCPError | None = None
     consecutive_failures: int = 0
     refresh_task: asyncio.Task[None] | None = None
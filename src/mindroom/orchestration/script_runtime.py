@@ -74,6 +74,7 @@ logger = get_logger(__name__)
 
 _SCRIPT_RETENTION_SECONDS_ENV = "MINDROOM_SCRIPT_RETENTION_SECONDS"
 _DEFAULT_SCRIPT_RETENTION_SECONDS = 30 * 24 * 60 * 60
+_SCRIPT_RECEIPT_COMMIT_WINDOW_MS_ENV = "MINDROOM_SCRIPT_RECEIPT_COMMIT_WINDOW_MS"
 
 
 class _ScriptRuntimeUnavailableError(RuntimeError):
@@ -1103,6 +1104,7 @@ class ScriptRuntimeLifecycle:
                 deadline=shutdown_deadline,
                 timeout_seconds=timeout_seconds,
             )
+            self.store.close()
 
     async def _run_shutdown_cleanup(
         self,
@@ -1189,7 +1191,10 @@ def build_script_runtime(
     api_enabled: bool,
 ) -> ScriptRuntimeLifecycle:
     """Construct the one process-local script store, resolver, broker, and manager."""
-    store = ScriptRunStore(runtime_paths)
+    store = ScriptRunStore(
+        runtime_paths,
+        receipt_commit_window_seconds=_script_receipt_commit_window_seconds(runtime_paths),
+    )
     resolver = _LiveScriptRuntimeResolver(
         runtime_paths=runtime_paths,
         bot_provider=bot_provider,
@@ -1291,6 +1296,19 @@ def _script_retention_seconds(runtime_paths: RuntimePaths) -> float:
     return value
 
 
+def _script_receipt_commit_window_seconds(runtime_paths: RuntimePaths) -> float:
+    raw = (runtime_paths.env_value(_SCRIPT_RECEIPT_COMMIT_WINDOW_MS_ENV, default="0") or "").strip()
+    try:
+        value = float(raw)
+    except ValueError:
+        msg = f"{_SCRIPT_RECEIPT_COMMIT_WINDOW_MS_ENV} must be a non-negative number"
+        raise ValueError(msg) from None
+    if not math.isfinite(value) or value < 0:
+        msg = f"{_SCRIPT_RECEIPT_COMMIT_WINDOW_MS_ENV} must be a non-negative number"
+        raise ValueError(msg)
+    return value / 1000
+
+
 async def _script_gateway_url(runtime_paths: RuntimePaths, *, host: str, port: int) -> str:
     """Return the gateway URL injected into isolated script processes."""
     worker_process_enabled = script_execution_uses_worker(
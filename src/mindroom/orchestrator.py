@@ -48,8 +48,11 @@ from mindroom.matrix.client_room_admin import get_joined_rooms, get_room_members
 from mindroom.matrix.health import reset_matrix_sync_health
 from mindroom.matrix.identity import managed_account_user_id
 from mindroom.matrix.rooms import ensure_all_rooms_exist, ensure_root_space, ensure_user_in_rooms
+from mindroom.matrix.shared_ingestion import SharedSyncFanout
 from mindroom.matrix.stale_stream_cleanup import (
+    read_inflight_stream_index,
     recover_stale_streaming_messages,
+    settle_inflight_stream_index,
 )
 from mindroom.matrix.state import load_rooms, resolve_room_aliases
 from mindroom.matrix.users import (
@@ -134,7 +137,7 @@ if TYPE_CHECKING:
 
     import nio
 
-    from mindroom.event_journal import ApprovalContinuation, ApprovalDeliveryView
+    from mindroom.event_journal import ApprovalContinuation, ApprovalDeliveryView, InflightStreamRecoveryView
     from mindroom.hooks import HookMatrixAdmin, HookMessageSender, HookRoomStatePutter, HookRoomStateQuerier
 
     from .constants import RuntimePaths
@@ -271,10 +274,12 @@ class _MultiAgentOrchestrator:
     _dispatch_recovery_requested: bool = field(default=False, init=False, repr=False)
     _response_admission_gate: ResponseAdmissionGate = field(default_factory=ResponseAdmissionGate, init=False)
     _mcp_catalog_change_task_owner: object = field(default_factory=object, init=False, repr=False)
+    _deferred_mcp_catalog_changes: set[str] = field(default_factory=set, init=False, repr=False)
     _pending_replacement_recovery_room_ids: dict[str, set[str]] = field(default_factory=dict, init=False)
     plugin_watch: PluginWatchState = field(init=False)
     _knowledge_refresh_scheduler: KnowledgeRefreshScheduler = field(init=False)
     _knowledge_source_watcher: KnowledgeSourceWatcher = field(init=False)
+    _shared_sync_fanout: SharedSyncFanout = field(init=False, repr=False)
     hook_registry: HookRegistry = field(default_factory=HookRegistry.empty, init=False)
     _runtime_shutdown_event: asyncio.Event | None = field(default=None, init=False, repr=False)
     _router_reply_memberships_live_sync_ready: asyncio.Event = field(
@@ -299,6 +304,10 @@ class _MultiAgentOrchestrator:
         self.config_path = self.runtime_paths.config_path
         self._knowledge_refresh_scheduler = KnowledgeRefreshScheduler()
         self._knowledge_source_watcher = KnowledgeSourceWatcher(self._knowledge_refresh_scheduler)
+        self._shared_sync_fanout = SharedSyncFanout(
+            lambda: tuple(self.agent_bots.values()),
+            configured_room_ids=self._shared_ingestion_configured_room_ids,
+        )
         self.agent_reply_membership_sync = AgentReplyMembershipSync(self.agent_reply_memberships)
         self.plugin_watch = PluginWatchState(runtime_paths=self.runtime_paths)
         self._external_trigger_runtime = ExternalTriggerRuntimeCoordinator(
@@ -367,6 +376,11 @@ class _MultiAgentOrchestrator:
         """Return the orchestrator-owned background knowledge refresh scheduler."""
         return self._knowledge_refresh_scheduler
 
+    @property
+    def shared_sync_fanout(self) -> SharedSyncFanout:
+        """Return the process-wide fan-out for application-service transactions."""
+        return self._shared_sync_fanout
+
     def entity_first_sync_complete(self, entity_name: str) -> bool | None:
         """Return first-sync readiness for the current entity generation."""
         bot = self.agent_bots.get(entity_name)
@@ -1215,13 +1229,19 @@ class _MultiAgentOrchestrator:
     ) -> None:
         """Recover interrupted responses from one concurrent room scan."""
         actors: dict[str, nio.AsyncClient] = {}
+        stream_indexes: dict[str, InflightStreamRecoveryView] = {}
         for bot in bots:
             if bot.client is None or not bot.agent_user.user_id:
                 continue
             actors[bot.agent_user.user_id] = bot.client
+            stream_indexes[bot.agent_user.user_id] = bot.inflight_stream_index
         if not actors:
             return
         router_bot = self._router_bot()
+        # Targeted replacement recovery already names its rooms, and carries no
+        # cutoff that would let it tell the previous run's rows from this one's.
+        use_stream_index = target_room_ids is None and startup_cutoff_ms is not None
+        indexed_room_ids = await read_inflight_stream_index(stream_indexes) if use_stream_index else None
 
         result = await recover_stale_streaming_messages(
             actors,
@@ -1231,10 +1251,20 @@ class _MultiAgentOrchestrator:
             startup_cutoff_ms=startup_cutoff_ms,
             scanned_room_ids=scanned_room_ids,
             target_room_ids=target_room_ids,
+            indexed_room_ids=indexed_room_ids,
         )
+        if indexed_room_ids is not None and startup_cutoff_ms is not None:
+            await settle_inflight_stream_index(
+                stream_indexes,
+                indexed_room_ids=indexed_room_ids,
+                result=result,
+                recovered_room_ids=scanned_room_ids,
+                startup_cutoff_ms=startup_cutoff_ms,
+            )
         logger.info(
             "Completed stale stream recovery",
             room_count=result.room_count,
+            skipped_room_count=result.skipped_room_count,
             cleaned_count=result.cleaned_count,
             resumed_count=result.resumed_count,
         )
@@ -1309,6 +1339,23 @@ class _MultiAgentOrchestrator:
             raise
         self._restore_pending_replacement_rooms(claimed_room_ids, scanned_room_ids)
 
+    def _shared_ingestion_configured_room_ids(self) -> dict[str, frozenset[str]]:
+        """Return the resolved room IDs of every configured account, running or not."""
+        config = self.config
+        if config is None:
+            return {}
+        return {
+            entity_name: frozenset(
+                room_id
+                for room_id in resolve_room_aliases(
+                    get_rooms_for_entity(entity_name, config),
+                    runtime_paths=self.runtime_paths,
+                )
+                if room_id.startswith("!")
+            )
+            for entity_name in configured_entity_names(config)
+        }
+
     def _resolve_bot_room_aliases(self, bots: list[AgentBot | TeamBot], config: Config) -> None:
         """Resolve currently known room aliases into each bot's configured room IDs."""
         for bot in bots:
@@ -1445,6 +1492,7 @@ class _MultiAgentOrchestrator:
                 name="embedder_startup_health_check",
             )
             set_runtime_ready()
+            self._replay_deferred_mcp_catalog_changes()
         # Stay alive until explicit shutdown. Hot reload replaces sync tasks in
         # self._sync_tasks, so awaiting the initial task generation would let a
         # config-triggered restart look like normal orchestrator completion.
@@ -1681,7 +1729,20 @@ class _MultiAgentOrchestrator:
     async def _notify_mcp_catalog_change(self, server_id: str) -> None:
         """Schedule a catalog restart so an admitted MCP call can release first."""
         if not self.running:
+            # A catalog restored from the startup cache can be revalidated before
+            # the runtime is running; replay the change once it is.
+            self._deferred_mcp_catalog_changes.add(server_id)
             return
+        self._schedule_mcp_catalog_change(server_id)
+
+    def _replay_deferred_mcp_catalog_changes(self) -> None:
+        """Apply catalog changes observed while the runtime was still starting."""
+        server_ids = sorted(self._deferred_mcp_catalog_changes)
+        self._deferred_mcp_catalog_changes.clear()
+        for server_id in server_ids:
+            self._schedule_mcp_catalog_change(server_id)
+
+    def _schedule_mcp_catalog_change(self, server_id: str) -> None:
         create_background_task(
             self._handle_mcp_catalog_change(server_id),
             name=f"mcp_catalog_change:{server_id}",
@@ -2311,6 +2372,7 @@ async def _run_api_server(
     knowledge_refresh_scheduler: KnowledgeRefreshScheduler | None = None,
     script_runtime: ScriptRuntimeLifecycle | None = None,
     shutdown_requested: asyncio.Event | None = None,
+    shared_sync_fanout: SharedSyncFanout | None = None,
 ) -> None:
     """Run the bundled dashboard/API server as an asyncio task."""
     from mindroom.api import main as api_main  # noqa: PLC0415
@@ -2325,6 +2387,8 @@ async def _run_api_server(
         )
     if knowledge_refresh_scheduler is not None:
         api_main.bind_orchestrator_knowledge_refresh_scheduler(api_main.app, knowledge_refresh_scheduler)
+    if shared_sync_fanout is not None:
+        api_main.bind_shared_sync_fanout(api_main.app, shared_sync_fanout)
     config = uvicorn.Config(
         api_main.app,
         host=host,
@@ -2695,6 +2759,7 @@ async def main(
                     orchestrator.knowledge_refresh_scheduler,
                     orchestrator.script_runtime,
                     shutdown_requested,
+                    orchestrator.shared_sync_fanout,
                 ),
                 name="api_server",
             )
@@ -19,6 +19,7 @@ __all__ = [
     "CREDENTIAL_SEEDS_JSON_ENV",
     "KUBERNETES_WORKER_BACKEND_CONFIG_ENV_BY_KEY",
     "KUBERNETES_WORKER_BACKEND_CONFIG_ENV_NAMES",
+    "MATRIX_APPSERVICE_HS_TOKEN_ENV",
     "MATRIX_APPSERVICE_TOKEN_ENV",
     "MATRIX_APPSERVICE_TOKEN_FILE_ENV",
     "MATRIX_MANAGED_ACCOUNT_AUTH_ENV",
@@ -61,6 +62,7 @@ SHARED_CREDENTIALS_PATH_ENV = "MINDROOM_SHARED_CREDENTIALS_PATH"
 MATRIX_MANAGED_ACCOUNT_AUTH_ENV = "MATRIX_MANAGED_ACCOUNT_AUTH"
 MATRIX_APPSERVICE_TOKEN_ENV = "MATRIX_APPSERVICE_TOKEN"  # noqa: S105 - environment variable name
 MATRIX_APPSERVICE_TOKEN_FILE_ENV = "MATRIX_APPSERVICE_TOKEN_FILE"  # noqa: S105 - environment variable name
+MATRIX_APPSERVICE_HS_TOKEN_ENV = "MATRIX_APPSERVICE_HS_TOKEN"  # noqa: S105 - environment variable name
 AWS_BEDROCK_CLAUDE_ENV_BY_KEY: Mapping[str, str] = MappingProxyType(
     {
         "access_key": "AWS_ACCESS_KEY_ID",
@@ -151,6 +153,7 @@ KUBERNETES_WORKER_BACKEND_CONFIG_ENV_BY_KEY: Mapping[str, str] = MappingProxyTyp
         "config_key": "MINDROOM_KUBERNETES_WORKER_CONFIG_KEY",
         "config_path": "MINDROOM_KUBERNETES_WORKER_CONFIG_PATH",
         "idle_timeout": "MINDROOM_KUBERNETES_WORKER_IDLE_TIMEOUT_SECONDS",
+        "idle_retain_max": "MINDROOM_KUBERNETES_WORKER_IDLE_RETAIN_MAX",
         "ready_timeout": "MINDROOM_KUBERNETES_WORKER_READY_TIMEOUT_SECONDS",
         "name_prefix": "MINDROOM_KUBERNETES_WORKER_NAME_PREFIX",
         "node_name": "MINDROOM_KUBERNETES_WORKER_NODE_NAME",
@@ -300,6 +303,7 @@ _RUNTIME_STARTUP_EXCLUDED_NAMES = frozenset(
         "MINDROOM_LOCAL_CLIENT_ID",
         MATRIX_APPSERVICE_TOKEN_ENV,
         MATRIX_APPSERVICE_TOKEN_FILE_ENV,
+        MATRIX_APPSERVICE_HS_TOKEN_ENV,
         MATRIX_MANAGED_ACCOUNT_AUTH_ENV,
         SANDBOX_RUNTIME_ENV_BY_KEY["proxy_token"],
         SANDBOX_STARTUP_MANIFEST_PATH_ENV,
@@ -325,6 +329,7 @@ _NON_SANDBOX_RUNTIME_CONTROL_ENV_NAMES = frozenset(
         "MINDROOM_LOCAL_CLIENT_SECRET",
         MATRIX_APPSERVICE_TOKEN_ENV,
         MATRIX_APPSERVICE_TOKEN_FILE_ENV,
+        MATRIX_APPSERVICE_HS_TOKEN_ENV,
         MATRIX_MANAGED_ACCOUNT_AUTH_ENV,
     },
 )
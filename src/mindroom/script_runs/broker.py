@@ -7,7 +7,9 @@ import hashlib
 import hmac
 import inspect
 import json
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field, replace
+from functools import partial
 from threading import Event
 from typing import TYPE_CHECKING, Protocol
 
@@ -60,7 +62,7 @@ from mindroom.tool_system.worker_routing import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable, Mapping
+    from collections.abc import AsyncIterator, Awaitable, Callable, Mapping, Sequence
 
     from agno.tools import Toolkit
 
@@ -99,6 +101,9 @@ _RESULT_TOO_LARGE_ERROR = {
     "retryable": False,
 }
 _ACTIVE_RUN_STATES = frozenset({ScriptRunState.STARTING, ScriptRunState.RUNNING})
+# Bounds how many calls from one batch authenticate and claim at once, and how
+# many of its calls execute at once during the batch's turn on the run lock.
+_BATCH_CONCURRENCY = 8
 
 
 class ScriptBrokerAuthenticationError(ValueError):
@@ -191,6 +196,41 @@ class _PreparedExecution:
     approval_config: Config
 
 
+@dataclass(slots=True)
+class _ScriptCallBatch:
+    """Independent calls of one batch, sharing one turn on their run's lock.
+
+    Calls outside a batch hold the run lock one at a time. The calls of a batch
+    were declared independent by the script, so the first of them to start takes
+    the run lock for the whole batch and the rest run beside it, at most
+    ``_BATCH_CONCURRENCY`` at a time. The lock is released when no call of the
+    batch is executing.
+    """
+
+    slots: asyncio.Semaphore = field(default_factory=lambda: asyncio.Semaphore(_BATCH_CONCURRENCY))
+    _entry: asyncio.Lock = field(default_factory=asyncio.Lock)
+    _held_run_lock: asyncio.Lock | None = None
+    _executing: int = 0
+
+    @asynccontextmanager
+    async def turn(self, run_lock: Callable[[], asyncio.Lock]) -> AsyncIterator[None]:
+        """Execute one call of the batch, taking the run lock if no sibling holds it."""
+        async with self.slots:
+            async with self._entry:
+                if self._executing == 0:
+                    lock = run_lock()
+                    await lock.acquire()
+                    self._held_run_lock = lock
+                self._executing += 1
+            try:
+                yield
+            finally:
+                self._executing -= 1
+                if self._executing == 0 and self._held_run_lock is not None:
+                    self._held_run_lock.release()
+                    self._held_run_lock = None
+
+
 class _CurrentGrantRevokedError(ValueError):
     """Raised when a launch grant is absent from the current live surface."""
 
@@ -292,6 +332,7 @@ class ScriptToolBroker:
         request: ScriptToolCallRequest,
         *,
         authorization: str | None,
+        batch: _ScriptCallBatch | None = None,
     ) -> ScriptCallRecord:
         key = (request.run_id, request.call_id)
         self._preparing[key] = self._preparing.get(key, 0) + 1
@@ -313,7 +354,7 @@ class ScriptToolBroker:
                 return prepared.call
 
             task = asyncio.create_task(
-                self._execute_claimed_call(prepared.run, prepared.call, prepared.arguments),
+                self._execute_claimed_call(prepared.run, prepared.call, prepared.arguments, batch=batch),
                 name=f"script-tool:{prepared.run.run_id}:{prepared.call.call_id}",
             )
             self._tasks[key] = task
@@ -430,6 +471,45 @@ class ScriptToolBroker:
             self._accept_prepared_call(request, authorization=authorization),
         )
 
+    async def accept_many_authenticated(
+        self,
+        requests: Sequence[ScriptToolCallRequest],
+        authorization: str | None,
+    ) -> list[ScriptCallRecord | BaseException]:
+        """Accept independent calls with bounded concurrency, reporting each outcome in order.
+
+        The accepted calls execute concurrently with each other, within the
+        same bound, during one turn on the run lock.
+        """
+        admission = asyncio.Semaphore(_BATCH_CONCURRENCY)
+        batch = _ScriptCallBatch()
+
+        async def accept(request: ScriptToolCallRequest) -> ScriptCallRecord:
+            async with admission:
+                return await run_coroutine_until_complete(
+                    self._accept_prepared_call(request, authorization=authorization, batch=batch),
+                )
+
+        return list(await asyncio.gather(*(accept(request) for request in requests), return_exceptions=True))
+
+    async def wait_authenticated(
+        self,
+        run_id: str,
+        call_id: str,
+        authorization: str | None,
+        *,
+        timeout_seconds: float,
+    ) -> None:
+        """Authenticate, then wait up to a bound for this broker's execution of one call to finish.
+
+        Returns early when nothing here owns the call, so the caller's receipt
+        read afterwards decides what the call's state actually is.
+        """
+        await asyncio.to_thread(self.authenticate, run_id, authorization)
+        task = self._tasks.get((run_id, call_id))
+        if task is not None and not task.done():
+            await asyncio.wait({task}, timeout=timeout_seconds)
+
     async def get_authenticated(
         self,
         run_id: str,
@@ -455,9 +535,11 @@ class ScriptToolBroker:
         run: ScriptRunRecord,
         call: ScriptCallRecord,
         arguments: dict[str, object],
+        *,
+        batch: _ScriptCallBatch | None = None,
     ) -> ScriptCallRecord:
-        run_lock = self._run_locks.setdefault(run.run_id, asyncio.Lock())
-        async with run_lock:
+        run_turn = self._run_lock(run.run_id) if batch is None else batch.turn(partial(self._run_lock, run.run_id))
+        async with run_turn:
             try:
                 durable_run = await asyncio.to_thread(self.store.require_call_dispatch_allowed, run.run_id)
             except ScriptCapabilityError:
@@ -468,6 +550,9 @@ class ScriptToolBroker:
                 )
             return await self._execute_claimed_call_serialized(durable_run, call, arguments)
 
+    def _run_lock(self, run_id: str) -> asyncio.Lock:
+        return self._run_locks.setdefault(run_id, asyncio.Lock())
+
     async def _execute_claimed_call_serialized(
         self,
         run: ScriptRunRecord,
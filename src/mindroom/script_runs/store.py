@@ -1,4 +1,18 @@
-"""SQLite-backed durable state for background Python script runs."""
+"""SQLite-backed durable state for background Python script runs.
+
+A script that makes many tool calls passes through ``claim_call``,
+``publish_call_result`` and ``require_active_capability`` once per call, so the
+store keeps its connections instead of opening one per operation: one writer,
+serialized by a lock because it is the only connection that begins
+transactions, and a small pool of readers. Each is configured once, when it is
+opened, rather than paying for four PRAGMAs on every statement.
+
+Terminal receipts may also be group-committed. With a positive commit window,
+the first publisher to arrive waits out the window and then applies every
+receipt queued behind it in one transaction, each inside its own savepoint so
+that one conflicting receipt fails alone. Every publisher still returns only
+after the transaction holding its receipt has committed.
+"""
 
 from __future__ import annotations
 
@@ -7,8 +21,10 @@ import hmac
 import json
 import secrets
 import sqlite3
+import threading
+import time
 from contextlib import contextmanager
-from dataclasses import replace
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime, timedelta
 from pathlib import PurePosixPath
 from typing import TYPE_CHECKING, cast
@@ -38,6 +54,7 @@ _REVOKED_CAPABILITY = "Background script capability has been revoked."
 _CALLS_NOT_ACCEPTED = "Background script run cannot accept new calls."
 _GRANT_NOT_GRANTED = "Requested script tool grant was not granted at launch."
 _RECEIPT_NOT_SERIALIZABLE = "Script call receipt must be JSON serializable."
+_READER_POOL_SIZE = 4
 _TERMINAL_RUN_STATES = frozenset(
     {
         ScriptRunState.EXITED,
@@ -112,6 +129,19 @@ class ScriptCapabilityError(ScriptRunStoreError):
     """Raised when a run capability is invalid or cannot accept calls."""
 
 
+@dataclass(slots=True)
+class _PendingReceipt:
+    """One terminal receipt waiting for the group commit that will carry it."""
+
+    run_id: str
+    call_id: str
+    state: ScriptCallState
+    receipt_json: str
+    done: threading.Event = field(default_factory=threading.Event)
+    record: ScriptCallRecord | None = None
+    error: BaseException | None = None
+
+
 def mint_script_capability() -> tuple[str, str]:
     """Create a bearer capability and its durable SHA-256 digest."""
     token = secrets.token_urlsafe(32)
@@ -121,15 +151,41 @@ def mint_script_capability() -> tuple[str, str]:
 class ScriptRunStore:
     """Persist primary-only run and call state with atomic SQLite transitions."""
 
-    def __init__(self, runtime_paths: RuntimePaths) -> None:
+    def __init__(
+        self,
+        runtime_paths: RuntimePaths,
+        *,
+        receipt_commit_window_seconds: float = 0.0,
+    ) -> None:
         control_root = runtime_paths.control_state_root
         if control_root is None:
             raise ScriptRunStoreError(_CONTROL_STATE_UNAVAILABLE)
+        if receipt_commit_window_seconds < 0:
+            msg = "Script receipt commit window must not be negative."
+            raise ScriptRunStoreError(msg)
         self.database_path = control_root / "script_runs" / "script_runs.sqlite3"
         self.storage_root = runtime_paths.storage_root.expanduser().resolve()
+        self.receipt_commit_window_seconds = receipt_commit_window_seconds
+        self._writer: sqlite3.Connection | None = None
+        self._writer_lock = threading.Lock()
+        self._readers: list[sqlite3.Connection] = []
+        self._reader_lock = threading.Lock()
+        self._pending_receipts: list[_PendingReceipt] = []
+        self._receipt_lock = threading.Lock()
         self.database_path.parent.mkdir(parents=True, exist_ok=True)
         self._initialize_database()
 
+    def close(self) -> None:
+        """Close the pooled connections; a later operation reopens them on demand."""
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+        with self._reader_lock:
+            readers, self._readers = self._readers, []
+        if writer is not None:
+            writer.close()
+        for reader in readers:
+            reader.close()
+
     def create_run(self, run: ScriptRunRecord) -> ScriptRunRecord:
         """Atomically store a new starting run before any worker action."""
         if run.state is not ScriptRunState.STARTING:
@@ -368,29 +424,28 @@ class ScriptRunStore:
             msg = "A script call result must use a terminal state."
             raise ScriptRunStoreError(msg)
         receipt_json = _serialize_receipt(result=result, error=error)
-        with self._write_transaction() as connection:
-            row = connection.execute(
-                "SELECT * FROM script_calls WHERE run_id = ? AND call_id = ?",
-                (run_id, call_id),
-            ).fetchone()
-            if row is None:
-                raise ScriptCallNotFoundError(call_id)
-            existing = _call_from_row(row)
-            if existing.state in _TERMINAL_CALL_STATES:
-                if existing.state is state and str(row["receipt_json"]) == receipt_json:
-                    return existing
-                msg = f"Script call '{call_id}' already has a terminal receipt."
-                raise ScriptCallConflictError(msg)
-            connection.execute(
-                """
-                UPDATE script_calls
-                SET state = ?, receipt_json = ?
-                WHERE run_id = ? AND call_id = ?
-                """,
-                (state.value, receipt_json, run_id, call_id),
-            )
-        stored_result, stored_error = _receipt_values(receipt_json)
-        return replace(existing, state=state, result=stored_result, error=stored_error)
+        if self.receipt_commit_window_seconds <= 0:
+            with self._write_transaction() as connection:
+                return _publish_receipt(
+                    connection,
+                    run_id=run_id,
+                    call_id=call_id,
+                    state=state,
+                    receipt_json=receipt_json,
+                )
+        pending = _PendingReceipt(run_id=run_id, call_id=call_id, state=state, receipt_json=receipt_json)
+        with self._receipt_lock:
+            self._pending_receipts.append(pending)
+            leads_batch = len(self._pending_receipts) == 1
+        if leads_batch:
+            time.sleep(self.receipt_commit_window_seconds)
+            with self._receipt_lock:
+                batch, self._pending_receipts = self._pending_receipts, []
+            self._commit_receipts(batch)
+        pending.done.wait()
+        if pending.error is not None:
+            raise pending.error
+        return cast("ScriptCallRecord", pending.record)
 
     def request_cancel(self, run_id: str, *, reason: str | None = None) -> ScriptRunRecord:
         """Durably revoke a run before any cancellation signal is sent."""
@@ -620,28 +675,77 @@ class ScriptRunStore:
                 if column_name not in existing_columns:
                     connection.execute(statement)
 
+    def _commit_receipts(self, batch: list[_PendingReceipt]) -> None:
+        """Apply a batch of receipts in one transaction, isolating each in a savepoint."""
+        try:
+            with self._write_transaction() as connection:
+                for pending in batch:
+                    connection.execute("SAVEPOINT script_receipt")
+                    try:
+                        pending.record = _publish_receipt(
+                            connection,
+                            run_id=pending.run_id,
+                            call_id=pending.call_id,
+                            state=pending.state,
+                            receipt_json=pending.receipt_json,
+                        )
+                    except ScriptRunStoreError as exc:
+                        connection.execute("ROLLBACK TO script_receipt")
+                        pending.error = exc
+                    connection.execute("RELEASE script_receipt")
+        except BaseException as exc:
+            # Nothing in the batch landed, so no publisher may report success.
+            for pending in batch:
+                pending.record = None
+                pending.error = pending.error or exc
+            raise
+        finally:
+            for pending in batch:
+                pending.done.set()
+
     @contextmanager
     def _read_connection(self) -> Iterator[sqlite3.Connection]:
-        connection = _connect(self.database_path)
+        with self._reader_lock:
+            connection = self._readers.pop() if self._readers else None
+        if connection is None:
+            connection = _connect(self.database_path)
         try:
             yield connection
-        finally:
+        except sqlite3.Error:
             connection.close()
+            raise
+        except BaseException:
+            self._release_reader(connection)
+            raise
+        self._release_reader(connection)
+
+    def _release_reader(self, connection: sqlite3.Connection) -> None:
+        with self._reader_lock:
+            if len(self._readers) < _READER_POOL_SIZE:
+                self._readers.append(connection)
+                return
+        connection.close()
 
     @contextmanager
     def _write_transaction(self) -> Iterator[sqlite3.Connection]:
-        connection = _connect(self.database_path)
-        try:
-            connection.execute("BEGIN IMMEDIATE")
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = _connect(self.database_path)
+            connection = self._writer
             try:
-                yield connection
-            except BaseException:
-                connection.execute("ROLLBACK")
-                raise
-            else:
+                connection.execute("BEGIN IMMEDIATE")
+                try:
+                    yield connection
+                except BaseException:
+                    connection.execute("ROLLBACK")
+                    raise
                 connection.execute("COMMIT")
-        finally:
-            connection.close()
+            except sqlite3.Error:
+                # A connection whose transaction state is unknown is not reused;
+                # closing it rolls back whatever it may still hold open.
+                self._writer = None
+                connection.close()
+                raise
 
 
 _SCHEMA_STATEMENTS = (
@@ -715,8 +819,42 @@ _SCRIPT_RUN_COLUMN_MIGRATIONS = (
 )
 
 
+def _publish_receipt(
+    connection: sqlite3.Connection,
+    *,
+    run_id: str,
+    call_id: str,
+    state: ScriptCallState,
+    receipt_json: str,
+) -> ScriptCallRecord:
+    row = connection.execute(
+        "SELECT * FROM script_calls WHERE run_id = ? AND call_id = ?",
+        (run_id, call_id),
+    ).fetchone()
+    if row is None:
+        raise ScriptCallNotFoundError(call_id)
+    existing = _call_from_row(row)
+    if existing.state in _TERMINAL_CALL_STATES:
+        if existing.state is state and str(row["receipt_json"]) == receipt_json:
+            return existing
+        msg = f"Script call '{call_id}' already has a terminal receipt."
+        raise ScriptCallConflictError(msg)
+    connection.execute(
+        """
+        UPDATE script_calls
+        SET state = ?, receipt_json = ?
+        WHERE run_id = ? AND call_id = ?
+        """,
+        (state.value, receipt_json, run_id, call_id),
+    )
+    stored_result, stored_error = _receipt_values(receipt_json)
+    return replace(existing, state=state, result=stored_result, error=stored_error)
+
+
 def _connect(database_path: Path) -> sqlite3.Connection:
-    connection = sqlite3.connect(database_path, isolation_level=None, timeout=10)
+    # Pooled connections move between the threads `asyncio.to_thread` picks,
+    # but each is used by one operation at a time under the store's locks.
+    connection = sqlite3.connect(database_path, isolation_level=None, timeout=10, check_same_thread=False)
     connection.row_factory = sqlite3.Row
     connection.execute("PRAGMA busy_timeout = 10000")
     connection.execute("PRAGMA journal_mode = WAL")
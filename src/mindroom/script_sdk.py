@@ -13,15 +13,21 @@ import urllib.request
 import uuid
 from dataclasses import dataclass
 from pathlib import Path
-from typing import cast
+from typing import TYPE_CHECKING, cast
 
-__all__ = ["MindRoomToolCallError", "MindRoomTools"]
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+
+__all__ = ["MindRoomCall", "MindRoomToolCallError", "MindRoomTools"]
 
 _GATEWAY_URL_ENV = "MINDROOM_SCRIPT_GATEWAY_URL"
 _RUN_ID_ENV = "MINDROOM_SCRIPT_RUN_ID"
 _TOKEN_PATH_ENV = "MINDROOM_SCRIPT_TOKEN_PATH"  # noqa: S105 - this names a path, not a token.
 _DEFAULT_HTTP_TIMEOUT_SECONDS = 15.0
 _DEFAULT_POLL_INTERVAL_SECONDS = 0.5
+_DEFAULT_LONG_POLL_SECONDS = 10.0
+_MAX_BATCH_CALLS = 32
+_MAX_BATCH_REQUEST_BYTES = 512 * 1024
 _MAX_TOKEN_BYTES = 4096
 _TRANSPORT_ERROR = "The background tool gateway transport failed after dispatch may have been accepted."
 _INVALID_RECEIPT_ERROR = "The background tool gateway returned an invalid receipt."
@@ -29,6 +35,7 @@ _CONFLICTING_RECEIPT_ERROR = "The stable call ID belongs to a different tool req
 _INVALID_ARGUMENTS_ERROR = "Background tool arguments must have an unambiguous JSON representation."
 _CAPABILITY_UNAVAILABLE_MESSAGE = "The MindRoom script capability token is unavailable."
 _CAPABILITY_INVALID_MESSAGE = "The MindRoom script capability token is invalid."
+_INVALID_BATCH_RESPONSE_ERROR = "The background tool gateway returned an invalid batch response."
 
 
 class MindRoomToolCallError(RuntimeError):
@@ -74,6 +81,42 @@ class _Receipt:
     error: object | None
 
 
+class MindRoomCall:
+    """Handle for one submitted governed call whose receipt may still be pending."""
+
+    def __init__(
+        self,
+        tools: MindRoomTools,
+        *,
+        call_id: str,
+        toolkit_name: str,
+        function_name: str,
+        arguments: dict[str, object],
+    ) -> None:
+        self._tools = tools
+        self.call_id = call_id
+        self.toolkit_name = toolkit_name
+        self.function_name = function_name
+        self._arguments = arguments
+        self._arguments_digest = _digest_arguments(arguments)
+        self._receipt: _Receipt | None = None
+        self._error: MindRoomToolCallError | None = None
+
+    def done(self) -> bool:
+        """Return whether this call has a terminal receipt or failed before acceptance."""
+        return self._error is not None or (self._receipt is not None and self._receipt.state != "pending")
+
+    def result(self) -> object:
+        """Block until this call is terminal, then return its result or raise its failure."""
+        self._tools._settle(self)
+        if self._error is not None:
+            raise self._error
+        receipt = cast("_Receipt", self._receipt)
+        if receipt.state == "completed":
+            return receipt.result
+        raise MindRoomToolCallError.from_receipt(receipt)
+
+
 class MindRoomTools:
     """Blocking governed-tool client for one launcher-injected script run."""
 
@@ -82,10 +125,14 @@ class MindRoomTools:
         *,
         http_timeout_seconds: float = _DEFAULT_HTTP_TIMEOUT_SECONDS,
         poll_interval_seconds: float = _DEFAULT_POLL_INTERVAL_SECONDS,
+        long_poll_seconds: float = _DEFAULT_LONG_POLL_SECONDS,
     ) -> None:
         if not math.isfinite(poll_interval_seconds) or poll_interval_seconds <= 0:
             msg = "poll_interval_seconds must be positive."
             raise ValueError(msg)
+        if not math.isfinite(long_poll_seconds) or not 0 <= long_poll_seconds < http_timeout_seconds:
+            msg = "long_poll_seconds must be non-negative and shorter than http_timeout_seconds."
+            raise ValueError(msg)
         self._gateway_url = _required_env(_GATEWAY_URL_ENV).rstrip("/")
         parsed_gateway = urllib.parse.urlsplit(self._gateway_url)
         if parsed_gateway.scheme not in {"http", "https"} or not parsed_gateway.netloc:
@@ -95,43 +142,159 @@ class MindRoomTools:
         self._token = _read_token(Path(_required_env(_TOKEN_PATH_ENV)))
         self._http_timeout_seconds = http_timeout_seconds
         self._poll_interval_seconds = poll_interval_seconds
+        self._long_poll_seconds = long_poll_seconds
 
     def call(self, toolkit_name: str, function_name: str, **arguments: object) -> object:
-        """Execute one logical governed call and poll only its stable call ID."""
-        call_id = uuid.uuid4().hex
-        wire_arguments = _json_wire_arguments(arguments, call_id=call_id)
-        arguments_digest = _digest_arguments(wire_arguments)
-        receipt: _Receipt | None = None
-        while receipt is None:
+        """Execute one logical governed call and wait only on its stable call ID."""
+        return self.submit(toolkit_name, function_name, **arguments).result()
+
+    def submit(self, toolkit_name: str, function_name: str, **arguments: object) -> MindRoomCall:
+        """Durably submit one logical call and return its handle without waiting for the result."""
+        handle = self._new_call(toolkit_name, function_name, arguments)
+        while handle._receipt is None:
             try:
-                receipt = self._submit(
-                    call_id,
+                handle._receipt = self._submit(
+                    handle.call_id,
                     toolkit_name,
                     function_name,
-                    wire_arguments,
-                    arguments_digest=arguments_digest,
+                    handle._arguments,
+                    arguments_digest=handle._arguments_digest,
                 )
             except MindRoomToolCallError as exc:
                 if not exc.retryable:
                     raise
                 time.sleep(self._poll_interval_seconds)
+        return handle
+
+    def call_many(
+        self,
+        calls: Iterable[tuple[str, str, Mapping[str, object]]],
+    ) -> list[MindRoomCall]:
+        """Submit independent calls in as few gateway requests as possible.
+
+        Every call's arguments are validated before anything is submitted. A
+        call the gateway refuses does not stop the others: its handle raises
+        the refusal from ``result()``. The calls of one gateway request run
+        concurrently with each other, a bounded number at a time, and may
+        finish in any order.
+        """
+        handles = [
+            self._new_call(toolkit_name, function_name, dict(arguments))
+            for toolkit_name, function_name, arguments in calls
+        ]
+        for batch in _batches(handles):
+            self._submit_batch(batch)
+        return handles
+
+    def as_completed(self, calls: Iterable[MindRoomCall]) -> Iterator[MindRoomCall]:
+        """Yield handles as their calls become terminal, waiting on the oldest pending one."""
+        waiting = list(calls)
+        while waiting:
+            settled = [handle for handle in waiting if handle.done()]
+            waiting = [handle for handle in waiting if not handle.done()]
+            yield from settled
+            if waiting:
+                self._wait_once(waiting[0])
+
+    def _new_call(self, toolkit_name: str, function_name: str, arguments: dict[str, object]) -> MindRoomCall:
+        call_id = uuid.uuid4().hex
+        return MindRoomCall(
+            self,
+            call_id=call_id,
+            toolkit_name=toolkit_name,
+            function_name=function_name,
+            arguments=_json_wire_arguments(arguments, call_id=call_id),
+        )
 
-        while receipt.state == "pending":
+    def _settle(self, handle: MindRoomCall) -> None:
+        while not handle.done():
+            self._wait_once(handle)
+
+    def _wait_once(self, handle: MindRoomCall) -> None:
+        """Long-poll one pending receipt, pacing retries and early pending answers."""
+        started = time.monotonic()
+        try:
+            handle._receipt = self._poll(
+                handle.call_id,
+                toolkit_name=handle.toolkit_name,
+                function_name=handle.function_name,
+                arguments_digest=handle._arguments_digest,
+            )
+        except MindRoomToolCallError as exc:
+            if not exc.retryable:
+                raise
             time.sleep(self._poll_interval_seconds)
+            return
+        elapsed = time.monotonic() - started
+        if not handle.done() and elapsed < self._poll_interval_seconds:
+            time.sleep(self._poll_interval_seconds - elapsed)
+
+    def _submit_batch(self, batch: list[MindRoomCall]) -> None:
+        pending = batch
+        while pending:
             try:
-                receipt = self._poll(
-                    call_id,
-                    toolkit_name=toolkit_name,
-                    function_name=function_name,
-                    arguments_digest=arguments_digest,
-                )
+                outcomes = self._request_batch(pending)
             except MindRoomToolCallError as exc:
-                if not exc.retryable:
-                    raise
+                if exc.retryable:
+                    time.sleep(self._poll_interval_seconds)
+                    continue
+                for handle in pending:
+                    handle._error = MindRoomToolCallError(
+                        str(exc),
+                        kind=exc.kind,
+                        retryable=False,
+                        call_id=handle.call_id,
+                    )
+                return
+            retry: list[MindRoomCall] = []
+            for handle, outcome in zip(pending, outcomes, strict=True):
+                if isinstance(outcome, _Receipt):
+                    handle._receipt = outcome
+                elif outcome.retryable:
+                    retry.append(handle)
+                else:
+                    handle._error = outcome
+            pending = retry
+            if pending:
+                time.sleep(self._poll_interval_seconds)
 
-        if receipt.state == "completed":
-            return receipt.result
-        raise MindRoomToolCallError.from_receipt(receipt)
+    def _request_batch(self, batch: list[MindRoomCall]) -> list[_Receipt | MindRoomToolCallError]:
+        payload = {"calls": [_call_payload(self._run_id, handle) for handle in batch]}
+        request = urllib.request.Request(  # noqa: S310 - the constructor restricts the gateway to HTTP(S).
+            f"{self._gateway_url}/calls/batch",
+            data=json.dumps(payload, allow_nan=False, separators=(",", ":")).encode(),
+            headers={"Content-Type": "application/json", "Authorization": f"Bearer {self._token}"},
+            method="POST",
+        )
+        first_call_id = batch[0].call_id
+        try:
+            with urllib.request.urlopen(request, timeout=self._http_timeout_seconds) as response:  # noqa: S310
+                body = json.loads(response.read())
+        except urllib.error.HTTPError as exc:
+            raise _http_error(exc, call_id=first_call_id) from exc
+        except (urllib.error.URLError, TimeoutError, OSError) as exc:
+            raise MindRoomToolCallError(
+                _TRANSPORT_ERROR,
+                kind="transport",
+                retryable=True,
+                call_id=first_call_id,
+            ) from exc
+        except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+            raise MindRoomToolCallError(
+                _INVALID_BATCH_RESPONSE_ERROR,
+                kind="invalid_response",
+                retryable=False,
+                call_id=first_call_id,
+            ) from exc
+        results = body.get("results") if isinstance(body, dict) else None
+        if not isinstance(results, list) or len(results) != len(batch):
+            raise MindRoomToolCallError(
+                _INVALID_BATCH_RESPONSE_ERROR,
+                kind="invalid_response",
+                retryable=False,
+                call_id=first_call_id,
+            )
+        return [_batch_outcome(item, handle, run_id=self._run_id) for item, handle in zip(results, batch, strict=True)]
 
     def _submit(
         self,
@@ -174,7 +337,7 @@ class MindRoomTools:
         encoded_call_id = urllib.parse.quote(call_id, safe="")
         return self._request(
             urllib.request.Request(  # noqa: S310 - the constructor restricts the gateway to HTTP(S).
-                f"{self._gateway_url}/runs/{run_id}/calls/{encoded_call_id}",
+                f"{self._gateway_url}/runs/{run_id}/calls/{encoded_call_id}?wait_seconds={self._long_poll_seconds:g}",
                 headers={"Authorization": f"Bearer {self._token}"},
                 method="GET",
             ),
@@ -222,6 +385,56 @@ class MindRoomTools:
         )
 
 
+def _call_payload(run_id: str, handle: MindRoomCall) -> dict[str, object]:
+    return {
+        "run_id": run_id,
+        "call_id": handle.call_id,
+        "toolkit_name": handle.toolkit_name,
+        "function_name": handle.function_name,
+        "arguments": handle._arguments,
+    }
+
+
+def _batches(handles: list[MindRoomCall]) -> Iterator[list[MindRoomCall]]:
+    """Split handles into requests within the gateway's batch count and size bounds."""
+    batch: list[MindRoomCall] = []
+    batch_bytes = 0
+    for handle in handles:
+        call_bytes = len(json.dumps(_call_payload("", handle), separators=(",", ":")).encode()) + 1
+        if batch and (len(batch) == _MAX_BATCH_CALLS or batch_bytes + call_bytes > _MAX_BATCH_REQUEST_BYTES):
+            yield batch
+            batch, batch_bytes = [], 0
+        batch.append(handle)
+        batch_bytes += call_bytes
+    if batch:
+        yield batch
+
+
+def _batch_outcome(item: object, handle: MindRoomCall, *, run_id: str) -> _Receipt | MindRoomToolCallError:
+    payload = cast("dict[str, object]", item) if isinstance(item, dict) else {}
+    status_code = payload.get("status_code")
+    if payload.get("call_id") != handle.call_id or not isinstance(status_code, int):
+        return MindRoomToolCallError(
+            _INVALID_BATCH_RESPONSE_ERROR,
+            kind="invalid_response",
+            retryable=False,
+            call_id=handle.call_id,
+        )
+    if status_code >= 400:
+        return _status_error(status_code, payload.get("detail"), call_id=handle.call_id)
+    try:
+        return _parse_receipt(
+            payload.get("receipt"),
+            expected_run_id=run_id,
+            expected_call_id=handle.call_id,
+            expected_toolkit_name=handle.toolkit_name,
+            expected_function_name=handle.function_name,
+            expected_arguments_digest=handle._arguments_digest,
+        )
+    except MindRoomToolCallError as exc:
+        return exc
+
+
 def _required_env(name: str) -> str:
     value = os.environ.get(name, "").strip()
     if not value:
@@ -348,15 +561,19 @@ def _parse_receipt(
 
 
 def _http_error(exc: urllib.error.HTTPError, *, call_id: str) -> MindRoomToolCallError:
-    rate_limited = exc.code == 429
-    retryable = rate_limited or exc.code >= 500
     try:
         payload = json.loads(exc.read())
     except (json.JSONDecodeError, UnicodeDecodeError):
         payload = {}
     detail = payload.get("detail") if isinstance(payload, dict) else None
+    return _status_error(exc.code, detail, call_id=call_id)
+
+
+def _status_error(status_code: int, detail: object, *, call_id: str) -> MindRoomToolCallError:
+    rate_limited = status_code == 429
+    retryable = rate_limited or status_code >= 500
     return MindRoomToolCallError(
-        str(detail or f"Background tool gateway request failed with status {exc.code}."),
+        str(detail or f"Background tool gateway request failed with status {status_code}."),
         kind="rate_limited" if rate_limited else ("gateway_unavailable" if retryable else "request_rejected"),
         retryable=retryable,
         call_id=call_id,
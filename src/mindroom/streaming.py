@@ -8,7 +8,7 @@ import time
 from contextlib import suppress
 from copy import deepcopy
 from dataclasses import dataclass, field, replace
-from typing import TYPE_CHECKING, Any, Literal, NoReturn
+from typing import TYPE_CHECKING, Any, Literal, NoReturn, Protocol
 
 from agno.run.agent import RunCompletedEvent, RunContentEvent, ToolCallCompletedEvent, ToolCallStartedEvent
 from nio.exceptions import SendRetryError
@@ -18,6 +18,7 @@ from mindroom.constants import (
     STREAM_STATUS_CANCELLED,
     STREAM_STATUS_COMPLETED,
     STREAM_STATUS_ERROR,
+    STREAM_STATUS_INTERRUPTED,
     STREAM_STATUS_KEY,
     STREAM_STATUS_PENDING,
     STREAM_STATUS_STREAMING,
@@ -26,9 +27,16 @@ from mindroom.constants import (
 )
 from mindroom.final_delivery import StreamTransportOutcome
 from mindroom.logging_config import get_logger
-from mindroom.matrix.client_delivery import build_edit_event_content, edit_message_result, send_message_result
+from mindroom.matrix.client_delivery import (
+    MatrixEditSupersededError,
+    build_edit_event_content,
+    edit_message_result,
+    send_message_result,
+)
+from mindroom.matrix.edit_cadence import edit_cadence_for_homeserver
 from mindroom.matrix.large_messages import should_send_oversized_nonterminal_streaming_edit
 from mindroom.matrix.mentions import format_message_with_mentions
+from mindroom.matrix.outbound_edits import record_coalesced_edits
 from mindroom.orchestration.runtime import (
     SYNC_RESTART_CANCEL_MSG,
     USER_STOP_CANCEL_MSG,
@@ -49,7 +57,7 @@ from mindroom.tool_system.events import (
 from mindroom.tool_system.runtime_context import worker_progress_pump_scope
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Awaitable, Callable
+    from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
 
     import nio
 
@@ -73,6 +81,7 @@ __all__ = [
     "FinalTextTransform",
     "ReplacementStreamingResponse",
     "StreamInputChunk",
+    "StreamStateObserver",
     "StreamingDeliveryError",
     "StreamingLifecycleSuspensionError",
     "StreamingPresentation",
@@ -87,6 +96,7 @@ __all__ = [
     "interactive_response_for_visible_body",
     "is_interrupted_partial_reply",
     "send_streaming_response",
+    "stream_needs_restart_recovery",
     "strip_visible_tool_markers",
 ]
 
@@ -289,6 +299,27 @@ def clean_partial_reply_text(text: str) -> str:
     return cleaned
 
 
+def stream_needs_restart_recovery(content: Mapping[str, object]) -> bool:
+    """Return whether a delivered stream event leaves work for restart recovery.
+
+    A stream still promising another revision has to be closed out if this
+    process stops, and one already ended by an interruption note still owes
+    the auto-resume that only a recovery pass sends.
+    """
+    stream_status = content.get(STREAM_STATUS_KEY)
+    if stream_status in {STREAM_STATUS_PENDING, STREAM_STATUS_STREAMING}:
+        return True
+    body = content.get(STREAM_VISIBLE_BODY_KEY, content.get("body"))
+    if not isinstance(body, str):
+        return False
+    trimmed_body = body.rstrip()
+    if trimmed_body.endswith(RESTART_INTERRUPTED_RESPONSE_NOTE):
+        return True
+    return stream_status in {STREAM_STATUS_ERROR, STREAM_STATUS_INTERRUPTED} and trimmed_body.endswith(
+        INTERRUPTED_RESPONSE_NOTE,
+    )
+
+
 def build_restart_interrupted_body(text: str) -> str:
     """Return restart-note text for a stale in-progress message body."""
     stripped_text = text.rstrip()
@@ -494,6 +525,20 @@ type TerminalSend = Callable[..., Awaitable[DeliveredMatrixEvent | None]]
 type FinalTextTransform = Callable[[str], Awaitable[str]]
 
 
+class StreamStateObserver(Protocol):
+    """Keeps the journal told which rooms hold a stream a restart would leave open.
+
+    It is called once before sending a revision that opens recovery work
+    (``delivered`` false, ``event_id`` still ``None`` before the first send
+    lands), and after each delivered revision whose recovery obligation differs
+    from the last one reported.
+    """
+
+    async def __call__(self, event_id: str | None, content: dict[str, Any], *, delivered: bool) -> None:
+        """Report one stream revision."""
+        ...
+
+
 @dataclass
 class StreamingResponse:
     """Manages a streaming response with incremental message updates."""
@@ -516,6 +561,9 @@ class StreamingResponse:
     min_char_update_interval: float = 0.35
     progress_update_interval: float = 1.0
     max_idle: float = 2.0
+    # Edits to keep in flight per homeserver; ``None`` keeps the fixed cadence.
+    target_inflight_edits: float | None = None
+    last_throttled_send_at: float = 0.0
     latest_thread_event_id: str | None = None  # For MSC3440 compliance
     show_tool_calls: bool = True  # When False, omit inline tool call text and tool-trace metadata
     tool_trace: list[ToolTraceEntry] = field(default_factory=list)
@@ -552,6 +600,7 @@ class StreamingResponse:
     # through the outbox, which knows the difference between refusing an
     # answer and stranding one the homeserver may already hold.
     transport_is_current: Callable[[], Awaitable[bool]] | None = None
+    stream_state_observer: StreamStateObserver | None = None
     canonical_final_body_candidate: str | None = None
     _warmup_state: WorkerWarmupState = field(default_factory=WorkerWarmupState, init=False, repr=False)
     _last_delivered_text: str = field(default="", init=False, repr=False)
@@ -571,6 +620,7 @@ class StreamingResponse:
     )
     _inflight_nonterminal_capture: asyncio.Future[None] | None = field(default=None, init=False, repr=False)
     _inflight_nonterminal_capture_state: _CommittedDeliveryState | None = field(default=None, init=False, repr=False)
+    _observed_needs_restart_recovery: bool | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Derive Matrix delivery fields from the canonical target."""
@@ -635,6 +685,15 @@ class StreamingResponse:
         threshold = fast_threshold + (self.update_char_threshold - fast_threshold) * progress
         return max(1, round(threshold))
 
+    def _paced_edit_interval(self, client: nio.AsyncClient) -> float | None:
+        """Return the homeserver-paced seconds between edits, or ``None`` to keep the fixed cadence."""
+        if self.target_inflight_edits is None:
+            return None
+        cadence = edit_cadence_for_homeserver(getattr(client, "homeserver", None))
+        if cadence is None:
+            return None
+        return cadence.paced_interval(target_inflight_edits=self.target_inflight_edits)
+
     def _mark_nonterminal_delivery(
         self,
         committed_state: _CommittedDeliveryState,
@@ -691,23 +750,35 @@ class StreamingResponse:
         current_interval = self._current_update_interval(current_time)
         if progress_hint:
             current_interval = min(current_interval, self.progress_update_interval)
+        min_edit_gap = self.min_char_update_interval
+        paced_interval = self._paced_edit_interval(client)
+        if paced_interval is not None:
+            # The homeserver's pace replaces the fixed floor, and no trigger edits faster than it.
+            min_edit_gap = paced_interval
+            current_interval = max(current_interval, paced_interval)
 
         elapsed_since_last_update = current_time - self.last_update
         time_triggered = elapsed_since_last_update >= current_interval
         char_triggered = (
             self.chars_since_last_update >= self._current_char_threshold(current_time)
-            and elapsed_since_last_update >= self.min_char_update_interval
+            and elapsed_since_last_update >= min_edit_gap
         )
         idle_reference_delta_at = prior_delta_at if prior_delta_at is not None else self.last_delta_at
         idle_triggered = (
             self.chars_since_last_update > 0
             and idle_reference_delta_at is not None
             and (current_time - idle_reference_delta_at) >= self.max_idle
-            and elapsed_since_last_update >= self.min_char_update_interval
+            and elapsed_since_last_update >= min_edit_gap
         )
         should_send = time_triggered or char_triggered or idle_triggered
+        if paced_interval is not None and current_time - self.last_throttled_send_at < paced_interval:
+            # ``last_update`` only advances once an edit matches the live text, so
+            # while text outruns a slow homeserver every trigger fires; the pace
+            # is measured from the previous send instead.
+            should_send = False
         allow_empty_progress = progress_hint and not self.accumulated_text.strip()
         if should_send and (self.accumulated_text.strip() or allow_empty_progress):
+            self.last_throttled_send_at = current_time
             await self._send_or_edit_message(
                 client,
                 allow_empty_progress=allow_empty_progress,
@@ -1009,6 +1080,7 @@ class StreamingResponse:
             # one the homeserver may already hold.
             _complete_capture_completions(capture_completions)
             return True
+        await self._announce_stream_state(prepared_delivery.content)
         capture = None
         if not is_final:
             capture = asyncio.get_running_loop().create_future()
@@ -1025,7 +1097,13 @@ class StreamingResponse:
                 retry_without_backoff=retry_without_backoff,
                 retry_sync_recovery=not is_final or retry_on_failure,
                 is_final=durable_terminal,
+                nonterminal=not is_final,
             )
+        except MatrixEditSupersededError:
+            # A terminal edit of this message replaced the progress edit before
+            # it went out. Nothing failed, and nothing new became visible.
+            logger.debug("Streaming progress edit superseded", event_id=self.event_id, room_id=self.room_id)
+            return True
         finally:
             if self._inflight_nonterminal_capture is capture:
                 self._inflight_nonterminal_capture = None
@@ -1038,6 +1116,7 @@ class StreamingResponse:
             return False
 
         self._mark_first_visible_reply_if_needed(prepared_delivery.committed_state)
+        await self._observe_stream_state(prepared_delivery.content)
         if not is_final:
             self._warmup_state.note_nonterminal_delivery(
                 had_warmup_suffix=prepared_delivery.had_warmup_suffix,
@@ -1051,6 +1130,26 @@ class StreamingResponse:
             self.placeholder_progress_sent = False
         return True
 
+    async def _announce_stream_state(self, content: dict[str, Any]) -> None:
+        """Report, before it is sent, a revision that opens restart-recovery work."""
+        if (
+            self.stream_state_observer is None
+            or self._observed_needs_restart_recovery
+            or not stream_needs_restart_recovery(content)
+        ):
+            return
+        await self.stream_state_observer(self.event_id, content, delivered=False)
+
+    async def _observe_stream_state(self, content: dict[str, Any]) -> None:
+        """Report a delivered revision whose restart-recovery obligation changed."""
+        if self.stream_state_observer is None or self.event_id is None:
+            return
+        needs_restart_recovery = stream_needs_restart_recovery(content)
+        if needs_restart_recovery == self._observed_needs_restart_recovery:
+            return
+        self._observed_needs_restart_recovery = needs_restart_recovery
+        await self.stream_state_observer(self.event_id, content, delivered=True)
+
     def _should_send_prepared_nonterminal_edit(
         self,
         prepared_delivery: _PreparedStreamingDelivery,
@@ -1255,18 +1354,29 @@ class StreamingResponse:
         display_text: str,
         retry_sync_recovery: bool,
         is_final: bool = False,
+        nonterminal: bool = False,
     ) -> bool:
         """Send one streaming edit event for the existing message."""
         assert self.event_id is not None
-        edit = self.terminal_edit if is_final and self.terminal_edit is not None else edit_message_result
-        delivered = await edit(
-            client,
-            self.room_id,
-            self.event_id,
-            content,
-            display_text,
-            retry_sync_recovery=retry_sync_recovery,
-        )
+        if is_final and self.terminal_edit is not None:
+            delivered = await self.terminal_edit(
+                client,
+                self.room_id,
+                self.event_id,
+                content,
+                display_text,
+                retry_sync_recovery=retry_sync_recovery,
+            )
+        else:
+            delivered = await edit_message_result(
+                client,
+                self.room_id,
+                self.event_id,
+                content,
+                display_text,
+                retry_sync_recovery=retry_sync_recovery,
+                nonterminal=nonterminal,
+            )
         return delivered is not None
 
     async def _direct_transport_allowed(self) -> bool:
@@ -1292,6 +1402,7 @@ class StreamingResponse:
         retry_without_backoff: bool = False,
         retry_sync_recovery: bool = False,
         is_final: bool = False,
+        nonterminal: bool = False,
     ) -> bool:
         """Send a new event or edit the existing one.
 
@@ -1299,6 +1410,9 @@ class StreamingResponse:
         narrower than "this is the last edit". A cancelled or failed stream
         also ends with a terminal edit, and that edit is a notice rather than
         an answer, so it must not claim the turn's durable delivery.
+        ``nonterminal`` marks a progress edit, which yields to terminal edits
+        in the room's outbound edit schedule. A superseded progress edit raises
+        ``MatrixEditSupersededError`` and is not retried.
         """
         total_attempts = 2 if retry_on_failure or retry_without_backoff else 1
         for attempt in range(1, total_attempts + 1):
@@ -1322,10 +1436,11 @@ class StreamingResponse:
                         display_text=display_text,
                         retry_sync_recovery=retry_sync_recovery,
                         is_final=is_final,
+                        nonterminal=nonterminal,
                     ):
                         return True
                     logger.error("Failed to edit streaming message", attempt=attempt)
-            except SendRetryError:
+            except (SendRetryError, MatrixEditSupersededError):
                 raise
             except Exception:
                 logger.warning(
@@ -1732,6 +1847,7 @@ async def _drive_stream_delivery(  # noqa: C901, PLR0912
         boundary_refresh_capture_completions = (
             [request.capture_completion] if request.boundary_refresh and request.capture_completion is not None else []
         )
+        coalesced_requests = 0
         while True:
             try:
                 next_request = delivery_queue.get_nowait()
@@ -1740,6 +1856,7 @@ async def _drive_stream_delivery(  # noqa: C901, PLR0912
             if next_request is None:
                 stop_after_current = True
                 break
+            coalesced_requests += 1
             if next_request.phase_boundary_flush and next_request.capture_completion is not None:
                 phase_boundary_capture_completions.append(next_request.capture_completion)
             if next_request.boundary_refresh and next_request.capture_completion is not None:
@@ -1760,6 +1877,7 @@ async def _drive_stream_delivery(  # noqa: C901, PLR0912
                     else merged_request.boundary_refresh_prior_delta_at
                 ),
             )
+        record_coalesced_edits(streaming.room_id, coalesced_requests)
 
         try:
             prepared_phase_boundary_flush = None
@@ -1969,6 +2087,7 @@ async def send_streaming_response(  # noqa: C901, PLR0912, PLR0915
     terminal_send: TerminalSend | None = None,
     final_text_transform: FinalTextTransform | None = None,
     transport_is_current: Callable[[], Awaitable[bool]] | None = None,
+    stream_state_observer: StreamStateObserver | None = None,
     interactive_creator_agent: str | None = None,
     interactive_source_event_id: str | None = None,
 ) -> StreamTransportOutcome:
@@ -1986,12 +2105,14 @@ async def send_streaming_response(  # noqa: C901, PLR0912, PLR0915
         min_update_interval=sc.min_update_interval,
         interval_ramp_seconds=sc.interval_ramp_seconds,
         max_idle=sc.max_idle,
+        target_inflight_edits=sc.target_inflight_edits if sc.adaptive_cadence else None,
         pipeline_timing=pipeline_timing,
         visible_event_id_callback=visible_event_id_callback,
         preserve_existing_visible_on_empty_terminal=preserve_existing_visible_on_empty_terminal,
         terminal_edit=terminal_edit,
         terminal_send=terminal_send,
         transport_is_current=transport_is_current,
+        stream_state_observer=stream_state_observer,
         interactive_creator_agent=interactive_creator_agent,
         interactive_source_event_id=interactive_source_event_id,
     )
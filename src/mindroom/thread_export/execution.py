@@ -16,13 +16,17 @@ from mindroom.thread_export.models import (
     failure_for_room,
 )
 from mindroom.thread_export.policy import target_accepts_room
-from mindroom.thread_export.projected_history import fetch_projected_thread_history
+from mindroom.thread_export.projected_history import fetch_projected_thread_history, projected_thread_watermark
 from mindroom.thread_export.selection import trusted_sender_ids_for_export
 from mindroom.thread_export.storage import (
+    ThreadExportManifest,
+    load_thread_export_manifest,
     remove_room_export,
     remove_stale_thread_exports,
     room_has_thread_exports,
+    thread_export_is_current,
     thread_payload,
+    thread_source_key,
     write_room_index,
     write_thread_payload,
 )
@@ -119,9 +123,43 @@ async def _write_thread_to_targets(
     thread_id: str,
     trusted_sender_ids: frozenset[str],
     accumulators: Sequence[ThreadExportAccumulator],
+    manifests: dict[int, ThreadExportManifest],
     changed_accumulator_ids: set[int],
 ) -> None:
-    """Fetch one thread once and write it independently to each target."""
+    """Fetch one thread once and write it independently to each target.
+
+    The journal watermark is read before the thread itself, so a thread that
+    moves during the fetch is recorded at its older position and read again
+    next pass. A target whose file was written from this exact watermark, and
+    is still intact, is counted as unchanged without the thread being read.
+    """
+    watermark = await projected_thread_watermark(reader, room_id=room.room_id, thread_id=thread_id)
+    source_key = (
+        None
+        if watermark is None
+        else thread_source_key(room, watermark=watermark, trusted_sender_ids=trusted_sender_ids)
+    )
+    pending: list[ThreadExportAccumulator] = []
+    for accumulator in accumulators:
+        try:
+            current = source_key is not None and thread_export_is_current(
+                accumulator.target.output_dir,
+                room,
+                thread_id,
+                manifest=manifests[id(accumulator)],
+                source_key=source_key,
+            )
+        except Exception as exc:
+            accumulator.failed_items.append(failure_for_room(room, str(exc), thread_id=thread_id))
+            continue
+        if current:
+            accumulator.threads_exported += 1
+            accumulator.threads_unchanged += 1
+        else:
+            pending.append(accumulator)
+    if not pending:
+        return
+
     try:
         payload = await _fetch_thread_payload(
             reader,
@@ -130,17 +168,19 @@ async def _write_thread_to_targets(
             trusted_sender_ids=trusted_sender_ids,
         )
     except Exception as exc:
-        for accumulator in accumulators:
+        for accumulator in pending:
             accumulator.failed_items.append(failure_for_room(room, str(exc), thread_id=thread_id))
         return
 
-    for accumulator in accumulators:
+    for accumulator in pending:
         try:
             wrote_file = write_thread_payload(
                 accumulator.target.output_dir,
                 room,
                 thread_id,
                 payload,
+                manifest=manifests[id(accumulator)],
+                source_key=source_key,
             )
         except Exception as exc:
             accumulator.failed_items.append(failure_for_room(room, str(exc), thread_id=thread_id))
@@ -158,9 +198,10 @@ def _finish_room_exports(
     *,
     truncated: bool,
     accumulators: Sequence[ThreadExportAccumulator],
+    manifests: dict[int, ThreadExportManifest],
     changed_accumulator_ids: set[int],
 ) -> None:
-    """Reconcile removed threads and update indexes for one enumerated room."""
+    """Reconcile removed threads and update indexes and manifests for one enumerated room."""
     for accumulator in accumulators:
         try:
             output_dir = accumulator.target.output_dir
@@ -184,6 +225,7 @@ def _finish_room_exports(
                 output_dir,
                 room,
                 thread_files_changed=id(accumulator) in changed_accumulator_ids,
+                manifest=manifests[id(accumulator)],
             )
         except Exception as exc:
             accumulator.failed_items.append(failure_for_room(room, f"Room reconciliation failed: {exc}"))
@@ -253,6 +295,9 @@ async def _export_enumerated_room_threads(
 ) -> None:
     """Export one enumerated room's threads to every authorized accumulator."""
     changed_accumulator_ids: set[int] = set()
+    manifests = {
+        id(accumulator): load_thread_export_manifest(accumulator.target.output_dir, room) for accumulator in authorized
+    }
 
     for thread_id in thread_ids:
         await _write_thread_to_targets(
@@ -261,6 +306,7 @@ async def _export_enumerated_room_threads(
             thread_id=thread_id,
             trusted_sender_ids=trusted_sender_ids,
             accumulators=authorized,
+            manifests=manifests,
             changed_accumulator_ids=changed_accumulator_ids,
         )
 
@@ -269,5 +315,6 @@ async def _export_enumerated_room_threads(
         thread_ids,
         truncated=truncated,
         accumulators=authorized,
+        manifests=manifests,
         changed_accumulator_ids=changed_accumulator_ids,
     )
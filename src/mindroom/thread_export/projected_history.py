@@ -51,6 +51,7 @@ from typing import TYPE_CHECKING, Protocol
 
 from mindroom.event_journal import HydrationPolicy
 from mindroom.event_journal.views import ConversationReadView, HydrationView
+from mindroom.logging_config import get_logger
 from mindroom.matrix.conversation_hydration import ConversationHydrator
 from mindroom.matrix.conversation_reads import ConversationReader, projected_visible_messages
 
@@ -61,6 +62,8 @@ if TYPE_CHECKING:
     from mindroom.event_journal import ConversationCursor
     from mindroom.matrix.client_visible_messages import ResolvedVisibleMessage
 
+logger = get_logger(__name__)
+
 # One page is a store round trip, not a homeserver one, so this trades a little
 # memory for far fewer of them. It is deliberately smaller than the prompt
 # window: export is the caller that reads whole threads, and a page that big
@@ -95,6 +98,10 @@ class SupportsConversationCompleteness(Protocol):
         """Return whether the walk that hydrated this conversation ran to its end."""
         ...
 
+    async def conversation_watermark(self, *, room_id: str, thread_id: str | None) -> str | None:
+        """Return a token that changes whenever this conversation's strict read would, or nothing."""
+        ...
+
 
 class ExportProjectionView(ConversationReadView, HydrationView, SupportsConversationCompleteness, Protocol):
     """Everything export reads from one principal's projection, and nothing else.
@@ -246,6 +253,27 @@ async def fetch_projected_thread_history(
     return messages
 
 
+async def projected_thread_watermark(
+    projection: ProjectedThreadReader,
+    *,
+    room_id: str,
+    thread_id: str,
+) -> str | None:
+    """Return where one thread stands in the journal, or nothing when only a read can say.
+
+    A pass compares this with the watermark it recorded beside the file it
+    last wrote, and reads the thread again only when the two differ. It is an
+    optimization and nothing more, so failing to answer is not a failure of
+    the thread: the caller reads it, and that read reports whatever is wrong.
+    """
+    try:
+        watermark = await projection.completeness.conversation_watermark(room_id=room_id, thread_id=thread_id)
+    except Exception as exc:
+        logger.debug("Thread watermark unavailable", room_id=room_id, thread_id=thread_id, error=str(exc))
+        return None
+    return watermark if isinstance(watermark, str) else None
+
+
 __all__ = [
     "EXPORT_MAX_FETCHED_EVENTS",
     "EXPORT_MAX_MESSAGES_REQUESTS",
@@ -257,4 +285,5 @@ __all__ = [
     "ThreadExportIncompleteError",
     "export_conversation_reader",
     "fetch_projected_thread_history",
+    "projected_thread_watermark",
 ]
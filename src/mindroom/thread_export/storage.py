@@ -1,15 +1,31 @@
-"""Thread-export document serialization and filesystem reconciliation."""
+"""Thread-export document serialization and filesystem reconciliation.
+
+Every room directory also holds ``.manifest.json``, the exporter's record of
+what each thread file was written from: the hash of its content, the journal
+watermark and render inputs it was built from, the file's size, inode and
+mtime when it was written, and the index entry it contributes. A
+``--watch`` pass used to YAML-parse every existing thread file to decide
+whether anything changed, and parse every one again to rebuild the room
+index. With the manifest, a thread whose watermark did not move is not read
+from the journal at all, a rebuilt payload is compared by hash, and the index
+is assembled from recorded entries. An entry is trusted only while the file
+still has the size, inode and mtime it recorded, so a file edited or replaced
+by hand falls back to the parse, and a missing or unreadable manifest only
+costs one pass of the old behaviour.
+"""
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import shutil
 import stat
 from contextlib import suppress
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, cast
 from urllib.parse import quote, unquote
 from uuid import uuid4
 
@@ -26,6 +42,8 @@ if TYPE_CHECKING:
 
 _EXPORT_SCHEMA_VERSION = 1
 _ROOM_INDEX_FILENAME = "index.json"
+_ROOM_MANIFEST_FILENAME = ".manifest.json"
+_ROOM_MANIFEST_VERSION = 1
 _ROOT_MARKER_FILENAME = ".mindroom-thread-exports"
 _ROOT_MARKER_TEXT = '{"format":"mindroom-thread-exports","version":1}\n'
 _THREAD_SUMMARY_CONTENT_KEY = "io.mindroom.thread_summary"
@@ -165,7 +183,7 @@ def _is_room_export_temp_file(room_fd: int, filename: str) -> bool:
     destination = _atomic_temp_destination(filename)
     return (
         destination is not None
-        and (destination == _ROOM_INDEX_FILENAME or _is_thread_export_filename(destination))
+        and (destination in {_ROOM_INDEX_FILENAME, _ROOM_MANIFEST_FILENAME} or _is_thread_export_filename(destination))
         and _regular_file_at(room_fd, filename)
     )
 
@@ -173,7 +191,7 @@ def _is_room_export_temp_file(room_fd: int, filename: str) -> bool:
 def _is_room_export_file(room_fd: int, filename: str) -> bool:
     """Return whether one room entry is an exporter-owned regular file."""
     return (
-        (filename == _ROOM_INDEX_FILENAME and _regular_file_at(room_fd, filename))
+        (filename in {_ROOM_INDEX_FILENAME, _ROOM_MANIFEST_FILENAME} and _regular_file_at(room_fd, filename))
         or (_is_thread_export_filename(filename) and _regular_file_at(room_fd, filename))
         or _is_room_export_temp_file(room_fd, filename)
     )
@@ -477,6 +495,16 @@ def _latest_thread_summary(
     return None
 
 
+def _room_block(room: ThreadExportRoom) -> dict[str, object]:
+    """Return the room identity block shared by thread documents and the room index."""
+    return {
+        "key": room.key,
+        "id": room.room_id,
+        "name": room.name,
+        "alias": room.alias,
+    }
+
+
 def thread_payload(
     *,
     room: ThreadExportRoom,
@@ -496,12 +524,7 @@ def thread_payload(
     thread_block["message_count"] = len(messages)
     return {
         "version": _EXPORT_SCHEMA_VERSION,
-        "room": {
-            "key": room.key,
-            "id": room.room_id,
-            "name": room.name,
-            "alias": room.alias,
-        },
+        "room": _room_block(room),
         "thread": thread_block,
         "messages": [_message_payload(message) for message in messages],
     }
@@ -518,6 +541,11 @@ def _thread_index_entry_at(directory_fd: int, filename: str) -> tuple[int, dict[
         return None
     if not isinstance(payload, dict):
         return None
+    return _thread_index_entry(filename, payload)
+
+
+def _thread_index_entry(filename: str, payload: dict[str, Any]) -> tuple[int, dict[str, object]] | None:
+    """Return one index pair from a thread payload, parsed or about to be written."""
     thread = payload.get("thread")
     messages = payload.get("messages")
     if not isinstance(thread, dict) or not isinstance(messages, list):
@@ -545,25 +573,30 @@ def _thread_index_entry_at(directory_fd: int, filename: str) -> tuple[int, dict[
     return last_timestamp, entry
 
 
-def _room_index_payload(room_fd: int, room: ThreadExportRoom) -> dict[str, object]:
-    """Build one room index document from the recognizable thread files on disk."""
-    indexed = [
-        indexed_entry
-        for filename in sorted(
-            name for name in os.listdir(room_fd) if _is_thread_export_filename(name) and _regular_file_at(room_fd, name)
-        )
-        if (indexed_entry := _thread_index_entry_at(room_fd, filename)) is not None
-    ]
+def _room_index_payload(
+    room_fd: int,
+    room: ThreadExportRoom,
+    manifest: ThreadExportManifest | None = None,
+) -> dict[str, object]:
+    """Build one room index document from the recognizable thread files on disk.
+
+    A file the manifest still vouches for contributes its recorded entry; only
+    the others are parsed.
+    """
+    indexed: list[tuple[int, dict[str, object]]] = []
+    for filename in sorted(
+        name for name in os.listdir(room_fd) if _is_thread_export_filename(name) and _regular_file_at(room_fd, name)
+    ):
+        recorded = None if manifest is None else _trusted_manifest_entry(room_fd, manifest, filename)
+        if recorded is not None:
+            indexed.append((recorded["last_timestamp"], dict(recorded["index_entry"])))
+        elif (indexed_entry := _thread_index_entry_at(room_fd, filename)) is not None:
+            indexed.append(indexed_entry)
     indexed.sort(key=lambda item: item[0], reverse=True)
     entries = [entry for _, entry in indexed]
     return {
         "version": _EXPORT_SCHEMA_VERSION,
-        "room": {
-            "key": room.key,
-            "id": room.room_id,
-            "name": room.name,
-            "alias": room.alias,
-        },
+        "room": _room_block(room),
         "thread_count": len(entries),
         "threads": entries,
     }
@@ -606,8 +639,9 @@ def write_room_index(
     room: ThreadExportRoom,
     *,
     thread_files_changed: bool = True,
+    manifest: ThreadExportManifest | None = None,
 ) -> None:
-    """Rebuild a room index after YAML changes or detected filename-set drift."""
+    """Rebuild a room index after YAML changes or detected filename-set drift, then save the manifest."""
     root_fd = _open_owned_export_root(output_dir, create=False)
     if root_fd is None:
         return
@@ -618,12 +652,13 @@ def write_room_index(
     if room_fd is None:
         return
     try:
-        if not thread_files_changed and _room_index_filename_set_matches(room_fd):
-            return
-        payload = _room_index_payload(room_fd, room)
-        text = f"{json.dumps(payload, indent=2)}\n"
-        if _read_text_at(room_fd, _ROOM_INDEX_FILENAME) != text:
-            _atomic_write_at(room_fd, _ROOM_INDEX_FILENAME, text)
+        if thread_files_changed or not _room_index_filename_set_matches(room_fd):
+            payload = _room_index_payload(room_fd, room, manifest)
+            text = f"{json.dumps(payload, indent=2)}\n"
+            if _read_text_at(room_fd, _ROOM_INDEX_FILENAME) != text:
+                _atomic_write_at(room_fd, _ROOM_INDEX_FILENAME, text)
+        if manifest is not None:
+            _save_manifest_at(room_fd, manifest)
     finally:
         os.close(room_fd)
 
@@ -821,13 +856,229 @@ def _existing_payload_matches(room_fd: int, filename: str, payload: dict[str, ob
     return _payload_without_exported_at(existing) == _payload_without_exported_at(payload)
 
 
+@dataclass(slots=True)
+class ThreadExportManifest:
+    """One room directory's record of what each thread file was written from.
+
+    Loaded once per room and target, updated as threads are written, and saved
+    by ``write_room_index``. Entries are keyed by thread filename.
+    """
+
+    entries: dict[str, dict[str, Any]] = field(default_factory=dict)
+    changed: bool = False
+
+
+def _thread_export_filename(thread_id: str) -> str:
+    """Return the canonical filename of one thread export."""
+    return f"{_safe_path_segment(thread_id)}.yaml"
+
+
+def _payload_content_hash(payload: dict[str, object]) -> str:
+    """Return a digest of one thread payload, ignoring the per-pass exported_at timestamp."""
+    text = json.dumps(_payload_without_exported_at(payload), sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def thread_source_key(
+    room: ThreadExportRoom,
+    *,
+    watermark: str,
+    trusted_sender_ids: Collection[str],
+) -> str:
+    """Return a digest of everything one thread file is rendered from.
+
+    The journal watermark stands for the messages; the room block, the senders
+    trusted for summaries, and the document version are the rest.
+    """
+    text = json.dumps(
+        {
+            "version": _EXPORT_SCHEMA_VERSION,
+            "room": _room_block(room),
+            "trusted_sender_ids": sorted(trusted_sender_ids),
+            "watermark": watermark,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _file_identity_at(directory_fd: int, filename: str) -> dict[str, int] | None:
+    """Return the size, inode and mtime of one regular file, or nothing."""
+    try:
+        file_stat = os.stat(filename, dir_fd=directory_fd, follow_symlinks=False)
+    except FileNotFoundError:
+        return None
+    if not stat.S_ISREG(file_stat.st_mode):
+        return None
+    return {"size": file_stat.st_size, "inode": file_stat.st_ino, "mtime_ns": file_stat.st_mtime_ns}
+
+
+def _is_manifest_entry(entry: object) -> bool:
+    """Return whether one decoded manifest entry has every field a reader relies on."""
+    if not isinstance(entry, dict):
+        return False
+    fields = cast("dict[str, object]", entry)
+    return (
+        isinstance(fields.get("content_hash"), str)
+        and isinstance(fields.get("source"), str | None)
+        and all(isinstance(fields.get(key), int) for key in ("size", "inode", "mtime_ns", "last_timestamp"))
+        and isinstance(fields.get("index_entry"), dict)
+    )
+
+
+def _trusted_manifest_entry(
+    room_fd: int,
+    manifest: ThreadExportManifest,
+    filename: str,
+) -> dict[str, Any] | None:
+    """Return one manifest entry while its file is still the one it describes."""
+    entry = manifest.entries.get(filename)
+    if entry is None:
+        return None
+    identity = _file_identity_at(room_fd, filename)
+    if identity is None or any(entry.get(key) != value for key, value in identity.items()):
+        return None
+    return entry
+
+
+def _load_manifest_at(room_fd: int) -> ThreadExportManifest:
+    """Read one room's manifest, dropping anything it cannot vouch for."""
+    text = _read_text_at(room_fd, _ROOM_MANIFEST_FILENAME)
+    if text is None:
+        return ThreadExportManifest()
+    try:
+        payload = json.loads(text)
+    except json.JSONDecodeError:
+        return ThreadExportManifest()
+    if (
+        not isinstance(payload, dict)
+        or payload.get("version") != _ROOM_MANIFEST_VERSION
+        or not isinstance(threads := payload.get("threads"), dict)
+    ):
+        return ThreadExportManifest()
+    return ThreadExportManifest(
+        entries={
+            filename: entry
+            for filename, entry in threads.items()
+            if _is_thread_export_filename(filename) and _is_manifest_entry(entry)
+        },
+    )
+
+
+def _save_manifest_at(room_fd: int, manifest: ThreadExportManifest) -> None:
+    """Persist one room's manifest after forgetting files that are gone."""
+    disk_filenames = {
+        filename
+        for filename in os.listdir(room_fd)
+        if _is_thread_export_filename(filename) and _regular_file_at(room_fd, filename)
+    }
+    for filename in [filename for filename in manifest.entries if filename not in disk_filenames]:
+        del manifest.entries[filename]
+        manifest.changed = True
+    if not manifest.changed:
+        return
+    payload = {"version": _ROOM_MANIFEST_VERSION, "threads": manifest.entries}
+    _atomic_write_at(room_fd, _ROOM_MANIFEST_FILENAME, f"{json.dumps(payload, sort_keys=True)}\n")
+    manifest.changed = False
+
+
+def _record_manifest_entry(
+    room_fd: int,
+    manifest: ThreadExportManifest,
+    filename: str,
+    payload: dict[str, object],
+    *,
+    content_hash: str,
+    source_key: str | None,
+) -> None:
+    """Record what the thread file now on disk was written from."""
+    identity = _file_identity_at(room_fd, filename)
+    indexed = _thread_index_entry(filename, payload)
+    if identity is None or indexed is None:
+        if manifest.entries.pop(filename, None) is not None:
+            manifest.changed = True
+        return
+    last_timestamp, index_entry = indexed
+    entry: dict[str, Any] = {
+        "content_hash": content_hash,
+        "source": source_key,
+        **identity,
+        "last_timestamp": last_timestamp,
+        "index_entry": index_entry,
+    }
+    if manifest.entries.get(filename) != entry:
+        manifest.entries[filename] = entry
+        manifest.changed = True
+
+
+def load_thread_export_manifest(output_dir: Path, room: ThreadExportRoom) -> ThreadExportManifest:
+    """Return one room's manifest, or an empty one when there is none to trust.
+
+    Never raises: a root or room directory that cannot be opened safely is
+    reported by the write that follows, and an empty manifest only means every
+    thread is checked the slow way.
+    """
+    try:
+        root_fd = _open_owned_export_root(output_dir, create=False)
+        if root_fd is None:
+            return ThreadExportManifest()
+        try:
+            room_fd = _open_room_directory(root_fd, output_dir, room, create=False)
+        finally:
+            os.close(root_fd)
+    except (OSError, RuntimeError):
+        return ThreadExportManifest()
+    if room_fd is None:
+        return ThreadExportManifest()
+    try:
+        return _load_manifest_at(room_fd)
+    finally:
+        os.close(room_fd)
+
+
+def thread_export_is_current(
+    output_dir: Path,
+    room: ThreadExportRoom,
+    thread_id: str,
+    *,
+    manifest: ThreadExportManifest,
+    source_key: str,
+) -> bool:
+    """Return whether one thread file was written from exactly this source and is still intact."""
+    filename = _thread_export_filename(thread_id)
+    entry = manifest.entries.get(filename)
+    if entry is None or entry.get("source") != source_key:
+        return False
+    root_fd = _open_owned_export_root(output_dir, create=False)
+    if root_fd is None:
+        return False
+    try:
+        room_fd = _open_room_directory(root_fd, output_dir, room, create=False)
+    finally:
+        os.close(root_fd)
+    if room_fd is None:
+        return False
+    try:
+        return _trusted_manifest_entry(room_fd, manifest, filename) is not None
+    finally:
+        os.close(room_fd)
+
+
 def write_thread_payload(
     output_dir: Path,
     room: ThreadExportRoom,
     thread_id: str,
     payload: dict[str, object],
+    *,
+    manifest: ThreadExportManifest | None = None,
+    source_key: str | None = None,
 ) -> bool:
-    """Write one thread payload when changed and return whether bytes were replaced."""
+    """Write one thread payload when changed and return whether bytes were replaced.
+
+    With a ``manifest``, a file it still vouches for is compared by content
+    hash instead of being parsed, and the entry is updated to match what is on
+    disk afterwards, recording ``source_key`` as what the payload was built from.
+    """
     root_fd = _open_owned_export_root(output_dir, create=True)
     if root_fd is None:
         msg = f"Failed to create thread export root: {output_dir}"
@@ -840,16 +1091,30 @@ def write_thread_payload(
         msg = f"Failed to create thread export room directory: {room.key}"
         raise RuntimeError(msg)
     try:
-        filename = f"{_safe_path_segment(thread_id)}.yaml"
-        if _existing_payload_matches(room_fd, filename, payload):
-            return False
-        text = yaml_io.safe_dump(
-            payload,
-            default_flow_style=False,
-            sort_keys=False,
-            allow_unicode=True,
-        )
-        _atomic_write_at(room_fd, filename, text)
-        return True
+        filename = _thread_export_filename(thread_id)
+        content_hash = _payload_content_hash(payload)
+        recorded = None if manifest is None else _trusted_manifest_entry(room_fd, manifest, filename)
+        if recorded is not None:
+            unchanged = recorded["content_hash"] == content_hash
+        else:
+            unchanged = _existing_payload_matches(room_fd, filename, payload)
+        if not unchanged:
+            text = yaml_io.safe_dump(
+                payload,
+                default_flow_style=False,
+                sort_keys=False,
+                allow_unicode=True,
+            )
+            _atomic_write_at(room_fd, filename, text)
+        if manifest is not None:
+            _record_manifest_entry(
+                room_fd,
+                manifest,
+                filename,
+                payload,
+                content_hash=content_hash,
+                source_key=source_key,
+            )
+        return not unchanged
     finally:
         os.close(room_fd)
@@ -17,6 +17,7 @@ from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_valida
 
 from mindroom.logging_config import get_logger
 from mindroom.matrix.room_history_reads import enumerate_room_thread_root_ids
+from mindroom.matrix.room_state_index import RoomStateEntries, RoomStateIndex, state_entries_from_events
 
 logger = get_logger(__name__)
 
@@ -45,9 +46,11 @@ __all__ = [
     "ThreadTagsListing",
     "ThreadTagsState",
     "coerce_tag_name",
+    "forget_thread_tags_sync",
     "get_thread_tags",
     "list_tagged_threads",
     "normalize_tag_name",
+    "observe_thread_tags_sync",
     "remove_thread_tag",
     "set_thread_tag",
     "set_thread_tags_if_empty",
@@ -56,6 +59,8 @@ __all__ = [
 type _ThreadTagMutationKey = tuple[str, str]
 
 _thread_tag_mutation_locks: WeakValueDictionary[_ThreadTagMutationKey, asyncio.Lock] = WeakValueDictionary()
+# Thread-tag reads are answered from this sync-fed projection; see room_state_index.
+_thread_tag_state_index = RoomStateIndex(THREAD_TAGS_EVENT_TYPE)
 
 # ARCHITECTURE DECISION: One State Event Per Thread Tag
 #
@@ -162,6 +167,16 @@ class SetThreadTagsIfEmptyResult:
     skipped_due_to_prior_mutation: bool = False
 
 
+def observe_thread_tags_sync(user_id: str, response: nio.SyncResponse | nio.SlidingSyncResponse) -> None:
+    """Project one account's sync response into the local thread-tag index."""
+    _thread_tag_state_index.observe_sync(user_id, response)
+
+
+def forget_thread_tags_sync(user_id: str) -> None:
+    """Stop serving thread-tag reads locally for one account whose sync has stopped."""
+    _thread_tag_state_index.forget_user(user_id)
+
+
 def _thread_tag_mutation_lock(room_id: str, thread_root_id: str) -> asyncio.Lock:
     """Return the process-local mutation lock shared by all clients for one thread."""
     key = room_id, thread_root_id
@@ -606,13 +621,17 @@ async def _put_thread_tag_state(
     error_prefix: str,
 ) -> None:
     """Write one tag state event and fail on Matrix errors."""
+    content = _thread_tag_record_content(record) if record is not None else {}
+    state_key = _thread_tag_state_key(thread_root_id, tag)
     response = await client.room_put_state(
         room_id=room_id,
         event_type=THREAD_TAGS_EVENT_TYPE,
-        content=_thread_tag_record_content(record) if record is not None else {},
-        state_key=_thread_tag_state_key(thread_root_id, tag),
+        content=content,
+        state_key=state_key,
     )
     if isinstance(response, nio.RoomPutStateResponse):
+        if isinstance(client.user_id, str):
+            _thread_tag_state_index.record_write(client.user_id, room_id, state_key, content)
         return
 
     msg = f"{error_prefix} for {thread_root_id} tag {tag!r} in {room_id}: {response}"
@@ -720,27 +739,52 @@ def _assert_user_can_write_thread_tags(
     )
 
 
-async def _get_room_thread_tags_snapshot(
+async def _get_room_thread_tag_state_entries(
     client: nio.AsyncClient,
     room_id: str,
-) -> _RoomThreadTagsSnapshot:
-    """Fetch current thread tags and durable tag-state history for one room."""
+    *,
+    authoritative: bool,
+) -> RoomStateEntries:
+    """Return raw thread-tag state for one room, from the sync index when it is current."""
+    user_id = client.user_id if isinstance(client.user_id, str) else None
+    if user_id is not None and not authoritative:
+        indexed_entries = _thread_tag_state_index.room_state(user_id, room_id)
+        if indexed_entries is not None:
+            return indexed_entries
+
+    generation = _thread_tag_state_index.generation(user_id, room_id) if user_id is not None else 0
     response = await client.room_get_state(room_id)
     if not isinstance(response, nio.RoomGetStateResponse):
         msg = f"Failed to fetch room state for thread tags in {room_id}: {response}"
         raise ThreadTagsError(msg)
+    entries = state_entries_from_events(THREAD_TAGS_EVENT_TYPE, response.events)
+    if user_id is not None:
+        _thread_tag_state_index.prime(user_id, room_id, entries, generation=generation)
+    return entries
+
+
+async def _get_room_thread_tags_snapshot(
+    client: nio.AsyncClient,
+    room_id: str,
+    *,
+    authoritative: bool = False,
+) -> _RoomThreadTagsSnapshot:
+    """Return current thread tags and durable tag-state history for one room.
+
+    Reads come from the sync-maintained index when it covers the room; an
+    authoritative read always fetches room state, for write verification.
+    """
+    entries = await _get_room_thread_tag_state_entries(client, room_id, authoritative=authoritative)
 
     legacy_tags_by_thread: dict[str, dict[str, ThreadTagRecord]] = {}
     per_tag_records_by_thread: dict[str, dict[str, ThreadTagRecord]] = {}
     per_tag_tombstones_by_thread: dict[str, set[str]] = {}
     observed_thread_root_ids: set[str] = set()
-    for event in response.events:
-        if event.get("type") != THREAD_TAGS_EVENT_TYPE:
-            continue
+    for state_key, content in entries.items():
         _collect_thread_tag_state_entry(
             room_id,
-            event.get("state_key"),
-            event.get("content"),
+            state_key,
+            content,
             legacy_tags_by_thread=legacy_tags_by_thread,
             per_tag_records_by_thread=per_tag_records_by_thread,
             per_tag_tombstones_by_thread=per_tag_tombstones_by_thread,
@@ -761,9 +805,11 @@ async def _get_room_thread_tags_snapshot(
 async def _get_room_thread_tags_states(
     client: nio.AsyncClient,
     room_id: str,
+    *,
+    authoritative: bool = False,
 ) -> dict[str, ThreadTagsState]:
-    """Fetch and merge all current thread-tag state for one room."""
-    snapshot = await _get_room_thread_tags_snapshot(client, room_id)
+    """Return all current merged thread-tag state for one room."""
+    snapshot = await _get_room_thread_tags_snapshot(client, room_id, authoritative=authoritative)
     return snapshot.tag_state
 
 
@@ -821,7 +867,18 @@ async def get_thread_tags(
     room_id: str,
     thread_root_id: str,
 ) -> ThreadTagsState | None:
-    """Fetch all valid tags for one thread root from Matrix state."""
+    """Return all valid tags for one thread root from Matrix state."""
+    return await _get_thread_tags(client, room_id, thread_root_id, authoritative=False)
+
+
+async def _get_thread_tags(
+    client: nio.AsyncClient,
+    room_id: str,
+    thread_root_id: str,
+    *,
+    authoritative: bool,
+) -> ThreadTagsState | None:
+    """Return one thread's tags, optionally bypassing the sync index."""
     normalized_thread_root_id = _normalize_non_empty_string(thread_root_id)
     if normalized_thread_root_id is None:
         return None
@@ -829,6 +886,7 @@ async def get_thread_tags(
     states = await _get_room_thread_tags_states(
         client,
         room_id,
+        authoritative=authoritative,
     )
     return states.get(normalized_thread_root_id)
 
@@ -912,10 +970,11 @@ async def _set_thread_tag_under_lock(
             error_prefix="Failed to write thread tags state",
         )
 
-        verified_state = await get_thread_tags(
+        verified_state = await _get_thread_tags(
             client,
             room_id,
             normalized_thread_root_id,
+            authoritative=True,
         )
         if _verified_state_contains_expected_tag(
             verified_state,
@@ -1065,10 +1124,11 @@ async def _remove_thread_tag_under_lock(
         )
         remove_written = True
 
-        verified_state = await get_thread_tags(
+        verified_state = await _get_thread_tags(
             client,
             room_id,
             normalized_thread_root_id,
+            authoritative=True,
         )
         if _verified_remove_state_matches(
             verified_state,
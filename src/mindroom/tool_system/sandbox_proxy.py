@@ -10,6 +10,8 @@ import hashlib
 import json
 import os
 import secrets
+import threading
+import weakref
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from contextvars import copy_context
@@ -20,6 +22,7 @@ from typing import TYPE_CHECKING, TypedDict
 import httpx
 
 from mindroom.constants import EXECUTION_ENV_TOOL_NAMES, build_execution_tool_env
+from mindroom.logging_config import get_logger
 from mindroom.runtime_env_policy import SANDBOX_RUNTIME_ENV_BY_KEY
 from mindroom.tool_system.registry_state import TOOL_METADATA
 from mindroom.tool_system.runtime_context import (
@@ -53,7 +56,7 @@ from mindroom.workers.runtime import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Mapping
+    from collections.abc import Callable, Iterable, Mapping
 
     from agno.tools.function import Function
     from agno.tools.toolkit import Toolkit
@@ -73,6 +76,8 @@ _UNSAFE_LOCAL_EXECUTION_MODES = frozenset({"off", "local", "disabled"})
 # Process-lifetime pool: threads start lazily and ThreadPoolExecutor joins them at interpreter shutdown.
 _WORKER_PROXY_EXECUTOR = ThreadPoolExecutor(thread_name_prefix="mindroom-worker-proxy")
 
+logger = get_logger(__name__)
+
 
 class _AttachmentSavePayloadFields(TypedDict):
     bytes_b64: str
@@ -845,6 +850,106 @@ async def _run_in_worker_proxy_executor(call: Callable[[], object]) -> object:
     return await loop.run_in_executor(_WORKER_PROXY_EXECUTOR, context.run, call)
 
 
+@dataclass(frozen=True, eq=False)
+class _ToolkitWorkerRoute:
+    """Where the calls of one proxied toolkit are routed."""
+
+    runtime_paths: RuntimePaths
+    tool_name: str
+    worker_target: ResolvedWorkerTarget | None
+
+
+# Routes of toolkits wrapped by ``maybe_wrap_toolkit_for_sandbox_proxy``; entries
+# go away with the agent that holds the toolkit.
+_TOOLKIT_WORKER_ROUTES: weakref.WeakKeyDictionary[Toolkit, _ToolkitWorkerRoute] = weakref.WeakKeyDictionary()
+_PREPARING_WORKER_ROUTES: set[_ToolkitWorkerRoute] = set()
+_PREPARING_WORKER_ROUTES_LOCK = threading.Lock()
+
+
+def _worker_route_for_function(tools: Iterable[object], function_name: str) -> _ToolkitWorkerRoute | None:
+    # Deferred so importing the tool catalog does not load Agno.
+    from agno.tools.toolkit import Toolkit  # noqa: PLC0415
+
+    for tool in tools:
+        if not isinstance(tool, Toolkit):
+            continue
+        route = _TOOLKIT_WORKER_ROUTES.get(tool)
+        if route is not None and (function_name in tool.functions or function_name in tool.async_functions):
+            return route
+    return None
+
+
+def _prepare_worker_route(route: _ToolkitWorkerRoute, function_name: str) -> None:
+    try:
+        worker_scope = route.worker_target.worker_scope if route.worker_target is not None else None
+        if worker_scope is None and not primary_worker_backend_is_dedicated(route.runtime_paths):
+            return
+        proxy_config = sandbox_proxy_config(route.runtime_paths)
+        manager_context = _primary_worker_manager_context(route.runtime_paths)
+        with lease_primary_worker_manager(
+            route.runtime_paths,
+            proxy_url=proxy_config.proxy_url,
+            proxy_token=proxy_config.proxy_token,
+            storage_root=manager_context.storage_root,
+            kubernetes_tool_validation_snapshot=manager_context.kubernetes_tool_validation_snapshot,
+            kubernetes_config_snapshot=manager_context.kubernetes_config_snapshot,
+            worker_grantable_credentials=manager_context.worker_grantable_credentials,
+        ) as worker_manager:
+            _build_worker_routing_payload(
+                runtime_paths=route.runtime_paths,
+                tool_name=route.tool_name,
+                function_name=function_name,
+                worker_target=route.worker_target,
+                worker_manager=worker_manager,
+            )
+    except Exception as exc:
+        # The call itself resolves the worker again and reports the failure.
+        logger.debug(
+            "Speculative worker preparation failed",
+            tool_name=route.tool_name,
+            function_name=function_name,
+            error=str(exc),
+        )
+    finally:
+        with _PREPARING_WORKER_ROUTES_LOCK:
+            _PREPARING_WORKER_ROUTES.discard(route)
+
+
+def prepare_worker_for_tool_call(tools: Iterable[object], function_name: str) -> bool:
+    """Start readying the worker for one announced tool call and return whether preparation started.
+
+    The model names a tool call before Mindroom runs it: the started event is
+    streamed out, rendered into the visible reply and passed through tool hooks
+    and approval first. For a worker-routed toolkit among ``tools`` this
+    resolves the worker and runs ``ensure_worker`` in the background over that
+    window, so a dedicated worker that has to be created, started or
+    readiness-checked is ready (or further along) when the call arrives. The
+    call still resolves its worker itself; backends serialize ``ensure_worker``
+    per worker key, so it either finds the worker ready or waits for the
+    preparation already in progress instead of starting a second one.
+
+    Credential leases are not created ahead of time. A lease is single-use
+    and expires, and a call the model announced can still be rejected by a
+    hook or an approval, which would leave a live lease behind.
+    """
+    route = _worker_route_for_function(tools, function_name)
+    if route is None:
+        return False
+    with _PREPARING_WORKER_ROUTES_LOCK:
+        if route in _PREPARING_WORKER_ROUTES:
+            return False
+        _PREPARING_WORKER_ROUTES.add(route)
+    context = copy_context()
+    try:
+        _WORKER_PROXY_EXECUTOR.submit(context.run, _prepare_worker_route, route, function_name)
+    except RuntimeError:
+        # The executor is shut down at interpreter exit.
+        with _PREPARING_WORKER_ROUTES_LOCK:
+            _PREPARING_WORKER_ROUTES.discard(route)
+        return False
+    return True
+
+
 def _wrap_sync_function(
     function: Function,
     tool_name: str,
@@ -987,4 +1092,9 @@ def maybe_wrap_toolkit_for_sandbox_proxy(
         )
         for function_name, function in original_async_functions.items()
     }
+    _TOOLKIT_WORKER_ROUTES[toolkit] = _ToolkitWorkerRoute(
+        runtime_paths=runtime_paths,
+        tool_name=tool_name,
+        worker_target=worker_target,
+    )
     return toolkit
@@ -40,6 +40,7 @@ register_builtin_tool_metadata(
             "validate_workflow",
             "update_workflow",
             "run_workflow",
+            "resume_workflow_run",
             "get_workflow_run",
             "list_workflows",
             "list_workflow_revisions",
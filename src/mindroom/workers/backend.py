@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Protocol, runtime_checkable
 from mindroom.workers.models import WorkerMaintenanceResult
 
 if TYPE_CHECKING:
-    from mindroom.workers.models import ProgressSink, WorkerHandle, WorkerSpec, WorkerStatus
+    from mindroom.workers.models import ProgressSink, WorkerClaimStats, WorkerHandle, WorkerSpec, WorkerStatus
 
 
 class WorkerBackendError(RuntimeError):
@@ -84,3 +84,18 @@ def maintain_workers(backend: WorkerBackend, *, now: float | None = None) -> Wor
     if isinstance(backend, _MaintainingWorkerBackend):
         return backend.maintain_workers(now=now)
     return WorkerMaintenanceResult(cleaned=tuple(backend.cleanup_idle_workers(now=now)), reconciled=())
+
+
+@runtime_checkable
+class _ClaimReportingWorkerBackend(Protocol):
+    """Backends that record how long ``ensure_worker`` calls take."""
+
+    def claim_stats(self) -> WorkerClaimStats:
+        """Return warm and cold claim latencies recorded by this backend."""
+
+
+def worker_claim_stats(backend: WorkerBackend) -> WorkerClaimStats | None:
+    """Return the backend's claim latencies, or ``None`` when it does not record them."""
+    if isinstance(backend, _ClaimReportingWorkerBackend):
+        return backend.claim_stats()
+    return None
@@ -0,0 +1,108 @@
+"""Idle-worker retention and claim metrics shared by dedicated worker backends.
+
+A dedicated worker is pinned to its worker key when it is created: the key,
+runtime paths and auth token are in its environment and its state roots are
+bind mounts or ``subPath`` volumes, none of which a running container or pod
+can change afterwards. A pool of anonymous workers that any key could claim
+would therefore have to share storage across keys, which is exactly the
+isolation dedicated workers exist to provide.
+
+There is no warm pool here: nothing is pre-started or replenished, and a key
+without a retained worker still starts cold. Idle retention only delays
+eviction. It leaves the most recently used idle workers of the current launch
+config running past their idle timeout (and restarts them when their container
+was stopped), so the next call for one of those keys skips the cold start.
+Every other idle worker is still stopped as before, so ``max_idle`` bounds what
+retention costs.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from mindroom.workers.models import ClaimLatencySummary, WorkerClaimStats
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Claim latencies kept per kind; enough for stable percentiles, bounded memory.
+_CLAIM_SAMPLE_LIMIT = 512
+
+
+@dataclass(frozen=True, slots=True)
+class IdleWorkerCandidate:
+    """One idle worker that cleanup could keep running."""
+
+    worker_key: str
+    last_used_at: float
+
+
+def select_retained_idle_worker_keys(candidates: Iterable[IdleWorkerCandidate], *, max_idle: int) -> frozenset[str]:
+    """Return the ``max_idle`` most recently used candidates, the ones most likely to be called again."""
+    if max_idle <= 0:
+        return frozenset()
+    newest_first = sorted(candidates, key=lambda candidate: candidate.last_used_at, reverse=True)
+    return frozenset(candidate.worker_key for candidate in newest_first[:max_idle])
+
+
+def _summarize(samples: Iterable[float]) -> ClaimLatencySummary:
+    ordered = sorted(samples)
+    if not ordered:
+        return ClaimLatencySummary(count=0, p50_seconds=0.0, p95_seconds=0.0, max_seconds=0.0)
+
+    def percentile(fraction: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))], 4)
+
+    return ClaimLatencySummary(
+        count=len(ordered),
+        p50_seconds=percentile(0.5),
+        p95_seconds=percentile(0.95),
+        max_seconds=round(ordered[-1], 4),
+    )
+
+
+class WorkerClaimMetrics:
+    """Thread-safe claim latency samples for one backend instance.
+
+    A claim is warm when the worker's container or pod was already running
+    and only needed its readiness confirmed, and cold when it had to be
+    created or started first.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._warm_claims = 0
+        self._cold_claims = 0
+        self._warm_samples: deque[float] = deque(maxlen=_CLAIM_SAMPLE_LIMIT)
+        self._cold_samples: deque[float] = deque(maxlen=_CLAIM_SAMPLE_LIMIT)
+
+    def record(self, *, warm: bool, started_at: float) -> None:
+        """Record one successful claim that began at monotonic time ``started_at``."""
+        elapsed = max(0.0, time.monotonic() - started_at)
+        with self._lock:
+            if warm:
+                self._warm_claims += 1
+                self._warm_samples.append(elapsed)
+            else:
+                self._cold_claims += 1
+                self._cold_samples.append(elapsed)
+
+    def stats(self, *, backend_name: str, idle_retain_max: int) -> WorkerClaimStats:
+        """Return a snapshot of the recorded claims."""
+        with self._lock:
+            warm_samples = tuple(self._warm_samples)
+            cold_samples = tuple(self._cold_samples)
+            warm_claims = self._warm_claims
+            cold_claims = self._cold_claims
+        return WorkerClaimStats(
+            backend_name=backend_name,
+            idle_retain_max=idle_retain_max,
+            warm_claims=warm_claims,
+            cold_claims=cold_claims,
+            warm_latency=_summarize(warm_samples),
+            cold_latency=_summarize(cold_samples),
+        )
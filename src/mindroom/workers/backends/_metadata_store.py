@@ -1,18 +1,35 @@
-"""Shared JSON metadata helpers for local worker backends."""
+"""Shared JSON metadata helpers for local worker backends.
+
+Each worker's metadata lives in its own ``metadata/worker.json`` file, so
+answering "which workers exist" or "which ones are idle" from disk means
+globbing the workers root and decoding every file. ``_WorkerMetadataRegistry``
+does that once per workers root and process, then keeps the decoded records in
+memory, writing every change through to disk before it becomes visible. Idle
+sweeps read the workers that may have expired from a min-heap on
+``last_used_at`` instead of visiting every worker.
+
+The registry is authoritative for its process: metadata files changed by
+anything other than the backends that share it are not picked up.
+"""
 
 from __future__ import annotations
 
+import copy
+import heapq
 import json
-from contextlib import nullcontext
+import threading
+from contextlib import contextmanager, nullcontext
 from typing import TYPE_CHECKING, Protocol
 
 from mindroom.durable_write import write_json_file_durable
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
     from pathlib import Path
     from threading import Lock
 
+    from mindroom.workers.models import WorkerStatus
+
 
 class _WorkerStatePathsLike(Protocol):
     """Filesystem paths required for worker metadata persistence."""
@@ -22,7 +39,7 @@ class _WorkerStatePathsLike(Protocol):
     metadata_file: Path
 
 
-def list_worker_state_paths[PathsT](
+def _list_worker_state_paths[PathsT](
     workers_root: Path,
     *,
     state_paths_from_root: Callable[[Path], PathsT],
@@ -37,7 +54,7 @@ def list_worker_state_paths[PathsT](
     ]
 
 
-def load_worker_metadata[MetadataT](
+def _load_worker_metadata[MetadataT](
     paths: _WorkerStatePathsLike,
     *,
     metadata_type: type[MetadataT],
@@ -58,7 +75,7 @@ def load_worker_metadata[MetadataT](
         return None
 
 
-def save_worker_metadata(
+def _save_worker_metadata(
     paths: _WorkerStatePathsLike,
     metadata: object,
     *,
@@ -78,3 +95,147 @@ def save_worker_metadata(
             strict_atomic_replace=True,
             sort_keys=True,
         )
+
+
+class _RegisteredWorkerMetadata(Protocol):
+    """Metadata fields the registry orders idle expiry by."""
+
+    last_used_at: float
+    status: WorkerStatus
+
+
+# Rebuild the expiry heap once stale entries outnumber live workers this much.
+_EXPIRY_HEAP_COMPACT_FACTOR = 4
+
+_registries: dict[tuple[str, type], _WorkerMetadataRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+class _WorkerMetadataRegistry[PathsT: _WorkerStatePathsLike, MetadataT: _RegisteredWorkerMetadata]:
+    """Write-through in-memory index of the worker metadata under one workers root.
+
+    Callers serialize access to one worker with their own per-worker lock; the
+    registry's lock only guards its in-memory maps and is never held across
+    disk writes after the initial load. Records are copied in and out, so a
+    caller's changes become visible only once ``save`` has persisted them.
+    """
+
+    def __init__(
+        self,
+        workers_root: Path,
+        *,
+        state_paths_from_root: Callable[[Path], PathsT],
+        metadata_type: type[MetadataT],
+    ) -> None:
+        self._workers_root = workers_root
+        self._state_paths_from_root = state_paths_from_root
+        self._metadata_type = metadata_type
+        self._lock = threading.Lock()
+        self._entries: dict[Path, tuple[PathsT, MetadataT]] | None = None
+        self._expiry_heap: list[tuple[float, Path]] = []
+        self._armed_at: dict[Path, float] = {}
+
+    def get(self, paths: PathsT) -> MetadataT | None:
+        """Return a copy of one worker's metadata, or ``None`` when it has none."""
+        with self._lock:
+            entry = self._loaded().get(paths.root)
+        return copy.copy(entry[1]) if entry is not None else None
+
+    def entries(self) -> list[tuple[PathsT, MetadataT]]:
+        """Return copies of every worker's paths and metadata, ordered by state root."""
+        with self._lock:
+            entries = sorted(self._loaded().items())
+        return [(paths, copy.copy(metadata)) for _root, (paths, metadata) in entries]
+
+    def save(self, paths: PathsT, metadata: MetadataT, *, ensure_root: bool = False) -> None:
+        """Persist one worker's metadata, then publish it to the in-memory index."""
+        _save_worker_metadata(paths, metadata, ensure_root=ensure_root)
+        stored = copy.copy(metadata)
+        with self._lock:
+            entries = self._loaded()
+            previous = entries.get(paths.root)
+            entries[paths.root] = (paths, stored)
+            if previous is None or (previous[1].last_used_at, previous[1].status) != (
+                stored.last_used_at,
+                stored.status,
+            ):
+                self._arm(paths.root, stored.last_used_at)
+
+    def forget(self, paths: PathsT) -> None:
+        """Drop one worker whose state root was removed."""
+        with self._lock:
+            self._loaded().pop(paths.root, None)
+            self._armed_at.pop(paths.root, None)
+
+    def rearm(self, paths: PathsT) -> None:
+        """Make one worker due again in the next expiry sweep that covers its ``last_used_at``."""
+        with self._lock:
+            entry = self._loaded().get(paths.root)
+            if entry is not None:
+                self._arm(paths.root, entry[1].last_used_at)
+
+    @contextmanager
+    def expired(self, *, last_used_before: float) -> Iterator[list[PathsT]]:
+        """Take the workers last used at or before ``last_used_before`` that changed since they were last swept.
+
+        A worker becomes due again once ``save`` changes its ``last_used_at`` or
+        status. If the sweep raises, every taken worker is returned to the heap.
+        """
+        with self._lock:
+            entries = self._loaded()
+            due: list[PathsT] = []
+            while self._expiry_heap and self._expiry_heap[0][0] <= last_used_before:
+                armed_at, root = heapq.heappop(self._expiry_heap)
+                if self._armed_at.get(root) != armed_at or root not in entries:
+                    continue
+                del self._armed_at[root]
+                due.append(entries[root][0])
+        try:
+            yield due
+        except BaseException:
+            for paths in due:
+                self.rearm(paths)
+            raise
+
+    def _loaded(self) -> dict[Path, tuple[PathsT, MetadataT]]:
+        if self._entries is None:
+            entries: dict[Path, tuple[PathsT, MetadataT]] = {}
+            for paths in _list_worker_state_paths(
+                self._workers_root,
+                state_paths_from_root=self._state_paths_from_root,
+            ):
+                metadata = _load_worker_metadata(paths, metadata_type=self._metadata_type)
+                if metadata is not None:
+                    entries[paths.root] = (paths, metadata)
+                    self._arm(paths.root, metadata.last_used_at)
+            self._entries = entries
+        return self._entries
+
+    def _arm(self, root: Path, last_used_at: float) -> None:
+        if self._armed_at.get(root) == last_used_at:
+            return
+        self._armed_at[root] = last_used_at
+        heapq.heappush(self._expiry_heap, (last_used_at, root))
+        if len(self._expiry_heap) > _EXPIRY_HEAP_COMPACT_FACTOR * max(len(self._armed_at), 1):
+            self._expiry_heap = [(armed_at, armed_root) for armed_root, armed_at in self._armed_at.items()]
+            heapq.heapify(self._expiry_heap)
+
+
+def worker_metadata_registry[PathsT: _WorkerStatePathsLike, MetadataT: _RegisteredWorkerMetadata](
+    workers_root: Path,
+    *,
+    state_paths_from_root: Callable[[Path], PathsT],
+    metadata_type: type[MetadataT],
+) -> _WorkerMetadataRegistry[PathsT, MetadataT]:
+    """Return the process-wide registry for one workers root, shared by every backend instance over it."""
+    key = (str(workers_root.expanduser().resolve()), metadata_type)
+    with _registries_lock:
+        registry = _registries.get(key)
+        if registry is None:
+            registry = _WorkerMetadataRegistry(
+                workers_root,
+                state_paths_from_root=state_paths_from_root,
+                metadata_type=metadata_type,
+            )
+            _registries[key] = registry
+    return registry
@@ -5,6 +5,7 @@ from __future__ import annotations
 import hashlib
 import importlib
 import json
+import logging
 import os
 import threading
 import time
@@ -38,6 +39,11 @@ from mindroom.workers.backends._dedicated_worker_common import (
     validate_dedicated_worker_extra_env,
     validate_unique_worker_visible_paths,
 )
+from mindroom.workers.backends._idle_retention import (
+    IdleWorkerCandidate,
+    WorkerClaimMetrics,
+    select_retained_idle_worker_keys,
+)
 from mindroom.workers.backends._lifecycle import (
     initial_worker_lifecycle_state,
     mark_worker_failed,
@@ -48,11 +54,7 @@ from mindroom.workers.backends._lifecycle import (
     touch_worker_lifecycle,
     write_lifecycle_state,
 )
-from mindroom.workers.backends._metadata_store import (
-    list_worker_state_paths,
-    load_worker_metadata,
-    save_worker_metadata,
-)
+from mindroom.workers.backends._metadata_store import worker_metadata_registry
 from mindroom.workers.backends.docker_config import (
     DEFAULT_WORKER_PORT,
     DOCKER_RESERVED_EXTRA_ENV_NAMES,
@@ -67,6 +69,7 @@ from mindroom.workers.backends.local import LocalWorkerStatePaths, local_worker_
 from mindroom.workers.compatibility import WORKER_PROTOCOL_VERSION
 from mindroom.workers.models import (
     ProgressSink,
+    WorkerClaimStats,
     WorkerHandle,
     WorkerReadyPhase,
     WorkerReadyProgress,
@@ -76,7 +79,7 @@ from mindroom.workers.models import (
 from mindroom.workers.worker_retirement import open_worker_state_root
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
 
     class _DockerContainer(Protocol):
         attrs: dict[str, object]
@@ -115,6 +118,9 @@ if TYPE_CHECKING:
         NotFound: type[Exception]
 
 
+logger = logging.getLogger(__name__)
+
+
 _READY_POLL_INTERVAL_SECONDS = 1.0
 _CONTAINER_LOG_EXCERPT_MAX_CHARS = 4096
 
@@ -355,7 +361,12 @@ class DockerWorkerBackend:
         self._client, self._docker_errors = _load_docker_client_and_errors(runtime_paths=self._runtime_paths)
         self._worker_locks: dict[str, threading.Lock] = {}
         self._worker_locks_lock = threading.Lock()
-        self._metadata_lock = threading.Lock()
+        self._metadata = worker_metadata_registry(
+            self._workers_root,
+            state_paths_from_root=local_worker_state_paths_for_root,
+            metadata_type=_DockerWorkerMetadata,
+        )
+        self._retained_idle_worker_keys: frozenset[str] = frozenset()
         self._projection_manager = DockerProjectionManager(
             config=config,
             projected_configs_root=self._workers_root / PROJECTED_CONFIGS_DIRNAME,
@@ -367,6 +378,7 @@ class DockerWorkerBackend:
             self._credentials_manager = get_runtime_credentials_manager(self._runtime_paths)
         self.worker_grantable_credentials = worker_grantable_credentials
         self._runtime_namespace = _runtime_namespace_for_workers_root(self._workers_root)
+        self._claim_metrics = WorkerClaimMetrics()
         self._workers_root.mkdir(parents=True, exist_ok=True)
 
     @classmethod
@@ -390,11 +402,8 @@ class DockerWorkerBackend:
     def shutdown(self) -> None:
         """Remove backend-owned containers before discarding this Docker manager."""
         failures: list[str] = []
-        for paths in self._metadata_paths():
-            metadata = self._load_metadata(paths)
-            if metadata is None:
-                continue
-            with self._worker_lock(metadata.worker_key):
+        for paths, listed in self._metadata.entries():
+            with self._worker_lock(listed.worker_key):
                 metadata = self._load_metadata(paths)
                 if metadata is None:
                     continue
@@ -530,8 +539,13 @@ class DockerWorkerBackend:
             self._save_metadata(paths, metadata)
             handle = self._to_handle(metadata, container, now=timestamp, paths=paths)
             emit_progress("ready")
+            self._claim_metrics.record(warm=not cold_start_emitted, started_at=start_time)
             return handle
 
+    def claim_stats(self) -> WorkerClaimStats:
+        """Return warm and cold ``ensure_worker`` latencies recorded by this backend."""
+        return self._claim_metrics.stats(backend_name=self.backend_name, idle_retain_max=self.config.idle_retain_max)
+
     def touch_worker(self, worker_key: str, *, now: float | None = None) -> WorkerHandle | None:
         """Refresh last-used metadata for one existing worker."""
         timestamp = time.time() if now is None else now
@@ -553,11 +567,8 @@ class DockerWorkerBackend:
         """List workers known to this backend."""
         timestamp = time.time() if now is None else now
         handles: list[WorkerHandle] = []
-        for paths in self._metadata_paths():
-            metadata = self._load_metadata(paths)
-            if metadata is None:
-                continue
-            with self._worker_lock(metadata.worker_key):
+        for paths, listed in self._metadata.entries():
+            with self._worker_lock(listed.worker_key):
                 metadata = self._load_metadata(paths)
                 if metadata is None:
                     continue
@@ -574,39 +585,119 @@ class DockerWorkerBackend:
         return sorted(handles, key=lambda handle: handle.last_used_at, reverse=True)
 
     def cleanup_idle_workers(self, *, now: float | None = None) -> list[WorkerHandle]:
-        """Stop idle containers while retaining worker-owned state."""
+        """Stop idle containers while retaining worker-owned state.
+
+        Of the workers this sweep visits (the ones that newly passed their idle
+        timeout and the ones retained by the previous sweep), the
+        ``idle_retain_max`` most recently used are kept running instead, and
+        restarted when their container was stopped, so their next claim skips
+        the cold start. No worker is started for a key that has none.
+        """
         timestamp = time.time() if now is None else now
         cleaned: list[WorkerHandle] = []
-        for paths in self._metadata_paths():
+        with self._metadata.expired(last_used_before=timestamp - self.idle_timeout_seconds) as expired_paths:
+            sweep_paths = {paths.root: paths for paths in expired_paths}
+            # A worker swept once leaves the expiry heap, so the workers retained
+            # last time are the only older ones that can stay retained.
+            for worker_key in sorted(self._retained_idle_worker_keys):
+                retained_paths = self._state_paths(worker_key)
+                sweep_paths.setdefault(retained_paths.root, retained_paths)
+            retained_worker_keys = self._select_retained_idle_worker_keys(sweep_paths.values(), now=timestamp)
+            self._retained_idle_worker_keys = retained_worker_keys
+            for paths in sweep_paths.values():
+                handle = self._cleanup_idle_worker(paths, now=timestamp, retained_worker_keys=retained_worker_keys)
+                if handle is not None:
+                    cleaned.append(handle)
+        return sorted(cleaned, key=lambda handle: handle.last_used_at, reverse=True)
+
+    def _cleanup_idle_worker(
+        self,
+        paths: LocalWorkerStatePaths,
+        *,
+        now: float,
+        retained_worker_keys: frozenset[str],
+    ) -> WorkerHandle | None:
+        metadata = self._load_metadata(paths)
+        if metadata is None:
+            return None
+        with self._worker_lock(metadata.worker_key):
             metadata = self._load_metadata(paths)
             if metadata is None:
+                return None
+            container = self._read_container(metadata.container_name)
+            metadata = self._reconcile_missing_container_metadata(paths, metadata, container)
+            handle = self._to_handle(metadata, container, now=now, paths=paths)
+            idle_timed_out = now - metadata.last_used_at >= self.idle_timeout_seconds
+            if handle.status == "idle" and metadata.worker_key in retained_worker_keys:
+                self._keep_retained_worker_running(paths, metadata, container)
+            elif handle.status == "idle" and self._container_is_running(container):
+                self._stop_container(container)
+                write_lifecycle_state(
+                    metadata,
+                    mark_worker_idle(read_lifecycle_state(metadata)),
+                )
+                self._save_metadata(paths, metadata)
+                return self._to_handle(metadata, container, now=now, paths=paths)
+            elif handle.status == "failed" and container is not None and idle_timed_out:
+                # A worker that failed and was never revived keeps its exited
+                # container so a quick retry can restart it. Once it is past the
+                # idle timeout it is abandoned, so reap the container to stop
+                # stale failures from accumulating; the failed metadata is kept
+                # and a later ensure recreates the container.
+                self._stop_container(container)
+                self._remove_container(container)
+                self._reconcile_missing_container_metadata(paths, metadata, None)
+        return None
+
+    def _select_retained_idle_worker_keys(
+        self,
+        swept_paths: Iterable[LocalWorkerStatePaths],
+        *,
+        now: float,
+    ) -> frozenset[str]:
+        if self.config.idle_retain_max <= 0:
+            return frozenset()
+        launch_config_hash = self._resolve_launch_config().launch_config_hash
+        candidates: list[IdleWorkerCandidate] = []
+        for paths in swept_paths:
+            metadata = self._load_metadata(paths)
+            if (
+                metadata is None
+                or metadata.status in {"failed", "starting"}
+                or metadata.launch_config_hash != launch_config_hash
+                or now - metadata.last_used_at < self.idle_timeout_seconds
+            ):
                 continue
-            with self._worker_lock(metadata.worker_key):
-                metadata = self._load_metadata(paths)
-                if metadata is None:
-                    continue
-                container = self._read_container(metadata.container_name)
-                metadata = self._reconcile_missing_container_metadata(paths, metadata, container)
-                handle = self._to_handle(metadata, container, now=timestamp, paths=paths)
-                idle_timed_out = timestamp - metadata.last_used_at >= self.idle_timeout_seconds
-                if handle.status == "idle" and self._container_is_running(container):
-                    self._stop_container(container)
-                    write_lifecycle_state(
-                        metadata,
-                        mark_worker_idle(read_lifecycle_state(metadata)),
-                    )
-                    self._save_metadata(paths, metadata)
-                    cleaned.append(self._to_handle(metadata, container, now=timestamp, paths=paths))
-                elif handle.status == "failed" and container is not None and idle_timed_out:
-                    # A worker that failed and was never revived keeps its exited
-                    # container so a quick retry can restart it. Once it is past the
-                    # idle timeout it is abandoned, so reap the container to stop
-                    # stale failures from accumulating; the failed metadata is kept
-                    # and a later ensure recreates the container.
-                    self._stop_container(container)
-                    self._remove_container(container)
-                    self._reconcile_missing_container_metadata(paths, metadata, None)
-        return sorted(cleaned, key=lambda handle: handle.last_used_at, reverse=True)
+            candidates.append(IdleWorkerCandidate(worker_key=metadata.worker_key, last_used_at=metadata.last_used_at))
+        return select_retained_idle_worker_keys(candidates, max_idle=self.config.idle_retain_max)
+
+    def _keep_retained_worker_running(
+        self,
+        paths: LocalWorkerStatePaths,
+        metadata: _DockerWorkerMetadata,
+        container: _DockerContainer | None,
+    ) -> None:
+        if container is None or self._container_is_running(container):
+            return
+        try:
+            # Only restart a container the next claim would reuse as-is; anything
+            # else is recreated by that claim anyway, so starting it is wasted work.
+            compatible_launch_config_hashes = self._compatible_launch_config_hashes(container)
+            if (
+                metadata.launch_config_hash not in compatible_launch_config_hashes
+                or self._container_launch_config_hash(container) not in compatible_launch_config_hashes
+                or not self._container_env_matches(container, expected_env=self._container_env(metadata.worker_key))
+            ):
+                return
+            container.start()
+            self._reload_container(container)
+        except (WorkerBackendError, self._docker_errors.DockerException):
+            logger.warning("Failed to restart retained idle Docker worker %r", metadata.worker_key, exc_info=True)
+            return
+        metadata.host_port = self._container_host_port(container)
+        metadata.endpoint = self._endpoint_for_host_port(metadata.host_port)
+        metadata.container_id = self._container_id(container)
+        self._save_metadata(paths, metadata)
 
     def retire_worker(self, worker_key: str) -> None:
         """Remove one exact Docker worker container and all backend-owned state."""
@@ -635,6 +726,7 @@ class DockerWorkerBackend:
                         raise WorkerBackendError(msg)
                     self._projection_manager.retire_worker_projection(worker_name)
                     state.remove()
+                    self._metadata.forget(self._state_paths(worker_key))
             except (OSError, RecursionError, TypeError, ValueError) as exc:
                 msg = f"Failed to retire Docker worker '{worker_key}': {exc}"
                 raise WorkerBackendError(msg) from exc
@@ -707,22 +799,11 @@ class DockerWorkerBackend:
         metadata.launch_config_hash = None
         return True
 
-    def _metadata_paths(self) -> list[LocalWorkerStatePaths]:
-        return list_worker_state_paths(
-            self._workers_root,
-            state_paths_from_root=local_worker_state_paths_for_root,
-        )
-
     def _load_metadata(self, paths: LocalWorkerStatePaths) -> _DockerWorkerMetadata | None:
-        return load_worker_metadata(paths, metadata_type=_DockerWorkerMetadata)
+        return self._metadata.get(paths)
 
     def _save_metadata(self, paths: LocalWorkerStatePaths, metadata: _DockerWorkerMetadata) -> None:
-        save_worker_metadata(
-            paths,
-            metadata,
-            ensure_root=True,
-            lock=self._metadata_lock,
-        )
+        self._metadata.save(paths, metadata, ensure_root=True)
 
     def _reconcile_missing_container_metadata(
         self,
@@ -72,6 +72,7 @@ _ENDPOINT_HOST_ENV = "MINDROOM_DOCKER_WORKER_ENDPOINT_HOST"
 _USER_ENV = "MINDROOM_DOCKER_WORKER_USER"
 _EXTRA_ENV_JSON_ENV = "MINDROOM_DOCKER_WORKER_ENV_JSON"
 _EXTRA_LABELS_JSON_ENV = "MINDROOM_DOCKER_WORKER_LABELS_JSON"
+_IDLE_RETAIN_MAX_ENV = "MINDROOM_DOCKER_WORKER_IDLE_RETAIN_MAX"
 DOCKER_RESERVED_EXTRA_ENV_NAMES = frozenset(
     {
         "MINDROOM_RUNTIME_PATHS_JSON",
@@ -192,6 +193,7 @@ class _DockerWorkerBackendConfig:
     user: str | None
     extra_env: dict[str, str]
     extra_labels: dict[str, str]
+    idle_retain_max: int = 0
 
     def __post_init__(self) -> None:
         validate_docker_extra_labels(self.extra_labels)
@@ -232,6 +234,7 @@ class _DockerWorkerBackendConfig:
             user=_read_docker_user(env),
             extra_env=extra_env,
             extra_labels=read_json_mapping_env(env, _EXTRA_LABELS_JSON_ENV),
+            idle_retain_max=max(0, read_int_env(env, _IDLE_RETAIN_MAX_ENV, 0)),
         )
 
     @classmethod
@@ -296,6 +299,7 @@ def docker_backend_config_signature(
             str(config.host_config_path or ""),
             str(config.idle_timeout_seconds),
             str(config.ready_timeout_seconds),
+            str(config.idle_retain_max),
             config.name_prefix,
             config.publish_host,
             config.endpoint_host,
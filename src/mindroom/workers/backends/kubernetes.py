@@ -21,9 +21,15 @@ from mindroom.workers.backend import (
     effective_idle_status,
     filter_and_sort_worker_handles,
 )
+from mindroom.workers.backends._idle_retention import (
+    IdleWorkerCandidate,
+    WorkerClaimMetrics,
+    select_retained_idle_worker_keys,
+)
 from mindroom.workers.backends._lifecycle import mark_worker_failed, mark_worker_idle, touch_worker_lifecycle
 from mindroom.workers.models import (
     ProgressSink,
+    WorkerClaimStats,
     WorkerHandle,
     WorkerMaintenanceResult,
     WorkerReadyPhase,
@@ -337,6 +343,7 @@ class KubernetesWorkerBackend:
         self._progress_sinks_lock = threading.Lock()
         self._ready_workers: dict[str, _ReadyWorkerCacheEntry] = {}
         self._ready_workers_lock = threading.Lock()
+        self._claim_metrics = WorkerClaimMetrics()
 
     @classmethod
     def from_runtime(
@@ -403,6 +410,7 @@ class KubernetesWorkerBackend:
     ) -> WorkerHandle:
         """Resolve or start the worker backing the given worker key."""
         worker_key = spec.worker_key
+        start_time = time.monotonic()
         if progress_sink is not None:
             self._register_progress_sink(worker_key, progress_sink)
         try:
@@ -410,6 +418,7 @@ class KubernetesWorkerBackend:
                 timestamp = time.time() if now is None else now
                 cached_handle = self._reuse_cached_ready_worker(spec, now=timestamp)
                 if cached_handle is not None:
+                    self._claim_metrics.record(warm=True, started_at=start_time)
                     return cached_handle
                 worker_id = self._worker_id(worker_key)
                 state_subpath = self._state_subpath(worker_key)
@@ -526,11 +535,19 @@ class KubernetesWorkerBackend:
                     annotations_override=final_deployment_annotations,
                 )
                 self._store_ready_worker(spec, handle, validated_at=timestamp)
+                self._claim_metrics.record(
+                    warm=existing is not None and self._deployment_ready(existing) and not deployment_apply.recreated,
+                    started_at=start_time,
+                )
                 return handle
         finally:
             if progress_sink is not None:
                 self._unregister_progress_sink(worker_key, progress_sink)
 
+    def claim_stats(self) -> WorkerClaimStats:
+        """Return warm and cold ``ensure_worker`` latencies recorded by this backend."""
+        return self._claim_metrics.stats(backend_name=self.backend_name, idle_retain_max=self.config.idle_retain_max)
+
     def touch_worker(self, worker_key: str, *, now: float | None = None) -> WorkerHandle | None:
         """Refresh last-used metadata for one existing worker."""
         timestamp = time.time() if now is None else now
@@ -568,7 +585,11 @@ class KubernetesWorkerBackend:
         return filter_and_sort_worker_handles(handles, include_idle)
 
     def cleanup_idle_workers(self, *, now: float | None = None) -> list[WorkerHandle]:
-        """Scale idle workers to zero while retaining their state."""
+        """Scale idle workers to zero while retaining their state.
+
+        The ``idle_retain_max`` most recently used idle workers that are still
+        running stay scaled up, so their next claim skips the pod start.
+        """
         timestamp = time.time() if now is None else now
         return self._cleanup_idle_deployments(self._resources.list_deployments(), now=timestamp)
 
@@ -624,10 +645,27 @@ class KubernetesWorkerBackend:
         now: float,
     ) -> list[WorkerHandle]:
         """Scale idle workers from one already-loaded Deployment snapshot."""
+        idle_handles = [
+            handle
+            for deployment in deployments
+            if int(deployment.spec.replicas or 0) > 0
+            and (handle := self._handle_from_deployment(deployment, now=now)).status == "idle"
+        ]
+        retained_worker_keys = select_retained_idle_worker_keys(
+            (
+                IdleWorkerCandidate(worker_key=handle.worker_key, last_used_at=handle.last_used_at)
+                for handle in idle_handles
+            ),
+            max_idle=self.config.idle_retain_max,
+        )
         cleaned: list[WorkerHandle] = []
         for deployment in deployments:
             handle = self._handle_from_deployment(deployment, now=now)
-            if handle.status != "idle" or int(deployment.spec.replicas or 0) == 0:
+            if (
+                handle.status != "idle"
+                or int(deployment.spec.replicas or 0) == 0
+                or handle.worker_key in retained_worker_keys
+            ):
                 continue
             annotations = dict(deployment.metadata.annotations or {})
             resources.apply_lifecycle_annotations(
@@ -74,6 +74,7 @@ _CONFIG_MAP_NAME_ENV = KUBERNETES_WORKER_BACKEND_CONFIG_ENV_BY_KEY["config_map_n
 _CONFIG_KEY_ENV = KUBERNETES_WORKER_BACKEND_CONFIG_ENV_BY_KEY["config_key"]
 _CONFIG_PATH_ENV = KUBERNETES_WORKER_BACKEND_CONFIG_ENV_BY_KEY["config_path"]
 _IDLE_TIMEOUT_ENV = KUBERNETES_WORKER_BACKEND_CONFIG_ENV_BY_KEY["idle_timeout"]
+_IDLE_RETAIN_MAX_ENV = KUBERNETES_WORKER_BACKEND_CONFIG_ENV_BY_KEY["idle_retain_max"]
 _READY_TIMEOUT_ENV = KUBERNETES_WORKER_BACKEND_CONFIG_ENV_BY_KEY["ready_timeout"]
 _NAME_PREFIX_ENV = KUBERNETES_WORKER_BACKEND_CONFIG_ENV_BY_KEY["name_prefix"]
 _NODE_NAME_ENV = KUBERNETES_WORKER_BACKEND_CONFIG_ENV_BY_KEY["node_name"]
@@ -345,6 +346,7 @@ class KubernetesWorkerBackendConfig:
     agent_vault: KubernetesAgentVaultConfig | None = None
     extra_containers: tuple[dict[str, object], ...] = ()
     extra_volumes: tuple[dict[str, object], ...] = ()
+    idle_retain_max: int = 0
 
     def __post_init__(self) -> None:
         """Reject storage prefixes that are not strict relative descendants."""
@@ -438,6 +440,7 @@ class KubernetesWorkerBackendConfig:
             ),
             reconcile_pod_templates=read_bool_env(env, _RECONCILE_POD_TEMPLATES_ENV, default=True),
             agent_vault=KubernetesAgentVaultConfig.from_env(env),
+            idle_retain_max=max(0, read_int_env(env, _IDLE_RETAIN_MAX_ENV, 0)),
         )
 
 
@@ -492,6 +495,7 @@ def kubernetes_backend_config_signature(
         str(config.enable_service_links),
         config.auth_secret_name or "",
         str(config.reconcile_pod_templates),
+        str(config.idle_retain_max),
         config.agent_vault.signature() if config.agent_vault is not None else "",
         credentials_encryption_key_marker,
         auth_token or "",
@@ -31,11 +31,7 @@ from mindroom.workers.backends._lifecycle import (
     touch_worker_lifecycle,
     write_lifecycle_state,
 )
-from mindroom.workers.backends._metadata_store import (
-    list_worker_state_paths,
-    load_worker_metadata,
-    save_worker_metadata,
-)
+from mindroom.workers.backends._metadata_store import worker_metadata_registry
 from mindroom.workers.models import ProgressSink, WorkerHandle, WorkerSpec, WorkerStatus
 
 if TYPE_CHECKING:
@@ -224,7 +220,11 @@ class _LocalWorkerBackend:
         self.api_root = _normalize_worker_api_root(api_root)
         self.idle_timeout_seconds = max(1.0, idle_timeout_seconds)
         self.worker_root.mkdir(parents=True, exist_ok=True)
-        self._lock = threading.Lock()
+        self._metadata = worker_metadata_registry(
+            self.worker_root,
+            state_paths_from_root=local_worker_state_paths_for_root,
+            metadata_type=_LocalWorkerMetadata,
+        )
 
     def shutdown(self) -> None:
         """Local worker state is persistent; manager replacement does not need extra teardown."""
@@ -244,38 +244,35 @@ class _LocalWorkerBackend:
         worker_lock = self._worker_lock(paths)
 
         with worker_lock:
-            with self._lock:
-                metadata = self._load_metadata(paths) or self._default_metadata(spec.worker_key, timestamp)
-                should_restart = self._effective_status(metadata, timestamp) != "ready"
-                write_lifecycle_state(
-                    metadata,
-                    prepare_worker_ensure_lifecycle(
-                        read_lifecycle_state(metadata),
-                        now=timestamp,
-                        should_restart=should_restart,
-                    ),
-                )
-                self._save_metadata(paths, metadata)
+            metadata = self._load_metadata(paths) or self._default_metadata(spec.worker_key, timestamp)
+            should_restart = self._effective_status(metadata, timestamp) != "ready"
+            write_lifecycle_state(
+                metadata,
+                prepare_worker_ensure_lifecycle(
+                    read_lifecycle_state(metadata),
+                    now=timestamp,
+                    should_restart=should_restart,
+                ),
+            )
+            self._save_metadata(paths, metadata)
 
             try:
                 self._ensure_worker_state(paths)
             except Exception as exc:
                 failure_reason = f"Failed to initialize worker '{spec.worker_key}': {exc}"
-                with self._lock:
-                    self._record_failure_locked(paths, spec.worker_key, failure_reason, now=timestamp)
+                self._record_failure_locked(paths, spec.worker_key, failure_reason, now=timestamp)
                 raise WorkerBackendError(failure_reason) from exc
 
-            with self._lock:
-                write_lifecycle_state(metadata, mark_worker_ready(read_lifecycle_state(metadata), now=timestamp))
-                self._save_metadata(paths, metadata)
-                return self._to_handle(metadata, paths, now=timestamp)
+            write_lifecycle_state(metadata, mark_worker_ready(read_lifecycle_state(metadata), now=timestamp))
+            self._save_metadata(paths, metadata)
+            return self._to_handle(metadata, paths, now=timestamp)
 
     def touch_worker(self, worker_key: str, *, now: float | None = None) -> WorkerHandle | None:
         """Refresh last-used bookkeeping for one local worker."""
         timestamp = time.time() if now is None else now
         paths = _local_worker_state_paths(worker_key, worker_root=self.worker_root)
         worker_lock = self._worker_lock(paths)
-        with worker_lock, self._lock:
+        with worker_lock:
             metadata = self._load_metadata(paths)
             if metadata is None:
                 return None
@@ -286,13 +283,7 @@ class _LocalWorkerBackend:
     def list_workers(self, *, include_idle: bool = True, now: float | None = None) -> list[WorkerHandle]:
         """List known local workers."""
         timestamp = time.time() if now is None else now
-        with self._lock:
-            handles = [
-                self._to_handle(metadata, paths, now=timestamp)
-                for paths in self._metadata_paths()
-                if (metadata := self._load_metadata(paths)) is not None
-            ]
-
+        handles = [self._to_handle(metadata, paths, now=timestamp) for paths, metadata in self._metadata.entries()]
         return filter_and_sort_worker_handles(handles, include_idle)
 
     def cleanup_idle_workers(self, *, now: float | None = None) -> list[WorkerHandle]:
@@ -300,15 +291,25 @@ class _LocalWorkerBackend:
         timestamp = time.time() if now is None else now
         cleaned_workers: list[WorkerHandle] = []
 
-        with self._lock:
-            for paths in self._metadata_paths():
-                metadata = self._load_metadata(paths)
-                if metadata is None:
+        with self._metadata.expired(last_used_before=timestamp - self.idle_timeout_seconds) as expired_paths:
+            for paths in expired_paths:
+                worker_lock = self._worker_lock(paths)
+                if not worker_lock.acquire(blocking=False):
+                    # Held by a call that is using this worker right now.
+                    self._metadata.rearm(paths)
                     continue
-                if metadata.status == "ready" and self._effective_status(metadata, timestamp) == "idle":
-                    write_lifecycle_state(metadata, mark_worker_idle(read_lifecycle_state(metadata)))
-                    self._save_metadata(paths, metadata)
-                    cleaned_workers.append(self._to_handle(metadata, paths, now=timestamp))
+                try:
+                    metadata = self._load_metadata(paths)
+                    if (
+                        metadata is not None
+                        and metadata.status == "ready"
+                        and self._effective_status(metadata, timestamp) == "idle"
+                    ):
+                        write_lifecycle_state(metadata, mark_worker_idle(read_lifecycle_state(metadata)))
+                        self._save_metadata(paths, metadata)
+                        cleaned_workers.append(self._to_handle(metadata, paths, now=timestamp))
+                finally:
+                    worker_lock.release()
 
         return filter_and_sort_worker_handles(cleaned_workers, True)
 
@@ -318,7 +319,7 @@ class _LocalWorkerBackend:
         paths = _local_worker_state_paths(worker_key, worker_root=self.worker_root)
         worker_lock = self._worker_lock(paths)
 
-        with worker_lock, self._lock:
+        with worker_lock:
             return self._record_failure_locked(paths, worker_key, failure_reason, now=timestamp)
 
     def _worker_lock(self, paths: LocalWorkerStatePaths) -> threading.Lock:
@@ -339,17 +340,11 @@ class _LocalWorkerBackend:
     def _ensure_worker_state(self, paths: LocalWorkerStatePaths) -> None:
         _ensure_local_worker_state(paths)
 
-    def _metadata_paths(self) -> list[LocalWorkerStatePaths]:
-        return list_worker_state_paths(
-            self.worker_root,
-            state_paths_from_root=local_worker_state_paths_for_root,
-        )
-
     def _load_metadata(self, paths: LocalWorkerStatePaths) -> _LocalWorkerMetadata | None:
-        return load_worker_metadata(paths, metadata_type=_LocalWorkerMetadata)
+        return self._metadata.get(paths)
 
     def _save_metadata(self, paths: LocalWorkerStatePaths, metadata: _LocalWorkerMetadata) -> None:
-        save_worker_metadata(paths, metadata)
+        self._metadata.save(paths, metadata)
 
     def _effective_status(self, metadata: _LocalWorkerMetadata, now: float) -> WorkerStatus:
         return effective_idle_status(metadata.status, metadata.last_used_at, self.idle_timeout_seconds, now)
@@ -50,6 +50,48 @@ class WorkerMaintenanceResult:
     reconciled: tuple[WorkerHandle, ...]
 
 
+@dataclass(frozen=True, slots=True)
+class ClaimLatencySummary:
+    """Latency percentiles for one kind of worker claim, in seconds."""
+
+    count: int
+    p50_seconds: float
+    p95_seconds: float
+    max_seconds: float
+
+    def as_dict(self) -> dict[str, object]:
+        """Return the summary as JSON-ready data."""
+        return {
+            "count": self.count,
+            "p50_seconds": self.p50_seconds,
+            "p95_seconds": self.p95_seconds,
+            "max_seconds": self.max_seconds,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class WorkerClaimStats:
+    """How long recent ``ensure_worker`` calls took, split by whether the worker was warm."""
+
+    backend_name: str
+    idle_retain_max: int
+    warm_claims: int
+    cold_claims: int
+    warm_latency: ClaimLatencySummary
+    cold_latency: ClaimLatencySummary
+
+    def as_dict(self) -> dict[str, object]:
+        """Return the stats as JSON-ready data."""
+        return {
+            "backend_name": self.backend_name,
+            "idle_retain_max": self.idle_retain_max,
+            "warm_claims": self.warm_claims,
+            "cold_claims": self.cold_claims,
+            "warm_latency": self.warm_latency.as_dict(),
+            "cold_latency": self.cold_latency.as_dict(),
+        }
+
+
 @dataclass(frozen=True, slots=True)
 class WorkerReadyProgress:
     """Progress event emitted while a worker is warming up."""
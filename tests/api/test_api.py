@@ -27,13 +27,16 @@ from jwt.algorithms import RSAAlgorithm
 
 from mindroom import constants, frontend_assets
 from mindroom.api import auth, config_lifecycle, frontend, homeassistant_integration, main
+from mindroom.api import mcp as mcp_api
 from mindroom.api import sandbox_runner as sandbox_runner_api
 from mindroom.api import tools as tools_api
 from mindroom.api import workers as workers_api
+from mindroom.api.openai_compat import openai_session_lock_stats
 from mindroom.commands.config_commands import apply_config_change
 from mindroom.config.main import Config
 from mindroom.credentials import get_runtime_credentials_manager, save_scoped_credentials
 from mindroom.embedder_health import capture_embedder_health_recorder
+from mindroom.hooks import RegisteredHook, hook_health
 from mindroom.matrix.decrypt_failure import e2ee_stats
 from mindroom.matrix.health import mark_matrix_sync_loop_started, mark_matrix_sync_success, reset_matrix_sync_health
 from mindroom.matrix.state import MatrixState
@@ -43,7 +46,8 @@ from mindroom.oauth.google_drive import google_drive_oauth_provider
 from mindroom.runtime_state import reset_runtime_state, set_runtime_ready, set_runtime_starting
 from mindroom.tool_system.worker_routing import ToolExecutionIdentity, resolve_worker_key, resolve_worker_target
 from mindroom.workers.backend import WorkerBackend
-from mindroom.workers.models import WorkerHandle, WorkerMaintenanceResult
+from mindroom.workers.backends._idle_retention import WorkerClaimMetrics
+from mindroom.workers.models import WorkerClaimStats, WorkerHandle, WorkerMaintenanceResult
 from tests.api.conftest import trusted_upstream_headers, use_trusted_upstream_runtime
 
 TEST_WORKER_AUTH = "token"
@@ -984,6 +988,7 @@ def test_health_check_reports_stale_matrix_sync(test_client: TestClient) -> None
         "status": "unhealthy",
         "last_sync_time": stale_sync_time.isoformat(),
         "e2ee": e2ee_stats().as_dict(),
+        "openai_sessions": openai_session_lock_stats().as_dict(),
         "stale_sync_entities": ["router"],
     }
     reset_matrix_sync_health()
@@ -1045,6 +1050,7 @@ def test_health_after_watchdog_restart_stays_unhealthy_until_sync(test_client: T
         "status": "unhealthy",
         "last_sync_time": stale_time.isoformat(),
         "e2ee": e2ee_stats().as_dict(),
+        "openai_sessions": openai_session_lock_stats().as_dict(),
         "stale_sync_entities": ["router"],
     }
 
@@ -1314,6 +1320,70 @@ def test_cleanup_workers_endpoint(test_client: TestClient, monkeypatch: pytest.M
     assert response.json()["cleaned_workers"][0]["status"] == "idle"
 
 
+def test_worker_claims_endpoint(test_client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Backends that record claim latencies expose them; others answer 404."""
+    stats = WorkerClaimMetrics().stats(backend_name="docker", idle_retain_max=2)
+
+    class _ClaimReportingManager:
+        def claim_stats(self) -> WorkerClaimStats:
+            return stats
+
+    managers: list[object] = [_ClaimReportingManager(), object()]
+    monkeypatch.setattr(
+        workers_api,
+        "lease_configured_primary_worker_manager",
+        lambda *_args, **_kwargs: nullcontext(managers.pop(0)),
+    )
+
+    response = test_client.get("/api/workers/claims")
+    assert response.status_code == 200
+    assert response.json() == stats.as_dict()
+    assert test_client.get("/api/workers/claims").status_code == 404
+
+
+def test_hooks_health_endpoint(test_client: TestClient) -> None:
+    """Hook health is reported per invoked hook, including its breaker state."""
+    registered = RegisteredHook(
+        plugin_name="audit",
+        hook_name="ship-logs",
+        event_name="message:received",
+        priority=100,
+        timeout_ms=None,
+        callback=AsyncMock(),
+        settings={},
+        plugin_order=0,
+        source_lineno=1,
+        agents=None,
+        rooms=None,
+    )
+    hook_health().record_failure(registered, 15000.0, TimeoutError())
+
+    response = test_client.get("/api/hooks/health")
+
+    assert response.status_code == 200
+    [reported] = response.json()["hooks"]
+    assert reported["plugin_name"] == "audit"
+    assert reported["hook_name"] == "ship-logs"
+    assert reported["state"] == "closed"
+    assert (reported["failures"], reported["timeouts"]) == (1, 1)
+    assert reported["latency_p95_ms"] == 15000.0
+
+
+def test_mcp_result_cache_endpoint(test_client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    """MCP result cache counters are reported per server, and empty before the manager starts."""
+    monkeypatch.setattr(mcp_api, "require_mcp_server_manager", lambda: None)
+    assert test_client.get("/api/mcp/result-cache").json() == {"servers": {}}
+
+    stats = {"demo": {"hits": 2, "misses": 3, "entries": 3}}
+    manager = SimpleNamespace(result_cache_stats=lambda: stats)
+    monkeypatch.setattr(mcp_api, "require_mcp_server_manager", lambda: manager)
+
+    response = test_client.get("/api/mcp/result-cache")
+
+    assert response.status_code == 200
+    assert response.json() == {"servers": stats}
+
+
 def test_load_config(test_client: TestClient) -> None:
     """Test loading configuration."""
     response = test_client.post("/api/config/load")
@@ -5471,6 +5541,7 @@ def test_health_repeated_restarts_do_not_extend_first_sync_grace(test_client: Te
         "status": "unhealthy",
         "last_sync_time": None,
         "e2ee": e2ee_stats().as_dict(),
+        "openai_sessions": openai_session_lock_stats().as_dict(),
         "stale_sync_entities": ["router"],
     }
     assert _matrix_sync_state["router"].loop_started_time == first_start_time
@@ -502,7 +502,7 @@ def test_trigger_invalidated_by_current_config_returns_404_before_replay_claim(
 
     assert response.status_code == 404
     assert response.json()["detail"] == "External trigger not found"
-    assert not (runtime_paths.control_state_root / "external_triggers" / "replay.json").exists()
+    assert not (runtime_paths.control_state_root / "external_triggers" / "replay.sqlite3").exists()
 
 
 def test_missing_signature_headers_return_401(trigger_api: TriggerApiContext) -> None:
@@ -699,7 +699,7 @@ def test_owner_permission_removed_blocks_delivery_before_replay_claim(
     response = _post_signed(trigger_api)
 
     assert response.status_code == 403
-    assert not (runtime_paths.control_state_root / "external_triggers" / "replay.json").exists()
+    assert not (runtime_paths.control_state_root / "external_triggers" / "replay.sqlite3").exists()
 
 
 @pytest.mark.asyncio
@@ -766,7 +766,7 @@ async def test_trigger_waiting_for_reload_rebinds_and_rechecks_current_authoriza
 
         assert response.status_code == 403
         execute.assert_not_awaited()
-        assert not (runtime_paths.control_state_root / "external_triggers" / "replay.json").exists()
+        assert not (runtime_paths.control_state_root / "external_triggers" / "replay.sqlite3").exists()
     finally:
         gate.reopen()
         if request_task is not None:
@@ -852,7 +852,7 @@ def test_owner_not_joined_blocks_delivery_before_replay_claim(
     response = _post_signed(trigger_api)
 
     assert response.status_code == 403
-    assert not (trigger_api.runtime_paths.control_state_root / "external_triggers" / "replay.json").exists()
+    assert not (trigger_api.runtime_paths.control_state_root / "external_triggers" / "replay.sqlite3").exists()
 
 
 def test_private_owner_not_joined_blocks_delivery_before_replay_claim(
@@ -868,7 +868,7 @@ def test_private_owner_not_joined_blocks_delivery_before_replay_claim(
     response = _post_signed(private_trigger_api)
 
     assert response.status_code == 403
-    assert not (private_trigger_api.runtime_paths.control_state_root / "external_triggers" / "replay.json").exists()
+    assert not (private_trigger_api.runtime_paths.control_state_root / "external_triggers" / "replay.sqlite3").exists()
 
 
 def test_duplicate_event_id_returns_duplicate_response(
@@ -0,0 +1,163 @@
+"""API tests for the application-service transaction endpoint."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+import yaml
+from fastapi.testclient import TestClient
+
+from mindroom import constants
+from mindroom.api import config_lifecycle
+from mindroom.api import main as api_main
+from mindroom.matrix.shared_ingestion import SharedSyncFanout
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    import nio
+
+_HS_TOKEN = "hs-secret"  # noqa: S105
+_ROOM = "!lobby:localhost"
+_PATH = "/_matrix/app/v1/transactions/txn-1"
+
+
+class _JoinedAgent:
+    agent_name = "general"
+
+    def __init__(self, *, ready: bool = True) -> None:
+        self.ready = ready
+        self.admitted: list[str] = []
+
+    def shared_ingestion_room_ids(self) -> frozenset[str]:
+        return frozenset({_ROOM})
+
+    def shared_ingestion_ready(self) -> bool:
+        return self.ready
+
+    async def admit_shared_event(self, room_id: str, event: nio.Event) -> None:
+        assert room_id == _ROOM
+        self.admitted.append(event.event_id)
+
+
+def _transaction() -> dict[str, object]:
+    return {
+        "events": [
+            {
+                "event_id": "$hello",
+                "room_id": _ROOM,
+                "sender": "@alice:localhost",
+                "origin_server_ts": 1_000,
+                "type": "m.room.message",
+                "content": {"msgtype": "m.text", "body": "hello"},
+            },
+        ],
+    }
+
+
+def _app_client(
+    tmp_path: Path,
+    *,
+    shared_ingestion: bool = True,
+    hs_token: str | None = _HS_TOKEN,
+    fanout: SharedSyncFanout | None = None,
+) -> Iterator[TestClient]:
+    tmp_path.mkdir(parents=True, exist_ok=True)
+    config_path = tmp_path / "config.yaml"
+    payload = {
+        "models": {"default": {"provider": "openai", "id": "gpt-5.6"}},
+        "agents": {"general": {"display_name": "General", "role": "test", "rooms": ["lobby"]}},
+        "matrix_sync": {"shared_ingestion": shared_ingestion},
+    }
+    config_path.write_text(yaml.safe_dump(payload), encoding="utf-8")
+    process_env = {} if hs_token is None else {"MATRIX_APPSERVICE_HS_TOKEN": hs_token}
+    runtime_paths = constants.resolve_primary_runtime_paths(
+        config_path=config_path,
+        storage_path=tmp_path / "mindroom_data",
+        process_env=process_env,
+    )
+    api_main.initialize_api_app(api_main.app, runtime_paths)
+    assert config_lifecycle.load_config_into_app(runtime_paths, api_main.app) is True
+    state = config_lifecycle.ensure_app_state(api_main.app)
+    if fanout is not None:
+        api_main.bind_shared_sync_fanout(api_main.app, fanout)
+    try:
+        with TestClient(api_main.app) as client:
+            yield client
+    finally:
+        state.shared_sync_fanout = None
+
+
+@pytest.fixture
+def agent() -> _JoinedAgent:
+    """Return one joined agent account standing in for a running bot."""
+    return _JoinedAgent()
+
+
+@pytest.fixture
+def appservice_client(tmp_path: Path, agent: _JoinedAgent) -> Iterator[TestClient]:
+    """Return one API client with shared ingestion enabled and bound."""
+    yield from _app_client(tmp_path, fanout=SharedSyncFanout(lambda: (agent,)))
+
+
+def test_transaction_is_admitted_and_acknowledged(appservice_client: TestClient, agent: _JoinedAgent) -> None:
+    """A homeserver push with the right token reaches the joined account's journal."""
+    response = appservice_client.put(_PATH, json=_transaction(), headers={"Authorization": f"Bearer {_HS_TOKEN}"})
+
+    assert response.status_code == 200
+    assert response.json() == {}
+    assert agent.admitted == ["$hello"]
+
+
+def test_legacy_query_token_is_accepted(appservice_client: TestClient, agent: _JoinedAgent) -> None:
+    """Homeservers that still send access_token in the query are accepted."""
+    response = appservice_client.put(f"{_PATH}?access_token={_HS_TOKEN}", json=_transaction())
+
+    assert response.status_code == 200
+    assert agent.admitted == ["$hello"]
+
+
+def test_wrong_token_is_rejected(appservice_client: TestClient, agent: _JoinedAgent) -> None:
+    """Only the configured homeserver may push transactions."""
+    response = appservice_client.put(_PATH, json=_transaction(), headers={"Authorization": "Bearer nope"})
+
+    assert response.status_code == 403
+    assert agent.admitted == []
+
+
+def test_malformed_transaction_is_rejected(appservice_client: TestClient) -> None:
+    """A body without an events list is a client error, not a retryable one."""
+    response = appservice_client.put(_PATH, json={"events": {}}, headers={"Authorization": f"Bearer {_HS_TOKEN}"})
+
+    assert response.status_code == 400
+
+
+def test_unready_account_makes_homeserver_retry(tmp_path: Path) -> None:
+    """Events are not acknowledged before every joined account can admit them."""
+    agent = _JoinedAgent(ready=False)
+    for client in _app_client(tmp_path, fanout=SharedSyncFanout(lambda: (agent,))):
+        headers = {"Authorization": f"Bearer {_HS_TOKEN}"}
+        assert client.put(_PATH, json=_transaction(), headers=headers).status_code == 503
+
+        agent.ready = True
+        assert client.put(_PATH, json=_transaction(), headers=headers).status_code == 200
+    assert agent.admitted == ["$hello"]
+
+
+def test_disabled_shared_ingestion_is_not_found(tmp_path: Path) -> None:
+    """The endpoint does not exist for deployments that keep per-account sync only."""
+    for client in _app_client(tmp_path, shared_ingestion=False):
+        response = client.put(_PATH, json=_transaction(), headers={"Authorization": f"Bearer {_HS_TOKEN}"})
+        assert response.status_code == 404
+
+
+def test_missing_token_or_runtime_is_unavailable(tmp_path: Path) -> None:
+    """Misconfigured or not-yet-started ingestion asks the homeserver to retry later."""
+    for client in _app_client(tmp_path / "no-token", hs_token=None):
+        response = client.put(_PATH, json=_transaction(), headers={"Authorization": f"Bearer {_HS_TOKEN}"})
+        assert response.status_code == 503
+    for client in _app_client(tmp_path / "no-runtime"):
+        response = client.put(_PATH, json=_transaction(), headers={"Authorization": f"Bearer {_HS_TOKEN}"})
+        assert response.status_code == 503
@@ -4322,7 +4322,7 @@ def test_sandbox_runner_cleanup_marks_idle_workers_without_deleting_state(
     """Idle cleanup should evict the live worker handle but keep its persisted state."""
     _set_sandbox_token(monkeypatch)
     monkeypatch.setenv("MINDROOM_SANDBOX_WORKER_IDLE_TIMEOUT_SECONDS", "60")
-    _refresh_runner_app_from_env()
+    runtime_paths, _config = _refresh_runner_app_from_env()
 
     save_response = runner_client.post(
         "/api/sandbox-runner/execute",
@@ -4339,11 +4339,7 @@ def test_sandbox_runner_cleanup_marks_idle_workers_without_deleting_state(
     assert save_response.json()["ok"] is True
 
     worker_root = tmp_path / ".mindroom" / "workers"
-    metadata_path = worker_root / worker_dir_name("worker-a") / "metadata" / "worker.json"
-    metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
-    metadata["last_used_at"] = 0.0
-    metadata["status"] = "ready"
-    metadata_path.write_text(json.dumps(metadata), encoding="utf-8")
+    assert local_workers_module.get_local_worker_manager(runtime_paths).touch_worker("worker-a", now=0.0) is not None
 
     cleanup_response = runner_client.post("/api/sandbox-runner/workers/cleanup", headers=SANDBOX_HEADERS)
     workers_response = runner_client.get("/api/sandbox-runner/workers", headers=SANDBOX_HEADERS)
@@ -536,3 +536,84 @@ async def test_script_gateway_accepts_slow_valid_claim_without_gateway_timeout()
 
     assert response.status_code == 202
     assert response.json()["state"] == "pending"
+
+
+@pytest.mark.asyncio
+async def test_script_gateway_batch_answers_each_call_with_its_own_status() -> None:
+    """One refused or oversized call in a batch does not refuse its siblings."""
+
+    class BatchBroker(_GatewayBroker):
+        accepted: tuple[str, ...] = ()
+
+        async def accept_many_authenticated(
+            self,
+            requests: list[ScriptToolCallRequest],
+            authorization: str | None,
+        ) -> list[ScriptCallRecord | BaseException]:
+            assert authorization == "Bearer secret-token"
+            self.accepted = tuple(request.call_id for request in requests)
+            message = "Background script tool-call rate limit exceeded."
+            return [self.submit_receipt, ScriptCallRateLimitError(message)]
+
+    broker = BatchBroker(
+        submit_receipt=_receipt(ScriptCallState.PENDING),
+        get_receipt=_receipt(ScriptCallState.PENDING),
+    )
+    oversized = {**_payload(), "call_id": "call-3", "arguments": {"body": "x" * (64 * 1024)}}
+    async with AsyncClient(transport=ASGITransport(app=_app(broker)), base_url="http://test") as client:
+        response = await client.post(
+            "/api/script-gateway/calls/batch",
+            json={"calls": [_payload(), {**_payload(), "call_id": "call-2"}, oversized]},
+            headers={"Authorization": "Bearer secret-token"},
+        )
+        mixed_runs = await client.post(
+            "/api/script-gateway/calls/batch",
+            json={"calls": [_payload(), {**_payload(), "run_id": "run-2", "call_id": "call-2"}]},
+            headers={"Authorization": "Bearer secret-token"},
+        )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert broker.accepted == ("call-1", "call-2")
+    assert [(item["call_id"], item["status_code"]) for item in results] == [
+        ("call-1", 202),
+        ("call-2", 429),
+        ("call-3", 413),
+    ]
+    assert results[0]["receipt"]["state"] == "pending"
+    assert results[1]["detail"] == "Background script tool-call rate limit exceeded."
+    assert mixed_runs.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_script_gateway_long_polls_a_receipt_only_when_asked() -> None:
+    """A bounded wait runs before the receipt read, and a plain read never waits."""
+    waits: list[float] = []
+
+    class WaitingBroker(_GatewayBroker):
+        async def wait_authenticated(
+            self,
+            run_id: str,
+            call_id: str,
+            authorization: str | None,
+            *,
+            timeout_seconds: float,
+        ) -> None:
+            assert (run_id, call_id, authorization) == ("run-1", "call-1", "Bearer secret-token")
+            waits.append(timeout_seconds)
+            self.get_receipt = _receipt(ScriptCallState.COMPLETED, result="settled")
+
+    broker = WaitingBroker(
+        submit_receipt=_receipt(ScriptCallState.PENDING),
+        get_receipt=_receipt(ScriptCallState.PENDING),
+    )
+    headers = {"Authorization": "Bearer secret-token"}
+    async with AsyncClient(transport=ASGITransport(app=_app(broker)), base_url="http://test") as client:
+        plain = await client.get("/api/script-gateway/runs/run-1/calls/call-1", headers=headers)
+        waited = await client.get("/api/script-gateway/runs/run-1/calls/call-1?wait_seconds=2.5", headers=headers)
+        too_long = await client.get("/api/script-gateway/runs/run-1/calls/call-1?wait_seconds=300", headers=headers)
+
+    assert plain.json()["state"] == "pending"
+    assert waited.json()["result"] == "settled"
+    assert waits == [2.5]
+    assert too_long.status_code == 422
@@ -10,6 +10,7 @@ import tempfile
 import time
 import uuid
 import warnings
+import weakref
 from collections.abc import (
     AsyncGenerator,
     AsyncIterator,
@@ -44,6 +45,7 @@ from structlog.typing import BindableLogger, Context, Processor, WrappedLogger
 import mindroom.approval_manager as approval_manager_module
 import mindroom.bot  # noqa: F401
 import mindroom.handled_turns as handled_turns_module
+from mindroom import thread_tags
 from mindroom.agent_reply_membership import AgentReplyMembershipIndex
 from mindroom.agent_storage import get_agent_session, get_team_session
 from mindroom.ai import ResponseTurnContext
@@ -101,15 +103,18 @@ from mindroom.history.types import (
     ResolvedHistorySettings,
 )
 from mindroom.hooks import EnrichmentItem, MessageEnvelope
+from mindroom.hooks import health as hook_health_module
 from mindroom.ingress_validation import IngressValidator
 from mindroom.interactive import InteractiveMetadata
 from mindroom.interactive_models import InteractivePrompt, interactive_prompt_content
+from mindroom.matrix import edit_cadence, outbound_edits
 from mindroom.matrix.client import DeliveredMatrixEvent, ResolvedVisibleMessage
 from mindroom.matrix.client_delivery import build_edit_event_content
 from mindroom.matrix.conversation_reads import ConversationReader
 from mindroom.matrix.identity import MatrixID
 from mindroom.matrix.media import is_matrix_media_dispatch_event
 from mindroom.matrix.relation_lookup import RelationLookup
+from mindroom.matrix.room_state_index import RoomStateIndex
 from mindroom.matrix.thread_diagnostics import is_thread_history_degraded
 from mindroom.matrix_delivery import TurnHandoff
 from mindroom.media_fallback import reset_model_media_capability_cache
@@ -121,6 +126,7 @@ from mindroom.response_payload_preparation import (
     ResponsePayloadPreparer,
 )
 from mindroom.response_runner import PostLockRequestPreparationError, ResponseRequest, ResponseRunner
+from mindroom.thread_tags import THREAD_TAGS_EVENT_TYPE
 from mindroom.thread_utils import decide_agent_response
 from mindroom.turn_controller import TurnController, _DispatchPreparation, _ReplayGuardContext
 from mindroom.turn_origin import TurnOrigin, classify_turn_origin
@@ -1282,12 +1288,27 @@ class FakeOutbox:
         # The journal sources each FINAL enqueue handed over, in order.
         self.handed_over: list[tuple[str, ...]] = []
         self.room_membership_epochs: dict[str, int] = {}
+        # Streams that would still owe restart recovery, event ID -> room ID.
+        self.inflight_streams: dict[str, str] = {}
+        self.inflight_stream_coverage_revoked = False
 
     @property
     def principal_id(self) -> str:
         """Return the principal this in-memory delivery store represents."""
         return "agent@alice"
 
+    async def record_inflight_stream(self, *, room_id: str, event_id: str) -> None:
+        """Remember one stream that would still owe restart recovery."""
+        self.inflight_streams.setdefault(event_id, room_id)
+
+    async def clear_inflight_stream(self, event_id: str) -> None:
+        """Forget one stream that ended without owing restart recovery."""
+        self.inflight_streams.pop(event_id, None)
+
+    async def revoke_inflight_stream_coverage(self) -> None:
+        """Remember that the index may now be missing a stream."""
+        self.inflight_stream_coverage_revoked = True
+
     async def membership_epoch(self, room_id: str) -> int:
         """Return the fake room's current membership epoch."""
         return self.room_membership_epochs.get(room_id, 0)
@@ -2107,15 +2128,35 @@ def bind_runtime_paths(
     runtime_paths: RuntimePaths,
 ) -> Config:
     """Return a runtime-bound copy of a test config."""
-    bound = Config.validate_with_runtime(config.authored_model_dump(), runtime_paths)
+    payload = config.authored_model_dump()
+    if "debounce_ms" not in config.defaults.coalescing.model_fields_set:
+        payload.setdefault("defaults", {}).setdefault("coalescing", {})["debounce_ms"] = 0
+    bound = Config.validate_with_runtime(payload, runtime_paths)
     _persist_bound_entity_accounts(bound, runtime_paths)
-    authored_coalescing = config.defaults.coalescing
-    if "debounce_ms" not in authored_coalescing.model_fields_set:
-        bound.defaults.coalescing.debounce_ms = 0
     _TEST_RUNTIME_PATHS_BY_CONFIG_ID[id(bound)] = runtime_paths
     return bound
 
 
+def revalidate_config(config: Config) -> Config:
+    """Return a runtime-validated copy of a bound test config after in-place edits.
+
+    A validated config compiles its entity index once, so a test that edits one
+    must revalidate before handing it to code that resolves entities.
+    """
+    return bind_runtime_paths(config, runtime_paths_for(config))
+
+
+def unvalidated_config_copy(config: Config) -> Config:
+    """Return an unindexed copy of a bound test config that keeps its runtime binding.
+
+    For tests that edit a config into a state runtime validation rejects, such as
+    an unknown tool name. The copy resolves every entity lookup from its fields.
+    """
+    copied = config.model_copy()
+    _TEST_RUNTIME_PATHS_BY_CONFIG_ID[id(copied)] = runtime_paths_for(config)
+    return copied
+
+
 def _persist_bound_entity_accounts(config: Config, runtime_paths: RuntimePaths) -> None:
     """Prepare managed Matrix accounts for tests that bind runtime config."""
     persist_entity_accounts(config, runtime_paths)
@@ -2793,6 +2834,30 @@ def _reset_model_media_capabilities() -> Generator[None, None, None]:
     reset_model_media_capability_cache()
 
 
+@pytest.fixture(autouse=True)
+def _reset_thread_tag_state_index(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give every test a cold thread-tag index, so a bot synced in one test cannot serve reads in another."""
+    monkeypatch.setattr(thread_tags, "_thread_tag_state_index", RoomStateIndex(THREAD_TAGS_EVENT_TYPE))
+
+
+@pytest.fixture(autouse=True)
+def _reset_edit_cadence(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start every test without edit round trips observed by an earlier one."""
+    monkeypatch.setattr(edit_cadence, "_CONTROLLERS", {})
+
+
+@pytest.fixture(autouse=True)
+def _reset_hook_health(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start every test with closed hook circuit breakers."""
+    monkeypatch.setattr(hook_health_module, "_tracker", hook_health_module.HookHealthTracker())
+
+
+@pytest.fixture(autouse=True)
+def _reset_outbound_edits(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start every test with empty per-room outbound edit schedules."""
+    monkeypatch.setattr(outbound_edits, "_ROOMS", weakref.WeakKeyDictionary())
+
+
 _LEDGER_LOADING_TEST_MODULES = frozenset(
     {
         "test_handled_turns.py",
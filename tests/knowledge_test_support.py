@@ -126,6 +126,10 @@ class _Collection:
             include=include,
         )
 
+    def count(self) -> int:
+        with _VectorDb.lock:
+            return len(_VectorDb.collections.get(self._name, []))
+
     def add(
         self,
         *,
@@ -218,6 +222,8 @@ class _VectorDb:
 
 
 class _Knowledge:
+    max_results = 10
+
     def __init__(self, vector_db: _VectorDb | None = None) -> None:
         self.vector_db = vector_db
 
@@ -314,6 +320,7 @@ def _config(
     watch: bool = False,
     modes: dict[str, str] | None = None,
     memory: dict[str, object] | None = None,
+    hybrid_search: bool = False,
 ) -> Config:
     runtime_paths = test_runtime_paths(tmp_path)
     return bind_runtime_paths(
@@ -327,6 +334,7 @@ def _config(
                     watch=watch,
                     git=(git_configs or {}).get(base_id),
                     mode=(modes or {}).get(base_id, "semantic"),
+                    hybrid_search=hybrid_search,
                 )
                 for base_id, path in bases.items()
             },
@@ -84,6 +84,7 @@ from mindroom.tool_system.worker_routing import (
     worker_root_path,
 )
 from mindroom.workspaces import _copy_workspace_template
+from tests.conftest import revalidate_config, unvalidated_config_copy
 from tests.identity_helpers import persist_entity_accounts
 
 if TYPE_CHECKING:
@@ -572,6 +573,7 @@ def test_agent_role_omits_tool_that_failed_to_build(
     """The prompt should not advertise a toolkit that is unavailable at runtime."""
     config = _test_config()
     config.agents["calculator"].include_default_tools = False
+    config = revalidate_config(config)
 
     agent = _create_agent_for_test("calculator", config=config)
 
@@ -777,6 +779,7 @@ def test_scheduler_tool_enabled_by_default(mock_storage: MagicMock) -> None:  #
     """All agents should get the scheduler tool even when not explicitly configured."""
     config = _test_config()
     config.agents["summary"].tools = []
+    config = revalidate_config(config)
 
     agent = _create_agent_for_test("summary", config=config)
     tool_names = [tool.name for tool in agent.tools]
@@ -790,6 +793,7 @@ def test_configurable_default_tools_are_applied(mock_storage: MagicMock) -> None
     config = _test_config()
     config.defaults.tools = ["scheduler", "calculator"]
     config.agents["summary"].tools = []
+    config = revalidate_config(config)
 
     agent = _create_agent_for_test("summary", config=config)
     tool_names = [tool.name for tool in agent.tools]
@@ -804,6 +808,7 @@ def test_default_tools_do_not_duplicate_agent_tools(mock_storage: MagicMock) ->
     config = _test_config()
     config.defaults.tools = ["scheduler"]
     config.agents["summary"].tools = ["scheduler"]
+    config = revalidate_config(config)
 
     agent = _create_agent_for_test("summary", config=config)
     tool_names = [tool.name for tool in agent.tools]
@@ -818,6 +823,7 @@ def test_agent_include_default_tools_false_skips_config_defaults(mock_storage: M
     config.defaults.tools = ["scheduler", "calculator"]
     config.agents["summary"].tools = []
     config.agents["summary"].include_default_tools = False
+    config = revalidate_config(config)
 
     agent = _create_agent_for_test("summary", config=config)
     tool_names = [tool.name for tool in agent.tools]
@@ -831,6 +837,7 @@ def test_openclaw_compat_expands_to_implied_tools() -> None:
     config = _test_config()
     config.agents["summary"].tools = ["openclaw_compat"]
     config.agents["summary"].include_default_tools = False
+    config = revalidate_config(config)
 
     assert config.resolve_entity("summary").available_tools == [
         "openclaw_compat",
@@ -857,6 +864,7 @@ def test_openclaw_compat_expansion_dedupes_preserving_order() -> None:
         "coding",
     ]
     config.defaults.tools = ["openclaw_compat", "python", "scheduler"]
+    config = revalidate_config(config)
 
     assert config.resolve_entity("summary").available_tools == [
         "browser",
@@ -885,6 +893,7 @@ def test_create_agent_uses_native_tool_lookups_for_openclaw_compat(
     config = _test_config()
     config.agents["summary"].tools = ["openclaw_compat"]
     config.agents["summary"].include_default_tools = False
+    config = revalidate_config(config)
 
     _create_agent_for_test("summary", config=config)
 
@@ -905,6 +914,7 @@ def test_create_agent_passes_merged_tool_config_overrides_to_registered_tools(
         {"shell": {"extra_env_passthrough": "DAWARICH_*", "enable_run_shell_command": False}},
     ]
     config.agents["general"].tools = [{"shell": {"enable_run_shell_command": True}}]
+    config = revalidate_config(config)
 
     _create_agent_for_test("general", config=config)
 
@@ -926,6 +936,7 @@ def test_create_agent_bootstraps_tool_registry_once_for_multiple_tools(
     config = _test_config()
     config.agents["general"].tools = ["shell", "coding", "duckduckgo", "website"]
     config.agents["general"].include_default_tools = False
+    config = revalidate_config(config)
 
     with patch("mindroom.agents.ensure_tool_registry_loaded") as mock_ensure_registry:
         _create_agent_for_test("general", config=config)
@@ -1010,6 +1021,7 @@ def test_create_agent_continues_when_implied_tool_import_fails(
     config = _test_config()
     config.agents["summary"].tools = ["openclaw_compat"]
     config.agents["summary"].include_default_tools = False
+    config = revalidate_config(config)
 
     agent = _create_agent_for_test("summary", config=config)
 
@@ -1070,6 +1082,7 @@ def test_create_agent_continues_when_tool_lookup_reports_unknown_tool(
     config = _test_config()
     config.agents["general"].tools = ["stale_tool", "shell"]
     config.agents["general"].include_default_tools = False
+    config = unvalidated_config_copy(config)
 
     agent = _create_agent_for_test("general", config=config)
 
@@ -1088,6 +1101,7 @@ def test_create_agent_expands_openclaw_compat_for_worker_tool_overrides(
     config.agents["summary"].tools = ["openclaw_compat"]
     config.agents["summary"].include_default_tools = False
     config.agents["summary"].worker_tools = ["openclaw_compat"]
+    config = revalidate_config(config)
 
     _create_agent_for_test("summary", config=config)
 
@@ -1434,6 +1448,7 @@ def test_resolve_agent_runtime_keeps_user_scope_worker_key_for_shared_agents(tmp
     runtime_paths = _runtime_paths(tmp_path)
     config = _bind_runtime_paths(_test_config(), runtime_paths)
     config.agents["general"].worker_scope = "user"
+    config = revalidate_config(config)
     identity = ToolExecutionIdentity(
         channel="matrix",
         agent_name="general",
@@ -1470,6 +1485,7 @@ def test_resolve_agent_runtime_requires_explicit_shared_execution_identity(tmp_p
     )
     config = _bind_runtime_paths(_test_config(), runtime_paths)
     config.agents["general"].worker_scope = "shared"
+    config = revalidate_config(config)
 
     runtime = resolve_agent_runtime("general", config, runtime_paths, execution_identity=None, create=True)
 
@@ -1539,6 +1555,7 @@ def test_resolve_agent_runtime_creates_workspace_knowledge_links_for_workspace_l
     config.agents["general"].memory_backend = "file"
     config.agents["general"].knowledge_bases = ["research"]
     config.knowledge_bases["research"] = KnowledgeBaseConfig(path=str(knowledge_root))
+    config = revalidate_config(config)
 
     runtime = resolve_agent_runtime("general", config, runtime_paths, execution_identity=None, create=True)
     runtime = resolve_agent_runtime("general", config, runtime_paths, execution_identity=None, create=True)
@@ -1558,6 +1575,7 @@ def test_resolve_agent_runtime_skips_workspace_knowledge_links_for_external_shar
     config.agents["general"].memory_backend = "file"
     config.agents["general"].knowledge_bases = ["research"]
     config.knowledge_bases["research"] = KnowledgeBaseConfig(path=str(knowledge_root))
+    config = revalidate_config(config)
 
     runtime = resolve_agent_runtime("general", config, runtime_paths, execution_identity=None, create=True)
 
@@ -1577,6 +1595,7 @@ def test_resolve_agent_runtime_creates_workspace_knowledge_links_for_private_bas
         root="mind_data",
         knowledge=AgentPrivateKnowledgeConfig(path="kb_repo"),
     )
+    config = revalidate_config(config)
     identity = ToolExecutionIdentity(
         channel="matrix",
         agent_name="general",
@@ -1619,6 +1638,7 @@ def test_resolve_agent_runtime_removes_stale_workspace_knowledge_links(tmp_path:
     config.agents["general"].memory_backend = "file"
     config.agents["general"].knowledge_bases = ["research"]
     config.knowledge_bases["research"] = KnowledgeBaseConfig(path=str(knowledge_root))
+    config = revalidate_config(config)
 
     runtime = resolve_agent_runtime("general", config, runtime_paths, execution_identity=None, create=True)
 
@@ -1627,6 +1647,7 @@ def test_resolve_agent_runtime_removes_stale_workspace_knowledge_links(tmp_path:
     assert knowledge_link.is_symlink()
 
     config.agents["general"].knowledge_bases = []
+    config = revalidate_config(config)
 
     runtime = resolve_agent_runtime("general", config, runtime_paths, execution_identity=None, create=True)
 
@@ -1645,6 +1666,7 @@ def test_resolve_agent_runtime_reuses_existing_workspace_local_knowledge_directo
     config.agents["general"].memory_backend = "file"
     config.agents["general"].knowledge_bases = ["research"]
     config.knowledge_bases["research"] = KnowledgeBaseConfig(path=str(knowledge_root))
+    config = revalidate_config(config)
 
     runtime = resolve_agent_runtime("general", config, runtime_paths, execution_identity=None, create=True)
 
@@ -1665,6 +1687,7 @@ def test_resolve_agent_runtime_skips_workspace_knowledge_links_for_targets_below
     config.agents["general"].memory_backend = "file"
     config.agents["general"].knowledge_bases = ["research"]
     config.knowledge_bases["research"] = KnowledgeBaseConfig(path=str(knowledge_root))
+    config = revalidate_config(config)
 
     runtime = resolve_agent_runtime("general", config, runtime_paths, execution_identity=None, create=True)
 
@@ -1688,6 +1711,7 @@ def test_resolve_agent_runtime_preserves_configured_external_workspace_knowledge
     config.agents["general"].memory_backend = "file"
     config.agents["general"].knowledge_bases = ["research"]
     config.knowledge_bases["research"] = KnowledgeBaseConfig(path=str(knowledge_root))
+    config = revalidate_config(config)
 
     runtime = resolve_agent_runtime("general", config, runtime_paths, execution_identity=None, create=True)
 
@@ -1712,6 +1736,7 @@ def test_resolve_agent_runtime_preserves_configured_workspace_local_knowledge_sy
     config.agents["general"].memory_backend = "file"
     config.agents["general"].knowledge_bases = ["research"]
     config.knowledge_bases["research"] = KnowledgeBaseConfig(path=str(knowledge_root))
+    config = revalidate_config(config)
 
     runtime = resolve_agent_runtime("general", config, runtime_paths, execution_identity=None, create=True)
 
@@ -1720,6 +1745,7 @@ def test_resolve_agent_runtime_preserves_configured_workspace_local_knowledge_sy
     assert knowledge_root.resolve() == target_root.resolve()
 
     config.agents["general"].knowledge_bases = []
+    config = revalidate_config(config)
 
     runtime = resolve_agent_runtime("general", config, runtime_paths, execution_identity=None, create=True)
 
@@ -1738,6 +1764,7 @@ def test_resolve_agent_runtime_skips_workspace_knowledge_links_for_private_root_
         root="mind_data",
         knowledge=AgentPrivateKnowledgeConfig(path="."),
     )
+    config = revalidate_config(config)
     identity = ToolExecutionIdentity(
         channel="matrix",
         agent_name="general",
@@ -1911,6 +1938,7 @@ def test_create_agent_passes_authored_shell_runtime_overrides(
         },
     ]
     config.agents["general"].include_default_tools = False
+    config = revalidate_config(config)
 
     _create_agent_for_test("general", config=config)
 
@@ -1935,6 +1963,7 @@ def test_create_agent_keeps_tool_default_base_dir_without_memory_workspace(
     config = _test_config()
     config.agents["general"].tools = ["coding", "shell", "duckduckgo"]
     config.agents["general"].include_default_tools = False
+    config = revalidate_config(config)
 
     _create_agent_for_test("general", config=config)
 
@@ -2042,6 +2071,7 @@ def test_create_agent_uses_default_worker_tool_policy_when_unset(
     config.agents["summary"].tools = ["openclaw_compat"]
     config.agents["summary"].include_default_tools = False
     config.agents["summary"].worker_tools = None
+    config = revalidate_config(config)
 
     _create_agent_for_test("summary", config=config)
 
@@ -2056,6 +2086,7 @@ def test_openclaw_compat_implies_matrix_message_tool(mock_storage: MagicMock) ->
     config = _test_config()
     config.agents["summary"].tools = ["openclaw_compat"]
     config.agents["summary"].include_default_tools = False
+    config = revalidate_config(config)
 
     effective_tools = config.resolve_entity("summary").available_tools
     assert "openclaw_compat" in effective_tools
@@ -2071,6 +2102,7 @@ def test_openclaw_compat_implied_matrix_message_does_not_duplicate() -> None:
     config = _test_config()
     config.agents["summary"].tools = ["openclaw_compat", "matrix_message"]
     config.agents["summary"].include_default_tools = False
+    config = revalidate_config(config)
 
     effective_tools = config.resolve_entity("summary").available_tools
     assert effective_tools.count("matrix_message") == 1
@@ -2081,6 +2113,7 @@ def test_matrix_message_implies_attachments_and_matrix_room_tools() -> None:
     config = _test_config()
     config.agents["summary"].tools = ["matrix_message"]
     config.agents["summary"].include_default_tools = False
+    config = revalidate_config(config)
 
     effective_tools = config.resolve_entity("summary").available_tools
     assert effective_tools == ["matrix_message", "attachments", "matrix_room"]
@@ -2091,6 +2124,7 @@ def test_matrix_message_implied_attachments_does_not_duplicate() -> None:
     config = _test_config()
     config.agents["summary"].tools = ["matrix_message", "attachments"]
     config.agents["summary"].include_default_tools = False
+    config = revalidate_config(config)
 
     effective_tools = config.resolve_entity("summary").available_tools
     assert effective_tools.count("attachments") == 1
@@ -2302,6 +2336,7 @@ def test_create_agent_loads_shared_worker_scoped_tool_credentials_with_explicit_
     config.defaults.tools = []
     config.agents["general"].tools = ["credentialed_toolkit"]
     config.agents["general"].worker_scope = "shared"
+    config = unvalidated_config_copy(config)
 
     credentials_manager = CredentialsManager(tmp_path / "credentials")
     shared_identity = ToolExecutionIdentity(
@@ -3243,6 +3278,7 @@ def test_create_agent_private_root_requires_execution_identity(
         per="user",
         root="mind_data",
     )
+    config = revalidate_config(config)
 
     with pytest.raises(ValueError, match="requires an active execution identity"):
         create_agent("general", config=config, runtime_paths=_runtime_paths(tmp_path), execution_identity=None)
@@ -3859,6 +3895,7 @@ def test_file_mode_agent_instructions_list_workspace_knowledge_path(tmp_path: Pa
         path=str(knowledge_root),
         mode="files",
     )
+    config = revalidate_config(config)
 
     agent = _create_agent_for_test("general", config)
 
@@ -3,9 +3,11 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pytest
 
-from mindroom.config.agent import AgentConfig, CultureConfig, TeamConfig
+from mindroom.config.agent import AgentConfig, CultureConfig, RoomConfig, TeamConfig
 from mindroom.config.knowledge import KnowledgeBaseConfig
 from mindroom.config.main import Config
 from mindroom.config.memory import AgentMemorySearchConfig, MemoryConfig, MemorySearchConfig
@@ -16,9 +18,12 @@ from mindroom.config.models import (
     ModelConfig,
     ToolConfigEntry,
 )
-from mindroom.constants import ROUTER_AGENT_NAME
+from mindroom.constants import ROUTER_AGENT_NAME, resolve_runtime_paths
 from mindroom.history.types import HistoryPolicy
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 def _representative_config() -> Config:
     return Config(
@@ -256,3 +261,66 @@ def test_unknown_entity_raises_on_field_access() -> None:
         _ = view.has_authored_compaction_config
     with pytest.raises(ValueError, match="Unknown entity: missing"):
         _ = view.model_name
+
+
+def _entity_resolution_snapshot(config: Config) -> dict[str, object]:
+    snapshot: dict[str, object] = {"rooms": config.get_all_configured_rooms()}
+    for name in (*config.agents, *config.teams):
+        view = config.resolve_entity(name)
+        snapshot[f"{name}.history"] = view.history_settings
+        snapshot[f"{name}.compaction"] = view.compaction_config.model_dump()
+    for name in config.agents:
+        view = config.resolve_entity(name)
+        snapshot[f"{name}.tools"] = view.tool_configs
+        snapshot[f"{name}.authored_tools"] = view.authored_tool_configs
+        snapshot[f"{name}.knowledge_base_ids"] = view.knowledge_base_ids
+        snapshot[f"{name}.delegation"] = config.get_agent_delegation_closure(name)
+    return snapshot
+
+
+def test_runtime_validated_config_serves_entity_values_from_compiled_index(tmp_path: Path) -> None:
+    authored = _representative_config()
+    authored.agents["overriding_agent"].delegate_to = ["inheriting_agent"]
+    authored.rooms = {"lobby": RoomConfig()}
+    authored.agents["inheriting_agent"].rooms = ["dev"]
+    runtime_paths = resolve_runtime_paths(config_path=tmp_path / "config.yaml", storage_path=tmp_path / "storage")
+
+    compiled = Config.validate_with_runtime(authored.authored_model_dump(), runtime_paths)
+
+    assert _entity_resolution_snapshot(compiled) == _entity_resolution_snapshot(authored)
+    assert compiled.get_agent_delegation_closure("overriding_agent") == {"overriding_agent", "inheriting_agent"}
+    assert compiled.get_all_configured_rooms() == {"lobby", "dev"}
+    assert compiled.resolve_entity("overriding_agent") is compiled.resolve_entity("overriding_agent")
+    # Callers get their own lists, so appending never leaks into the shared index.
+    compiled.resolve_entity("overriding_agent").tool_configs.clear()
+    assert (
+        compiled.resolve_entity("overriding_agent").tool_configs
+        == authored.resolve_entity(
+            "overriding_agent",
+        ).tool_configs
+    )
+
+
+def test_config_copies_resolve_from_their_own_fields(tmp_path: Path) -> None:
+    runtime_paths = resolve_runtime_paths(config_path=tmp_path / "config.yaml", storage_path=tmp_path / "storage")
+    compiled = Config.validate_with_runtime(_representative_config().authored_model_dump(), runtime_paths)
+
+    copied = compiled.model_copy(deep=True)
+    copied.agents["inheriting_agent"].num_history_runs = 2
+
+    assert copied.resolve_entity("inheriting_agent").history_settings.policy == HistoryPolicy(mode="runs", limit=2)
+    assert compiled.resolve_entity("inheriting_agent").history_settings.policy == HistoryPolicy(mode="runs", limit=4)
+    assert copied.resolve_entity("inheriting_agent") is not copied.resolve_entity("inheriting_agent")
+
+
+def test_edits_reach_the_index_through_a_new_config(tmp_path: Path) -> None:
+    runtime_paths = resolve_runtime_paths(config_path=tmp_path / "config.yaml", storage_path=tmp_path / "storage")
+    compiled = Config.validate_with_runtime(_representative_config().authored_model_dump(), runtime_paths)
+    edited_agent = AgentConfig(display_name="Inheriting Agent", tools=[ToolConfigEntry(name="calculator")])
+
+    updated = compiled.model_copy(update={"agents": {**compiled.agents, "inheriting_agent": edited_agent}})
+    revalidated = Config.validate_with_runtime(updated.authored_model_dump(), runtime_paths)
+
+    assert "calculator" in updated.resolve_entity("inheriting_agent").available_tools
+    assert "calculator" in revalidated.resolve_entity("inheriting_agent").available_tools
+    assert "calculator" not in compiled.resolve_entity("inheriting_agent").available_tools
@@ -626,6 +626,7 @@ def _backend(
     runtime_paths: RuntimePaths | None = None,
     storage_path: Path | None = None,
     host_config_path: Path | None = None,
+    idle_retain_max: int = 0,
 ) -> tuple[DockerWorkerBackend, _FakeDockerClient, list[tuple[str, frozenset[str]]]]:
     config = _DockerWorkerBackendConfig(
         image="ghcr.io/mindroom-ai/mindroom:latest",
@@ -641,6 +642,7 @@ def _backend(
         user="1000:1000",
         extra_env={"EXTRA_ENV": "present"},
         extra_labels={"mindroom.ai/tenant": "test"},
+        idle_retain_max=idle_retain_max,
     )
     assert config.host_config_path is not None
     config.host_config_path.parent.mkdir(parents=True, exist_ok=True)
@@ -2075,12 +2077,7 @@ def test_docker_backend_cleanup_stops_idle_workers(
     backend, fake_client, _sync_calls = _backend(monkeypatch, tmp_path, idle_timeout_seconds=60.0)
 
     backend.ensure_worker(WorkerSpec(_TEST_UNSCOPED_WORKER_KEY), now=10.0)
-
-    metadata_path = worker_root_path(tmp_path, _TEST_UNSCOPED_WORKER_KEY) / "metadata" / "worker.json"
-    metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
-    metadata["last_used_at"] = 0.0
-    metadata["status"] = "ready"
-    metadata_path.write_text(json.dumps(metadata), encoding="utf-8")
+    backend.touch_worker(_TEST_UNSCOPED_WORKER_KEY, now=0.0)
 
     cleaned = backend.cleanup_idle_workers(now=100.0)
 
@@ -2097,6 +2094,46 @@ def test_docker_backend_cleanup_stops_idle_workers(
     assert worker_file.read_text(encoding="utf-8") == "still here"
 
 
+def test_docker_backend_cleanup_retains_recent_idle_workers(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """The most recently used idle workers stay running, and a stopped retained worker is restarted."""
+    backend, fake_client, _sync_calls = _backend(monkeypatch, tmp_path, idle_timeout_seconds=60.0, idle_retain_max=1)
+    older_key = "v1:t:user_agent:alice:watcher"
+    older = backend.ensure_worker(WorkerSpec(older_key, private_agent_names=frozenset()), now=5.0)
+    newer = backend.ensure_worker(WorkerSpec(_TEST_UNSCOPED_WORKER_KEY), now=10.0)
+    older_container = fake_client.containers.by_name[older.worker_id]
+    newer_container = fake_client.containers.by_name[newer.worker_id]
+
+    def full_scan() -> None:
+        msg = "retention must read candidates from the expiry heap"
+        raise AssertionError(msg)
+
+    with monkeypatch.context() as scan_guard:
+        scan_guard.setattr(backend._metadata, "entries", full_scan)
+        cleaned = backend.cleanup_idle_workers(now=100.0)
+
+    assert [worker.worker_key for worker in cleaned] == [older_key]
+    assert older_container.status == "exited"
+    assert newer_container.status == "running"
+    assert newer_container.stopped == 0
+
+    newer_container.stop()
+    starts_before = newer_container.started
+    backend.cleanup_idle_workers(now=110.0)
+
+    assert newer_container.status == "running"
+    assert newer_container.started == starts_before + 1
+    assert older_container.status == "exited"
+
+    backend.ensure_worker(WorkerSpec(_TEST_UNSCOPED_WORKER_KEY), now=120.0)
+    stats = backend.claim_stats()
+    assert (stats.cold_claims, stats.warm_claims) == (2, 1)
+    assert stats.idle_retain_max == 1
+    assert stats.as_dict()["warm_latency"]["count"] == 1
+
+
 def test_docker_backend_retires_only_one_exact_run_worker_idempotently(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
@@ -9,7 +9,11 @@ from mindroom.dynamic_workflows.validation import (
     collect_workflow_spec_errors,
     validate_workflow_input,
     validate_workflow_spec,
+    workflow_checkpoint_retention_seconds,
+    workflow_concurrent_agents,
+    workflow_memoize_ttl_seconds,
     workflow_runtime_seconds,
+    workflow_step_dependencies,
 )
 
 
@@ -686,3 +690,55 @@ def test_collect_errors_does_not_mutate_the_input_spec() -> None:
     collect_workflow_spec_errors(spec)
     assert "permissions" not in spec
     assert "tools" not in spec["participants"][0]
+
+
+def test_step_dependencies_follow_references_and_shared_participant_sessions() -> None:
+    """Steps depend on referenced prior steps and the previous step of their participant."""
+    validated = validate_workflow_spec(
+        _spec(
+            participants=[
+                {"id": "writer", "kind": "ephemeral_agent", "name": "Writer"},
+                {"id": "critic", "kind": "ephemeral_agent", "name": "Critic"},
+            ],
+            workflow=[
+                {"id": "draft", "participant": "writer", "prompt": "Draft {input.topic}."},
+                {"id": "notes", "participant": "critic", "prompt": "List risks."},
+                {"id": "revise", "participant": "writer", "prompt": "Revise with {steps.notes.content}."},
+                {"id": "summary", "type": "transform_step", "template": "{steps.revise}"},
+                {"id": "report", "type": "report_step", "title": "{steps.notes}", "from_step": "summary"},
+            ],
+        ),
+    )
+
+    assert workflow_step_dependencies(validated["workflow"]) == {
+        "draft": (),
+        "notes": (),
+        "revise": ("notes", "draft"),
+        "summary": ("revise",),
+        "report": ("notes", "summary"),
+    }
+
+
+def test_concurrent_agents_defaults_to_sequential_execution() -> None:
+    """Agent steps run one at a time unless the spec raises the limit."""
+    assert workflow_concurrent_agents(_spec()) == 1
+    assert workflow_concurrent_agents(_spec(permissions={"max_concurrent_agents": 3})) == 3
+    with pytest.raises(DynamicWorkflowError, match="max_concurrent_agents"):
+        workflow_concurrent_agents(_spec(permissions={"max_concurrent_agents": 9}))
+
+
+def test_memoize_ttl_is_optional_and_bounded() -> None:
+    """Memoisation stays off unless the spec sets a TTL within the weekly cap."""
+    assert workflow_memoize_ttl_seconds(validate_workflow_spec(_spec())) is None
+    assert workflow_memoize_ttl_seconds(validate_workflow_spec(_spec(memoize_ttl_seconds=600))) == 600
+    errors = collect_workflow_spec_errors(_spec(memoize_ttl_seconds=0))
+    assert errors == ["Workflow spec field 'memoize_ttl_seconds' must be an integer between 1 and 604800."]
+
+
+def test_checkpoints_are_kept_only_for_memoising_or_resumable_specs() -> None:
+    """Step checkpoints are retained for the TTL, or a week for resumable specs, and not at all otherwise."""
+    assert workflow_checkpoint_retention_seconds(validate_workflow_spec(_spec())) is None
+    assert workflow_checkpoint_retention_seconds(validate_workflow_spec(_spec(memoize_ttl_seconds=600))) == 600
+    assert workflow_checkpoint_retention_seconds(validate_workflow_spec(_spec(resumable=True))) == 604800
+    errors = collect_workflow_spec_errors(_spec(resumable="yes"))
+    assert errors == ["Workflow spec field 'resumable' must be true or false."]
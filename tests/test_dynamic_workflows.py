@@ -30,9 +30,13 @@ from mindroom.config.models import ModelConfig
 from mindroom.custom_tools import dynamic_workflow as dynamic_workflow_module
 from mindroom.custom_tools.dynamic_workflow import _MINIMAL_SPEC_EXAMPLE, DynamicWorkflowTools
 from mindroom.dynamic_workflows.agno_adapter import build_agno_workflow_factory
-from mindroom.dynamic_workflows.runner import DynamicWorkflowExecutionError, execute_workflow_spec
+from mindroom.dynamic_workflows.runner import (
+    DynamicWorkflowExecutionError,
+    async_execute_workflow_spec,
+    execute_workflow_spec,
+)
 from mindroom.dynamic_workflows.service import DynamicWorkflowService
-from mindroom.dynamic_workflows.store import DynamicWorkflowStore
+from mindroom.dynamic_workflows.store import DynamicWorkflowRun, DynamicWorkflowStore
 from mindroom.dynamic_workflows.validation import DynamicWorkflowError
 from mindroom.entity_resolution import entity_identity_registry
 from mindroom.matrix.state import MatrixState
@@ -241,6 +245,7 @@ def test_dynamic_workflow_tool_registered() -> None:
         "validate_workflow",
         "update_workflow",
         "run_workflow",
+        "resume_workflow_run",
         "get_workflow_run",
         "list_workflows",
         "list_workflow_revisions",
@@ -1006,6 +1011,272 @@ def test_agent_step_fails_without_participant_executor() -> None:
     assert execution.error == "Agent step 'write' requires a participant executor."
 
 
+def _fan_out_spec() -> dict[str, object]:
+    return _workflow_spec(
+        participants=[
+            {"id": participant_id, "kind": "ephemeral_agent", "name": participant_id.title(), "tools": []}
+            for participant_id in ("alpha", "beta", "gamma", "editor")
+        ],
+        workflow=[
+            {"id": "a", "type": "agent_step", "participant": "alpha", "prompt": "Research {input.topic}."},
+            {"id": "b", "type": "agent_step", "participant": "beta", "prompt": "Research {input.topic}."},
+            {"id": "c", "type": "agent_step", "participant": "gamma", "prompt": "Research {input.topic}."},
+            {"id": "merge", "type": "agent_step", "participant": "editor", "prompt": "Merge {steps.a} and {steps.c}."},
+            {"id": "report", "type": "report_step", "body_template": "{steps.merge}\n\n{steps.b}"},
+        ],
+        outputs=[{"id": "report_md", "type": "markdown", "from_step": "report"}],
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_workflow_runs_independent_steps_concurrently_in_spec_order() -> None:
+    """Independent agent steps should overlap up to the limit while results stay in spec order."""
+    in_flight = 0
+    peak = 0
+    seen_outputs: dict[str, dict[str, object]] = {}
+
+    async def participant_executor(
+        *,
+        participant: dict[str, object],
+        prompt: str,
+        input_data: dict[str, object],
+        step_outputs: dict[str, object],
+    ) -> str:
+        nonlocal in_flight, peak
+        del prompt, input_data
+        participant_id = str(participant["id"])
+        seen_outputs[participant_id] = step_outputs
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Later fan-out steps finish first, so completion order differs from spec order.
+        await asyncio.sleep({"alpha": 0.03, "beta": 0.02, "gamma": 0.01}.get(participant_id, 0))
+        in_flight -= 1
+        return f"{participant_id} done"
+
+    execution = await async_execute_workflow_spec(
+        _fan_out_spec(),
+        {"topic": "factories"},
+        participant_executor=participant_executor,
+        max_concurrent_agents=2,
+    )
+
+    assert execution.status == "completed"
+    assert peak == 2
+    assert [step.step_id for step in execution.steps] == ["a", "b", "c", "merge", "report"]
+    assert seen_outputs["editor"] == {"a": "alpha done", "c": "gamma done"}
+    assert seen_outputs["alpha"] == {}
+    assert execution.outputs == {"report_md": "editor done\n\nbeta done"}
+
+
+@pytest.mark.asyncio
+async def test_async_workflow_reports_earliest_failure_and_cancels_in_flight_steps() -> None:
+    """A failed step should stop new launches and report deterministically."""
+    cancelled: list[str] = []
+
+    async def participant_executor(
+        *,
+        participant: dict[str, object],
+        prompt: str,
+        input_data: dict[str, object],
+        step_outputs: dict[str, object],
+    ) -> str:
+        del prompt, input_data, step_outputs
+        participant_id = str(participant["id"])
+        if participant_id == "beta":
+            msg = "beta unavailable"
+            raise RuntimeError(msg)
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(participant_id)
+            raise
+        return f"{participant_id} done"
+
+    execution = await async_execute_workflow_spec(
+        _fan_out_spec(),
+        {"topic": "factories"},
+        participant_executor=participant_executor,
+        max_concurrent_agents=3,
+    )
+
+    assert execution.status == "failed"
+    assert execution.error == "Agent step 'b' participant 'beta' failed: beta unavailable"
+    assert [(step.step_id, step.status) for step in execution.steps] == [("b", "failed")]
+    assert sorted(cancelled) == ["alpha", "gamma"]
+
+
+def _two_step_spec(**overrides: object) -> dict[str, object]:
+    participant = {"kind": "ephemeral_agent", "model": "claude-sonnet-4-6", "tools": []}
+    return _workflow_spec(
+        participants=[
+            {**participant, "id": "researcher", "name": "Researcher"},
+            {**participant, "id": "writer", "name": "Report Writer"},
+        ],
+        workflow=[
+            {"id": "research", "participant": "researcher", "prompt": "Research {input.topic}."},
+            {"id": "write", "participant": "writer", "prompt": "Write from {steps.research}."},
+        ],
+        outputs=[{"id": "report", "type": "text", "from_step": "write"}],
+        **overrides,
+    )
+
+
+@pytest.mark.asyncio
+async def test_service_resume_replays_completed_steps_and_continues(tmp_path: Path) -> None:
+    """Resuming a failed run should skip steps the earlier run completed."""
+    store = DynamicWorkflowStore(tmp_path / "mindroom_data")
+    calls: list[str] = []
+    writer_available = False
+
+    async def participant_executor(*, participant: dict[str, object], prompt: str, **_kwargs: object) -> object:
+        calls.append(str(participant["id"]))
+        if participant["id"] == "writer" and not writer_available:
+            msg = "writer unavailable"
+            raise RuntimeError(msg)
+        return f"{participant['id']}: {prompt}"
+
+    service = DynamicWorkflowService(store, async_participant_executor=participant_executor)
+    store.create_workflow(
+        spec=_two_step_spec(resumable=True),
+        scope="agent",
+        owner_id="general",
+        created_by="general",
+    )
+    failed = await service.arun_workflow(
+        workflow_id="competitor-research-report",
+        scope="agent",
+        owner_id="general",
+        input_data={"topic": "factories"},
+        requested_by="general",
+    )
+    writer_available = True
+
+    resumed = await service.aresume_workflow_run(failed, requested_by="general")
+
+    assert failed.status == "failed"
+    assert resumed.status == "completed"
+    assert resumed.run_id != failed.run_id
+    assert resumed.revision == failed.revision
+    assert calls == ["researcher", "writer", "writer"]
+    assert resumed.outputs == {"report": "writer: Write from researcher: Research factories.."}
+    with pytest.raises(DynamicWorkflowError, match="already completed"):
+        await service.aresume_workflow_run(resumed, requested_by="general")
+    assert not list((tmp_path / "mindroom_data").rglob("step_results/*/*/*.json")), "completion drops checkpoints"
+
+
+@pytest.mark.asyncio
+async def test_service_records_no_checkpoints_unless_the_spec_opts_in(tmp_path: Path) -> None:
+    """A spec that neither memoises nor resumes should write no step checkpoints and refuse to resume."""
+    store = DynamicWorkflowStore(tmp_path / "mindroom_data")
+
+    async def participant_executor(*, participant: dict[str, object], **_kwargs: object) -> object:
+        if participant["id"] == "writer":
+            msg = "writer unavailable"
+            raise RuntimeError(msg)
+        return f"{participant['id']} output"
+
+    service = DynamicWorkflowService(store, async_participant_executor=participant_executor)
+    store.create_workflow(spec=_two_step_spec(), scope="agent", owner_id="general", created_by="general")
+    failed = await service.arun_workflow(
+        workflow_id="competitor-research-report",
+        scope="agent",
+        owner_id="general",
+        input_data={"topic": "factories"},
+        requested_by="general",
+    )
+
+    assert failed.status == "failed"
+    assert not list((tmp_path / "mindroom_data").rglob("step_results/*/*/*.json"))
+    with pytest.raises(DynamicWorkflowError, match="resumable: true"):
+        await service.aresume_workflow_run(failed, requested_by="general")
+
+
+@pytest.mark.asyncio
+async def test_service_prunes_expired_step_checkpoints(tmp_path: Path) -> None:
+    """Checkpoints past their expiry should be deleted when the workflow next runs."""
+    store = DynamicWorkflowStore(tmp_path / "mindroom_data")
+
+    async def participant_executor(*, participant: dict[str, object], **_kwargs: object) -> object:
+        return f"{participant['id']} output"
+
+    service = DynamicWorkflowService(store, async_participant_executor=participant_executor)
+    store.create_workflow(
+        spec=_two_step_spec(memoize_ttl_seconds=60),
+        scope="agent",
+        owner_id="general",
+        created_by="general",
+    )
+
+    async def run(topic: str) -> DynamicWorkflowRun:
+        return await service.arun_workflow(
+            workflow_id="competitor-research-report",
+            scope="agent",
+            owner_id="general",
+            input_data={"topic": topic},
+            requested_by="general",
+        )
+
+    await run("factories")
+    checkpoint_paths = list((tmp_path / "mindroom_data").rglob("step_results/*/*/*.json"))
+    assert len(checkpoint_paths) == 2
+    for checkpoint_path in checkpoint_paths:
+        checkpoint = json.loads(checkpoint_path.read_text())
+        checkpoint["expires_at"] = checkpoint["recorded_at"] - 1
+        checkpoint_path.write_text(json.dumps(checkpoint))
+
+    await run("agents")
+
+    remaining = list((tmp_path / "mindroom_data").rglob("step_results/*/*/*.json"))
+    assert len(remaining) == 2
+    assert not set(remaining) & set(checkpoint_paths)
+    assert not checkpoint_paths[0].parent.exists(), "emptied checkpoint directories are removed"
+
+
+@pytest.mark.asyncio
+async def test_service_memoises_step_results_only_when_the_spec_opts_in(tmp_path: Path) -> None:
+    """Identical runs should reuse stored steps within the TTL and re-execute otherwise."""
+    store = DynamicWorkflowStore(tmp_path / "mindroom_data")
+    calls: list[str] = []
+
+    async def participant_executor(*, participant: dict[str, object], **_kwargs: object) -> object:
+        calls.append(str(participant["id"]))
+        return f"{participant['id']} output"
+
+    service = DynamicWorkflowService(store, async_participant_executor=participant_executor)
+    store.create_workflow(spec=_two_step_spec(), scope="agent", owner_id="general", created_by="general")
+
+    async def run(topic: str) -> DynamicWorkflowRun:
+        return await service.arun_workflow(
+            workflow_id="competitor-research-report",
+            scope="agent",
+            owner_id="general",
+            input_data={"topic": topic},
+            requested_by="general",
+        )
+
+    await run("factories")
+    await run("factories")
+    assert calls == ["researcher", "writer"] * 2
+
+    store.update_workflow(
+        workflow_id="competitor-research-report",
+        scope="agent",
+        owner_id="general",
+        patch={"memoize_ttl_seconds": 60},
+        updated_by="general",
+        reason="reuse identical runs",
+    )
+    calls.clear()
+    first = await run("factories")
+    second = await run("factories")
+    other_input = await run("agents")
+
+    assert calls == ["researcher", "writer", "researcher", "writer"]
+    assert second.outputs == first.outputs == {"report": "writer output"}
+    assert [step["completed_at"] for step in second.steps] == [step["completed_at"] for step in first.steps]
+    assert other_input.status == "completed"
+
+
 def test_service_completes_tool_runs_without_raw_background_thread(tmp_path: Path) -> None:
     """Tool-triggered workflow runs should complete on the managed execution path."""
     store = DynamicWorkflowStore(tmp_path / "mindroom_data")
@@ -1081,6 +1081,83 @@ class TestPrincipalIsolation:
         assert not await second.is_pending("$shared-id")
 
 
+class TestInflightStreamIndex:
+    """Which rooms startup recovery has to visit, kept from the sender's side."""
+
+    async def test_index_is_unknown_until_a_full_sweep_covers_it(self, alice: PrincipalStore) -> None:
+        """Rows alone never narrow recovery: an older release left none."""
+        await alice.record_inflight_stream(room_id="!a:x", event_id="$stream")
+
+        assert await alice.inflight_stream_room_ids() is None
+
+        await alice.mark_inflight_streams_covered(tracked_since_ms=1)
+
+        assert await alice.inflight_stream_room_ids() == frozenset({"!a:x"})
+
+    async def test_clearing_a_finished_stream_drops_its_room(self, alice: PrincipalStore) -> None:
+        """A stream that ended cleanly no longer sends recovery to its room."""
+        await alice.mark_inflight_streams_covered(tracked_since_ms=1)
+        await alice.record_inflight_stream(room_id="!a:x", event_id="$one")
+        await alice.record_inflight_stream(room_id="!a:x", event_id="$two")
+        await alice.record_inflight_stream(room_id="!b:x", event_id="$three")
+
+        await alice.clear_inflight_stream("$three")
+        await alice.clear_inflight_stream("$one")
+
+        assert await alice.inflight_stream_room_ids() == frozenset({"!a:x"})
+
+    async def test_revoked_coverage_sends_recovery_back_to_a_full_sweep(self, alice: PrincipalStore) -> None:
+        """After a failed index write the index cannot rule any room out until the next full sweep."""
+        await alice.mark_inflight_streams_covered(tracked_since_ms=1)
+        await alice.record_inflight_stream(room_id="!a:x", event_id="$one")
+
+        await alice.revoke_inflight_stream_coverage()
+
+        assert await alice.inflight_stream_room_ids() is None
+        await alice.mark_inflight_streams_covered(tracked_since_ms=2)
+        assert await alice.inflight_stream_room_ids() == frozenset({"!a:x"})
+
+    async def test_settling_keeps_newer_rows_and_unvisited_rooms(self, alice: PrincipalStore) -> None:
+        """Only rows older than the pass go, and only where the pass recovered or long after."""
+        await alice.mark_inflight_streams_covered(tracked_since_ms=1)
+        await alice.record_inflight_stream(room_id="!visited:x", event_id="$old-visited")
+        await alice.record_inflight_stream(room_id="!deferred:x", event_id="$old-deferred")
+        cutoff_ms = time.time_ns() // 1_000_000 + 1
+        await asyncio.sleep(0.005)
+        await alice.record_inflight_stream(room_id="!visited:x", event_id="$started-after-cutoff")
+
+        removed = await alice.settle_inflight_streams(
+            recovered_room_ids={"!visited:x"},
+            recorded_before_ms=cutoff_ms,
+            expired_before_ms=0,
+        )
+
+        assert removed == 1
+        assert await alice.inflight_stream_room_ids() == frozenset({"!visited:x", "!deferred:x"})
+
+        removed = await alice.settle_inflight_streams(
+            recovered_room_ids=(),
+            recorded_before_ms=cutoff_ms,
+            expired_before_ms=cutoff_ms,
+        )
+
+        assert removed == 1
+        assert await alice.inflight_stream_room_ids() == frozenset({"!visited:x"})
+
+    async def test_index_is_bound_to_its_principal(self, journal_store: EventJournalStore) -> None:
+        """One bot's streams never send another bot's recovery anywhere."""
+        first = journal_store.principal("agent@one")
+        second = journal_store.principal("agent@two")
+        await first.mark_inflight_streams_covered(tracked_since_ms=1)
+        await second.mark_inflight_streams_covered(tracked_since_ms=1)
+        await first.record_inflight_stream(room_id="!a:x", event_id="$shared-id")
+
+        await second.clear_inflight_stream("$shared-id")
+
+        assert await first.inflight_stream_room_ids() == frozenset({"!a:x"})
+        assert await second.inflight_stream_room_ids() == frozenset()
+
+
 class TestAdmission:
     """The journal decides exactly once what MindRoom accepted."""
 
@@ -9049,6 +9126,15 @@ class TestHotQueriesAreIndexCovered:
             "SELECT * FROM visible_messages WHERE principal_id=? AND room_id=? AND thread_id=?"  # noqa: S608 - the production clause, not input
             f"{_CONVERSATION_CURSOR_CLAUSE} ORDER BY created_ts DESC, logical_event_id DESC LIMIT 50"
         ),
+        "export watermark over a thread": (
+            "SELECT COUNT(*), COUNT(content_json), COUNT(refresh_token), SUM(revision_ts), MAX(revision_ts), "
+            "SUM(LENGTH(revision_event_id)), SUM(LENGTH(content_json)) FROM visible_messages "
+            "WHERE principal_id=? AND room_id=? AND thread_id=?"
+        ),
+        "export watermark of a thread root": (
+            "SELECT COUNT(*), SUM(revision_ts) FROM visible_messages "
+            "WHERE principal_id=? AND room_id=? AND logical_event_id=?"
+        ),
         "revision point lookup": (
             "SELECT * FROM visible_messages WHERE principal_id=? AND room_id=? AND revision_event_id=?"
         ),
@@ -25,7 +25,7 @@ from mindroom.external_triggers.store import ExternalTriggerTarget, TriggerDeliv
 from mindroom.matrix.client_delivery import DeliveredMatrixEvent
 from mindroom.matrix.identity import managed_account_key
 from mindroom.matrix.state import MatrixState
-from tests.conftest import bind_runtime_paths, runtime_paths_for, test_runtime_paths
+from tests.conftest import bind_runtime_paths, revalidate_config, runtime_paths_for, test_runtime_paths
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -47,7 +47,7 @@ def _config(tmp_path: Path) -> Config:
 def _private_config(tmp_path: Path) -> Config:
     config = _config(tmp_path)
     config.agents["research"].private = AgentPrivateConfig(per="user", root="research_data")
-    return config
+    return revalidate_config(config)
 
 
 def _config_with_unprepared_stale_agent(tmp_path: Path) -> Config:
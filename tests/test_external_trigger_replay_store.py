@@ -4,10 +4,10 @@ from __future__ import annotations
 
 import json
 import multiprocessing
-import time
+import sqlite3
 from pathlib import Path
 from queue import Empty
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING
 
 import pytest
 from pydantic import ValidationError
@@ -22,7 +22,6 @@ from mindroom.external_triggers.replay_store import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
     from multiprocessing.queues import Queue
     from multiprocessing.synchronize import Event
 
@@ -33,23 +32,12 @@ def _store_path(tmp_path: Path) -> Path:
     return path
 
 
-def _claim_nonce_with_slow_read_worker(
+def _claim_nonce_worker(
     control_state_root: str,
     start_event: Event,
     result_queue: Queue[tuple[str, bool | str]],
 ) -> None:
-    """Claim one nonce after slowing reads enough to expose missing cross-process locking."""
-    original_read_store = cast(
-        "Callable[[ExternalTriggerReplayStore], object]",
-        ExternalTriggerReplayStore._read_store,
-    )
-
-    def slow_read_store(self: ExternalTriggerReplayStore) -> object:
-        store = original_read_store(self)
-        time.sleep(0.1)
-        return store
-
-    ExternalTriggerReplayStore._read_store = slow_read_store
+    """Claim one nonce as soon as every worker process has been released."""
     try:
         if not start_event.wait(timeout=5):
             result_queue.put(("error", "timed out waiting for start signal"))
@@ -145,7 +133,7 @@ def test_shared_store_processes_coordinate_nonce_claims(tmp_path: Path) -> None:
     result_queue = context.Queue()
     processes = [
         context.Process(
-            target=_claim_nonce_with_slow_read_worker,
+            target=_claim_nonce_worker,
             args=(str(tmp_path), start_event, result_queue),
         )
         for _ in range(2)
@@ -338,44 +326,62 @@ def test_replay_store_read_oserror_fails_closed(
         store.claim_nonce("campground", "nonce-1", now=1_000, ttl_seconds=300)
 
 
-def test_replay_store_write_oserror_fails_closed(
-    tmp_path: Path,
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """Replay store write failures should surface through the typed store error."""
-
-    def raise_disk_full(_fd: int) -> None:
-        msg = "disk full"
-        raise OSError(msg)
-
-    monkeypatch.setattr("mindroom.durable_write.os.fsync", raise_disk_full)
+def test_replay_store_database_error_fails_closed(tmp_path: Path) -> None:
+    """An unusable replay database should surface through the typed store error."""
+    (tmp_path / "external_triggers" / "replay.sqlite3").mkdir(parents=True)
     store = ExternalTriggerReplayStore(tmp_path)
 
     with pytest.raises(ExternalTriggerReplayStoreError, match="unavailable"):
         store.claim_nonce("campground", "nonce-1", now=1_000, ttl_seconds=300)
 
 
-def test_replay_store_write_uses_bind_mount_safe_replace(
-    tmp_path: Path,
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """Replay writes should survive filesystems where atomic replace reports EBUSY."""
+def test_legacy_json_replay_state_is_imported_once_and_retired(tmp_path: Path) -> None:
+    """Replay claims recorded by the JSON store should keep protecting after the upgrade."""
     store_path = _store_path(tmp_path)
-    original_replace = type(store_path).replace
+    store_path.write_text(
+        json.dumps(
+            {
+                "nonces": {"campground": {"nonce-1": {"expires_at": 1_300}}},
+                "events": {
+                    "campground": {
+                        "availability-1": {"state": "delivered", "expires_at": 1_300},
+                        "availability-2": {"state": "in_progress", "expires_at": 1_300},
+                    },
+                },
+            },
+        ),
+        encoding="utf-8",
+    )
+    store = ExternalTriggerReplayStore(tmp_path)
 
-    def raise_busy_on_store_replace(path: Path, target: Path) -> Path:
-        if target == store_path:
-            msg = "Device or resource busy"
-            raise OSError(msg)
-        return original_replace(path, target)
+    assert not store.claim_nonce("campground", "nonce-1", now=1_000, ttl_seconds=300)
+    assert not store_path.exists()
+    assert store.claim_event_id("campground", "availability-1", now=1_000, ttl_seconds=300) is (
+        ExternalTriggerEventClaim.DELIVERED
+    )
+    assert store.claim_event_id("campground", "availability-2", now=1_000, ttl_seconds=300) is (
+        ExternalTriggerEventClaim.IN_PROGRESS
+    )
 
-    monkeypatch.setattr(type(store_path), "replace", raise_busy_on_store_replace)
+
+def test_claims_prune_expired_rows_incrementally(tmp_path: Path) -> None:
+    """Each claim should delete expired replay rows so the table tracks the live window."""
     store = ExternalTriggerReplayStore(tmp_path)
+    for index in range(5):
+        assert store.claim_nonce("campground", f"nonce-{index}", now=1_000, ttl_seconds=10)
+    assert store.claim_event_id("campground", "availability-1", now=1_000, ttl_seconds=10) is (
+        ExternalTriggerEventClaim.FRESH
+    )
 
-    assert store.claim_nonce("campground", "nonce-1", now=1_000, ttl_seconds=300)
-    assert json.loads(store_path.read_text(encoding="utf-8"))["nonces"]["campground"]["nonce-1"] == {
-        "expires_at": 1_300,
-    }
+    assert store.claim_nonce("campground", "nonce-late", now=2_000, ttl_seconds=10)
+    store.close()
+
+    connection = sqlite3.connect(tmp_path / "external_triggers" / "replay.sqlite3")
+    try:
+        rows = connection.execute("SELECT kind, replay_key FROM external_trigger_replay").fetchall()
+    finally:
+        connection.close()
+    assert rows == [("nonce", "nonce-late")]
 
 
 def test_safe_replace_copy_fallback_fsyncs_target_file(
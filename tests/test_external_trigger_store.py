@@ -24,6 +24,7 @@ from mindroom.matrix.identity import managed_account_key
 from mindroom.matrix.state import MatrixState
 
 if TYPE_CHECKING:
+    import os
     from pathlib import Path
 
 _PUBLIC_KEY = "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA="
@@ -445,20 +446,59 @@ def test_record_store_invalid_allowed_kinds_type_fails_closed(tmp_path: Path, al
 def test_record_store_read_oserror_fails_closed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """Store path stat failures should map to the store-unavailable boundary."""
     store = ExternalTriggerStore(_runtime_paths(tmp_path))
-    original_exists = type(store.store_path).exists
+    original_stat = type(store.store_path).stat
 
-    def raise_for_store_path(path: Path) -> bool:
+    def raise_for_store_path(path: Path, **kwargs: bool) -> os.stat_result:
         if path == store.store_path:
             msg = "permission denied"
             raise OSError(msg)
-        return original_exists(path)
+        return original_stat(path, **kwargs)
 
-    monkeypatch.setattr(type(store.store_path), "exists", raise_for_store_path)
+    monkeypatch.setattr(type(store.store_path), "stat", raise_for_store_path)
 
     with pytest.raises(ExternalTriggerStoreError, match="invalid"):
         store.list_records()
 
 
+def test_record_lookups_reuse_index_until_file_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Webhook lookups use the in-memory index and only re-read the file after another writer."""
+    config = _config()
+    runtime_paths = _runtime_paths(tmp_path)
+    store = ExternalTriggerStore(runtime_paths)
+    record = _create(store, config)
+    other_owner_record = record.model_copy(
+        update={"trigger_id": "other", "uid": "other-uid", "owner_user_id": "@other:example.org"},
+    )
+    reads: list[Path] = []
+    original_open = type(store.store_path).open
+
+    def counting_open(path: Path, *args: object, **kwargs: object) -> object:
+        if path == store.store_path:
+            reads.append(path)
+        return original_open(path, *args, **kwargs)
+
+    monkeypatch.setattr(type(store.store_path), "open", counting_open)
+
+    for _ in range(3):
+        snapshot = ExternalTriggerStore(runtime_paths).delivery_snapshot(
+            record.trigger_id,
+            config=config,
+            config_generation=1,
+        )
+        assert snapshot is not None
+        assert snapshot.uid == record.uid
+    assert reads == []
+
+    raw_records = json.loads(store.store_path.read_text(encoding="utf-8"))
+    raw_records["triggers"]["other"] = other_owner_record.model_dump(mode="json")
+    store.store_path.write_text(json.dumps(raw_records), encoding="utf-8")
+    reads.clear()
+
+    assert [item.trigger_id for item in store.list_records(owner_user_id="@other:example.org")] == ["other"]
+    assert [item.trigger_id for item in store.list_records(owner_user_id=_OWNER)] == [record.trigger_id]
+    assert len(reads) == 1
+
+
 def test_non_owner_cannot_modify_trigger_but_admin_can(tmp_path: Path) -> None:
     """Record mutation requires trigger ownership or configured trigger admin."""
     config = _config(admin_users=["@admin:example.org"])
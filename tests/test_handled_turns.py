@@ -1680,3 +1680,67 @@ async def test_an_adopted_record_survives_a_key_this_version_retired(
     assert record is not None
     assert record.response_event_id == "$reply"
     assert "input_snapshot" not in TurnRecordCodec._to_ledger_record(record)
+
+
+@pytest.mark.asyncio
+async def test_conversation_and_response_lookups_follow_updates_and_cleanup(
+    journal_store: EventJournalStore,
+) -> None:
+    """Indexed lookups must track replaced records and evicted turns, not the first write."""
+    tracker = await _open_ledger(journal_store, "test_indexed_lookups")
+    target = MessageTarget.resolve(room_id="!room:example.com", thread_id="$thread", reply_to_event_id="$reply")
+    old_timestamp = time.time() - (40 * 24 * 60 * 60)
+    await tracker.record_handled_turn(
+        TurnRecord.create(
+            ["$old"],
+            response_event_id="$old-response",
+            conversation_target=target,
+            timestamp=old_timestamp,
+        ),
+    )
+    await tracker.record_handled_turn(
+        TurnRecord.create(["$a", "$b"], response_event_id="$first-response", conversation_target=target),
+    )
+    await tracker.update_handled_turn(
+        ["$a"],
+        lambda existing: canonicalize_turn_record(
+            existing["$a"],
+            response_event_id="$regenerated",
+            visible_echo_event_id="$echo",
+            timestamp=0.0,
+        ),
+    )
+
+    assert tracker.turn_record_for_response_event_id("$first-response") is None
+    regenerated = tracker.turn_record_for_response_event_id("$regenerated")
+    assert regenerated is not None
+    assert regenerated.source_event_ids == ("$a", "$b")
+    assert tracker.turn_record_for_response_event_id("$echo") == regenerated
+    assert {
+        record.anchor_event_id for record in tracker.turn_records_for_conversation(session_id=target.session_id)
+    } == {
+        "$old",
+        "$b",
+    }
+
+    await tracker._cleanup_old_events(max_events=100, max_age_days=30)
+
+    assert tracker.turn_record_for_response_event_id("$old-response") is None
+    assert tracker.turn_records_for_conversation(session_id=target.session_id) == (regenerated,)
+
+
+@pytest.mark.asyncio
+async def test_cleanup_orders_turns_by_their_latest_write(journal_store: EventJournalStore) -> None:
+    """A turn rewritten after older turns must outlive them when the count cap applies."""
+    tracker = await _open_ledger(journal_store, "test_cleanup_rewritten")
+    base_time = time.time()
+    for index in range(3):
+        await tracker.record_handled_turn(TurnRecord.create([f"$event{index}"], timestamp=base_time + index))
+    await tracker.update_handled_turn(
+        ["$event0"],
+        lambda existing: canonicalize_turn_record(existing["$event0"], timestamp=base_time + 10),
+    )
+
+    await tracker._cleanup_old_events(max_events=2)
+
+    assert set(tracker._responses) == {"$event0", "$event2"}
@@ -31,6 +31,7 @@ from mindroom.hooks import (
     ResponseDraft,
     build_hook_matrix_admin,
     hook,
+    hook_health,
 )
 from mindroom.hooks.execution import emit, emit_collect, emit_final_response_transform, emit_transform
 from mindroom.logging_config import get_logger
@@ -282,6 +283,54 @@ async def test_emit_observer_propagates_keyboard_interrupt_from_plugin_hook(tmp_
         await emit(registry, EVENT_MESSAGE_RECEIVED, context)
 
 
+@pytest.mark.asyncio
+async def test_repeatedly_failing_hook_trips_its_circuit_breaker(tmp_path: Path) -> None:
+    """A hook that keeps failing is skipped during cool-down and probed once afterwards."""
+    now = [0.0]
+    hook_health().clock = lambda: now[0]
+    calls: list[str] = []
+
+    @hook(EVENT_MESSAGE_RECEIVED, name="flaky")
+    async def flaky_hook(ctx: MessageReceivedContext) -> None:
+        del ctx
+        calls.append("flaky")
+        raise RuntimeError
+
+    @hook(EVENT_MESSAGE_RECEIVED, name="healthy")
+    async def healthy_hook(ctx: MessageReceivedContext) -> None:
+        del ctx
+        calls.append("healthy")
+
+    registry = HookRegistry.from_plugins([_plugin("breaker-plugin", [flaky_hook, healthy_hook])])
+    for _ in range(6):
+        await emit(registry, EVENT_MESSAGE_RECEIVED, _message_received_context(tmp_path))
+
+    assert calls.count("flaky") == 5, "the open breaker still invoked the hook"
+    assert calls.count("healthy") == 6
+    flaky, healthy = hook_health().snapshot()
+    assert (flaky["state"], flaky["failures"], flaky["skipped"]) == ("open", 5, 1)
+    assert healthy["state"] == "closed"
+    assert healthy["latency_p50_ms"] is not None
+
+    now[0] = 31.0
+    await emit(registry, EVENT_MESSAGE_RECEIVED, _message_received_context(tmp_path))
+    await emit(registry, EVENT_MESSAGE_RECEIVED, _message_received_context(tmp_path))
+
+    assert calls.count("flaky") == 6, "a failed half-open probe must reopen the breaker"
+    assert hook_health().snapshot()[0]["state"] == "open"
+
+    @hook(EVENT_MESSAGE_RECEIVED, name="flaky")
+    async def fixed_hook(ctx: MessageReceivedContext) -> None:
+        del ctx
+        calls.append("fixed")
+
+    reloaded = HookRegistry.from_plugins([_plugin("breaker-plugin", [fixed_hook])])
+    await emit(reloaded, EVENT_MESSAGE_RECEIVED, _message_received_context(tmp_path))
+
+    assert calls[-1] == "fixed", "a reloaded callback must not wait out the old breaker"
+    assert hook_health().snapshot()[0]["state"] == "closed"
+
+
 @pytest.mark.asyncio
 async def test_emit_collect_merges_in_hook_order_and_isolates_per_hook_state(tmp_path: Path) -> None:
     """Collectors should run concurrently but merge results in registry order."""
@@ -181,3 +181,36 @@ def test_hook_registry_scope_filtering_uses_decorator_agents_and_rooms(tmp_path:
     eligible = _eligible_hooks(registry, EVENT_MESSAGE_RECEIVED, _message_received_context(tmp_path))
 
     assert [hook.hook_name for hook in eligible] == ["matching"]
+
+
+def test_hook_registry_scope_index_returns_only_applicable_hooks_in_order() -> None:
+    """The precompiled scope index must agree with per-hook filtering and keep hook order."""
+
+    @hook(EVENT_MESSAGE_RECEIVED, name="global", priority=50)
+    async def global_hook(ctx: object) -> None:
+        del ctx
+
+    @hook(EVENT_MESSAGE_RECEIVED, name="code-anywhere", agents=["code"], priority=10)
+    async def code_hook(ctx: object) -> None:
+        del ctx
+
+    @hook(EVENT_MESSAGE_RECEIVED, name="code-in-ops", agents=["code"], rooms=["!ops:localhost"], priority=20)
+    async def code_ops_hook(ctx: object) -> None:
+        del ctx
+
+    @hook(EVENT_MESSAGE_RECEIVED, name="lobby", rooms=["!lobby:localhost", "!ops:localhost"], priority=30)
+    async def lobby_hook(ctx: object) -> None:
+        del ctx
+
+    registry = HookRegistry.from_plugins(
+        [_plugin("indexed-plugin", [global_hook, code_hook, code_ops_hook, lobby_hook])],
+    )
+
+    def names(agent_name: str | None, *room_ids: str) -> list[str]:
+        return [hook.hook_name for hook in registry.hooks_in_scope(EVENT_MESSAGE_RECEIVED, agent_name, room_ids)]
+
+    assert names("code", "!ops:localhost") == ["code-anywhere", "code-in-ops", "lobby", "global"]
+    assert names("code", "!lobby:localhost") == ["code-anywhere", "lobby", "global"]
+    assert names("research", "!ops:localhost") == ["lobby", "global"]
+    assert names(None) == ["global"]
+    assert registry.hooks_in_scope(EVENT_MESSAGE_ENRICH, "code", ()) == ()
@@ -0,0 +1,154 @@
+"""Tests for the content-addressed chunk embedding store used across knowledge refreshes."""
+
+from __future__ import annotations
+
+import sqlite3
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+from agno.knowledge.embedder.base import Embedder
+
+from mindroom.knowledge import chunk_embedding_store
+from mindroom.knowledge.chunk_embedding_store import ChunkEmbeddingStore
+from mindroom.knowledge.embedding_batch import BatchPrefetchEmbedder
+from mindroom.knowledge.manager import _CandidateProgress
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+class _CountingEmbedder(Embedder):
+    """Embedder that records every text it was asked to embed."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.requests: list[str] = []
+
+    def get_embedding(self, text: str) -> list[float]:
+        return self.get_embedding_and_usage(text)[0]
+
+    def get_embedding_and_usage(self, text: str) -> tuple[list[float], dict[str, Any] | None]:
+        self.requests.append(text)
+        return [float(len(text)), 0.5], None
+
+
+def _store(tmp_path: Path, signature: str = "openai/text-embedding-3-small") -> ChunkEmbeddingStore:
+    return ChunkEmbeddingStore(tmp_path / "chunks.sqlite3", embedder_signature=signature)
+
+
+def test_lookup_is_keyed_by_chunk_text_and_embedder(tmp_path: Path) -> None:
+    """A stored vector is found by its text, and only under the embedder that made it."""
+    store = _store(tmp_path)
+    store.store({"alpha": [1.0, 2.0], "beta": [3.0, 4.0]})
+
+    assert store.lookup(["alpha", "gamma", "alpha"]) == {"alpha": [1.0, 2.0]}
+    store.close()
+    assert _store(tmp_path).lookup(["beta"]) == {"beta": [3.0, 4.0]}, "vectors must survive a reopen"
+    assert _store(tmp_path, "ollama/nomic-embed-text").lookup(["alpha", "beta"]) == {}
+
+
+def test_forget_embedder_only_drops_its_own_rows(tmp_path: Path) -> None:
+    """A forced rebuild distrusts one embedder's vectors, not another's."""
+    store = _store(tmp_path)
+    other = _store(tmp_path, "ollama/nomic-embed-text")
+    store.store({"alpha": [1.0]})
+    other.store({"alpha": [2.0]})
+
+    store.forget_embedder()
+
+    assert store.lookup(["alpha"]) == {}
+    assert other.lookup(["alpha"]) == {"alpha": [2.0]}
+
+
+def test_prune_keeps_the_most_recently_used_rows(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Pruning bounds the store by the published corpus and evicts stale rows first."""
+    monkeypatch.setattr(chunk_embedding_store, "_MIN_RETAINED_ROWS", 2)
+    monkeypatch.setattr(chunk_embedding_store, "_RETAINED_ROWS_PER_PUBLISHED_CHUNK", 1)
+    clock = iter(range(100, 200))
+    monkeypatch.setattr(chunk_embedding_store, "time", SimpleNamespace(time=lambda: next(clock)))
+    store = _store(tmp_path)
+    store.store({"old": [1.0]})
+    store.store({"middle": [2.0]})
+    store.store({"new": [3.0]})
+    store.lookup(["old"])
+
+    assert store.prune(published_chunks=2) == 1
+
+    assert store.lookup(["old", "middle", "new"]) == {"old": [1.0], "new": [3.0]}
+
+
+def test_unusable_store_turns_itself_off(tmp_path: Path) -> None:
+    """A broken store costs embeddings, never a refresh."""
+    path = tmp_path / "chunks.sqlite3"
+    path.write_bytes(b"not a database" * 100)
+    store = ChunkEmbeddingStore(path, embedder_signature="openai/text-embedding-3-small")
+
+    store.store({"alpha": [1.0]})
+
+    assert store.lookup(["alpha"]) == {}
+    assert store.prune(published_chunks=0) == 0
+    assert path.read_bytes().startswith(b"not a database")
+
+
+def test_batch_adapter_serves_stored_chunks_and_reports_reuse(tmp_path: Path) -> None:
+    """Only chunks the store does not know reach the provider, and the split is counted."""
+    store = _store(tmp_path)
+    first = BatchPrefetchEmbedder(inner=_CountingEmbedder(), store=store)
+    assert first.embed_batch_into_cache(["kept", "edited"]) == 2
+    assert first.get_embedding("added late") == [10.0, 0.5]
+
+    inner = _CountingEmbedder()
+    second = BatchPrefetchEmbedder(inner=inner, store=store)
+    assert second.restore_stored(["kept", "rewritten"]) == 1
+    assert second.uncached(["kept", "rewritten"]) == [], "confirming the width embedded the new chunk"
+    assert second.get_embedding("kept") == [4.0, 0.5]
+    assert second.get_embedding("added late") == [10.0, 0.5], "per-file misses consult the store too"
+    assert inner.requests == ["rewritten"]
+
+    progress = _CandidateProgress(base_id="docs", total=1)
+    assert progress.chunk_reuse_ratio is None
+    progress.count_chunks(second)
+    assert (progress.chunks_reused, progress.chunks_embedded) == (2, 1)
+    assert progress.chunk_reuse_ratio == 2 / 3
+
+
+def test_stored_vector_of_another_width_is_embedded_again(tmp_path: Path) -> None:
+    """A row written under a different vector width must not mix into one collection."""
+    store = _store(tmp_path)
+    store.store({"wide": [1.0, 2.0, 3.0]})
+    inner = _CountingEmbedder()
+    adapter = BatchPrefetchEmbedder(inner=inner, store=store)
+    assert adapter.embed_batch_into_cache(["narrow"]) == 1
+
+    assert adapter.get_embedding("wide") == [4.0, 0.5]
+    assert inner.requests == ["narrow", "wide"]
+    with sqlite3.connect(tmp_path / "chunks.sqlite3") as connection:
+        (rows,) = connection.execute("SELECT COUNT(*) FROM chunk_embeddings").fetchone()
+    assert rows == 2, "the re-embedded vector replaced the stale row"
+
+
+def test_stale_stored_vector_never_sets_the_expected_width(tmp_path: Path) -> None:
+    """A stored vector read before any provider vector is checked against the provider's width, not trusted."""
+    store = _store(tmp_path)
+    store.store({"wide": [1.0, 2.0, 3.0], "stale": [1.0, 2.0, 3.0]})
+    inner = _CountingEmbedder()
+    adapter = BatchPrefetchEmbedder(inner=inner, store=store)
+
+    assert adapter.restore_stored(["wide", "fresh"]) == 0
+    assert adapter.uncached(["wide", "fresh"]) == ["wide"]
+    assert adapter.get_embedding("stale") == [5.0, 0.5]
+    assert inner.requests == ["fresh", "stale"]
+
+
+def test_configured_width_validates_stored_vectors_without_a_provider_request(tmp_path: Path) -> None:
+    """A width pinned by the embedder config lets stored vectors be reused before the provider answers."""
+    store = _store(tmp_path)
+    store.store({"kept": [1.0, 2.0], "stale": [1.0, 2.0, 3.0]})
+    inner = _CountingEmbedder()
+    adapter = BatchPrefetchEmbedder(inner=inner, store=store, configured_dimensions=2)
+
+    assert adapter.restore_stored(["kept", "stale"]) == 1
+    assert adapter.uncached(["kept", "stale"]) == ["stale"]
+    assert inner.requests == []
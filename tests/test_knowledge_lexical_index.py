@@ -0,0 +1,101 @@
+"""Tests for the BM25 lexical index published next to knowledge collections."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, cast
+
+import pytest
+from agno.knowledge.document import Document
+
+from mindroom.knowledge.lexical_index import (
+    LexicalIndex,
+    build_lexical_index,
+    delete_lexical_index,
+    lexical_index_path,
+)
+from mindroom.knowledge.utils import _MultiKnowledgeVectorDb
+from tests.bot_helpers import _SyncStubVectorDb
+from tests.knowledge_test_support import _VectorDb
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from agno.vectordb.chroma import ChromaDb
+
+_CHUNKS = {
+    "row-1": "Deployments run through the release pipeline every night.",
+    "row-2": "fetch_orders_v2 retries when the connection pool is exhausted.",
+    "row-3": "Error E4021 means the connection pool is exhausted; see TICKET-1234.",
+}
+
+
+@pytest.fixture
+def collection() -> Iterator[ChromaDb]:
+    """Return a fake collection holding the test chunks."""
+    _VectorDb.collections = {
+        "docs": [
+            {"id": chunk_id, "content": content, "embedding": [1.0], "metadata": {"source_path": f"{chunk_id}.md"}}
+            for chunk_id, content in _CHUNKS.items()
+        ],
+    }
+    yield cast("ChromaDb", _VectorDb(collection="docs"))
+    _VectorDb.collections = {}
+
+
+def test_build_indexes_every_stored_chunk_and_ranks_exact_identifiers(tmp_path: Path, collection: ChromaDb) -> None:
+    """Identifiers an embedder blurs are exact terms for the lexical index."""
+    assert build_lexical_index(collection, tmp_path) == 3
+    index = LexicalIndex(lexical_index_path(tmp_path, "docs"))
+
+    [error_hit] = index.search(query="what is E4021?", limit=1)
+    assert error_hit.id == "row-3"
+    assert error_hit.meta_data == {"source_path": "row-3.md"}
+    assert [document.id for document in index.search(query="fetch_orders_v2", limit=5)] == ["row-2"]
+    assert [document.id for document in index.search(query="ticket 1234", limit=5)] == ["row-3"]
+    assert index.search(query="?!", limit=5) == []
+    assert index.search(query="pipeline", limit=0) == []
+
+
+def test_rebuild_replaces_the_index_and_delete_removes_it(tmp_path: Path, collection: ChromaDb) -> None:
+    """Each build describes the collection as it is now, and deletion follows the collection."""
+    build_lexical_index(collection, tmp_path)
+    _VectorDb.collections["docs"] = _VectorDb.collections["docs"][:1]
+    build_lexical_index(collection, tmp_path)
+    path = lexical_index_path(tmp_path, "docs")
+
+    assert LexicalIndex(path).search(query="E4021", limit=5) == []
+    assert [item.name for item in path.parent.iterdir()] == [path.name]
+    delete_lexical_index(tmp_path, "docs")
+    assert not path.exists()
+
+
+def test_fused_search_promotes_lexical_matches_and_skips_filtered_queries(
+    tmp_path: Path,
+    collection: ChromaDb,
+) -> None:
+    """Chunks found by both rankings lead; metadata-filtered searches stay vector-only."""
+    build_lexical_index(collection, tmp_path)
+    vector_ranking = [Document(content=_CHUNKS["row-1"]), Document(content=_CHUNKS["row-3"])]
+    vector_db = _MultiKnowledgeVectorDb(
+        vector_dbs=[_SyncStubVectorDb(documents=vector_ranking)],
+        lexical_indexes=[LexicalIndex(lexical_index_path(tmp_path, "docs"))],
+    )
+
+    assert [document.content for document in vector_db.search(query="E4021", limit=2)] == [
+        _CHUNKS["row-3"],
+        _CHUNKS["row-1"],
+    ]
+    assert vector_db.search(query="E4021", limit=2, filters={"source_path": "row-1.md"}) == vector_ranking
+
+
+@pytest.mark.asyncio
+async def test_async_fused_search_falls_back_to_vectors_when_the_index_is_unreadable(tmp_path: Path) -> None:
+    """A missing or corrupt lexical index never fails a knowledge search."""
+    vector_ranking = [Document(content="vector only")]
+    vector_db = _MultiKnowledgeVectorDb(
+        vector_dbs=[_SyncStubVectorDb(documents=vector_ranking)],
+        lexical_indexes=[LexicalIndex(tmp_path / "missing.sqlite3")],
+    )
+
+    assert await vector_db.async_search(query="E4021", limit=3) == vector_ranking
@@ -62,6 +62,7 @@ from mindroom.knowledge.file_listing import (
 from mindroom.knowledge.git_source import GitKnowledgeSource, GitSyncResult
 from mindroom.knowledge.github_app_auth import GitHubAppTokenProvider
 from mindroom.knowledge.indexing_config import IndexingSettings
+from mindroom.knowledge.lexical_index import lexical_index_path
 from mindroom.knowledge.manager import KnowledgeManager, _knowledge_source_signature
 from mindroom.knowledge.redaction import (
     credential_free_repo_url,
@@ -77,6 +78,7 @@ from mindroom.knowledge.registry import (
     load_published_index_state,
     published_index_metadata_path,
     published_index_refresh_state,
+    published_index_storage_path,
     resolve_published_index_key,
     save_published_index_state,
 )
@@ -85,7 +87,7 @@ from mindroom.knowledge.watch import KnowledgeSourceWatcher
 from mindroom.memory_scope_ids import agent_scope_user_id
 from mindroom.runtime_resolution import resolve_agent_runtime
 from mindroom.tool_system.worker_routing import ToolExecutionIdentity, agent_workspace_root_path
-from tests.conftest import bind_runtime_paths, runtime_paths_for, test_runtime_paths
+from tests.conftest import bind_runtime_paths, revalidate_config, runtime_paths_for, test_runtime_paths
 from tests.knowledge_test_support import (
     _Client,
     _Collection,
@@ -409,6 +411,7 @@ def test_default_merged_search_budget_is_bounded_while_representing_sources_that
             for base_id in authored_base_ids
         },
     )
+    config = revalidate_config(config)
     runtime_paths = runtime_paths_for(config)
 
     def _published_index(base_id: str, **_kwargs: object) -> object:
@@ -3966,6 +3969,47 @@ async def test_successful_refreshes_keep_only_published_index(tmp_path: Path) ->
     ]
 
 
+@pytest.mark.asyncio
+async def test_hybrid_search_indexes_published_chunks_and_ranks_exact_identifiers_first(tmp_path: Path) -> None:
+    """Enabling hybrid search on an unchanged base adds its BM25 index without re-embedding."""
+    docs_path = tmp_path / "docs"
+    docs_path.mkdir()
+    (docs_path / "a.md").write_text("general notes about the deployment pipeline", encoding="utf-8")
+    (docs_path / "b.md").write_text("connection pool exhausted raises E4021", encoding="utf-8")
+    config = _config(tmp_path, bases={"docs": docs_path}, agent_bases=["docs"])
+    runtime_paths = runtime_paths_for(config)
+    await refresh_knowledge_binding("docs", config=config, runtime_paths=runtime_paths)
+    key = resolve_published_index_key("docs", config=config, runtime_paths=runtime_paths)
+    state = load_published_index_state(published_index_metadata_path(key))
+    assert state is not None
+    assert state.collection is not None
+    lexical_path = lexical_index_path(published_index_storage_path(key), state.collection)
+    assert not lexical_path.exists()
+    # The fake vector search ranks by storage order; put the identifier chunk last.
+    _VectorDb.collections[state.collection].sort(key=lambda item: "E4021" in str(item["content"]))
+
+    hybrid_config = _config(tmp_path, bases={"docs": docs_path}, agent_bases=["docs"], hybrid_search=True)
+    result = await refresh_knowledge_binding("docs", config=hybrid_config, runtime_paths=runtime_paths)
+
+    republished = load_published_index_state(published_index_metadata_path(key))
+    assert republished is not None
+    assert republished.collection == state.collection
+    assert result.indexed_count == state.indexed_count
+    assert lexical_path.is_file()
+    knowledge = resolve_agent_knowledge_access("helper", hybrid_config, runtime_paths).knowledge
+    assert knowledge is not None
+    assert [document.content for document in knowledge.search("E4021", max_results=2)] == [
+        "connection pool exhausted raises E4021",
+        "general notes about the deployment pipeline",
+    ]
+    plain_knowledge = resolve_agent_knowledge_access("helper", config, runtime_paths).knowledge
+    assert plain_knowledge is not None
+    assert [document.content for document in plain_knowledge.search("E4021", max_results=2)] == [
+        "general notes about the deployment pipeline",
+        "connection pool exhausted raises E4021",
+    ]
+
+
 @pytest.mark.asyncio
 async def test_refresh_rebuilds_malformed_metadata_without_serving_old_collection(tmp_path: Path) -> None:
     """Malformed metadata forces a fresh publish without serving the old collection."""
@@ -17,7 +17,7 @@ import json
 import os
 from dataclasses import dataclass, field, replace
 from pathlib import Path
-from threading import Event
+from threading import Event, Lock
 from typing import TYPE_CHECKING, Any, ClassVar, Protocol
 
 import pytest
@@ -112,6 +112,13 @@ def _next_record_id() -> str:
     return f"chunk-{next(_record_ids)}"
 
 
+#: Files are indexed on concurrent worker threads. Each write swaps or extends
+#: a collection's row list, so it is serialized the way Chroma serializes
+#: writes; otherwise one file's delete could drop rows another file has just
+#: written, and the wrong file would look unindexed.
+_store_write_lock = Lock()
+
+
 class _FakeCollection:
     def __init__(self, name: str) -> None:
         self._name = name
@@ -160,19 +167,21 @@ class _FakeCollection:
         if len(_FakeVectorDb.writes) > _FakeVectorDb.max_writes:
             message = "vector store refused the write"
             raise RuntimeError(message)
-        _FakeVectorDb.store.setdefault(self._name, []).extend(
-            _Record(identifier=identifier, content=document, embedding=list(embedding), metadata=dict(metadata))
-            for identifier, embedding, document, metadata in zip(ids, embeddings, documents, metadatas, strict=True)
-        )
+        with _store_write_lock:
+            _FakeVectorDb.store.setdefault(self._name, []).extend(
+                _Record(identifier=identifier, content=document, embedding=list(embedding), metadata=dict(metadata))
+                for identifier, embedding, document, metadata in zip(ids, embeddings, documents, metadatas, strict=True)
+            )
 
     def delete(self, *, where: dict[str, object]) -> None:
         validate_where_operands(where)
         key, condition = next(iter(where.items()))
-        _FakeVectorDb.store[self._name] = [
-            record
-            for record in _FakeVectorDb.store.get(self._name, [])
-            if not metadata_matches(record.metadata, key, condition)
-        ]
+        with _store_write_lock:
+            _FakeVectorDb.store[self._name] = [
+                record
+                for record in _FakeVectorDb.store.get(self._name, [])
+                if not metadata_matches(record.metadata, key, condition)
+            ]
 
 
 class _FakeClient:
@@ -266,7 +275,8 @@ class _FakeKnowledge:
         documents = (
             reader.read(source, name=source.name) if reader is not None else [Document(content=source.read_text())]
         )
-        records = _FakeVectorDb.store.setdefault(self.vector_db.collection_name, [])
+        with _store_write_lock:
+            _FakeVectorDb.store.setdefault(self.vector_db.collection_name, [])
         embedded: list[_Record] = []
         for document in documents:
             embedder = self.vector_db.embedder
@@ -280,17 +290,21 @@ class _FakeKnowledge:
                     metadata=dict(metadata),
                 ),
             )
-        records.extend(embedded)
+        with _store_write_lock:
+            # Appended to the current list, not the one seen before embedding:
+            # a concurrent delete replaces the list in the meantime.
+            _FakeVectorDb.store.setdefault(self.vector_db.collection_name, []).extend(embedded)
 
     def remove_vectors_by_metadata(self, metadata: dict[str, Any]) -> bool:
         assert self.vector_db is not None
-        records = _FakeVectorDb.store.get(self.vector_db.collection_name, [])
-        kept = [
-            record
-            for record in records
-            if not all(record.metadata.get(key) == value for key, value in metadata.items())
-        ]
-        _FakeVectorDb.store[self.vector_db.collection_name] = kept
+        with _store_write_lock:
+            records = _FakeVectorDb.store.get(self.vector_db.collection_name, [])
+            kept = [
+                record
+                for record in records
+                if not all(record.metadata.get(key) == value for key, value in metadata.items())
+            ]
+            _FakeVectorDb.store[self.vector_db.collection_name] = kept
         return len(kept) != len(records)
 
     def search(self, query: str, max_results: int | None = None) -> list[Document]:
@@ -1428,6 +1442,8 @@ async def test_completed_checkpoint_entry_without_vectors_is_requeued(
     embedder.embedded_texts.clear()
 
     assert (await _manager(config).reindex_all()).indexed_count == 1
+    # The file is indexed again. Its chunk is stored, but a fresh refresh has
+    # no confirmed vector width yet, so that one chunk is embedded to learn it.
     assert embedder.embedded_count("lost body") == 1
     assert embedder.embedded_count("kept body") == 0
     stored = sorted(record.metadata["source_path"] for record in _FakeVectorDb.store[checkpoint.collection])
@@ -1608,8 +1624,9 @@ async def test_scale_refresh_resumes_after_ninety_percent_and_stays_bounded(
 
     assert (await _manager(config).reindex_all()).indexed_count == file_count - completed_after_interrupt
 
-    remaining = file_count - completed_after_interrupt
-    assert len(embedder.embedded_texts) == remaining, "resume embeds only the outstanding files"
+    # The interrupted batch had already prefetched the outstanding files, so
+    # their chunks come from the chunk store after one width-confirming request.
+    assert len(embedder.embedded_texts) == 1, "resume re-embedded chunks the interrupted pass had stored"
     assert embedder.request_count < first_pass_requests / 5, "resume is far cheaper than a rebuild"
     # Exactly one collection survives: the candidate that became the published
     # index. Interrupted refreshes must not accumulate collections.
@@ -3180,6 +3197,32 @@ async def test_refresh_after_publish_reuses_vectors_for_unchanged_files(
     assert reused_ids <= published_ids, "copied chunks must keep their published ids"
 
 
+@pytest.mark.asyncio
+async def test_edited_file_only_embeds_the_chunks_that_changed(
+    tmp_path: Path,
+    embedder: _RecordingEmbedder,
+) -> None:
+    """A changed file re-reads every chunk but only embeds the ones whose text moved."""
+    docs_path = tmp_path / "docs"
+    docs_path.mkdir()
+    source = docs_path / "large.md"
+    source.write_text(_overlapping_body(500), encoding="utf-8")
+    config = _config(tmp_path, docs_path, chunk_size=1_000)
+
+    assert (await _manager(config).reindex_all()).indexed_count == 1
+    first_pass = set(embedder.embedded_texts)
+    assert len(first_pass) > 2, "the document did not split into several chunks"
+
+    source.write_text(_overlapping_body(500).replace("token0499", "TOKEN0499"), encoding="utf-8")
+    embedder.embedded_texts.clear()
+
+    assert (await _manager(config).reindex_all()).indexed_count == 1
+
+    assert embedder.embedded_texts, "the edited chunk was never embedded"
+    assert all("TOKEN0499" in text for text in embedder.embedded_texts), "unchanged chunks were embedded again"
+    assert not first_pass & set(embedder.embedded_texts)
+
+
 @pytest.mark.asyncio
 async def test_published_vector_reuse_leaves_the_published_collection_untouched(
     tmp_path: Path,
@@ -3209,7 +3252,11 @@ async def test_published_vector_reuse_requires_matching_indexing_settings(
     tmp_path: Path,
     embedder: _RecordingEmbedder,
 ) -> None:
-    """Settings pin the chunker and the embedder, so a change invalidates every vector."""
+    """Settings pin the chunker and the embedder, so a change invalidates every copied vector.
+
+    Chunks the new chunker still produces verbatim are served from the chunk
+    store, which is keyed by embedder and chunk text rather than by settings.
+    """
     docs_path = tmp_path / "docs"
     _write_corpus(docs_path, 3)
     config = _config(tmp_path, docs_path)
@@ -3222,7 +3269,7 @@ async def test_published_vector_reuse_requires_matching_indexing_settings(
     assert (await _manager(rechunked).reindex_all()).indexed_count == 3, (
         "vectors built under other settings were reused"
     )
-    assert embedder.embedded_count("content 0") == 1
+    assert len(embedder.embedded_texts) == 1, "only the width-confirming chunk reaches the provider"
 
 
 @pytest.mark.asyncio
@@ -3310,7 +3357,9 @@ async def test_published_vector_reuse_never_claims_a_path_the_published_index_ca
 
     assert (await _manager(config).reindex_all()).indexed_count == 1
 
-    assert embedder.embedded_count("content 2") == 1, "a path with no published rows was claimed as indexed"
+    # Re-indexed this run, so the path is claimed by rows written now; its one
+    # stored chunk is embedded again to confirm the vector width.
+    assert embedder.embedded_count("content 2") == 1
     state = _published_state(config, runtime_paths)
     assert state is not None
     assert state.collection is not None
@@ -489,6 +489,7 @@ def _backend(
     reconcile_pod_templates: bool = True,
     agent_vault: KubernetesAgentVaultConfig | None = None,
     config_snapshot: dict[str, object] | None = None,
+    idle_retain_max: int = 0,
 ) -> tuple[KubernetesWorkerBackend, _FakeAppsApi, _FakeCoreApi]:
     profile_config: dict[str, object] = {}
     if script_resource_profiles is not None:
@@ -524,6 +525,7 @@ def _backend(
         auth_secret_name=auth_secret_name,
         reconcile_pod_templates=reconcile_pod_templates,
         agent_vault=agent_vault,
+        idle_retain_max=idle_retain_max,
     )
     resolved_runtime_paths = runtime_paths or resolve_primary_runtime_paths(
         config_path=Path("config.yaml"),
@@ -3033,6 +3035,21 @@ def test_kubernetes_backend_cleanup_idle_deletes_service_but_keeps_deployment()
     assert handle.worker_id not in core_api.secrets
 
 
+def test_kubernetes_backend_cleanup_retains_most_recent_idle_worker() -> None:
+    """Retained idle workers stay scaled up past their idle timeout; older idle workers are scaled down."""
+    backend, apps_api, core_api = _backend(idle_timeout_seconds=5.0, idle_retain_max=1)
+    older = backend.ensure_worker(WorkerSpec(_TEST_SCOPED_WORKER_KEY_A), now=0.0)
+    newer = backend.ensure_worker(WorkerSpec(_TEST_SCOPED_WORKER_KEY_B), now=1.0)
+
+    cleaned = backend.cleanup_idle_workers(now=10.0)
+
+    assert [worker.worker_key for worker in cleaned] == [_TEST_SCOPED_WORKER_KEY_A]
+    assert apps_api.deployments[older.worker_id].spec.replicas == 0
+    assert apps_api.deployments[newer.worker_id].spec.replicas == 1
+    assert newer.worker_id in core_api.services
+    assert backend.claim_stats().cold_claims == 2
+
+
 def _wire_fake_apis(backend: KubernetesWorkerBackend, apps_api: _FakeAppsApi, core_api: _FakeCoreApi) -> None:
     backend._resources.apps_api = apps_api
     backend._resources.core_api = core_api
@@ -26,14 +26,18 @@ from mindroom.constants import (
 )
 from mindroom.interactive import parse_and_format_interactive
 from mindroom.matrix.large_messages import (
+    _CONTINUATION_INDICATOR,
     _MATRIX_EVENT_HARD_LIMIT,
     _NORMAL_MESSAGE_LIMIT,
     _SIDECAR_UPLOAD_FALLBACK_INDICATOR,
     _calculate_delivery_event_size,
     _calculate_event_size,
     _create_preview,
+    _DeliveryEventSizer,
     _is_edit_message,
     _oversized_nonterminal_streaming_edit_sent_at,
+    _PreviewSizeModel,
+    _serialized_content_bytes,
     prepare_large_message,
     should_send_oversized_nonterminal_streaming_edit,
 )
@@ -901,6 +905,70 @@ async def test_prepare_terminal_edit_rejects_irreducible_metadata_before_repeate
     assert calculate_size.call_count <= 3
 
 
+@pytest.mark.parametrize(
+    "text",
+    [
+        "plain ascii " * 40,
+        'quotes " and \\ backslashes\n\ttabs\x01controls\x7f' * 8,
+        "accents é, CJK 中文, astral 😀 and 🧪" * 8,
+    ],
+)
+def test_preview_size_model_matches_serialized_previews(text: str) -> None:
+    """The analytical model must agree byte-for-byte with building and escaping each preview."""
+    maximum = len(text.encode("utf-8")) + 8
+    model = _PreviewSizeModel(text, _CONTINUATION_INDICATOR, max_bytes=maximum)
+
+    for max_bytes in range(maximum + 1):
+        preview = _create_preview(text, max_bytes) if max_bytes > 0 else ""
+        assert model.escaped_preview(max_bytes) == (len(json.dumps(preview)) - 2, len(preview))
+
+
+@pytest.mark.parametrize("room_encrypted", [False, True])
+def test_delivery_sizer_predicts_size_from_content_bytes(room_encrypted: bool) -> None:
+    """Re-sizing from a byte count must match serializing the grown event."""
+    sizer = _DeliveryEventSizer(room_id="!room:server", room_encrypted=room_encrypted, device_id="DEVICE")
+    template: dict[str, object] = {
+        "msgtype": "m.text",
+        "body": "",
+        "m.relates_to": {"rel_type": "m.replace", "event_id": "$target"},
+        STREAM_STATUS_KEY: "completed",
+    }
+    size_for_content_bytes = sizer.content_bytes_sizer(template)
+    for body in ("", "short", "é" * 700, "x" * 40_000):
+        content = {**template, "body": body}
+        content_bytes = _serialized_content_bytes(template) + len(json.dumps(body)) - 2
+        assert size_for_content_bytes(content_bytes) == sizer(content)
+
+
+@pytest.mark.asyncio
+async def test_terminal_edit_fitting_serializes_a_bounded_number_of_events() -> None:
+    """Preview fitting probes the size model, not one full serialization per candidate limit."""
+    client = _UploadClient(nio.UploadResponse("mxc://server/fitted-final-edit"))
+    text = 'final answer with "quotes" and émojis 😀\n' * 2_000
+    metadata = "m" * 20_000
+    edit_content = {
+        "body": f"* {text}",
+        "m.new_content": {"body": text, "msgtype": "m.text", "io.mindroom.required_metadata": metadata},
+        "m.relates_to": {"rel_type": "m.replace", "event_id": "$target"},
+        "msgtype": "m.text",
+        "io.mindroom.required_metadata": metadata,
+    }
+
+    with patch(
+        "mindroom.matrix.large_messages._calculate_event_size",
+        wraps=_calculate_event_size,
+    ) as calculate_size:
+        result = await prepare_large_message(client, "!room:server", edit_content, room_encrypted=True)
+
+    assert _actual_encrypted_event_size(result, room_id="!room:server") <= _MATRIX_EVENT_HARD_LIMIT
+    inner_body = result["m.new_content"]["body"]
+    assert inner_body.endswith(_CONTINUATION_INDICATOR)
+    assert result["m.new_content"]["io.mindroom.long_text"]["preview_size"] == len(inner_body)
+    # Upfront checks plus one empty-preview sizing and one verification; a
+    # binary search would add a full serialization per probed limit.
+    assert calculate_size.call_count <= 8
+
+
 @pytest.mark.asyncio
 async def test_sidecar_locator_overflow_falls_back_without_repreparing() -> None:
     """An unexpectedly large MXC URI must not turn preparation into a retry loop."""
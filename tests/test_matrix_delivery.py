@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import ast
+import asyncio
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -12,10 +13,12 @@ import pytest
 from nio import crypto
 
 from mindroom.delivery_gateway import _matrix_delivery_failure_reason
+from mindroom.matrix import outbound_edits
 from mindroom.matrix.client_delivery import (
     DeliveredMatrixEvent,
     MatrixDeliveryFailure,
     MatrixDeliveryFailureKind,
+    MatrixEditSupersededError,
     build_edit_event_content,
     edit_message_outcome,
     edit_message_result,
@@ -23,7 +26,9 @@ from mindroom.matrix.client_delivery import (
     send_message_result,
     send_room_event_result,
 )
+from mindroom.matrix.edit_cadence import _EditCadenceController, edit_cadence_snapshots
 from mindroom.matrix.large_messages import _MATRIX_EVENT_HARD_LIMIT, _calculate_delivery_event_size
+from mindroom.matrix.outbound_edits import outbound_edit_snapshots
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -562,6 +567,205 @@ async def test_edit_message_outcome_success_returns_delivered_event() -> None:
     assert outcome.content_sent["m.relates_to"] == {"rel_type": "m.replace", "event_id": "$original"}
 
 
+@pytest.mark.asyncio
+async def test_edit_message_outcome_reports_round_trips_and_rate_limits_to_edit_cadence() -> None:
+    """Edits feed their homeserver's cadence controller, and a rate-limit refusal has its own kind."""
+    client = _mock_client()
+    client.homeserver = "https://matrix.example.org"
+
+    delivered = await edit_message_outcome(
+        client,
+        "!room:localhost",
+        "$original",
+        {"body": "updated", "msgtype": "m.text"},
+        "updated",
+    )
+    client.room_send.return_value = nio.RoomSendError(
+        message="Too Many Requests",
+        status_code="M_LIMIT_EXCEEDED",
+        room_id="!room:localhost",
+    )
+    rate_limited = await edit_message_outcome(
+        client,
+        "!room:localhost",
+        "$original",
+        {"body": "again", "msgtype": "m.text"},
+        "again",
+    )
+
+    assert isinstance(delivered, DeliveredMatrixEvent)
+    assert isinstance(rate_limited, MatrixDeliveryFailure)
+    assert rate_limited.kind is MatrixDeliveryFailureKind.RATE_LIMITED
+    [snapshot] = edit_cadence_snapshots()
+    assert snapshot.homeserver == "https://matrix.example.org"
+    assert (snapshot.edits, snapshot.rate_limited_edits, snapshot.inflight_edits) == (2, 1, 0)
+    assert snapshot.active_streams == 1
+    assert snapshot.smoothed_rtt_seconds is not None
+    assert snapshot.backoff_factor == 2.0
+
+
+def test_edit_cadence_forgets_finished_streams_without_pacing_reads() -> None:
+    """Edits alone prune messages that stopped streaming, even when no stream asks for a pace."""
+    now = 0.0
+    cadence = _EditCadenceController("https://matrix.example.org", clock=lambda: now)
+    for index in range(100):
+        cadence.edit_finished(cadence.edit_started(f"$finished{index}"), delivered=True)
+
+    now = 5.0
+    cadence.edit_finished(cadence.edit_started("$finished0"), delivered=True)
+    now = 11.0
+    cadence.edit_finished(cadence.edit_started("$live"), delivered=True)
+
+    assert list(cadence._last_edit_at_by_event_id) == ["$finished0", "$live"]
+
+
+@pytest.mark.asyncio
+async def test_edit_message_outcome_schedules_terminal_edits_first_and_supersedes_waiting_progress() -> None:
+    """Waiting edits of one room go out terminal-first, and a terminal edit replaces its event's waiting progress."""
+    client = _mock_client()
+    release = asyncio.Event()
+    sent_bodies: list[str] = []
+
+    async def room_send(room_id: str, message_type: str, content: dict[str, object], **_kwargs: object) -> object:
+        del message_type
+        sent_bodies.append(str(content["body"]))
+        if len(sent_bodies) <= 2:
+            await release.wait()
+        return nio.RoomSendResponse(event_id=f"$edit{len(sent_bodies)}", room_id=room_id)
+
+    client.room_send.side_effect = room_send
+
+    def edit(event_id: str, text: str, *, nonterminal: bool) -> asyncio.Task[object]:
+        return asyncio.create_task(
+            edit_message_outcome(
+                client,
+                "!room:localhost",
+                event_id,
+                {"body": text, "msgtype": "m.notice" if nonterminal else "m.text"},
+                text,
+                nonterminal=nonterminal,
+            ),
+        )
+
+    # Two progress edits fill the room's in-flight budget.
+    busy = [edit("$a", "a1", nonterminal=True), edit("$b", "b1", nonterminal=True)]
+    await asyncio.sleep(0)
+    stale = edit("$c", "c1", nonterminal=True)
+    other = edit("$e", "e1", nonterminal=True)
+    await asyncio.sleep(0)
+    terminal_c = edit("$c", "c-final", nonterminal=False)
+    terminal_d = edit("$d", "d-final", nonterminal=False)
+    await asyncio.sleep(0)
+    release.set()
+    outcomes = await asyncio.gather(*busy, stale, other, terminal_c, terminal_d)
+
+    superseded = outcomes[2]
+    assert isinstance(superseded, MatrixDeliveryFailure)
+    assert superseded.kind is MatrixDeliveryFailureKind.SUPERSEDED
+    assert all(isinstance(outcome, DeliveredMatrixEvent) for outcome in outcomes[3:])
+    assert sent_bodies == ["* a1", "* b1", "* c-final", "* d-final", "* e1"]
+    [snapshot] = outbound_edit_snapshots()
+    assert (snapshot.waiting_edits, snapshot.inflight_edits) == (0, 0)
+    assert (snapshot.sent_edits, snapshot.terminal_edits, snapshot.superseded_edits) == (5, 2, 1)
+    assert snapshot.queue_latency_p95_ms is not None
+
+
+@pytest.mark.asyncio
+async def test_edit_message_result_raises_for_a_superseded_progress_edit() -> None:
+    """A superseded progress edit is not a delivery failure, so it is not reported as ``None``."""
+    client = _mock_client()
+    release = asyncio.Event()
+
+    async def room_send(room_id: str, message_type: str, content: dict[str, object], **_kwargs: object) -> object:
+        del message_type, content
+        await release.wait()
+        return nio.RoomSendResponse(event_id="$edit", room_id=room_id)
+
+    client.room_send.side_effect = room_send
+    busy = [
+        asyncio.create_task(
+            edit_message_outcome(client, "!room:localhost", event_id, {"body": "x", "msgtype": "m.text"}, "x"),
+        )
+        for event_id in ("$a", "$b")
+    ]
+    await asyncio.sleep(0)
+    progress = asyncio.create_task(
+        edit_message_result(
+            client,
+            "!room:localhost",
+            "$stream",
+            {"body": "partial", "msgtype": "m.notice"},
+            "partial",
+            nonterminal=True,
+        ),
+    )
+    await asyncio.sleep(0)
+    terminal = asyncio.create_task(
+        edit_message_outcome(client, "!room:localhost", "$stream", {"body": "done", "msgtype": "m.text"}, "done"),
+    )
+    await asyncio.sleep(0)
+    release.set()
+
+    with pytest.raises(MatrixEditSupersededError):
+        await progress
+    await asyncio.gather(*busy, terminal)
+
+
+@pytest.mark.asyncio
+async def test_outbound_edit_schedule_keeps_only_recent_idle_rooms(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Rooms whose edits have finished are retired oldest-first past the retention bound."""
+    monkeypatch.setattr(outbound_edits, "_IDLE_ROOM_RETENTION", 2)
+    client = _mock_client()
+    room_ids = ("!one:localhost", "!two:localhost", "!three:localhost")
+    client.rooms = {room_id: MagicMock(encrypted=False) for room_id in room_ids}
+
+    for room_id in room_ids:
+        outcome = await edit_message_outcome(client, room_id, "$original", {"body": "x", "msgtype": "m.text"}, "x")
+        assert isinstance(outcome, DeliveredMatrixEvent)
+    outbound_edits.record_coalesced_edits("!two:localhost", 3)
+
+    snapshots = {snapshot.room_id: snapshot for snapshot in outbound_edit_snapshots()}
+    assert set(snapshots) == {"!two:localhost", "!three:localhost"}
+    assert snapshots["!two:localhost"].coalesced_edits == 3
+
+
+@pytest.mark.asyncio
+async def test_edit_message_outcome_never_sends_two_edits_of_one_event_at_once() -> None:
+    """A terminal edit waits for the in-flight progress edit of the same event."""
+    client = _mock_client()
+    release = asyncio.Event()
+    sent_bodies: list[str] = []
+
+    async def room_send(room_id: str, message_type: str, content: dict[str, object], **_kwargs: object) -> object:
+        del message_type
+        sent_bodies.append(str(content["body"]))
+        if len(sent_bodies) == 1:
+            await release.wait()
+        return nio.RoomSendResponse(event_id="$edit", room_id=room_id)
+
+    client.room_send.side_effect = room_send
+    progress = asyncio.create_task(
+        edit_message_outcome(
+            client,
+            "!room:localhost",
+            "$stream",
+            {"body": "partial", "msgtype": "m.notice"},
+            "partial",
+            nonterminal=True,
+        ),
+    )
+    await asyncio.sleep(0)
+    terminal = asyncio.create_task(
+        edit_message_outcome(client, "!room:localhost", "$stream", {"body": "done", "msgtype": "m.text"}, "done"),
+    )
+    await asyncio.sleep(0)
+    assert sent_bodies == ["* partial"]
+
+    release.set()
+    await asyncio.gather(progress, terminal)
+    assert sent_bodies == ["* partial", "* done"]
+
+
 def test_gateway_failure_vocabulary_covers_every_failure_kind() -> None:
     """The gateway translation maps every typed failure kind and never guesses from None."""
     reasons = {
@@ -19,6 +19,7 @@ from unittest.mock import patch
 import mcp.types as mcp_types
 import pytest
 from agno.models.openai import OpenAIChat
+from agno.tools.function import ToolResult
 from authlib.integrations.base_client.errors import OAuthError
 from mcp.types import CallToolResult, Implementation, ListToolsResult, Tool, ToolListChangedNotification
 
@@ -34,7 +35,7 @@ from mindroom.credentials import (
     scoped_credentials_path,
 )
 from mindroom.custom_tools.dynamic_tools import DynamicToolsToolkit
-from mindroom.mcp.config import MCPServerConfig
+from mindroom.mcp.config import MCPResultCacheConfig, MCPServerConfig
 from mindroom.mcp.errors import (
     MCPConnectionError,
     MCPProtocolError,
@@ -48,6 +49,7 @@ from mindroom.mcp.manager import (
     _MCPAuthorizationChangedError,
     _MCPConfigurationChangedError,
 )
+from mindroom.mcp.result_cache import MCPToolResultCache, canonical_tool_arguments
 from mindroom.mcp.toolkit import MindRoomMCPToolkit, bind_mcp_server_manager
 from mindroom.mcp.transports import _MCPTransportHandle
 from mindroom.mcp.types import MCPServerState
@@ -73,8 +75,6 @@ if TYPE_CHECKING:
     from datetime import timedelta
     from pathlib import Path
 
-    from agno.tools.function import ToolResult
-
     from mindroom.constants import RuntimePaths
     from mindroom.mcp.manager import _MCPAuthorizationLease
     from mindroom.mcp.types import MCPServerCatalog
@@ -566,6 +566,93 @@ async def test_mcp_manager_syncs_catalog_and_calls_tool(monkeypatch: pytest.Monk
     assert result.content == "pong"
 
 
+@pytest.mark.asyncio
+async def test_mcp_manager_restores_cached_catalog_and_revalidates_in_background(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """A restart publishes the persisted catalog at once and picks up live changes afterwards."""
+    _patch_manager(monkeypatch)
+    runtime_paths = _runtime_paths(tmp_path)
+    config = _ConfigStub({"demo": MCPServerConfig(transport="stdio", command="npx")})
+    _FakeClientSession.tool_list = [_tool("echo")]
+    first_boot = MCPServerManager(runtime_paths)
+    assert await first_boot.sync_servers(config) == {"demo"}
+    await first_boot.shutdown()
+
+    changed_servers: list[str] = []
+
+    async def record_change(server_id: str) -> None:
+        changed_servers.append(server_id)
+
+    _FakeClientSession.tool_list = [_tool("echo"), _tool("ping")]
+    _FakeClientSession.initialize_delay_seconds = 0.05
+    _FakeClientSession.planned_tool_results = [
+        CallToolResult(content=[mcp_types.TextContent(type="text", text="pong")]),
+    ]
+    second_boot = MCPServerManager(runtime_paths, on_catalog_change=record_change)
+    try:
+        sessions_before = len(_FakeClientSession.sessions)
+        assert await second_boot.sync_servers(config) == {"demo"}
+        assert not second_boot._states["demo"].connected
+        assert [tool.remote_name for tool in second_boot.get_catalog("demo").tools] == ["echo"]
+        assert second_boot.failed_server_ids() == set()
+
+        result = await second_boot.call_tool("demo", "echo", {"value": "ping"})
+
+        assert result.content == "pong"
+        assert len(_FakeClientSession.sessions) == sessions_before + 1
+        assert [tool.remote_name for tool in second_boot.get_catalog("demo").tools] == ["echo", "ping"]
+        assert changed_servers == ["demo"]
+    finally:
+        await second_boot.shutdown()
+
+    persisted = json.loads((tmp_path / "mcp" / "catalog_cache.json").read_text(encoding="utf-8"))
+    assert [tool["remote_name"] for tool in persisted["servers"]["demo"]["catalog"]["tools"]] == ["echo", "ping"]
+
+
+@pytest.mark.asyncio
+async def test_mcp_manager_ignores_cached_catalog_after_config_change_or_failure(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Only an unchanged server config reuses its catalog, and failed discovery drops it."""
+    _patch_manager(monkeypatch)
+    runtime_paths = _runtime_paths(tmp_path)
+    _FakeClientSession.tool_list = [_tool("echo")]
+    first_boot = MCPServerManager(runtime_paths)
+    await first_boot.sync_servers(_ConfigStub({"demo": MCPServerConfig(transport="stdio", command="npx")}))
+    await first_boot.shutdown()
+
+    changed_config = _ConfigStub({"demo": MCPServerConfig(transport="stdio", command="npx", args=["--v2"])})
+    _FakeClientSession.tool_list = [_tool("other")]
+    second_boot = MCPServerManager(runtime_paths)
+    try:
+        await second_boot.sync_servers(changed_config)
+        assert [tool.remote_name for tool in second_boot.get_catalog("demo").tools] == ["other"]
+        assert second_boot._states["demo"].connected
+    finally:
+        await second_boot.shutdown()
+
+    async def fail_discovery(state: MCPServerState, **_kwargs: object) -> MCPServerCatalog:
+        raise MCPConnectionError(state.server_id, "server down")
+
+    third_boot = MCPServerManager(runtime_paths)
+    monkeypatch.setattr(third_boot, "_connect_and_discover", fail_discovery)
+    try:
+        await third_boot.sync_servers(changed_config)
+        assert third_boot.failed_server_ids() == set()
+        revalidation = third_boot._states["demo"].refresh_task
+        assert revalidation is not None
+        await asyncio.wait({revalidation})
+        assert third_boot.failed_server_ids() == {"demo"}
+    finally:
+        await third_boot.shutdown()
+
+    persisted = json.loads((tmp_path / "mcp" / "catalog_cache.json").read_text(encoding="utf-8"))
+    assert "demo" not in persisted["servers"]
+
+
 @pytest.mark.asyncio
 async def test_mcp_manager_enforces_call_filters_before_remote_dispatch(
     monkeypatch: pytest.MonkeyPatch,
@@ -5262,3 +5349,131 @@ async def test_mcp_manager_disconnect_cancels_owner_task_when_close_event_missin
     assert state.session_close_event is None
     assert state.session is None
     assert state.connected is False
+
+
+def _annotated_tool(name: str, annotations: mcp_types.ToolAnnotations) -> Tool:
+    return Tool(
+        name=name,
+        description=f"{name} tool",
+        inputSchema={"type": "object", "properties": {}},
+        annotations=annotations,
+    )
+
+
+@pytest.mark.asyncio
+async def test_mcp_manager_result_cache_reuses_only_read_only_results(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Read-only tools serve repeated identical calls from the cache; idempotent ones still reach the server."""
+    _patch_manager(monkeypatch)
+    _FakeClientSession.tool_list = [
+        _annotated_tool("lookup", mcp_types.ToolAnnotations(readOnlyHint=True)),
+        _annotated_tool("upsert", mcp_types.ToolAnnotations(readOnlyHint=False, idempotentHint=True)),
+        _tool("write"),
+    ]
+    _FakeClientSession.planned_tool_results = [
+        CallToolResult(content=[mcp_types.TextContent(type="text", text="first")]),
+        CallToolResult(content=[mcp_types.TextContent(type="text", text="other")]),
+        CallToolResult(content=[mcp_types.TextContent(type="text", text="upserted")]),
+        CallToolResult(content=[mcp_types.TextContent(type="text", text="upserted again")]),
+        CallToolResult(content=[mcp_types.TextContent(type="text", text="written")]),
+        CallToolResult(content=[mcp_types.TextContent(type="text", text="written again")]),
+    ]
+    manager = MCPServerManager(_runtime_paths(tmp_path))
+    server_config = MCPServerConfig.model_validate(
+        {"transport": "stdio", "command": "npx", "result_cache": {"ttl_seconds": 30}},
+    )
+    await manager.sync_servers(_ConfigStub({"demo": server_config}))
+
+    first = await manager.call_tool("demo", "lookup", {"a": 1, "b": [1, 2]})
+    repeated = await manager.call_tool("demo", "lookup", {"b": [1, 2], "a": 1})
+    other = await manager.call_tool("demo", "lookup", {"a": 2})
+    upserted = await manager.call_tool("demo", "upsert", {"key": "k"})
+    upserted_again = await manager.call_tool("demo", "upsert", {"key": "k"})
+    written = await manager.call_tool("demo", "write", {})
+    written_again = await manager.call_tool("demo", "write", {})
+
+    assert (first.content, repeated.content, other.content) == ("first", "first", "other")
+    assert (upserted.content, upserted_again.content) == ("upserted", "upserted again")
+    assert (written.content, written_again.content) == ("written", "written again")
+    assert _FakeClientSession.call_tool_invocation_count == 6
+    assert manager.result_cache_stats() == {"demo": {"hits": 1, "misses": 2, "entries": 2}}
+
+
+@pytest.mark.asyncio
+async def test_mcp_manager_result_cache_hit_does_not_wait_for_a_call_slot(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """A cached result is served while every concurrency slot is held by a running call."""
+    _patch_manager(monkeypatch)
+    _FakeClientSession.tool_list = [_annotated_tool("lookup", mcp_types.ToolAnnotations(readOnlyHint=True))]
+    _FakeClientSession.planned_tool_results = [
+        CallToolResult(content=[mcp_types.TextContent(type="text", text="first")]),
+    ]
+    manager = MCPServerManager(_runtime_paths(tmp_path))
+    server_config = MCPServerConfig.model_validate({"transport": "stdio", "command": "npx", "result_cache": {}})
+    await manager.sync_servers(_ConfigStub({"demo": server_config}))
+    assert (await manager.call_tool("demo", "lookup", {})).content == "first"
+
+    async with manager._states["demo"].semaphore:
+        cached = await asyncio.wait_for(manager.call_tool("demo", "lookup", {}), timeout=1)
+
+    assert cached.content == "first"
+    assert _FakeClientSession.call_tool_invocation_count == 1
+
+
+@pytest.mark.asyncio
+async def test_mcp_manager_result_cache_honours_config_ttl_and_catalog_refresh(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Explicitly cached tools expire by TTL and are dropped when the catalog is republished."""
+    _patch_manager(monkeypatch)
+    now = 1000.0
+    _FakeClientSession.tool_list = [_tool("search")]
+    _FakeClientSession.planned_tool_results = [
+        CallToolResult(content=[mcp_types.TextContent(type="text", text=f"result-{index}")]) for index in range(3)
+    ]
+    manager = MCPServerManager(_runtime_paths(tmp_path))
+    manager._result_cache._clock = lambda: now
+    server_config = MCPServerConfig.model_validate(
+        {
+            "transport": "stdio",
+            "command": "npx",
+            "result_cache": {"ttl_seconds": 10, "use_annotations": False, "tools": ["search"]},
+        },
+    )
+    await manager.sync_servers(_ConfigStub({"demo": server_config}))
+
+    assert (await manager.call_tool("demo", "search", {"q": "x"})).content == "result-0"
+    assert (await manager.call_tool("demo", "search", {"q": "x"})).content == "result-0"
+    now += 11
+    assert (await manager.call_tool("demo", "search", {"q": "x"})).content == "result-1"
+
+    await manager._refresh_server_catalog(manager._states["demo"], notify=False)
+    assert manager.result_cache_stats()["demo"]["entries"] == 0
+    assert (await manager.call_tool("demo", "search", {"q": "x"})).content == "result-2"
+
+
+def test_mcp_result_cache_evicts_least_recently_used_entries() -> None:
+    """The per-server size limit evicts the least recently used result first."""
+    cache = MCPToolResultCache(clock=lambda: 0.0)
+    cache_config = MCPResultCacheConfig(max_entries=2)
+    for name in ("a", "b", "c"):
+        if name == "c":
+            assert cache.get("demo", config_generation=1, remote_tool_name="a", arguments="{}", oauth_scope=None)
+        cache.put(
+            "demo",
+            cache_config,
+            config_generation=1,
+            remote_tool_name=name,
+            arguments="{}",
+            oauth_scope=None,
+            result=ToolResult(content=name),
+        )
+
+    assert cache.get("demo", config_generation=1, remote_tool_name="b", arguments="{}", oauth_scope=None) is None
+    assert cache.stats()["demo"].entries == 2
+    assert canonical_tool_arguments({"value": object()}) is None
@@ -30,7 +30,7 @@ from mindroom.tool_system.worker_routing import (
     resolve_worker_key,
     tool_execution_identity,
 )
-from tests.conftest import bind_runtime_paths, runtime_paths_for
+from tests.conftest import bind_runtime_paths, revalidate_config, runtime_paths_for
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -985,6 +985,7 @@ async def test_worker_removes_stale_private_entries_when_agent_becomes_shared(tm
         execution_identity=alice_identity,
     )
     config.agents["mind"].private = None
+    config = revalidate_config(config)
 
     worker = MemoryAutoFlushWorker(
         storage_path=tmp_path,
@@ -0,0 +1,335 @@
+"""Tests for OpenAI-compatible batch completions."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from mindroom.api import openai_compat
+from mindroom.api.main import initialize_api_app
+from mindroom.api.openai_batches import (
+    OpenAIBatch,
+    OpenAIBatchInputError,
+    OpenAIBatchRegistry,
+    OpenAIBatchRequest,
+    _ModelRateLimiter,
+    parse_openai_batch_input,
+)
+from mindroom.config.agent import AgentConfig
+from mindroom.config.main import Config
+from mindroom.config.models import ModelConfig, RouterConfig
+from mindroom.constants import resolve_runtime_paths
+from tests.identity_helpers import persist_entity_accounts
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+def _jsonl(*lines: dict[str, object]) -> bytes:
+    return "".join(json.dumps(line) + "\n" for line in lines).encode()
+
+
+def _chat_line(custom_id: str, *, model: str = "general", **body: object) -> dict[str, object]:
+    return {
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": {"model": model, "messages": [{"role": "user", "content": f"prompt {custom_id}"}], **body},
+    }
+
+
+@pytest.fixture
+def batch_client(tmp_path: Path) -> Iterator[TestClient]:
+    """Create a /v1 test client whose batches write under a temporary storage root."""
+    config = Config(
+        agents={"general": AgentConfig(display_name="GeneralAgent", role="General-purpose assistant", rooms=[])},
+        models={"default": ModelConfig(provider="ollama", id="test-model")},
+        router=RouterConfig(model="default"),
+    )
+    runtime_paths = resolve_runtime_paths(
+        config_path=tmp_path / "config.yaml",
+        storage_path=tmp_path / "storage",
+        process_env={"OPENAI_COMPAT_API_KEYS": "key-a,key-b", "OPENAI_COMPAT_BATCH_CONCURRENCY": "2"},
+    )
+    persist_entity_accounts(config, runtime_paths)
+    app = FastAPI()
+    app.include_router(openai_compat.router)
+    initialize_api_app(app, runtime_paths)
+    with (
+        patch("mindroom.api.openai_compat._load_config", return_value=(config, runtime_paths)),
+        TestClient(app, headers={"Authorization": "Bearer key-a"}) as client,
+    ):
+        yield client
+
+
+def _wait_for_batch(client: TestClient, batch_id: str) -> dict[str, object]:
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        batch = client.get(f"/v1/batches/{batch_id}").json()
+        if batch["status"] not in {"in_progress", "cancelling"}:
+            return batch
+        time.sleep(0.01)
+    pytest.fail(f"batch {batch_id} did not finish")
+
+
+def test_parse_openai_batch_input_rejects_invalid_lines() -> None:
+    """Malformed uploads fail as a whole with the offending line number."""
+    assert [request.custom_id for request in parse_openai_batch_input(_jsonl(_chat_line("a")), max_requests=5)] == [
+        "a",
+    ]
+    with pytest.raises(OpenAIBatchInputError, match="Line 2 repeats custom_id"):
+        parse_openai_batch_input(_jsonl(_chat_line("a"), _chat_line("a")), max_requests=5)
+    with pytest.raises(OpenAIBatchInputError, match="Line 1 must be a POST"):
+        parse_openai_batch_input(_jsonl({**_chat_line("a"), "url": "/v1/embeddings"}), max_requests=5)
+    with pytest.raises(OpenAIBatchInputError, match="Line 1 is not valid JSON"):
+        parse_openai_batch_input(b"{nope\n", max_requests=5)
+    with pytest.raises(OpenAIBatchInputError, match="limit of 1 requests"):
+        parse_openai_batch_input(_jsonl(_chat_line("a"), _chat_line("b")), max_requests=1)
+    with pytest.raises(OpenAIBatchInputError, match="no requests"):
+        parse_openai_batch_input(b"\n\n", max_requests=5)
+
+
+@pytest.mark.asyncio
+async def test_model_rate_limiter_spaces_starts_per_model() -> None:
+    """Each model gets its own request spacing; other models are not delayed."""
+    now = 100.0
+    limiter = _ModelRateLimiter(60, clock=lambda: now)
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    with patch("mindroom.api.openai_batches.asyncio.sleep", side_effect=fake_sleep):
+        await limiter.wait("general")
+        await limiter.wait("general")
+        await limiter.wait("general")
+        await limiter.wait("code")
+
+    assert sleeps == [1.0, 2.0]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_batches_share_one_rate_limit_per_model(tmp_path: Path) -> None:
+    """A second batch for the same model queues behind the first instead of getting its own budget."""
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    async def execute(_request: OpenAIBatchRequest) -> tuple[int, dict[str, object]]:
+        return 200, {"ok": True}
+
+    registry = OpenAIBatchRegistry()
+    batches = [
+        OpenAIBatch(
+            owner="noauth",
+            requests=[OpenAIBatchRequest(custom_id="a", body={"model": "general"})],
+            output_dir=tmp_path,
+        )
+        for _ in range(2)
+    ]
+    with patch("mindroom.api.openai_batches.asyncio.sleep", side_effect=fake_sleep):
+        for batch in batches:
+            registry.start(batch, execute, concurrency=1, requests_per_minute=60)
+        await asyncio.gather(*(batch.task for batch in batches if batch.task is not None))
+
+    assert len(sleeps) == 1
+    assert 0.9 < sleeps[0] <= 1.0
+
+
+@pytest.mark.asyncio
+async def test_batch_runs_with_bounded_concurrency(tmp_path: Path) -> None:
+    """No more than the configured number of requests run at once."""
+    running = 0
+    peak = 0
+
+    async def execute(_request: OpenAIBatchRequest) -> tuple[int, dict[str, object]]:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return 200, {"ok": True}
+
+    registry = OpenAIBatchRegistry()
+    requests = [OpenAIBatchRequest(custom_id=str(index), body={"model": "general"}) for index in range(10)]
+    batch = OpenAIBatch(owner="noauth", requests=requests, output_dir=tmp_path)
+    registry.start(batch, execute, concurrency=3, requests_per_minute=0)
+    assert batch.task is not None
+    await batch.task
+
+    assert peak == 3
+    assert batch.status == "completed"
+    assert batch.as_dict()["request_counts"] == {"total": 10, "completed": 10, "failed": 0}
+    assert len(batch.output_path.read_text(encoding="utf-8").splitlines()) == 10
+
+
+def test_batch_endpoint_runs_requests_and_reports_progress(batch_client: TestClient) -> None:
+    """A batch runs each line through the completion path and writes one output line per request."""
+    upload = _jsonl(
+        _chat_line("first"),
+        _chat_line("second"),
+        _chat_line("streamed", stream=True),
+        _chat_line("unknown", model="missing-agent"),
+    )
+    with patch("mindroom.api.openai_compat.ai_response", new_callable=AsyncMock) as mock_ai:
+        mock_ai.return_value = "Batch answer"
+        created = batch_client.post("/v1/batches", content=upload)
+        assert created.status_code == 200
+        assert created.json()["object"] == "batch"
+        batch = _wait_for_batch(batch_client, created.json()["id"])
+
+    assert batch["status"] == "completed"
+    assert batch["request_counts"] == {"total": 4, "completed": 2, "failed": 2}
+    session_ids = {call.args[0].session_id for call in mock_ai.call_args_list}
+    assert len(session_ids) == 2
+
+    output = batch_client.get(f"/v1/batches/{batch['id']}/output")
+    assert output.status_code == 200
+    results = {line["custom_id"]: line["response"] for line in map(json.loads, output.text.splitlines())}
+    assert results["first"]["status_code"] == 200
+    assert results["first"]["body"]["choices"][0]["message"]["content"] == "Batch answer"
+    assert results["streamed"]["status_code"] == 400
+    assert results["streamed"]["body"]["error"]["param"] == "stream"
+    assert results["unknown"]["status_code"] == 404
+
+
+def test_batch_endpoint_rejects_invalid_upload(batch_client: TestClient) -> None:
+    """An invalid upload is rejected before any request runs."""
+    response = batch_client.post("/v1/batches", content=b'{"custom_id": "a"}\n')
+
+    assert response.status_code == 400
+    assert response.json()["error"]["message"] == "Line 1 needs an object body"
+
+
+def test_batch_is_only_visible_to_its_api_key(batch_client: TestClient) -> None:
+    """Batches created with one API key are not visible with another."""
+    with patch("mindroom.api.openai_compat.ai_response", new_callable=AsyncMock, return_value="ok"):
+        created = batch_client.post("/v1/batches", content=_jsonl(_chat_line("a"))).json()
+        _wait_for_batch(batch_client, created["id"])
+
+    other_key = {"Authorization": "Bearer key-b"}
+    assert batch_client.get(f"/v1/batches/{created['id']}", headers=other_key).status_code == 404
+    assert batch_client.get(f"/v1/batches/{created['id']}/output", headers=other_key).status_code == 404
+    assert batch_client.get(f"/v1/batches/{created['id']}", headers={"Authorization": ""}).status_code == 401
+
+
+def test_cancel_batch_stops_pending_requests(batch_client: TestClient) -> None:
+    """Cancelling keeps finished results and stops the rest."""
+
+    async def slow_response(*_args: object, **_kwargs: object) -> str:
+        await asyncio.sleep(0.2)
+        return "late"
+
+    with patch("mindroom.api.openai_compat.ai_response", side_effect=slow_response):
+        created = batch_client.post("/v1/batches", content=_jsonl(*(_chat_line(str(i)) for i in range(4)))).json()
+        cancelled = batch_client.post(f"/v1/batches/{created['id']}/cancel")
+        assert cancelled.status_code == 200
+        assert cancelled.json()["status"] == "cancelling"
+        batch = _wait_for_batch(batch_client, created["id"])
+
+    assert batch["status"] == "cancelled"
+    assert batch["cancelled_at"] is not None
+    counts = batch["request_counts"]
+    assert counts["completed"] + counts["failed"] <= 2, "only lines already running may finish"
+    output = batch_client.get(f"/v1/batches/{created['id']}/output").text
+    assert len(output.splitlines()) == counts["completed"] + counts["failed"]
+
+
+@pytest.mark.asyncio
+async def test_cancel_lets_running_requests_finish(tmp_path: Path) -> None:
+    """Requests already running when a batch is cancelled finish and are written; no new one starts."""
+    started: list[str] = []
+    both_started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def execute(request: OpenAIBatchRequest) -> tuple[int, dict[str, object]]:
+        started.append(request.custom_id)
+        if len(started) == 2:
+            both_started.set()
+        await release.wait()
+        return 200, {"ok": True}
+
+    registry = OpenAIBatchRegistry()
+    requests = [OpenAIBatchRequest(custom_id=str(index), body={"model": "general"}) for index in range(5)]
+    batch = OpenAIBatch(owner="noauth", requests=requests, output_dir=tmp_path)
+    registry.start(batch, execute, concurrency=2, requests_per_minute=0)
+    assert batch.task is not None
+    await both_started.wait()
+
+    registry.cancel(batch)
+    assert batch.status == "cancelling"
+    release.set()
+    await batch.task
+
+    assert started == ["0", "1"]
+    assert batch.status == "cancelled"
+    assert batch.as_dict()["request_counts"] == {"total": 5, "completed": 2, "failed": 0}
+    assert [json.loads(line)["custom_id"] for line in batch.output_path.read_text(encoding="utf-8").splitlines()] == [
+        "0",
+        "1",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failing_worker_stops_its_siblings_before_the_output_closes(tmp_path: Path) -> None:
+    """A worker that fails outside its request cancels the others instead of leaving them writing."""
+    started: list[str] = []
+    sibling_started = asyncio.Event()
+
+    async def execute(request: OpenAIBatchRequest) -> tuple[int, dict[str, object]]:
+        started.append(request.custom_id)
+        if request.custom_id == "0":
+            await sibling_started.wait()
+            return 200, {"unserializable": object()}
+        sibling_started.set()
+        await asyncio.sleep(10)
+        return 200, {"ok": True}
+
+    registry = OpenAIBatchRegistry()
+    requests = [OpenAIBatchRequest(custom_id=str(index), body={"model": "general"}) for index in range(4)]
+    batch = OpenAIBatch(owner="noauth", requests=requests, output_dir=tmp_path)
+    registry.start(batch, execute, concurrency=2, requests_per_minute=0)
+    assert batch.task is not None
+    await asyncio.wait_for(batch.task, timeout=5)
+
+    assert batch.status == "failed"
+    assert started == ["0", "1"], "the sleeping sibling was cancelled instead of taking more lines"
+    assert batch.as_dict()["request_counts"] == {"total": 4, "completed": 0, "failed": 0}
+    assert batch.output_path.read_text(encoding="utf-8") == ""
+
+
+@pytest.mark.asyncio
+async def test_evicted_batches_delete_their_output(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Dropping a finished batch from the registry also removes its output file."""
+    monkeypatch.setattr("mindroom.api.openai_batches._FINISHED_BATCH_RETENTION", 1)
+
+    async def execute(_request: OpenAIBatchRequest) -> tuple[int, dict[str, object]]:
+        return 200, {"ok": True}
+
+    registry = OpenAIBatchRegistry()
+    batches = []
+    for _ in range(2):
+        batch = OpenAIBatch(
+            owner="noauth",
+            requests=[OpenAIBatchRequest(custom_id="a", body={"model": "general"})],
+            output_dir=tmp_path,
+        )
+        registry.start(batch, execute, concurrency=1, requests_per_minute=0)
+        assert batch.task is not None
+        await batch.task
+        batches.append(batch)
+
+    older, newer = batches
+    assert registry.get(older.id, owner="noauth") is None
+    assert not older.output_path.exists()
+    assert registry.get(newer.id, owner="noauth") is newer
+    assert newer.output_path.exists()
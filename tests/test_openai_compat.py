@@ -44,6 +44,7 @@ from mindroom.api.openai_compat import (
     _is_error_response,
 )
 from mindroom.api.openai_request_parsing import _extract_content_text
+from mindroom.api.openai_session_locks import OpenAISessionLockTable
 from mindroom.config.agent import AgentConfig, AgentPrivateConfig, TeamConfig
 from mindroom.config.main import Config
 from mindroom.config.models import ModelConfig, RouterConfig, ToolConfigEntry
@@ -1044,6 +1045,30 @@ class TestChatCompletions:
 
         assert not completion_lock.locked()
 
+    def test_full_session_queue_returns_rate_limit_error(self, app_client: TestClient) -> None:
+        """A same-session request beyond the queue bound is rejected instead of parked."""
+        completion_lock = asyncio.Lock()
+        asyncio.run(completion_lock.acquire())
+
+        with (
+            patch("mindroom.api.openai_compat._openai_completion_lock", return_value=completion_lock),
+            patch("mindroom.api.openai_compat._max_queued_per_session", return_value=0),
+            patch("mindroom.api.openai_compat.ai_response", new_callable=AsyncMock) as mock_ai,
+        ):
+            response = app_client.post(
+                "/v1/chat/completions",
+                json={
+                    "model": "general",
+                    "messages": [{"role": "user", "content": "Hi"}],
+                },
+            )
+
+        assert response.status_code == 429
+        assert response.json()["error"]["code"] == "session_busy"
+        assert response.json()["error"]["type"] == "rate_limit_error"
+        mock_ai.assert_not_called()
+        assert completion_lock.locked()
+
     def test_does_not_pass_include_default_tools_flag(self, app_client: TestClient) -> None:
         """Default tool behavior is now resolved from agent config, not a runtime flag."""
         with patch("mindroom.api.openai_compat.ai_response", new_callable=AsyncMock) as mock_ai:
@@ -2212,6 +2237,51 @@ async def test_openai_completion_lock_is_shared_and_dropped_when_unreferenced(tm
     assert key not in openai_compat._OPENAI_COMPLETION_LOCKS
 
 
+@pytest.mark.asyncio
+async def test_openai_session_lock_table_rejects_when_session_queue_is_full() -> None:
+    """A full per-session queue rejects immediately and waits are counted."""
+    clock = iter([10.0, 10.0, 10.0, 12.5])
+    table = OpenAISessionLockTable(clock=lambda: next(clock))
+    lock = table.lock_for(("root", "general", "session-1"))
+
+    assert await table.acquire(lock, max_waiting=1)
+    waiter = asyncio.create_task(table.acquire(lock, max_waiting=1))
+    await asyncio.sleep(0)
+    assert table.stats().waiting == 1
+
+    assert not await table.acquire(lock, max_waiting=1)
+
+    lock.release()
+    assert await waiter
+    stats = table.stats()
+    assert stats.acquisitions == 2
+    assert stats.contended_acquisitions == 1
+    assert stats.rejected == 1
+    assert stats.waiting == 0
+    assert stats.wait_seconds_max == 2.5
+    assert stats.as_dict()["active_sessions"] == 1
+    lock.release()
+
+
+def test_openai_max_queued_per_session_reads_env(tmp_path: Path) -> None:
+    """The queue bound comes from the runtime env and falls back on invalid values."""
+    config_path = tmp_path / "config.yaml"
+    storage_path = tmp_path / "data"
+
+    def resolved(value: str) -> int:
+        runtime_paths = resolve_runtime_paths(
+            config_path=config_path,
+            storage_path=storage_path,
+            process_env={"OPENAI_COMPAT_MAX_QUEUED_PER_SESSION": value},
+        )
+        return openai_compat._max_queued_per_session(runtime_paths)
+
+    assert resolved("0") == 0
+    assert resolved("3") == 3
+    assert resolved("-1") == openai_compat._DEFAULT_MAX_QUEUED_PER_SESSION
+    assert resolved("many") == openai_compat._DEFAULT_MAX_QUEUED_PER_SESSION
+
+
 @pytest.mark.asyncio
 async def test_openai_stream_response_runs_background_when_client_closes_after_done() -> None:
     """A client closing after [DONE] should not skip the response finalizer."""
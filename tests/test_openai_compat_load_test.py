@@ -0,0 +1,42 @@
+"""Tests for the OpenAI-compatible load-test harness."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from mindroom.constants import resolve_runtime_paths
+from scripts.testing.load_test_openai_compat import _run_load_test
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_load_test_rejects_hot_session_overflow_and_serves_random_sessions(tmp_path: Path) -> None:
+    """Random sessions never queue, while a single hot session past its queue bound gets 429s."""
+    runtime_paths = resolve_runtime_paths(
+        config_path=tmp_path / "config.yaml",
+        storage_path=tmp_path / "storage",
+        process_env={
+            "OPENAI_COMPAT_ALLOW_UNAUTHENTICATED": "true",
+            "OPENAI_COMPAT_MAX_QUEUED_PER_SESSION": "1",
+        },
+    )
+
+    results = asyncio.run(
+        _run_load_test(
+            runtime_paths,
+            requests=8,
+            hot_sessions=1,
+            concurrency=8,
+            latency_seconds=0.2,
+            seed=0,
+        ),
+    )
+
+    random_sessions, hot_sessions = results["workloads"]
+    assert random_sessions["status_counts"] == {"200": 8}
+    hot_status_counts = hot_sessions["status_counts"]
+    assert set(hot_status_counts) == {"200", "429"}
+    assert hot_status_counts["200"] + hot_status_counts["429"] == 8
+    assert results["session_locks"]["rejected"] >= hot_status_counts["429"]
@@ -831,6 +831,7 @@ class TestAgentBot(AgentBotTestBase):
             _knowledge_refresh_scheduler: object,
             _script_runtime: object,
             shutdown_requested: asyncio.Event | None,
+            _shared_sync_fanout: object = None,
         ) -> None:
             assert shutdown_requested is not None
             shutdown_requested.set()
@@ -907,6 +908,7 @@ class TestAgentBot(AgentBotTestBase):
             _knowledge_refresh_scheduler: object,
             _script_runtime: object,
             shutdown_requested: asyncio.Event | None,
+            _shared_sync_fanout: object = None,
         ) -> None:
             assert shutdown_requested is not None
             shutdown_requested.set()
@@ -973,6 +975,7 @@ class TestAgentBot(AgentBotTestBase):
             _knowledge_refresh_scheduler: object,
             _script_runtime: object,
             shutdown_requested: asyncio.Event | None,
+            _shared_sync_fanout: object = None,
         ) -> None:
             assert shutdown_requested is not None
             shutdown_requested.set()
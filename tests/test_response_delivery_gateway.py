@@ -19,12 +19,19 @@ import pytest
 
 from mindroom.config.agent import AgentConfig
 from mindroom.config.main import Config
-from mindroom.constants import DURABLE_FINAL_OUTCOME_KEY
+from mindroom.constants import (
+    DURABLE_FINAL_OUTCOME_KEY,
+    STREAM_STATUS_COMPLETED,
+    STREAM_STATUS_KEY,
+    STREAM_STATUS_PENDING,
+    STREAM_STATUS_STREAMING,
+)
 from mindroom.delivery_gateway import (
     CancelledVisibleNoteRequest,
     DeliveryGateway,
     DeliveryGatewayDeps,
     DeliveryStage,
+    EditTextRequest,
     FinalDeliveryRequest,
     ResponseIdentity,
     SendTextRequest,
@@ -587,6 +594,106 @@ class TestTurnDeliveryGoesThroughTheOutbox:
         assert event_id == "$placeholder"
         assert list(outbox.rows) == [("$cause", "initial")]
 
+    async def test_stream_placeholders_stay_indexed_until_a_terminal_edit(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Restart recovery finds open streams from the journal, not room history.
+
+        The placeholder opens the entry, and only an edit that leaves nothing
+        to recover closes it.
+        """
+        outbox = FakeOutbox()
+        gateway = _gateway(tmp_path, outbox)
+        target = MessageTarget.resolve(_ROOM_ID, None, None, room_mode=True)
+        placeholder = DeliveredMatrixEvent("$placeholder", {"msgtype": "m.text", "body": "..."})
+
+        with (
+            patch("mindroom.delivery_gateway.send_message_outcome", AsyncMock(return_value=placeholder)),
+            patch(
+                "mindroom.delivery_gateway.edit_message_outcome",
+                AsyncMock(return_value=DeliveredMatrixEvent("$edit", {})),
+            ),
+        ):
+            await gateway.send_text(
+                SendTextRequest(
+                    target=target,
+                    response_text="...",
+                    extra_content={STREAM_STATUS_KEY: STREAM_STATUS_PENDING},
+                ),
+            )
+            assert outbox.inflight_streams == {"$placeholder": _ROOM_ID}
+
+            await gateway.edit_text(
+                EditTextRequest(
+                    target=target,
+                    event_id="$placeholder",
+                    new_text="partial",
+                    extra_content={STREAM_STATUS_KEY: STREAM_STATUS_STREAMING},
+                ),
+            )
+            assert outbox.inflight_streams == {"$placeholder": _ROOM_ID}
+
+            await gateway.edit_text(
+                EditTextRequest(
+                    target=target,
+                    event_id="$placeholder",
+                    new_text="done",
+                    extra_content={STREAM_STATUS_KEY: STREAM_STATUS_COMPLETED},
+                ),
+            )
+
+        assert outbox.inflight_streams == {}
+
+    async def test_stream_placeholder_is_indexed_before_it_is_sent(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """A crash right after the placeholder lands still leaves its room indexed."""
+        outbox = FakeOutbox()
+        gateway = _gateway(tmp_path, outbox)
+        indexed_at_send: list[dict[str, str]] = []
+
+        async def send(*_args: object, **_kwargs: object) -> DeliveredMatrixEvent:
+            indexed_at_send.append(dict(outbox.inflight_streams))
+            return DeliveredMatrixEvent("$placeholder", {"msgtype": "m.text", "body": "..."})
+
+        with patch("mindroom.delivery_gateway.send_message_outcome", side_effect=send):
+            await gateway.send_text(
+                SendTextRequest(
+                    target=MessageTarget.resolve(_ROOM_ID, None, None, room_mode=True),
+                    response_text="...",
+                    extra_content={STREAM_STATUS_KEY: STREAM_STATUS_PENDING},
+                ),
+            )
+
+        [indexed] = indexed_at_send
+        assert list(indexed.values()) == [_ROOM_ID]
+        assert next(iter(indexed)).startswith("pending:")
+        assert outbox.inflight_streams == {"$placeholder": _ROOM_ID}
+
+    async def test_failed_index_write_revokes_index_coverage(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """A stream the index may have missed sends the next restart back to a full room sweep."""
+        outbox = FakeOutbox()
+        outbox.record_inflight_stream = AsyncMock(side_effect=RuntimeError("journal unavailable"))
+        gateway = _gateway(tmp_path, outbox)
+        placeholder = DeliveredMatrixEvent("$placeholder", {"msgtype": "m.text", "body": "..."})
+
+        with patch("mindroom.delivery_gateway.send_message_outcome", AsyncMock(return_value=placeholder)):
+            event_id = await gateway.send_text(
+                SendTextRequest(
+                    target=MessageTarget.resolve(_ROOM_ID, None, None, room_mode=True),
+                    response_text="...",
+                    extra_content={STREAM_STATUS_KEY: STREAM_STATUS_PENDING},
+                ),
+            )
+
+        assert event_id == "$placeholder"
+        assert outbox.inflight_stream_coverage_revoked
+
     async def test_the_placeholder_and_the_final_answer_do_not_collide(
         self,
         tmp_path: Path,
@@ -26,6 +26,7 @@ from tests.conftest import (
     TEST_PASSWORD,
     bind_runtime_paths,
     make_visible_message,
+    revalidate_config,
     runtime_paths_for,
     test_runtime_paths,
 )
@@ -766,6 +767,7 @@ class TestAgentDescription:
         """Test describing an agent without tools."""
         config = _agent_description_config()
         config.defaults.tools = []
+        config = revalidate_config(config)
         description = describe_agent("general", config)
 
         assert "general" in description
@@ -778,6 +780,7 @@ class TestAgentDescription:
         config = _agent_description_config()
         config.defaults.tools = ["scheduler"]
         config.agents["general"].tools = []
+        config = revalidate_config(config)
 
         description = describe_agent("general", config)
 
@@ -789,6 +792,7 @@ class TestAgentDescription:
         config.defaults.tools = ["scheduler"]
         config.agents["general"].tools = []
         config.agents["general"].include_default_tools = False
+        config = revalidate_config(config)
 
         description = describe_agent("general", config)
 
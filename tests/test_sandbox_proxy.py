@@ -11,6 +11,7 @@ import os
 import stat
 import sys
 import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
 from contextvars import ContextVar
 from dataclasses import asdict
@@ -3252,6 +3253,56 @@ def test_scoped_dedicated_worker_payload_preserves_resolved_worker_key(monkeypat
     assert fake_manager.ensure_calls == [expected_worker_key]
 
 
+def test_prepare_worker_for_tool_call_ensures_routed_worker_in_background(monkeypatch: pytest.MonkeyPatch) -> None:
+    """An announced worker-routed call should start its worker before the call runs, once at a time."""
+    ensure_started = threading.Event()
+    release_ensure = threading.Event()
+
+    class _BlockingWorkerManager(_TrackingWorkerManager):
+        def __init__(self) -> None:
+            super().__init__()
+            self.ensure_calls: list[str] = []
+
+        def ensure_worker(self, spec: WorkerSpec, *, now: float | None = None, progress_sink: object = None) -> object:
+            self.ensure_calls.append(spec.worker_key)
+            ensure_started.set()
+            release_ensure.wait(timeout=5)
+            return super().ensure_worker(spec, now=now, progress_sink=progress_sink)
+
+    runtime_paths = _configure_proxy_runtime(
+        monkeypatch,
+        proxy_url="http://sandbox-runner:8765",
+        proxy_token=_TEST_AUTH_TOKEN,
+        execution_mode="all",
+        credential_policy={},
+    )
+    manager = _BlockingWorkerManager()
+    monkeypatch.setattr(
+        sandbox_proxy_module,
+        "lease_primary_worker_manager",
+        lambda *_args, **_kwargs: _static_worker_manager_lease(manager),
+    )
+    monkeypatch.setattr(sandbox_proxy_module, "primary_worker_backend_is_dedicated", lambda _runtime_paths_arg: True)
+    toolkit = get_tool_by_name(
+        "calculator",
+        runtime_paths,
+        worker_target=_worker_target(runtime_paths, None, "code", None),
+    )
+
+    assert sandbox_proxy_module.prepare_worker_for_tool_call([{"name": "schema-only"}, toolkit], "missing") is False
+    assert sandbox_proxy_module.prepare_worker_for_tool_call([{"name": "schema-only"}, toolkit], "add") is True
+    assert ensure_started.wait(timeout=1)
+    assert sandbox_proxy_module.prepare_worker_for_tool_call([toolkit], "multiply") is False
+
+    release_ensure.set()
+    deadline = time.monotonic() + 2
+    while sandbox_proxy_module._PREPARING_WORKER_ROUTES and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert not sandbox_proxy_module._PREPARING_WORKER_ROUTES
+    assert manager.ensure_calls == ["v1:default:unscoped:code"]
+
+
 def test_proxy_surfaces_runner_http_detail(monkeypatch: pytest.MonkeyPatch) -> None:
     """Proxy should preserve sandbox-runner detail messages on HTTP failures."""
 
@@ -13,6 +13,7 @@ from mindroom.constants import RuntimePaths
 from mindroom.script_runs import store as store_module
 from mindroom.script_runs.models import (
     ScriptCallClaim,
+    ScriptCallRecord,
     ScriptCallState,
     ScriptRunRecord,
     ScriptRunState,
@@ -174,8 +175,9 @@ def test_write_transaction_closes_connection_when_begin_fails(
     runtime_paths: RuntimePaths,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """SQLite lock failure during BEGIN cannot leak its connection."""
+    """SQLite lock failure during BEGIN cannot leak or retain its connection."""
     store = ScriptRunStore(runtime_paths)
+    store.close()
 
     class BeginFailure:
         closed = False
@@ -195,6 +197,81 @@ def test_write_transaction_closes_connection_when_begin_fails(
         pass
 
     assert connection.closed is True
+    assert store._writer is None
+
+
+def test_run_store_reuses_its_connections_across_operations(
+    runtime_paths: RuntimePaths,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Calls are served by the store's writer and pooled readers, not a connection each."""
+    store = ScriptRunStore(runtime_paths)
+    store.close()
+    opened: list[sqlite3.Connection] = []
+    connect = store_module._connect
+
+    def counting_connect(path: Path) -> sqlite3.Connection:
+        opened.append(connect(path))
+        return opened[-1]
+
+    monkeypatch.setattr(store_module, "_connect", counting_connect)
+    run = store.create_run(_new_run())
+    for index in range(10):
+        store.get_run(run.run_id)
+        store.claim_call(
+            run_id=run.run_id,
+            call_id=f"call-{index}",
+            grant=ScriptToolGrant("website", "read_url"),
+            arguments_digest="digest-a",
+        )
+        store.publish_call_result(
+            run_id=run.run_id,
+            call_id=f"call-{index}",
+            state=ScriptCallState.COMPLETED,
+            result=index,
+        )
+
+    assert len(opened) == 2
+    store.close()
+    assert store.get_call(run.run_id, "call-9").result == 9
+    assert len(opened) == 3
+
+
+def test_group_commit_lands_concurrent_receipts_in_one_transaction(runtime_paths: RuntimePaths) -> None:
+    """Receipts inside one window share a commit, and a conflicting one fails alone."""
+    store = ScriptRunStore(runtime_paths, receipt_commit_window_seconds=0.2)
+    store.create_run(replace(_new_run(), max_tool_calls_per_minute=100))
+    for index in range(4):
+        store.claim_call(
+            run_id="run-1",
+            call_id=f"call-{index}",
+            grant=ScriptToolGrant("website", "read_url"),
+            arguments_digest="digest-a",
+        )
+    store.publish_call_result(run_id="run-1", call_id="call-3", state=ScriptCallState.COMPLETED, result="first")
+    statements: list[str] = []
+    assert store._writer is not None
+    store._writer.set_trace_callback(statements.append)
+
+    def publish(index: int) -> ScriptCallRecord | ScriptCallConflictError:
+        try:
+            return store.publish_call_result(
+                run_id="run-1",
+                call_id=f"call-{index}",
+                state=ScriptCallState.COMPLETED,
+                result=f"result-{index}",
+            )
+        except ScriptCallConflictError as exc:
+            return exc
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        outcomes = list(executor.map(publish, range(4)))
+
+    assert [getattr(outcome, "result", None) for outcome in outcomes[:3]] == ["result-0", "result-1", "result-2"]
+    assert isinstance(outcomes[3], ScriptCallConflictError)
+    assert statements.count("COMMIT") == 1
+    assert store.get_call("run-1", "call-2").result == "result-2"
+    assert store.get_call("run-1", "call-3").result == "first"
 
 
 def test_snapshot_locator_is_durable_and_rejects_parent_traversal(runtime_paths: RuntimePaths) -> None:
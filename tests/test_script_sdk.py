@@ -6,7 +6,7 @@ import hashlib
 import io
 import json
 import urllib.error
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 import pytest
 
@@ -85,7 +85,7 @@ def test_script_sdk_polls_the_same_accepted_call_id_until_completed(
             payload = json.loads(request.data or b"{}")
             assert payload["call_id"] == "stable-call"
             return io.BytesIO(_receipt("pending"))
-        assert request.full_url.endswith("/runs/run-1/calls/stable-call")
+        assert request.full_url.endswith("/runs/run-1/calls/stable-call?wait_seconds=10")
         return io.BytesIO(_receipt("completed", result={"status": "ok"}))
 
     monkeypatch.setattr("mindroom.script_sdk.uuid.uuid4", lambda: type("ID", (), {"hex": "stable-call"})())
@@ -480,3 +480,55 @@ def test_script_sdk_rejects_unhashable_receipt_states(
         MindRoomTools(poll_interval_seconds=0.0001).call("website", "read_url", url="https://example.org/")
 
     assert exc_info.value.kind == "invalid_response"
+
+
+def test_script_sdk_call_many_submits_one_batch_and_streams_results_as_they_settle(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """A batch is one POST; refused calls fail alone and pending ones are long-polled oldest first."""
+    _configure(monkeypatch, tmp_path)
+    call_ids = iter(["call-a", "call-b", "call-c"])
+    requests: list[Request] = []
+
+    def receipt_for(call: dict[str, object], state: str, result: object = None) -> dict[str, object]:
+        receipt = json.loads(_receipt(state, result=result, arguments=cast("dict[str, object]", call["arguments"])))
+        return {**receipt, "call_id": call["call_id"]}
+
+    def urlopen(request: Request, *, timeout: float) -> io.BytesIO:
+        del timeout
+        requests.append(request)
+        if request.method == "POST":
+            calls = json.loads(request.data or b"{}")["calls"]
+            results = [
+                {"call_id": "call-a", "status_code": 202, "receipt": receipt_for(calls[0], "pending")},
+                {"call_id": "call-b", "status_code": 200, "receipt": receipt_for(calls[1], "completed", "b")},
+                {"call_id": "call-c", "status_code": 409, "detail": "conflict"},
+            ]
+            return io.BytesIO(json.dumps({"results": results}).encode())
+        assert request.full_url.endswith("/runs/run-1/calls/call-a?wait_seconds=10")
+        posted = json.loads(requests[0].data or b"{}")["calls"][0]
+        return io.BytesIO(json.dumps(receipt_for(posted, "completed", "a")).encode())
+
+    monkeypatch.setattr("mindroom.script_sdk.uuid.uuid4", lambda: type("ID", (), {"hex": next(call_ids)})())
+    monkeypatch.setattr("mindroom.script_sdk.urllib.request.urlopen", urlopen)
+    tools = MindRoomTools(poll_interval_seconds=0.0001)
+
+    handles = tools.call_many(
+        [
+            ("website", "read_url", {"url": "https://example.org/a"}),
+            ("website", "read_url", {"url": "https://example.org/b"}),
+            ("website", "read_url", {"url": "https://example.org/c"}),
+        ],
+    )
+    settled = [handle.call_id for handle in tools.as_completed(handles)]
+
+    assert requests[0].full_url.endswith("/calls/batch")
+    assert settled == ["call-b", "call-c", "call-a"]
+    assert [request.method for request in requests] == ["POST", "GET"]
+    assert handles[0].result() == "a"
+    assert handles[1].result() == "b"
+    with pytest.raises(MindRoomToolCallError) as exc_info:
+        handles[2].result()
+    assert exc_info.value.kind == "request_rejected"
+    assert exc_info.value.call_id == "call-c"
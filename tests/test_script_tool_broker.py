@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import threading
 import time
@@ -1926,6 +1927,51 @@ async def test_script_broker_serializes_distinct_calls_within_one_run(
     assert second_entered.is_set()
 
 
+@pytest.mark.asyncio
+async def test_script_broker_batch_accepts_together_and_long_poll_wakes_on_settlement(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A batch is claimed in one pass, runs its calls concurrently up to the bound, and waiters wake as calls land."""
+    active = 0
+    peak = 0
+    bound_reached = asyncio.Event()
+
+    class SlowToolkit(Toolkit):
+        def __init__(self) -> None:
+            super().__init__(name="calculator", tools=[self.add])
+
+        async def add(self, a: int, b: int) -> int:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            if active == broker_module._BATCH_CONCURRENCY:
+                bound_reached.set()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(bound_reached.wait(), timeout=0.5)
+            active -= 1
+            return a + b
+
+    _replace_calculator_toolkit(monkeypatch, SlowToolkit)
+    broker, token = _broker(tmp_path, events=[])
+    authorization = f"Bearer {token}"
+    requests = [_request(call_id=f"batch-{b}", b=b) for b in range(broker_module._BATCH_CONCURRENCY + 2)]
+
+    accepted = await broker.accept_many_authenticated(requests, authorization)
+
+    assert [getattr(outcome, "call_id", None) for outcome in accepted] == [request.call_id for request in requests]
+    for request in requests:
+        await asyncio.wait_for(
+            broker.wait_authenticated(request.run_id, request.call_id, authorization, timeout_seconds=5),
+            timeout=1,
+        )
+        receipt = await broker.get_authenticated(request.run_id, request.call_id, authorization)
+        assert receipt.state is ScriptCallState.COMPLETED
+        assert receipt.result == 1 + cast("int", request.arguments["b"])
+    assert bound_reached.is_set()
+    assert peak == broker_module._BATCH_CONCURRENCY
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("result", [float("nan"), float("inf"), float("-inf")])
 async def test_script_broker_never_publishes_nonfinite_completed_receipt(
@@ -0,0 +1,184 @@
+"""Tests for process-wide fan-out of application-service room events."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import nio
+import pytest
+
+from mindroom.config.matrix import MatrixSyncConfig
+from mindroom.matrix.shared_ingestion import (
+    _SHARED_INGESTION_EVENT_TYPES,
+    SharedIngestionUnavailableError,
+    SharedSyncFanout,
+    shared_ingestion_sync_filter,
+)
+
+ROOM = "!room:localhost"
+OTHER_ROOM = "!other:localhost"
+
+
+def _message(event_id: str, *, room_id: str = ROOM, body: str = "hello") -> dict[str, object]:
+    return {
+        "event_id": event_id,
+        "room_id": room_id,
+        "sender": "@alice:localhost",
+        "origin_server_ts": 1_000,
+        "type": "m.room.message",
+        "content": {"msgtype": "m.text", "body": body},
+    }
+
+
+@dataclass
+class _FakeTarget:
+    agent_name: str
+    room_ids: frozenset[str] = frozenset({ROOM})
+    ready: bool = True
+    refuse: bool = False
+    admitted: list[tuple[str, nio.Event]] = field(default_factory=list)
+
+    def shared_ingestion_room_ids(self) -> frozenset[str]:
+        return self.room_ids
+
+    def shared_ingestion_ready(self) -> bool:
+        return self.ready
+
+    async def admit_shared_event(self, room_id: str, event: nio.Event) -> None:
+        if self.refuse:
+            msg = "journal unavailable"
+            raise nio.CallbackNotAcceptedError(msg)
+        self.admitted.append((room_id, event))
+
+
+@pytest.mark.asyncio
+async def test_transaction_is_parsed_once_and_admitted_in_order_for_joined_accounts() -> None:
+    """Every joined account receives the same parsed events in transaction order."""
+    first = _FakeTarget("first")
+    second = _FakeTarget("second", room_ids=frozenset({ROOM, OTHER_ROOM}))
+    elsewhere = _FakeTarget("elsewhere", room_ids=frozenset({OTHER_ROOM}))
+    fanout = SharedSyncFanout(lambda: (first, second, elsewhere))
+
+    admissions = await fanout.ingest_transaction("txn-1", [_message("$a"), _message("$b")])
+
+    assert admissions == 4
+    assert [event.event_id for _room_id, event in first.admitted] == ["$a", "$b"]
+    assert [event.event_id for _room_id, event in second.admitted] == ["$a", "$b"]
+    assert elsewhere.admitted == []
+    # One parse per event, shared by every account.
+    assert first.admitted[0][1] is second.admitted[0][1]
+
+
+@pytest.mark.asyncio
+async def test_completed_transaction_retry_is_a_no_op() -> None:
+    """A homeserver retry of an acknowledged transaction is not admitted twice."""
+    target = _FakeTarget("agent")
+    fanout = SharedSyncFanout(lambda: (target,))
+
+    await fanout.ingest_transaction("txn-1", [_message("$a")])
+    assert await fanout.ingest_transaction("txn-1", [_message("$a")]) == 0
+
+    assert len(target.admitted) == 1
+
+
+@pytest.mark.asyncio
+async def test_types_left_to_per_account_sync_are_ignored() -> None:
+    """State, encrypted, and malformed events stay with classic sync."""
+    target = _FakeTarget("agent")
+    fanout = SharedSyncFanout(lambda: (target,))
+    encrypted = {**_message("$enc"), "type": "m.room.encrypted", "content": {"algorithm": "m.megolm.v1.aes-sha2"}}
+    membership = {**_message("$join"), "type": "m.room.member", "state_key": "@alice:localhost"}
+    missing_room = {key: value for key, value in _message("$orphan").items() if key != "room_id"}
+
+    admissions = await fanout.ingest_transaction("txn-1", [encrypted, membership, missing_room, "junk"])
+
+    assert admissions == 0
+    assert target.admitted == []
+
+
+@pytest.mark.asyncio
+async def test_unready_joined_account_defers_the_whole_transaction() -> None:
+    """Acknowledgement waits until every joined account can admit, then the retry succeeds."""
+    ready = _FakeTarget("ready")
+    starting = _FakeTarget("starting", ready=False)
+    fanout = SharedSyncFanout(lambda: (ready, starting))
+
+    with pytest.raises(SharedIngestionUnavailableError, match="starting"):
+        await fanout.ingest_transaction("txn-1", [_message("$a")])
+    assert ready.admitted == []
+
+    starting.ready = True
+    assert await fanout.ingest_transaction("txn-1", [_message("$a")]) == 2
+    assert [event.event_id for _room_id, event in starting.admitted] == ["$a"]
+
+
+@pytest.mark.asyncio
+async def test_unready_account_outside_the_room_does_not_block() -> None:
+    """Only accounts joined to a transaction's rooms gate its acknowledgement."""
+    ready = _FakeTarget("ready")
+    idle = _FakeTarget("idle", room_ids=frozenset({OTHER_ROOM}), ready=False)
+    fanout = SharedSyncFanout(lambda: (ready, idle))
+
+    assert await fanout.ingest_transaction("txn-1", [_message("$a")]) == 1
+
+
+@pytest.mark.asyncio
+async def test_configured_account_without_a_running_bot_defers_the_transaction() -> None:
+    """An account configured for the room but not enrolled yet keeps the transaction unacknowledged."""
+    running = _FakeTarget("running")
+    late = _FakeTarget("late")
+    targets: list[_FakeTarget] = [running]
+    configured = {"running": frozenset({ROOM}), "late": frozenset({ROOM})}
+    fanout = SharedSyncFanout(lambda: tuple(targets), configured_room_ids=lambda: configured)
+
+    with pytest.raises(SharedIngestionUnavailableError, match="late"):
+        await fanout.ingest_transaction("txn-1", [_message("$a")])
+    assert running.admitted == []
+
+    targets.append(late)
+    assert await fanout.ingest_transaction("txn-1", [_message("$a")]) == 2
+    assert [event.event_id for _room_id, event in late.admitted] == ["$a"]
+
+
+@pytest.mark.asyncio
+async def test_configured_account_for_other_rooms_does_not_block() -> None:
+    """Only accounts configured for a transaction's rooms gate its acknowledgement."""
+    running = _FakeTarget("running")
+    configured = {"running": frozenset({ROOM}), "elsewhere": frozenset({OTHER_ROOM})}
+    fanout = SharedSyncFanout(lambda: (running,), configured_room_ids=lambda: configured)
+
+    assert await fanout.ingest_transaction("txn-1", [_message("$a")]) == 1
+
+
+@pytest.mark.asyncio
+async def test_refused_admission_leaves_transaction_unacknowledged() -> None:
+    """A journal refusal surfaces so the homeserver retries the transaction."""
+    accepted = _FakeTarget("accepted")
+    refused = _FakeTarget("refused", refuse=True)
+    fanout = SharedSyncFanout(lambda: (accepted, refused))
+
+    with pytest.raises(SharedIngestionUnavailableError, match="refused"):
+        await fanout.ingest_transaction("txn-1", [_message("$a")])
+
+    refused.refuse = False
+    assert await fanout.ingest_transaction("txn-1", [_message("$a")]) == 2
+
+
+def test_sync_filter_leaves_shared_types_out_of_the_timeline() -> None:
+    """Classic sync keeps its own filter and drops only the fanned-out timeline types."""
+    base = {"room": {"timeline": {"limit": 20, "not_types": ["m.call.invite"]}, "state": {"lazy_load_members": True}}}
+
+    merged = shared_ingestion_sync_filter(base)
+
+    timeline = merged["room"]["timeline"]
+    assert timeline["limit"] == 20
+    assert timeline["not_types"] == ["m.call.invite", *_SHARED_INGESTION_EVENT_TYPES]
+    assert merged["room"]["state"] == {"lazy_load_members": True}
+    assert base["room"]["timeline"]["not_types"] == ["m.call.invite"]
+
+
+def test_shared_ingestion_requires_classic_sync() -> None:
+    """Shared ingestion filters classic sync timelines, so other modes reject it."""
+    assert MatrixSyncConfig(shared_ingestion=True).shared_ingestion is True
+    with pytest.raises(ValueError, match="shared_ingestion"):
+        MatrixSyncConfig(mode="sliding", shared_ingestion=True)
@@ -54,6 +54,7 @@ from tests.conftest import (
     delivered_matrix_event,
     delivered_matrix_side_effect,
     make_matrix_client_mock,
+    revalidate_config,
     runtime_paths_for,
     test_runtime_paths,
 )
@@ -1151,6 +1152,7 @@ async def test_auto_resume_target_mention_ignores_unprepared_unrelated_entity(tm
     config = _make_config(tmp_path)
     runtime_paths = runtime_paths_for(config)
     config.agents["stale"] = config.agents["other"].model_copy(update={"display_name": "Stale Agent"})
+    config = revalidate_config(config)
     state = MatrixState.load(runtime_paths)
     state.accounts.pop(managed_account_key("stale"), None)
     state.save(runtime_paths)
@@ -3701,3 +3703,92 @@ def test_bot_module_does_not_import_stale_stream_cleanup() -> None:
     assert "recover_stale_streaming_messages" not in bot_source, (
         "bot.py must not import or call recover_stale_streaming_messages; the orchestrator owns restart recovery"
     )
+
+
+@pytest.mark.asyncio
+async def test_recovery_visits_only_rooms_the_stream_index_names(tmp_path: Path) -> None:
+    """A covered index narrows the sweep, but an account without one still scans every room it shares."""
+    config = _make_config(tmp_path)
+    agent_client = make_matrix_client_mock(user_id=BOT_USER_ID)
+    other_client = make_matrix_client_mock(user_id=OTHER_BOT_USER_ID)
+    joined_rooms = {
+        BOT_USER_ID: ["!indexed:example.com", "!quiet:example.com", "!shared:example.com"],
+        OTHER_BOT_USER_ID: ["!shared:example.com"],
+    }
+
+    async def fake_joined_rooms(client: nio.AsyncClient) -> list[str]:
+        return joined_rooms[client.user_id]
+
+    with (
+        patch("mindroom.matrix.stale_stream_cleanup.get_joined_rooms", new=fake_joined_rooms),
+        patch(
+            "mindroom.matrix.stale_stream_cleanup._cleanup_stale_streaming_room",
+            new=AsyncMock(return_value=(0, [])),
+        ) as cleanup_room,
+    ):
+        scanned_room_ids: set[str] = set()
+        result = await recover_stale_streaming_messages(
+            {BOT_USER_ID: agent_client, OTHER_BOT_USER_ID: other_client},
+            resume_client=None,
+            config=config,
+            runtime_paths=runtime_paths_for(config),
+            startup_cutoff_ms=NOW_MS,
+            scanned_room_ids=scanned_room_ids,
+            indexed_room_ids={BOT_USER_ID: frozenset({"!indexed:example.com"}), OTHER_BOT_USER_ID: None},
+        )
+
+    assert {awaited.kwargs["room_id"] for awaited in cleanup_room.await_args_list} == {
+        "!indexed:example.com",
+        "!shared:example.com",
+    }
+    assert scanned_room_ids == {"!indexed:example.com", "!shared:example.com"}
+    assert result.skipped_room_count == 1
+    assert result.fully_swept_user_ids == {BOT_USER_ID, OTHER_BOT_USER_ID}
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_recovery_settles_the_stream_index_and_covers_fully_swept_accounts(
+    tmp_path: Path,
+) -> None:
+    """Startup reads each bot's index first, then settles it and covers only accounts it swept in full."""
+    config = _make_config(tmp_path)
+    orchestrator = _MultiAgentOrchestrator(runtime_paths=runtime_paths_for(config))
+    orchestrator.config = config
+
+    bots = []
+    indexes = {}
+    for user_id, room_ids in ((BOT_USER_ID, frozenset({ROOM_ID})), (OTHER_BOT_USER_ID, None)):
+        bot = MagicMock()
+        bot.agent_name = user_id
+        bot.client = AsyncMock(spec=nio.AsyncClient)
+        bot.agent_user = MagicMock(user_id=user_id)
+        bot.inflight_stream_index = AsyncMock()
+        bot.inflight_stream_index.inflight_stream_room_ids.return_value = room_ids
+        bots.append(bot)
+        indexes[user_id] = bot.inflight_stream_index
+
+    with patch(
+        "mindroom.orchestrator.recover_stale_streaming_messages",
+        new=AsyncMock(
+            return_value=StaleStreamRecoveryResult(
+                room_count=1,
+                cleaned_count=0,
+                resumed_count=0,
+                fully_swept_user_ids=frozenset({BOT_USER_ID, OTHER_BOT_USER_ID}),
+            ),
+        ),
+    ) as mock_recover:
+        await orchestrator._recover_stale_streams_after_restart(bots, config, NOW_MS, {ROOM_ID})
+
+    assert mock_recover.await_args.kwargs["indexed_room_ids"] == {
+        BOT_USER_ID: frozenset({ROOM_ID}),
+        OTHER_BOT_USER_ID: None,
+    }
+    for index in indexes.values():
+        index.settle_inflight_streams.assert_awaited_once_with(
+            recovered_room_ids={ROOM_ID},
+            recorded_before_ms=NOW_MS,
+            expired_before_ms=NOW_MS - stale_stream_cleanup_module._STALE_STREAM_LOOKBACK_MS,
+        )
+    indexes[BOT_USER_ID].mark_inflight_streams_covered.assert_not_awaited()
+    indexes[OTHER_BOT_USER_ID].mark_inflight_streams_covered.assert_awaited_once_with(tracked_since_ms=NOW_MS)
@@ -99,6 +99,7 @@ class _FakeGateway:
         new_text: str,
         *,
         retry_sync_recovery: bool = False,  # noqa: ARG002
+        nonterminal: bool = False,  # noqa: ARG002
     ) -> DeliveredMatrixEvent:
         self._record(_GatewayOp(kind="edit", content=dict(new_content), display_text=new_text))
         return DeliveredMatrixEvent(event_id=f"$edit_{len(self.ops)}", content_sent=dict(new_content))
@@ -391,6 +392,7 @@ async def test_placeholder_ack_waits_for_answer_ack_before_marking_substantive(c
         _new_text: str,
         *,
         retry_sync_recovery: bool = False,  # noqa: ARG001
+        nonterminal: bool = False,  # noqa: ARG001
     ) -> DeliveredMatrixEvent:
         delivered_bodies.append(new_content["body"])
         return DeliveredMatrixEvent(event_id="$answer-edit", content_sent=dict(new_content))
@@ -454,6 +456,7 @@ async def test_terminal_failure_note_ack_is_visible_but_not_substantive(
         _new_text: str,
         *,
         retry_sync_recovery: bool = False,  # noqa: ARG001
+        nonterminal: bool = False,  # noqa: ARG001
     ) -> DeliveredMatrixEvent:
         return DeliveredMatrixEvent(event_id="$terminal-edit", content_sent=dict(new_content))
 
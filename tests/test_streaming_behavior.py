@@ -40,8 +40,11 @@ from mindroom.history.interrupted_replay import (
 )
 from mindroom.hooks import MessageEnvelope
 from mindroom.matrix.client import DeliveredMatrixEvent
+from mindroom.matrix.client_delivery import MatrixEditSupersededError
+from mindroom.matrix.edit_cadence import edit_cadence_for_homeserver
 from mindroom.matrix.identity import MatrixID
 from mindroom.matrix.large_messages import _oversized_nonterminal_streaming_edit_sent_at
+from mindroom.matrix.outbound_edits import outbound_edit_snapshots
 from mindroom.matrix.users import AgentMatrixUser
 from mindroom.message_target import MessageTarget
 from mindroom.response_runner import ResponseRequest
@@ -237,6 +240,8 @@ async def test_dropped_optional_delivery_still_sends_latest_visible_text(tmp_pat
     assert shutdown_error is None
     mock_client.room_send.assert_awaited_once()
     assert mock_client.room_send.await_args.kwargs["content"]["body"] == "latest body"
+    [room] = outbound_edit_snapshots()
+    assert (room.room_id, room.coalesced_edits) == ("!test:localhost", 31), "merged requests are counted"
 
 
 @pytest.fixture
@@ -619,6 +624,7 @@ class TestStreamingBehavior:
             _new_text: str,
             *,
             retry_sync_recovery: bool = False,  # noqa: ARG001
+            nonterminal: bool = False,  # noqa: ARG001
         ) -> DeliveredMatrixEvent:
             return DeliveredMatrixEvent(event_id="$edit", content_sent=dict(new_content))
 
@@ -680,6 +686,30 @@ class TestStreamingBehavior:
         assert capture_completion.done()
         assert capture_completion.result() is None
 
+    @pytest.mark.asyncio
+    async def test_superseded_progress_edit_is_neither_reported_nor_retried(self) -> None:
+        """A progress edit that a terminal edit replaced in the room's schedule is skipped quietly."""
+        mock_client = _make_matrix_client_mock()
+        streaming = StreamingResponse(
+            target=MessageTarget.resolve("!test:localhost", "$thread_123", "$original_123"),
+            config=self.config,
+            runtime_paths=runtime_paths_for(self.config),
+        )
+        streaming.event_id = "$stream_123"
+        streaming.accumulated_text = "partial"
+        superseded_edit = AsyncMock(side_effect=MatrixEditSupersededError("replaced"))
+
+        with (
+            patch("mindroom.streaming.edit_message_result", new=superseded_edit),
+            patch("mindroom.streaming.logger") as logger_mock,
+        ):
+            assert await streaming._send_or_edit_message(mock_client)
+
+        assert superseded_edit.await_count == 1
+        assert superseded_edit.await_args.kwargs["nonterminal"] is True
+        logger_mock.error.assert_not_called()
+        logger_mock.warning.assert_not_called()
+
     def test_streaming_update_interval_starts_fast_then_slows(self) -> None:
         """Test progressive throttling: frequent edits first, slower later."""
         streaming = StreamingResponse(
@@ -838,6 +868,38 @@ class TestStreamingBehavior:
         assert mock_client.room_send.call_count == 1
         assert streaming.event_id == "$stream_char_1"
 
+    @pytest.mark.asyncio
+    async def test_adaptive_cadence_paces_char_triggered_edits_by_homeserver_round_trip(self) -> None:
+        """A slow homeserver holds character-triggered edits back, a fast one lets them out before the fixed floor."""
+
+        async def edits_sent(*, homeserver: str, rtt_seconds: float, since_last_update: float) -> int:
+            mock_client = _make_matrix_client_mock()
+            mock_client.homeserver = homeserver
+            mock_response = MagicMock()
+            mock_response.__class__ = nio.RoomSendResponse
+            mock_response.event_id = "$stream_paced"
+            mock_client.room_send.return_value = mock_response
+            cadence = edit_cadence_for_homeserver(homeserver)
+            assert cadence is not None
+            cadence.edit_finished(cadence.edit_started("$earlier") - rtt_seconds, delivered=True)
+
+            streaming = StreamingResponse(
+                target=MessageTarget.resolve("!test:localhost", None, "$original_123"),
+                config=self.config,
+                runtime_paths=runtime_paths_for(self.config),
+                update_interval=10.0,
+                update_char_threshold=5,
+                min_update_char_threshold=5,
+                min_char_update_interval=0.35,
+                target_inflight_edits=1.0,
+            )
+            streaming.last_update = time.time() - since_last_update
+            await streaming.update_content("hello", mock_client)
+            return mock_client.room_send.call_count
+
+        assert await edits_sent(homeserver="https://slow.example.org", rtt_seconds=2.0, since_last_update=1.0) == 0
+        assert await edits_sent(homeserver="https://fast.example.org", rtt_seconds=0.01, since_last_update=0.2) == 1
+
     @pytest.mark.asyncio
     async def test_pre_tool_flush_fires_on_immediate_tool_start(self) -> None:
         """Tool-start phase boundaries should flush buffered text immediately in both visible and hidden modes."""
@@ -1904,6 +1966,7 @@ class TestStreamingBehavior:
             new_text: str,
             *,
             retry_sync_recovery: bool = False,  # noqa: ARG001
+            nonterminal: bool = False,  # noqa: ARG001
         ) -> DeliveredMatrixEvent:
             edited_contents.append((new_content, new_text))
             return DeliveredMatrixEvent(event_id="$edit", content_sent=dict(new_content))
@@ -2004,6 +2067,7 @@ class TestStreamingBehavior:
             _new_text: str,
             *,
             retry_sync_recovery: bool = False,  # noqa: ARG001
+            nonterminal: bool = False,  # noqa: ARG001
         ) -> DeliveredMatrixEvent:
             return DeliveredMatrixEvent(event_id="$stream_1", content_sent={})
 
@@ -2263,6 +2327,7 @@ class TestStreamingBehavior:
             new_text: str,
             *,
             retry_sync_recovery: bool = False,  # noqa: ARG001
+            nonterminal: bool = False,  # noqa: ARG001
         ) -> DeliveredMatrixEvent:
             edited_texts.append(new_text)
             return DeliveredMatrixEvent(event_id="$edit", content_sent={})
@@ -2304,6 +2369,7 @@ class TestStreamingBehavior:
             new_text: str,
             *,
             retry_sync_recovery: bool = False,  # noqa: ARG001
+            nonterminal: bool = False,  # noqa: ARG001
         ) -> DeliveredMatrixEvent:
             edited_texts.append(new_text)
             return DeliveredMatrixEvent(event_id="$edit", content_sent={})
@@ -2403,6 +2469,7 @@ class TestStreamingBehavior:
             new_text: str,
             *,
             retry_sync_recovery: bool = False,  # noqa: ARG001
+            nonterminal: bool = False,  # noqa: ARG001
         ) -> DeliveredMatrixEvent:
             edited_messages.append((new_content, new_text))
             return DeliveredMatrixEvent(event_id="$edit", content_sent=dict(new_content))
@@ -2454,6 +2521,7 @@ class TestStreamingBehavior:
                 _new_text: str,
                 *,
                 retry_sync_recovery: bool = False,  # noqa: ARG001
+                nonterminal: bool = False,  # noqa: ARG001
                 _edited_messages: list[dict[str, object]] = edited_messages,
             ) -> DeliveredMatrixEvent:
                 _edited_messages.append(new_content)
@@ -2500,6 +2568,7 @@ class TestStreamingBehavior:
             new_text: str,
             *,
             retry_sync_recovery: bool = False,  # noqa: ARG001
+            nonterminal: bool = False,  # noqa: ARG001
         ) -> DeliveredMatrixEvent:
             edited_texts.append(new_text)
             return DeliveredMatrixEvent(event_id="$edit", content_sent={})
@@ -2547,6 +2616,7 @@ class TestStreamingBehavior:
             new_text: str,
             *,
             retry_sync_recovery: bool = False,  # noqa: ARG001
+            nonterminal: bool = False,  # noqa: ARG001
         ) -> DeliveredMatrixEvent:
             edited_texts.append(new_text)
             return DeliveredMatrixEvent(event_id="$edit", content_sent={})
@@ -2593,6 +2663,7 @@ class TestStreamingBehavior:
             new_text: str,
             *,
             retry_sync_recovery: bool = False,  # noqa: ARG001
+            nonterminal: bool = False,  # noqa: ARG001
         ) -> DeliveredMatrixEvent:
             if "Preparing isolated worker" in new_text:
                 msg = "edit blew up"
@@ -2650,6 +2721,7 @@ class TestStreamingBehavior:
             new_text: str,
             *,
             retry_sync_recovery: bool = False,  # noqa: ARG001
+            nonterminal: bool = False,  # noqa: ARG001
         ) -> DeliveredMatrixEvent:
             terminal_statuses.append(str(new_content[STREAM_STATUS_KEY]))
             edited_texts.append(new_text)
@@ -2709,6 +2781,7 @@ class TestStreamingBehavior:
             new_text: str,
             *,
             retry_sync_recovery: bool = False,  # noqa: ARG001
+            nonterminal: bool = False,  # noqa: ARG001
         ) -> DeliveredMatrixEvent:
             edited_texts.append(new_text)
             if "Preparing isolated worker" in new_text:
@@ -2827,6 +2900,7 @@ class TestStreamingBehavior:
             new_text: str,
             *,
             retry_sync_recovery: bool = False,  # noqa: ARG001
+            nonterminal: bool = False,  # noqa: ARG001
         ) -> DeliveredMatrixEvent:
             edited_texts.append(new_text)
             if "Preparing isolated worker" in new_text and "hello" not in new_text and "world" not in new_text:
@@ -2899,6 +2973,7 @@ class TestStreamingBehavior:
             _new_text: str,
             *,
             retry_sync_recovery: bool = False,  # noqa: ARG001
+            nonterminal: bool = False,  # noqa: ARG001
         ) -> DeliveredMatrixEvent:
             await stream_finished.wait()
             if _new_content.get("io.mindroom.stream_status") == "streaming":
@@ -2954,6 +3029,7 @@ class TestStreamingBehavior:
             new_text: str,
             *,
             retry_sync_recovery: bool = False,  # noqa: ARG001
+            nonterminal: bool = False,  # noqa: ARG001
         ) -> DeliveredMatrixEvent | None:
             terminal_texts.append(new_text)
             return edit_results.pop(0)
@@ -3020,6 +3096,7 @@ class TestStreamingBehavior:
             _new_text: str,
             *,
             retry_sync_recovery: bool = False,  # noqa: ARG001
+            nonterminal: bool = False,  # noqa: ARG001
         ) -> DeliveredMatrixEvent:
             streaming.accumulated_text = "hello"
             return DeliveredMatrixEvent(event_id="$edit", content_sent={})
@@ -3447,6 +3524,7 @@ class TestStreamingBehavior:
             new_text: str,
             *,
             retry_sync_recovery: bool = False,  # noqa: ARG001
+            nonterminal: bool = False,  # noqa: ARG001
         ) -> DeliveredMatrixEvent:
             nonlocal in_flight, max_in_flight
             in_flight += 1
@@ -3736,6 +3814,7 @@ class TestStreamingBehavior:
             new_text: str,
             *,
             retry_sync_recovery: bool = False,  # noqa: ARG001
+            nonterminal: bool = False,  # noqa: ARG001
         ) -> DeliveredMatrixEvent:
             captured_texts.append(new_text)
             return DeliveredMatrixEvent(event_id="$edit", content_sent={})
@@ -3840,6 +3919,7 @@ class TestStreamingBehavior:
             new_text: str,
             *,
             retry_sync_recovery: bool = False,  # noqa: ARG001
+            nonterminal: bool = False,  # noqa: ARG001
         ) -> DeliveredMatrixEvent:
             captured_texts.append(new_text)
             return DeliveredMatrixEvent(event_id="$edit", content_sent={})
@@ -86,6 +86,7 @@ async def test_streaming_e2e_worker_warmup_edit_sequence(tmp_path: Path) -> None
         new_text: str,
         *,
         retry_sync_recovery: bool = False,  # noqa: ARG001
+        nonterminal: bool = False,  # noqa: ARG001
     ) -> DeliveredMatrixEvent:
         deliveries.append(("edit", new_text))
         return DeliveredMatrixEvent(event_id="$stream_edit", content_sent=dict(new_content))
@@ -1287,6 +1287,7 @@ async def test_full_state_only_after_successful_first_sync() -> None:
 
     bot = MagicMock(spec=AgentBot)
     bot.agent_name = "test_agent"
+    bot.agent_user = MagicMock(user_id="@mindroom_test_agent:localhost")
     bot.last_sync_time = None
     bot._first_sync_done = False
     bot._classic_sync_rebuild_pending = False
@@ -99,6 +99,7 @@ from tests.conftest import (
     bind_runtime_paths,
     make_turn_context,
     make_visible_message,
+    revalidate_config,
     runtime_paths_for,
     test_runtime_paths,
 )
@@ -2463,6 +2464,7 @@ async def test_team_response_stream_event_only_stop_after_finalizes_delivered_no
         role="Configured test team",
         agents=["general"],
     )
+    config = revalidate_config(config)
     runtime_paths = runtime_paths_for(config)
     orchestrator = MagicMock()
     orchestrator.config = config
@@ -4579,6 +4581,7 @@ async def test_team_response_stream_retry_does_not_relocate_failed_attempt_notic
         role="Configured test team",
         agents=["general"],
     )
+    config = revalidate_config(config)
     runtime_paths = runtime_paths_for(config)
     orchestrator = MagicMock()
     orchestrator.config = config
@@ -1156,3 +1156,128 @@ async def test_export_threads_counts_only_enumerated_rooms(tmp_path: Path) -> No
     assert stats.rooms_exported == 1
     assert stats.failures == 1
     assert stats.failed_items[0].room_key == "lobby"
+
+
+def _reader_at(watermarks: dict[str, str]) -> Mock:
+    """Return a projection reader whose journal reports ``watermarks`` per thread."""
+
+    async def watermark(*, room_id: str, thread_id: str) -> str | None:
+        del room_id
+        return watermarks.get(thread_id)
+
+    reader = Mock()
+    reader.completeness.conversation_watermark = AsyncMock(side_effect=watermark)
+    return reader
+
+
+async def _export_with_watermarks(
+    tmp_path: Path,
+    watermarks: dict[str, str],
+    histories: dict[str, list[ResolvedVisibleMessage]],
+) -> tuple[ThreadExportStats, AsyncMock]:
+    """Run one single-target pass over ``histories`` and return its stats and fetch mock."""
+    config = _config(tmp_path)
+    runtime_paths = runtime_paths_for(config)
+
+    async def fetch_history(*_args: object, thread_id: str, **_kwargs: object) -> list[ResolvedVisibleMessage]:
+        return histories[thread_id]
+
+    fetch_thread = AsyncMock(side_effect=fetch_history)
+    with (
+        patch(
+            "mindroom.thread_export.execution.enumerate_room_thread_root_ids",
+            new=AsyncMock(return_value=(list(histories), False)),
+        ),
+        patch("mindroom.thread_export.execution.fetch_projected_thread_history", new=fetch_thread),
+    ):
+        accumulators = await _export_threads_for_targets_for_client(
+            client=Mock(),
+            reader=_reader_at(watermarks),
+            config=config,
+            runtime_paths=runtime_paths,
+            rooms=_export_rooms(runtime_paths, "lobby"),
+            targets=(ThreadExportTarget(output_dir=tmp_path / "exports"),),
+        )
+    return accumulators[0].stats(), fetch_thread
+
+
+def _history(event_id: str, body: str, *, timestamp: int = 1_700_000_000_000) -> list[ResolvedVisibleMessage]:
+    return [
+        ResolvedVisibleMessage.synthetic(
+            sender="@alice:localhost",
+            body=body,
+            timestamp=timestamp,
+            event_id=event_id,
+        ),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_thread_whose_watermark_did_not_move_is_not_read_again(tmp_path: Path) -> None:
+    """A pass reads from the journal only the threads whose position moved since the file was written."""
+    _write_matrix_state(tmp_path)
+    histories = {"$quiet:localhost": _history("$quiet:localhost", "Quiet")}
+
+    first_stats, first_fetch = await _export_with_watermarks(tmp_path, {"$quiet:localhost": "1:1"}, histories)
+    exported_file = next((tmp_path / "exports" / "lobby").glob("*.yaml"))
+    first_bytes = exported_file.read_bytes()
+    second_stats, second_fetch = await _export_with_watermarks(tmp_path, {"$quiet:localhost": "1:1"}, histories)
+
+    assert first_fetch.await_count == 1
+    assert first_stats.threads_unchanged == 0
+    second_fetch.assert_not_awaited()
+    assert (second_stats.threads_exported, second_stats.threads_unchanged) == (1, 1)
+    assert exported_file.read_bytes() == first_bytes
+
+    histories = {"$quiet:localhost": _history("$quiet:localhost", "Quiet, then edited")}
+    third_stats, third_fetch = await _export_with_watermarks(tmp_path, {"$quiet:localhost": "1:2"}, histories)
+
+    assert third_fetch.await_count == 1
+    assert third_stats.threads_unchanged == 0
+    assert "Quiet, then edited" in exported_file.read_text(encoding="utf-8")
+
+
+@pytest.mark.asyncio
+async def test_hand_edited_thread_file_is_rewritten_despite_an_unmoved_watermark(tmp_path: Path) -> None:
+    """The manifest vouches for a file only while it is the file the exporter wrote."""
+    _write_matrix_state(tmp_path)
+    histories = {"$kept:localhost": _history("$kept:localhost", "Original")}
+    await _export_with_watermarks(tmp_path, {"$kept:localhost": "1:1"}, histories)
+    exported_file = next((tmp_path / "exports" / "lobby").glob("*.yaml"))
+    original = exported_file.read_text(encoding="utf-8")
+    exported_file.write_text(original.replace("Original", "Tampered"), encoding="utf-8")
+
+    stats, fetch_thread = await _export_with_watermarks(tmp_path, {"$kept:localhost": "1:1"}, histories)
+
+    assert fetch_thread.await_count == 1
+    assert stats.threads_unchanged == 0
+    assert "Original" in exported_file.read_text(encoding="utf-8")
+
+
+@pytest.mark.asyncio
+async def test_room_index_update_parses_only_thread_files_the_manifest_cannot_vouch_for(tmp_path: Path) -> None:
+    """A changed thread updates the index from recorded entries instead of re-parsing every file."""
+    _write_matrix_state(tmp_path)
+    histories = {
+        "$older:localhost": _history("$older:localhost", "Older", timestamp=1_700_000_000_000),
+        "$newer:localhost": _history("$newer:localhost", "Newer", timestamp=1_700_000_100_000),
+    }
+    await _export_with_watermarks(tmp_path, {"$older:localhost": "1:1", "$newer:localhost": "1:1"}, histories)
+    histories["$older:localhost"] = _history("$older:localhost", "Older, latest", timestamp=1_700_000_200_000)
+
+    with patch(
+        "mindroom.thread_export.storage._thread_index_entry_at",
+        wraps=thread_export_storage._thread_index_entry_at,
+    ) as parse_thread_file:
+        stats, fetch_thread = await _export_with_watermarks(
+            tmp_path,
+            {"$older:localhost": "1:2", "$newer:localhost": "1:1"},
+            histories,
+        )
+
+    assert fetch_thread.await_count == 1
+    assert stats.threads_unchanged == 1
+    parse_thread_file.assert_not_called()
+    index = json.loads((tmp_path / "exports" / "lobby" / "index.json").read_text(encoding="utf-8"))
+    assert [entry["thread_id"] for entry in index["threads"]] == ["$older:localhost", "$newer:localhost"]
+    assert index["threads"][0]["last_timestamp"] == 1_700_000_200_000
@@ -31,6 +31,7 @@ from mindroom.thread_export.projected_history import (
     ThreadExportIncompleteError,
     export_conversation_reader,
     fetch_projected_thread_history,
+    projected_thread_watermark,
 )
 
 if TYPE_CHECKING:
@@ -351,6 +352,42 @@ async def test_live_sync_rows_alone_do_not_count_as_a_built_conversation(
     assert homeserver.history_calls == 0
 
 
+async def test_the_watermark_moves_with_everything_an_export_would_show(
+    router: PrincipalStore,
+) -> None:
+    """An unchanged watermark is what lets a pass skip a thread, so every visible change must move it."""
+    homeserver = FakeHomeserver()
+    root = raw(ROOT, "root", ts=100)
+    reply = raw("$a:example.org", "first", ts=200, thread_id=ROOT)
+    serve_thread(homeserver, root, [reply])
+    await admit_live(router, [root, reply])
+    reader = reader_for(router, homeserver)
+
+    async def watermark() -> str | None:
+        return await projected_thread_watermark(reader, room_id=ROOM, thread_id=ROOT)
+
+    # Rows alone are not a built conversation, so only a read can answer.
+    assert await watermark() is None
+    await export(reader)
+    hydrated = await watermark()
+    assert hydrated is not None
+    await export(reader)
+    assert await watermark() == hydrated
+
+    seen = {hydrated}
+    for source in (
+        raw("$b:example.org", "second", ts=300, thread_id=ROOT),
+        raw("$edit:example.org", "first, edited", ts=400, replaces="$a:example.org"),
+        raw("$root-edit:example.org", "root, edited", ts=500, replaces=ROOT),
+        redaction("$r:example.org", "$b:example.org", ts=600),
+    ):
+        await admit_live(router, [source])
+        moved = await watermark()
+        assert moved is not None
+        assert moved not in seen
+        seen.add(moved)
+
+
 async def test_a_thread_longer_than_one_page_exports_in_order_with_one_root(
     router: PrincipalStore,
 ) -> None:
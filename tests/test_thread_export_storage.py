@@ -14,6 +14,7 @@ from mindroom.thread_export.storage import (
     _ROOT_MARKER_TEXT,
     _safe_path_segment,
     _UnsafeThreadExportPathError,
+    load_thread_export_manifest,
     prepare_export_root,
     reconcile_room_directories,
     remove_room_export,
@@ -349,6 +350,31 @@ def test_recognizable_room_removal_still_retracts_data(tmp_path: Path) -> None:
     assert not room_dir.exists()
 
 
+def test_room_manifest_is_exporter_data_that_prunes_removed_threads(tmp_path: Path) -> None:
+    """The manifest forgets deleted thread files and never blocks retracting its room."""
+    output_dir = tmp_path / "thread_exports"
+    room = _room()
+    manifest = load_thread_export_manifest(output_dir, room)
+    for thread_id in ("$kept:localhost", "$gone:localhost"):
+        write_thread_payload(
+            output_dir,
+            room,
+            thread_id,
+            {"version": 1, "thread": {"id": thread_id, "message_count": 0}, "messages": []},
+            manifest=manifest,
+            source_key="source",
+        )
+    write_room_index(output_dir, room, manifest=manifest)
+    room_dir = output_dir / "lobby"
+    (room_dir / _thread_filename("$gone:localhost")).unlink()
+    write_room_index(output_dir, room, manifest=manifest)
+
+    assert set(load_thread_export_manifest(output_dir, room).entries) == {_thread_filename("$kept:localhost")}
+    assert (room_dir / ".manifest.json").is_file()
+    remove_room_export(output_dir, room)
+    assert not room_dir.exists()
+
+
 @pytest.mark.parametrize("full_reconciliation", [False, True])
 @pytest.mark.parametrize("indexed", [False, True])
 def test_room_retraction_removes_only_exporter_data_when_unknown_entries_remain(
@@ -21,8 +21,10 @@ from mindroom.thread_tags import (
     ThreadTagsListing,
     ThreadTagsState,
     coerce_tag_name,
+    forget_thread_tags_sync,
     get_thread_tags,
     list_tagged_threads,
+    observe_thread_tags_sync,
     remove_thread_tag,
     set_thread_tag,
     set_thread_tags_if_empty,
@@ -30,7 +32,7 @@ from mindroom.thread_tags import (
 from tests.conftest import make_relation_lookup
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable
+    from collections.abc import Awaitable, Iterator
 
 
 def _message_event_response(
@@ -3005,3 +3007,111 @@ async def test_resolve_thread_root_event_id_for_client_returns_none_for_cyclic_e
     )
 
     assert normalized is None
+
+
+def _sync_response_with_room_state(
+    room_id: str,
+    *state_events: dict[str, object],
+    limited: bool = False,
+    in_timeline: bool = False,
+) -> nio.SyncResponse:
+    events = [
+        {"event_id": f"$state-{index}", "sender": "@user:localhost", "origin_server_ts": 1, **event}
+        for index, event in enumerate(state_events)
+    ]
+    room_info = {
+        "state": {"events": [] if in_timeline else events},
+        "timeline": {"events": events if in_timeline else [], "limited": limited, "prev_batch": "s-prev"},
+    }
+    response = nio.SyncResponse.from_dict(
+        {"next_batch": "s-next", "rooms": {"join": {room_id: room_info}, "invite": {}, "leave": {}}},
+    )
+    assert isinstance(response, nio.SyncResponse)
+    return response
+
+
+@pytest.fixture
+def synced_tag_client() -> Iterator[MagicMock]:
+    """Return a client whose account is syncing, so thread-tag reads use the sync index."""
+    user_id = "@mindroom_index_reader:localhost"
+    client = MagicMock()
+    client.user_id = user_id
+    client.room_get_state = AsyncMock(
+        return_value=_thread_tags_room_state_response(_thread_tag_state_event("$thread", "blocked")),
+    )
+    observe_thread_tags_sync(user_id, _sync_response_with_room_state("!other:localhost"))
+    yield client
+    forget_thread_tags_sync(user_id)
+
+
+@pytest.mark.asyncio
+async def test_thread_tag_reads_use_sync_index_after_priming(synced_tag_client: MagicMock) -> None:
+    """Only the first read fetches room state; later reads and sync updates stay local."""
+    first = await get_thread_tags(synced_tag_client, "!room:localhost", "$thread")
+    assert first is not None
+    assert set(first.tags) == {"blocked"}
+
+    observe_thread_tags_sync(
+        synced_tag_client.user_id,
+        _sync_response_with_room_state(
+            "!room:localhost",
+            _thread_tag_state_event("$thread", "blocked", content={}),
+            _thread_tag_state_event("$other", "resolved"),
+            in_timeline=True,
+        ),
+    )
+    listing = await list_tagged_threads(synced_tag_client, "!room:localhost")
+
+    assert set(listing.tag_state) == {"$other"}
+    assert await get_thread_tags(synced_tag_client, "!room:localhost", "$thread") is None
+    synced_tag_client.room_get_state.assert_awaited_once_with("!room:localhost")
+
+
+@pytest.mark.asyncio
+async def test_limited_sync_forces_thread_tag_refetch(synced_tag_client: MagicMock) -> None:
+    """A limited timeline may hide state changes, so the next read refetches room state."""
+    await get_thread_tags(synced_tag_client, "!room:localhost", "$thread")
+    observe_thread_tags_sync(
+        synced_tag_client.user_id,
+        _sync_response_with_room_state("!room:localhost", limited=True),
+    )
+
+    await get_thread_tags(synced_tag_client, "!room:localhost", "$thread")
+
+    assert synced_tag_client.room_get_state.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_thread_tag_priming_fetch_racing_sync_is_not_cached(synced_tag_client: MagicMock) -> None:
+    """A state fetch that overlaps a sync update for the room is used once and not stored."""
+    room_state = _thread_tags_room_state_response(_thread_tag_state_event("$thread", "blocked"))
+
+    async def racing_room_get_state(room_id: str) -> nio.RoomGetStateResponse:
+        observe_thread_tags_sync(
+            synced_tag_client.user_id,
+            _sync_response_with_room_state(room_id, _thread_tag_state_event("$thread", "waiting")),
+        )
+        return room_state
+
+    synced_tag_client.room_get_state.side_effect = racing_room_get_state
+    await get_thread_tags(synced_tag_client, "!room:localhost", "$thread")
+    synced_tag_client.room_get_state.side_effect = None
+    synced_tag_client.room_get_state.return_value = room_state
+    await get_thread_tags(synced_tag_client, "!room:localhost", "$thread")
+
+    assert synced_tag_client.room_get_state.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_thread_tag_reads_without_sync_always_fetch() -> None:
+    """Accounts whose sync is not observed never serve tag reads from a stale index."""
+    client = MagicMock()
+    client.user_id = "@mindroom_not_syncing:localhost"
+    client.room_get_state = AsyncMock(
+        return_value=_thread_tags_room_state_response(_thread_tag_state_event("$thread", "blocked")),
+    )
+
+    await get_thread_tags(client, "!room:localhost", "$thread")
+    await get_thread_tags(client, "!room:localhost", "$thread")
+
+    assert client.room_get_state.await_count == 2
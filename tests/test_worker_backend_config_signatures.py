@@ -146,6 +146,7 @@ def _legacy_kubernetes_backend_config_signature(
         str(config.enable_service_links),
         config.auth_secret_name or "",
         str(config.reconcile_pod_templates),
+        str(config.idle_retain_max),
         config.agent_vault.signature() if config.agent_vault is not None else "",
         credentials_encryption_key_marker,
         auth_token or "",
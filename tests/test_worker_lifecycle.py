@@ -17,7 +17,7 @@ from mindroom.workers.backends._lifecycle import (
     mark_worker_idle,
     touch_worker_lifecycle,
 )
-from mindroom.workers.backends._metadata_store import save_worker_metadata
+from mindroom.workers.backends._metadata_store import _save_worker_metadata
 from mindroom.workers.backends.static_runner import StaticSandboxRunnerBackend
 from mindroom.workers.models import WorkerHandle, WorkerSpec, WorkerStatus
 
@@ -157,7 +157,7 @@ def test_local_backend_touch_revives_idle_worker_and_clears_failure(tmp_path: Pa
     worker_key = "v1:t:shared:a"
     paths = local_module._local_worker_state_paths(worker_key, worker_root=backend.worker_root)
     paths.metadata_dir.mkdir(parents=True, exist_ok=True)
-    save_worker_metadata(
+    _save_worker_metadata(
         paths,
         local_module._LocalWorkerMetadata(
             worker_id="w",
@@ -189,7 +189,7 @@ def test_worker_metadata_replace_preserves_previous_document_when_serialization_
     )
     paths = local_module._local_worker_state_paths("v1:t:shared:a", worker_root=backend.worker_root)
     original = SimpleNamespace(worker_key="v1:t:shared:a", last_used_at=1.0)
-    save_worker_metadata(paths, original, ensure_root=True)
+    _save_worker_metadata(paths, original, ensure_root=True)
     original_bytes = paths.metadata_file.read_bytes()
 
     def fail_after_partial_write(_payload: object, stream: TextIO, **_kwargs: object) -> None:
@@ -200,9 +200,60 @@ def test_worker_metadata_replace_preserves_previous_document_when_serialization_
     monkeypatch.setattr(json, "dump", fail_after_partial_write)
 
     with pytest.raises(RuntimeError, match="serialization interrupted"):
-        metadata_store_module.save_worker_metadata(
+        metadata_store_module._save_worker_metadata(
             paths,
             SimpleNamespace(worker_key="v1:t:shared:a", last_used_at=2.0),
         )
 
     assert paths.metadata_file.read_bytes() == original_bytes
+
+
+def test_worker_metadata_registry_sweeps_only_workers_that_expired_since_their_last_change(tmp_path: Path) -> None:
+    """The expiry heap hands each change out once, and again only after the next change or a failed sweep."""
+    registry = metadata_store_module._WorkerMetadataRegistry(
+        tmp_path / "workers",
+        state_paths_from_root=local_module.local_worker_state_paths_for_root,
+        metadata_type=local_module._LocalWorkerMetadata,
+    )
+
+    def save(worker_key: str, *, last_used_at: float, status: WorkerStatus) -> None:
+        paths = local_module._local_worker_state_paths(worker_key, worker_root=tmp_path / "workers")
+        registry.save(
+            paths,
+            local_module._LocalWorkerMetadata(
+                worker_id=worker_key,
+                worker_key=worker_key,
+                endpoint="/api/sandbox-runner/execute",
+                backend_name="local_sandbox_runner",
+                created_at=0.0,
+                last_used_at=last_used_at,
+                status=status,
+            ),
+        )
+
+    def sweep(cutoff: float) -> list[str]:
+        with registry.expired(last_used_before=cutoff) as expired_paths:
+            return [registry.get(paths).worker_key for paths in expired_paths]
+
+    save("old", last_used_at=1.0, status="ready")
+    save("new", last_used_at=50.0, status="ready")
+    save("old", last_used_at=2.0, status="ready")
+
+    assert sweep(10.0) == ["old"]
+    assert sweep(10.0) == []
+    save("old", last_used_at=2.0, status="idle")
+    assert sweep(10.0) == ["old"]
+    save("old", last_used_at=2.0, status="idle")
+    assert sweep(100.0) == ["new"]
+
+    save("new", last_used_at=60.0, status="ready")
+    with pytest.raises(RuntimeError), registry.expired(last_used_before=100.0):
+        raise RuntimeError
+    assert sweep(100.0) == ["new"]
+
+    reloaded = metadata_store_module._WorkerMetadataRegistry(
+        tmp_path / "workers",
+        state_paths_from_root=local_module.local_worker_state_paths_for_root,
+        metadata_type=local_module._LocalWorkerMetadata,
+    )
+    assert {metadata.worker_key for _paths, metadata in reloaded.entries()} == {"new", "old"}
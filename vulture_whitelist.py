@@ -111,6 +111,7 @@ DEEPSEEK_V4_PRO  # used by scripts/utilities/rewrite_git_commits_ai.py
 EXPIRED  # dynamically restored ApprovalDecision enum value (src/mindroom/approval_continuation.py)
 _.confirmation_note  # Set by Agno requirement rejection (approval_execution.py, teams.py)
 _.cache_results  # Script broker disables Agno's pre-hook result cache for durable calls
+_.call_many  # public background-script SDK entry point (src/mindroom/script_sdk.py)
 SAAS_MODEL_PRESETS  # used by scripts/sync_config.py
 _.to_config_dict  # used by scripts/sync_config.py
 _.serialize_datetime  # unused method (src/mindroom/matrix/state.py)
@@ -211,6 +212,7 @@ _.download_file  # unused method (src/mindroom/custom_tools/google_drive.py)
 _._batch_get  # inherited Gmail tools call this override dynamically (src/mindroom/custom_tools/gmail.py)
 _._build_service  # Agno Google auth decorator calls this override dynamically (src/mindroom/custom_tools/google_drive.py)
 _.reject_legacy_defaults_fields  # unused method (src/mindroom/config/models.py)
+_.normalize_tools  # unused method (src/mindroom/mcp/config.py)
 _.normalize_tool_filters  # unused method (src/mindroom/mcp/config.py)
 _.normalize_description  # unused method (src/mindroom/mcp/config.py)
 _.validate_provider_id  # unused method (src/mindroom/mcp/config.py)
@@ -248,6 +250,8 @@ _threads_export_command  # unused function (src/mindroom/cli/main.py)
 _journal_adopt_command  # unused function (src/mindroom/cli/main.py)
 update_model  # unused function (src/mindroom/api/main.py)
 get_all_agents_rooms  # unused function (src/mindroom/api/matrix_operations.py)
+get_edit_cadence  # unused function (src/mindroom/api/matrix_operations.py)
+get_outbound_edits  # unused function (src/mindroom/api/matrix_operations.py)
 get_agent_rooms  # unused function (src/mindroom/api/matrix_operations.py)
 authorize  # unused function (src/mindroom/api/oauth.py)
 confirm_reset  # FastAPI route dispatch (src/mindroom/api/oauth.py)
@@ -255,6 +259,8 @@ reset_and_authorize  # FastAPI route dispatch (src/mindroom/api/oauth.py)
 health_check  # unused function (src/mindroom/api/main.py)
 private_dynamic_workflow_report  # unused function (src/mindroom/api/dynamic_workflows.py)
 legacy_private_dynamic_workflow_report  # unused function (src/mindroom/api/dynamic_workflows.py)
+hooks_health  # unused function (src/mindroom/api/hooks.py)
+mcp_result_cache  # unused function (src/mindroom/api/mcp.py)
 public_report  # unused function (src/mindroom/api/report_publishing.py)
 public_report_index  # unused function (src/mindroom/api/report_publishing.py)
 public_report_asset  # unused function (src/mindroom/api/report_publishing.py)
@@ -329,3 +335,9 @@ FINAL  # unused variable (src/mindroom/event_journal/models.py)
 # Named only inside a `cast("_RoomIdEvent", event)` string literal, which
 # vulture does not resolve.
 _RoomIdEvent  # unused class (src/mindroom/matrix/journal_ingress.py)
+_.validate_shared_ingestion_mode  # unused method (src/mindroom/config/matrix.py)
+put_appservice_transaction  # unused function (src/mindroom/api/matrix_appservice.py)
+create_batch  # unused function (src/mindroom/api/openai_compat.py)
+retrieve_batch  # unused function (src/mindroom/api/openai_compat.py)
+retrieve_batch_output  # unused function (src/mindroom/api/openai_compat.py)
+cancel_batch  # unused function (src/mindroom/api/openai_compat.py)